@@ -372,6 +372,43 @@ class TestingApp(RequestHandler):
         data = b"1" * length
         return Response(data, headers=[("Content-Type", "application/octet-stream")])
 
+    def ranged(self, request: httputil.HTTPServerRequest) -> Response:
+        """Serve ``length`` bytes honoring a single ``Range`` (and ``If-Range``).
+        The ETag is ``etag`` unless ``changed_etag`` is given, served from the first range
+        that does not start at zero on."""
+        params = request_params(request)
+        length = int(params.get("length", b"1024"))
+        data = bytes(i % 251 for i in range(length))
+        etag = params.get("etag", b"v1").decode()
+
+        range_header = request.headers.get("Range")
+
+        if range_header and not range_header.startswith("bytes=0-"):
+            etag = params.get("changed_etag", etag.encode()).decode()
+
+        etag = f'"{etag}"'
+
+        headers = [
+            ("Accept-Ranges", "bytes"),
+            ("ETag", etag),
+            ("Content-Type", "application/octet-stream"),
+        ]
+
+        if request.method == "HEAD":
+            headers.append(("Content-Length", str(length)))
+            return Response(headers=headers)
+
+        if range_header and request.headers.get("If-Range", etag) == etag:
+            first, last = range_header[len("bytes=") :].split("-")
+            start, end = int(first), min(int(last), length - 1)
+            headers.append(("Content-Range", f"bytes {start}-{end}/{length}"))
+
+            return Response(
+                data[start : end + 1], status="206 Partial Content", headers=headers
+            )
+
+        return Response(data, headers=headers)
+
     def status(self, request: httputil.HTTPServerRequest) -> Response:
         params = request_params(request)
         status = params.get("status", b"200 OK").decode("latin-1")
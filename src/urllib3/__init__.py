@@ -4,6 +4,8 @@ Python HTTP library with thread-safe connection pooling, file post support, user
 
 from __future__ import annotations
 
+import importlib
+
 # Set default logging handler to avoid "No handler found" warnings.
 import logging
 import typing
@@ -12,18 +14,12 @@ from logging import NullHandler
 from os import environ
 
 from . import exceptions
-from ._async.connectionpool import AsyncHTTPConnectionPool, AsyncHTTPSConnectionPool
-from ._async.connectionpool import connection_from_url as async_connection_from_url
-from ._async.poolmanager import AsyncPoolManager, AsyncProxyManager
-from ._async.poolmanager import proxy_from_url as async_proxy_from_url
-from ._async.response import AsyncHTTPResponse
 from ._collections import HTTPHeaderDict
 from ._typing import _TYPE_BODY, _TYPE_FIELDS
 from ._version import __version__
 from .backend import ConnectionInfo, HttpVersion, ResponsePromise
 from .connectionpool import HTTPConnectionPool, HTTPSConnectionPool, connection_from_url
 from .contrib.resolver import ResolverDescription
-from .contrib.resolver._async import AsyncResolverDescription
 from .filepost import encode_multipart_formdata
 from .poolmanager import PoolManager, ProxyManager, proxy_from_url
 from .response import BaseHTTPResponse, HTTPResponse
@@ -31,6 +27,17 @@ from .util.request import make_headers
 from .util.retry import Retry
 from .util.timeout import Timeout
 
+if typing.TYPE_CHECKING:
+    from ._async.connectionpool import (
+        AsyncHTTPConnectionPool,
+        AsyncHTTPSConnectionPool,
+    )
+    from ._async.connectionpool import connection_from_url as async_connection_from_url
+    from ._async.poolmanager import AsyncPoolManager, AsyncProxyManager
+    from ._async.poolmanager import proxy_from_url as async_proxy_from_url
+    from ._async.response import AsyncHTTPResponse
+    from .contrib.resolver._async import AsyncResolverDescription
+
 __author__ = "Andrey Petrov (andrey.petrov@shazow.net)"
 __license__ = "MIT"
 __version__ = __version__
@@ -66,6 +73,40 @@ __all__ = (
     "async_connection_from_url",
 )
 
+#: Resolved on first access (PEP 562). A program that only issue synchronous requests
+#: never pays for the import of the async stack (and asyncio).
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "AsyncHTTPConnectionPool": ("._async.connectionpool", "AsyncHTTPConnectionPool"),
+    "AsyncHTTPSConnectionPool": ("._async.connectionpool", "AsyncHTTPSConnectionPool"),
+    "async_connection_from_url": ("._async.connectionpool", "connection_from_url"),
+    "AsyncPoolManager": ("._async.poolmanager", "AsyncPoolManager"),
+    "AsyncProxyManager": ("._async.poolmanager", "AsyncProxyManager"),
+    "async_proxy_from_url": ("._async.poolmanager", "proxy_from_url"),
+    "AsyncHTTPResponse": ("._async.response", "AsyncHTTPResponse"),
+    "AsyncResolverDescription": (
+        ".contrib.resolver._async",
+        "AsyncResolverDescription",
+    ),
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    # subsequent lookups no longer go through this function.
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
+
 logging.getLogger(__name__).addHandler(NullHandler())
 
 
@@ -36,7 +36,13 @@ from ..util.util import to_str
 from ..contrib.anytls import ssl
 
 
-from ..backend import HttpVersion, QuicPreemptiveCacheType, ResponsePromise
+from ..backend import (
+    HttpVersion,
+    MemoryBudget,
+    QuicPreemptiveCacheType,
+    QuicSessionTicketStore,
+    ResponsePromise,
+)
 from ..backend._async import AsyncHfaceBackend
 from ..connection import (
     _CONTAINS_CONTROL_CHAR_RE,
@@ -131,6 +137,9 @@ class AsyncHTTPConnection(AsyncHfaceBackend):
         proxy_config: ProxyConfig | None = None,
         disabled_svn: set[HttpVersion] | None = None,
         preemptive_quic_cache: QuicPreemptiveCacheType | None = None,
+        quic_session_tickets: QuicSessionTicketStore | None = None,
+        flow_control_budget: int | None = None,
+        memory_budget: MemoryBudget | None = None,
         resolver: AsyncBaseResolver | None = None,
         socket_family: socket.AddressFamily = socket.AF_UNSPEC,
         keepalive_delay: float | int | None = DEFAULT_KEEPALIVE_DELAY,
@@ -146,6 +155,9 @@ class AsyncHTTPConnection(AsyncHfaceBackend):
             socket_options=socket_options,
             disabled_svn=disabled_svn,
             preemptive_quic_cache=preemptive_quic_cache,
+            quic_session_tickets=quic_session_tickets,
+            flow_control_budget=flow_control_budget,
+            memory_budget=memory_budget,
             keepalive_delay=keepalive_delay,
             background_watch_delay=background_watch_delay,
             keepalive_idle_window=keepalive_idle_window,
@@ -372,7 +384,7 @@ class AsyncHTTPConnection(AsyncHfaceBackend):
 
     def putheader(self, header: str, *values: str) -> None:
         """"""
-        if not any(isinstance(v, str) and v == SKIP_HEADER for v in values):
+        if SKIP_HEADER not in values:
             super().putheader(header, *values)
         elif to_str(header.lower()) not in SKIPPABLE_HEADERS:
             skippable_headers = "', '".join(
@@ -732,6 +744,9 @@ class AsyncHTTPSConnection(AsyncHTTPConnection):
         | None = AsyncHTTPConnection.default_socket_options,
         disabled_svn: set[HttpVersion] | None = None,
         preemptive_quic_cache: QuicPreemptiveCacheType | None = None,
+        quic_session_tickets: QuicSessionTicketStore | None = None,
+        flow_control_budget: int | None = None,
+        memory_budget: MemoryBudget | None = None,
         resolver: AsyncBaseResolver | None = None,
         socket_family: socket.AddressFamily = socket.AF_UNSPEC,
         keepalive_delay: float | int | None = DEFAULT_KEEPALIVE_DELAY,
@@ -776,6 +791,9 @@ class AsyncHTTPSConnection(AsyncHTTPConnection):
             proxy_config=proxy_config,
             disabled_svn=disabled_svn,
             preemptive_quic_cache=preemptive_quic_cache,
+            quic_session_tickets=quic_session_tickets,
+            flow_control_budget=flow_control_budget,
+            memory_budget=memory_budget,
             resolver=resolver,
             socket_family=socket_family,
             keepalive_delay=keepalive_delay,
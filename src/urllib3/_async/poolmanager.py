@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import socket
+import time
 import typing
 import warnings
+from collections import deque
 from types import TracebackType
 from urllib.parse import urljoin
 
@@ -11,27 +14,55 @@ from .._collections import HTTPHeaderDict
 from .._constant import DEFAULT_BLOCKSIZE
 from .._request_methods import AsyncRequestMethods
 from .._typing import _TYPE_BODY, _TYPE_BODY_POSITION, _TYPE_TIMEOUT, ProxyConfig
-from ..backend import HttpVersion, QuicPreemptiveCacheType, ResponsePromise
+from ..backend import (
+    HttpVersion,
+    MemoryBudget,
+    QuicPreemptiveCacheType,
+    QuicSessionTicketStore,
+    ResponsePromise,
+)
 from ..connectionpool import port_by_scheme
 from ..contrib.resolver import ProtocolResolver
+from ..contrib.resolver._cache import ResolutionResult
 from ..contrib.resolver._async import (
     AsyncBaseResolver,
     AsyncManyResolver,
     AsyncResolverDescription,
 )
 from ..exceptions import (
+    EmptyPoolError,
+    LocationParseError,
     LocationValueError,
     MaxRetryError,
     ProxySchemeUnknown,
     URLSchemeUnknown,
 )
-from ..poolmanager import SSL_KEYWORDS, PoolKey, key_fn_by_scheme
+from ..poolmanager import (
+    _COALESCED_ADDRESSES_MAX_AGE,
+    SSL_KEYWORDS,
+    BatchRequest,
+    PoolKey,
+    _ConnectionPoolKw,
+    _PoolKeyMemo,
+    _apply_retry_policies,
+    _batch_host_key,
+    _unpack_batch_request,
+    key_fn_by_scheme,
+)
 from ..util._async.traffic_police import AsyncTrafficPolice
 from ..util.proxy import connection_requires_http_tunnel
 from ..util.request import NOT_FORWARDABLE_HEADERS
-from ..util.retry import Retry
+from ..util.retry import CircuitBreaker, Retry, RetryBudget
+from ..util.singleflight import (
+    AsyncRequestCoalescer,
+    BufferedResponse,
+    coalescing_key,
+    is_coalescable,
+    wait_bound,
+)
 from ..util.traffic_police import UnavailableTraffic
 from ..util.url import Url, parse_extension, parse_url
+from ..response import HTTPResponse
 from .connectionpool import AsyncHTTPConnectionPool, AsyncHTTPSConnectionPool
 from .response import AsyncHTTPResponse
 
@@ -40,11 +71,26 @@ if typing.TYPE_CHECKING:
 
     from typing_extensions import Literal
 
-__all__ = ["AsyncPoolManager", "AsyncProxyManager", "proxy_from_url"]
+__all__ = [
+    "AsyncBatchResult",
+    "AsyncPoolManager",
+    "AsyncProxyManager",
+    "proxy_from_url",
+]
 
 
 log = logging.getLogger(__name__)
 
+
+class AsyncBatchResult(typing.NamedTuple):
+    """Outcome of one of the requests of a batch. Exactly one of response and error is set."""
+
+    #: the request, as it was given.
+    request: BatchRequest
+    response: AsyncHTTPResponse | None
+    error: Exception | None
+
+
 _SelfT = typing.TypeVar("_SelfT")
 
 pool_classes_by_scheme = {
@@ -66,6 +112,38 @@ class AsyncPoolManager(AsyncRequestMethods):
         Headers to include with all requests, unless other headers are given
         explicitly.
 
+    :param retry_budget:
+        A :class:`~urllib3.util.retry.RetryBudget` shared by every request
+        issued through this manager, unless their retries carry their own.
+
+    :param circuit_breaker:
+        A :class:`~urllib3.util.retry.CircuitBreaker` shared by every request
+        issued through this manager, unless their retries carry their own.
+
+    :param quic_session_tickets:
+        A :class:`~urllib3.backend.QuicSessionTicketStore` to resume HTTP/3 sessions
+        when reconnecting. One is created by default, pass ``False`` to disable resumption.
+        Use ``QuicSessionTicketStore(early_data=True)`` to send safe requests in 0-RTT.
+
+    :param memory_budget:
+        Amount of bytes (or a :class:`~urllib3.backend.MemoryBudget`) that every HTTP/2 and HTTP/3
+        connection of this manager may buffer, all together, for the responses that are not read yet.
+        Beyond it, the streams that keep piling up data stop receiving flow control credit until
+        they are consumed. Its usage is exposed by :attr:`memory_budget`. Unlimited by default.
+        The data a response already pulled into its own buffer is no longer accounted.
+
+    :param connection_coalescing:
+        Let the requests for a host ride an established HTTP/2 or HTTP/3 connection of another host
+        instead of opening a new one, provided that both resolve to the same address and that the
+        peer certificate covers the two of them. A ``421 Misdirected Request`` answer sends the
+        request again through a dedicated connection. Disabled by default.
+
+    :param request_coalescing:
+        Let concurrent ``GET`` and ``HEAD`` requests with identical URL and headers share a single
+        upstream request (singleflight). Each caller gets a response of its own over the same
+        buffered body. Requests with a body or a streamed response (``preload_content=False``)
+        are never coalesced. Disabled by default.
+
     :param \\**connection_pool_kw:
         Additional parameters are used to create fresh
         :class:`urllib3._async.connectionpool.AsyncConnectionPool` instances.
@@ -95,12 +173,18 @@ class AsyncPoolManager(AsyncRequestMethods):
         num_pools: int = 10,
         headers: typing.Mapping[str, str] | None = None,
         preemptive_quic_cache: QuicPreemptiveCacheType | None = None,
+        quic_session_tickets: QuicSessionTicketStore | Literal[False] | None = None,
         resolver: AsyncResolverDescription
         | list[AsyncResolverDescription]
         | str
         | list[str]
         | AsyncBaseResolver
         | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        memory_budget: int | MemoryBudget | None = None,
+        connection_coalescing: bool = False,
+        request_coalescing: bool = False,
         **connection_pool_kw: typing.Any,
     ) -> None:
         super().__init__(headers)
@@ -121,6 +205,16 @@ class AsyncPoolManager(AsyncRequestMethods):
                 connection_pool_kw = connection_pool_kw.copy()
                 connection_pool_kw["retries"] = retries
 
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
+
+        if retry_budget is not None or circuit_breaker is not None:
+            connection_pool_kw = connection_pool_kw.copy()
+            connection_pool_kw["retries"] = _apply_retry_policies(
+                connection_pool_kw.get("retries"), True, retry_budget, circuit_breaker
+            )
+
+        self._pool_key_memo = _PoolKeyMemo()
         self.connection_pool_kw = connection_pool_kw
 
         self._num_pools = num_pools
@@ -142,6 +236,33 @@ class AsyncPoolManager(AsyncRequestMethods):
 
         self._preemptive_quic_cache = preemptive_quic_cache
 
+        #: QUIC session tickets, so that reconnecting to an HTTP/3 origin resume the TLS session.
+        self._quic_session_tickets: QuicSessionTicketStore | None = (
+            QuicSessionTicketStore()
+            if quic_session_tickets is None
+            else quic_session_tickets
+            if quic_session_tickets is not False
+            else None
+        )
+
+        #: Shared by every connection, monitor the buffered bytes with ``memory_budget.usage``.
+        self.memory_budget: MemoryBudget | None = (
+            MemoryBudget(memory_budget)
+            if isinstance(memory_budget, int)
+            else memory_budget
+        )
+
+        self._connection_coalescing = connection_coalescing
+        #: addresses resolved for the hosts that ride the connection of another host, until when they are trusted.
+        self._coalesced_addresses: dict[PoolKey, tuple[frozenset[str], float]] = {}
+        #: hosts that answered 421 Misdirected Request, they always get a connection of their own.
+        self._coalescing_denied: set[PoolKey] = set()
+
+        #: identical GET/HEAD requests in flight, shared between the concurrent callers.
+        self._request_coalescer: AsyncRequestCoalescer | None = (
+            AsyncRequestCoalescer() if request_coalescing else None
+        )
+
         self._own_resolver = not isinstance(resolver, AsyncBaseResolver)
 
         if resolver is None:
@@ -197,6 +318,15 @@ class AsyncPoolManager(AsyncRequestMethods):
             else resolver
         )
 
+    @property
+    def connection_pool_kw(self) -> dict[str, typing.Any]:
+        return self._connection_pool_kw
+
+    @connection_pool_kw.setter
+    def connection_pool_kw(self, value: typing.Mapping[str, typing.Any]) -> None:
+        self._connection_pool_kw = _ConnectionPoolKw(value)
+        self._pool_key_memo.clear()
+
     async def __aenter__(self: _SelfT) -> _SelfT:
         return self
 
@@ -247,6 +377,10 @@ class AsyncPoolManager(AsyncRequestMethods):
                 request_context.pop(kw, None)
 
         request_context["preemptive_quic_cache"] = self._preemptive_quic_cache
+        request_context["quic_session_tickets"] = self._quic_session_tickets
+
+        if self.memory_budget is not None:
+            request_context["memory_budget"] = self.memory_budget
 
         if not self._resolver.is_available():
             self._resolver = self._resolver.recycle()
@@ -267,6 +401,7 @@ class AsyncPoolManager(AsyncRequestMethods):
         reused after completion.
         """
         await self.pools.clear()
+        self._coalesced_addresses.clear()
 
         if self._own_resolver and self._resolver.is_available():
             await self._resolver.close()
@@ -298,7 +433,62 @@ class AsyncPoolManager(AsyncRequestMethods):
         request_context["port"] = port
         request_context["host"] = host
 
-        return await self.connection_from_context(request_context)
+        # a subclass may customize connection_from_context, the memo must not bypass it.
+        if (
+            type(self).connection_from_context
+            is not AsyncPoolManager.connection_from_context
+        ):
+            return await self.connection_from_context(request_context)
+
+        pool_key = self._memoized_pool_key(request_context, pool_kwargs)
+
+        if pool_key is None:
+            return await self.connection_from_context(request_context)
+
+        if self._preemptive_quic_cache is not None:
+            request_context["preemptive_quic_cache"] = self._preemptive_quic_cache
+
+        return await self.connection_from_pool_key(
+            pool_key, request_context=request_context
+        )
+
+    def _memoized_pool_key(
+        self,
+        request_context: dict[str, typing.Any],
+        pool_kwargs: dict[str, typing.Any] | None,
+    ) -> PoolKey | None:
+        """Retrieve (or compute then remember) the PoolKey for a given request context.
+        Return None when the context cannot be memoized, e.g. an extension scheme like wss://
+        that rewrite the context or unhashable pool kwargs."""
+        pool_key_constructor = self.key_fn_by_scheme.get(
+            request_context["scheme"].lower()
+        )
+
+        if pool_key_constructor is None:
+            return None
+
+        memo_key = _PoolKeyMemo.key(
+            request_context["scheme"],
+            request_context["host"],
+            request_context["port"],
+            pool_kwargs,
+            pool_key_constructor,
+            self.connection_pool_kw,
+        )
+
+        if memo_key is None:
+            return None
+
+        if "strict" in request_context:
+            request_context.pop("strict")
+
+        pool_key = self._pool_key_memo.get(memo_key)
+
+        if pool_key is None:
+            pool_key = pool_key_constructor(request_context)
+            self._pool_key_memo.put(memo_key, pool_key)
+
+        return pool_key
 
     async def connection_from_context(
         self, request_context: dict[str, typing.Any]
@@ -422,6 +612,84 @@ class AsyncPoolManager(AsyncRequestMethods):
             u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
         )
 
+    async def _connection_from_coalescing(
+        self, host: str, port: int | None, pool_kwargs: dict[str, typing.Any] | None
+    ) -> tuple[PoolKey, AsyncHTTPConnectionPool, frozenset[str]] | None:
+        """
+        Find the pool of another host with a connection able to carry the requests for given host.
+        It is only looked after as long as the host has no pool of its own. Return the pool key
+        of the host, the pool to use and the addresses the host resolve to, or None if no connection
+        can be coalesced.
+        """
+        request_context = self._merge_pool_kwargs(pool_kwargs)
+        request_context["scheme"] = "https"
+        request_context["port"] = port or port_by_scheme["https"]
+        request_context["host"] = host
+
+        pool_key = self._memoized_pool_key(request_context, pool_kwargs)
+
+        if (
+            pool_key is None
+            or pool_key in self._coalescing_denied
+            or await self.pools.beacon(pool_key)
+        ):
+            return None
+
+        # the pools that only differ by their host are eligible, the TLS settings must match.
+        candidates = [
+            (key, pool)
+            for key, pool in list(self.pools._map.items())
+            if type(key) is type(pool_key)
+            and key != pool_key
+            and key._replace(key_host=pool_key.key_host) == pool_key
+        ]
+
+        if not candidates:
+            return None
+
+        now = time.monotonic()
+        addresses, trusted_until = self._coalesced_addresses.get(
+            pool_key, (frozenset(), now)
+        )
+
+        if trusted_until <= now:
+            try:
+                records = await self._resolver.getaddrinfo(
+                    host,
+                    request_context["port"],
+                    socket.AF_UNSPEC,
+                    socket.SOCK_STREAM,
+                )
+            except OSError:
+                return None
+
+            addresses = frozenset(str(info[-1][0]) for info in records)
+            trusted_until = now + (
+                min(records.ttl, _COALESCED_ADDRESSES_MAX_AGE)
+                if isinstance(records, ResolutionResult)
+                else _COALESCED_ADDRESSES_MAX_AGE
+            )
+
+        for carrier_key, carrier in candidates:
+            if not carrier._can_coalesce(host, addresses):
+                continue
+
+            self._coalesced_addresses[pool_key] = addresses, trusted_until
+
+            request_context["host"] = carrier_key.key_host
+
+            return (
+                pool_key,
+                await self.connection_from_pool_key(
+                    carrier_key, request_context=request_context
+                ),
+                addresses,
+            )
+
+        self._coalesced_addresses.pop(pool_key, None)
+
+        return None
+
     def _merge_pool_kwargs(
         self, override: dict[str, typing.Any] | None
     ) -> dict[str, typing.Any]:
@@ -515,6 +783,47 @@ class AsyncPoolManager(AsyncRequestMethods):
         method = typing.cast(str, from_promise.get_parameter("method"))
         redirect = typing.cast(bool, from_promise.get_parameter("pm_redirect"))
 
+        coalesced_key = from_promise.get_parameter("pm_coalesced")
+
+        # The server refused to answer for that host on a coalesced connection.
+        if coalesced_key is not None and response.status == 421:
+            url = typing.cast(str, from_promise.get_parameter("pm_url"))
+            direct_headers = HTTPHeaderDict(from_promise.get_parameter("headers"))
+            direct_headers.discard("Host")
+            response_kw = typing.cast(
+                typing.MutableMapping[str, typing.Any],
+                from_promise.get_parameter("response_kw"),
+            )
+
+            log.info("Misdirected request %s, retrying on a dedicated connection", url)
+
+            self._coalescing_denied.add(coalesced_key)
+            await response.drain_conn()
+
+            new_promise = await self.urlopen(
+                method,
+                url,
+                redirect,
+                body=from_promise.get_parameter("body"),
+                headers=direct_headers,
+                retries=from_promise.get_parameter("retries"),
+                timeout=from_promise.get_parameter("timeout"),
+                pool_timeout=from_promise.get_parameter("pool_timeout"),
+                release_conn=True,
+                chunked=from_promise.get_parameter("chunked"),
+                body_pos=from_promise.get_parameter("body_pos"),
+                preload_content=from_promise.get_parameter("preload_content"),
+                decode_content=from_promise.get_parameter("decode_content"),
+                multiplexed=True,
+                **response_kw,
+            )
+
+            # the dedicated connection may not be multiplexed.
+            if not isinstance(new_promise, ResponsePromise):
+                return new_promise
+
+            return await self.get_response(promise=new_promise if promise else None)
+
         # Handle redirect?
         if redirect and response.get_redirect_location():
             url = typing.cast(str, from_promise.get_parameter("pm_url"))
@@ -525,6 +834,12 @@ class AsyncPoolManager(AsyncRequestMethods):
                 typing.Union[HTTPHeaderDict, None],
                 from_promise.get_parameter("headers"),
             )
+
+            # the authority was set for the coalesced connection.
+            if coalesced_key is not None:
+                headers = HTTPHeaderDict(headers)
+                headers.discard("Host")
+
             preload_content = typing.cast(
                 bool, from_promise.get_parameter("preload_content")
             )
@@ -607,6 +922,12 @@ class AsyncPoolManager(AsyncRequestMethods):
                 typing.Union[HTTPHeaderDict, None],
                 from_promise.get_parameter("headers"),
             )
+
+            # the authority was set for the coalesced connection.
+            if coalesced_key is not None:
+                headers = HTTPHeaderDict(headers)
+                headers.discard("Host")
+
             preload_content = typing.cast(
                 bool, from_promise.get_parameter("preload_content")
             )
@@ -672,6 +993,173 @@ class AsyncPoolManager(AsyncRequestMethods):
 
         return response
 
+    async def iter_responses(
+        self, promises: typing.Iterable[ResponsePromise]
+    ) -> typing.AsyncIterator[AsyncHTTPResponse]:
+        """
+        Retrieve the responses of given promises as they arrive on their connection rather
+        than in the order the requests were issued. Every stream of a connection is served in
+        a single pass, so a slow response does not hold back the ones of the same connection
+        that are already there.
+
+        Promises may span over several pools, but only the connection holding the oldest pending
+        promise is waited on. A response already there on another connection is retrieved
+        after that promise got its own.
+        """
+        pending = list(promises)
+
+        for promise in pending:
+            if not isinstance(promise, ResponsePromise):
+                raise TypeError(
+                    f"iter_responses only support ResponsePromise but received {type(promise)} instead."
+                )
+
+        while pending:
+            try:
+                async with self.pools.borrow(
+                    pending[0], block=False, not_idle_only=True
+                ) as pool:
+                    promise = await pool._wait_for_any_promise(pending)
+            except UnavailableTraffic:
+                promise = pending[0]  # let get_response() raise properly.
+
+            pending.remove(promise)
+
+            yield typing.cast(
+                AsyncHTTPResponse, await self.get_response(promise=promise)
+            )
+
+    async def request_many(
+        self,
+        requests: typing.Iterable[BatchRequest],
+        *,
+        concurrency: int = 16,
+        per_host: int | None = None,
+    ) -> typing.AsyncIterator[AsyncBatchResult]:
+        """
+        Issue a batch of requests, at most ``concurrency`` at a time, and yield their
+        outcome as they complete. A failed request yields its error instead of
+        interrupting the batch.
+
+        Each request is sent with ``multiplexed=True``, it rides an HTTP/2 or HTTP/3
+        connection as a new stream whenever possible instead of waiting for a free connection.
+        The requests are pulled from the given iterable only when there is room for them,
+        so the memory usage does not depend upon the batch size (a generator is welcome).
+
+        :param requests: Each being a URL (GET), a ``(method, url)`` pair or a
+            ``(method, url, kwargs)`` triple, ``kwargs`` being forwarded to :meth:`request`.
+        :param concurrency: Maximum number of requests in flight.
+        :param per_host: Maximum number of requests in flight per (scheme, host, port). Unlimited by default.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if per_host is not None and per_host < 1:
+            raise ValueError(f"per_host must be at least 1, got {per_host}")
+
+        source = iter(requests)
+        exhausted = False
+
+        #: requests waiting for their host to go below per_host, the oldest host first.
+        queues: dict[
+            tuple[str, str | None, int | None],
+            deque[tuple[BatchRequest, str, str, typing.Mapping[str, typing.Any]]],
+        ] = {}
+        queued = 0
+
+        inflight: dict[
+            asyncio.Task[AsyncHTTPResponse],
+            tuple[BatchRequest, tuple[str, str | None, int | None]],
+        ] = {}
+        inflight_per_host: dict[tuple[str, str | None, int | None], int] = {}
+
+        try:
+            while True:
+                while len(inflight) < concurrency:
+                    picked = None
+
+                    for host_key, queue in queues.items():
+                        if per_host is None or inflight_per_host[host_key] < per_host:
+                            picked = host_key, queue.popleft()
+                            queued -= 1
+
+                            if not queue:
+                                del queues[host_key]
+                            break
+
+                    # bounded by concurrency, the queues can't grow with the batch.
+                    while picked is None and not exhausted and queued < concurrency:
+                        try:
+                            request = next(source)
+                        except StopIteration:
+                            exhausted = True
+                            break
+
+                        method, url, request_kw = _unpack_batch_request(request)
+
+                        try:
+                            host_key = _batch_host_key(url)
+                        except LocationParseError as e:
+                            yield AsyncBatchResult(request, None, e)
+                            continue
+
+                        if (
+                            per_host is None
+                            or inflight_per_host.get(host_key, 0) < per_host
+                        ):
+                            picked = host_key, (request, method, url, request_kw)
+                        else:
+                            queues.setdefault(host_key, deque()).append(
+                                (request, method, url, request_kw)
+                            )
+                            queued += 1
+
+                    if picked is None:
+                        break
+
+                    host_key, (request, method, url, request_kw) = picked
+
+                    task = asyncio.ensure_future(
+                        self._request_in_batch(method, url, request_kw)
+                    )
+
+                    inflight[task] = (request, host_key)
+                    inflight_per_host[host_key] = inflight_per_host.get(host_key, 0) + 1
+
+                if not inflight:
+                    return
+
+                done, _ = await asyncio.wait(
+                    inflight, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    request, host_key = inflight.pop(task)
+                    inflight_per_host[host_key] -= 1
+
+                    error = task.exception()
+
+                    if error is None:
+                        yield AsyncBatchResult(request, task.result(), None)
+                    elif isinstance(error, Exception):
+                        yield AsyncBatchResult(request, None, error)
+                    else:
+                        raise error
+        finally:
+            for task in inflight:
+                task.cancel()
+
+    async def _request_in_batch(
+        self, method: str, url: str, request_kw: typing.Mapping[str, typing.Any]
+    ) -> AsyncHTTPResponse:
+        response = await self.request(method, url, multiplexed=True, **request_kw)
+
+        if isinstance(response, ResponsePromise):
+            return typing.cast(
+                AsyncHTTPResponse, await self.get_response(promise=response)
+            )
+
+        return response
+
     @typing.overload  # type: ignore[override]
     async def urlopen(
         self,
@@ -705,6 +1193,9 @@ class AsyncPoolManager(AsyncRequestMethods):
         The given ``url`` parameter must be absolute, such that an appropriate
         :class:`urllib3._async.connectionpool.AsyncConnectionPool` can be chosen for it.
         """
+        if self._request_coalescer is not None and is_coalescable(method, url, kw):
+            return await self._urlopen_coalesced(method, url, redirect, **kw)
+
         u = parse_url(url)
 
         if u.scheme is None:
@@ -738,9 +1229,38 @@ class AsyncPoolManager(AsyncRequestMethods):
 
             pool_kwargs["disabled_svn"] = disabled_svn
 
-        conn = await self.connection_from_host(
-            u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
-        )
+        if "headers" not in kw:
+            kw["headers"] = self.headers
+
+        coalesced = None
+
+        if (
+            self._connection_coalescing
+            and extension is None
+            and self.proxy is None
+            and u.scheme == "https"
+            and u.host is not None
+            and "host" not in (k.lower() for k in kw["headers"])
+        ):
+            coalesced = await self._connection_from_coalescing(
+                u.host, u.port, pool_kwargs
+            )
+
+        if coalesced is not None:
+            coalesced_key, conn, addresses = coalesced
+
+            # the connection was established for another host, the authority must be ours.
+            headers = kw["headers"]
+            kw["headers"] = HTTPHeaderDict(headers)
+            kw["headers"]["Host"] = u.netloc
+            # and the request must go over a connection verified to be able to carry it.
+            kw["coalescing"] = u.host, addresses
+        else:
+            coalesced_key = None
+
+            conn = await self.connection_from_host(
+                u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
+            )
 
         if u.scheme is not None and u.scheme.lower() not in ("http", "https"):
             from ..contrib.webextensions._async import load_extension
@@ -752,20 +1272,49 @@ class AsyncPoolManager(AsyncRequestMethods):
         kw["assert_same_host"] = False
         kw["redirect"] = False
 
-        if "headers" not in kw:
-            kw["headers"] = self.headers
+        if kw.get("retries") is not None and (
+            self._retry_budget is not None or self._circuit_breaker is not None
+        ):
+            kw["retries"] = _apply_retry_policies(
+                kw["retries"], redirect, self._retry_budget, self._circuit_breaker
+            )
 
-        if self._proxy_requires_url_absolute_form(u):
-            response = await conn.urlopen(method, url, **kw)
-        else:
-            response = await conn.urlopen(method, u.request_uri, **kw)
+        request_url = (
+            url if self._proxy_requires_url_absolute_form(u) else u.request_uri
+        )
+
+        try:
+            response = await conn.urlopen(method, request_url, **kw)
+        except EmptyPoolError:
+            if coalesced_key is None:
+                raise
+
+            # the connection able to carry the request is busy or went away meanwhile.
+            self.pools.release()
+
+            log.debug("No connection to coalesce %s onto, using a dedicated one", url)
+
+            coalesced_key = None
+            del kw["coalescing"]
+            kw["headers"] = headers
+
+            conn = await self.connection_from_host(
+                u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
+            )
+            response = await conn.urlopen(method, request_url, **kw)
 
         self.pools.release()
 
+        if coalesced_key is not None:
+            # whatever comes next (redirect, retry) is not bound to the coalesced connection.
+            del kw["coalescing"]
+            kw["headers"] = headers
+
         if kw.get("multiplexed"):
             if isinstance(response, ResponsePromise):
                 response.set_parameter("pm_redirect", redirect)
                 response.set_parameter("pm_url", url)
+                response.set_parameter("pm_coalesced", coalesced_key)
 
                 return response
 
@@ -773,6 +1322,17 @@ class AsyncPoolManager(AsyncRequestMethods):
             kw["multiplexed"] = False
 
         assert isinstance(response, AsyncHTTPResponse)
+
+        if coalesced_key is not None and response.status == 421:
+            log.info("Misdirected request %s, retrying on a dedicated connection", url)
+
+            self._coalescing_denied.add(coalesced_key)
+            await response.drain_conn()
+
+            kw["redirect"] = redirect
+
+            return await self.urlopen(method, url, **kw)  # type: ignore[no-any-return]
+
         redirect_location = redirect and response.get_redirect_location()
         if not redirect_location:
             return response
@@ -821,6 +1381,35 @@ class AsyncPoolManager(AsyncRequestMethods):
         await response.drain_conn()
         return await self.urlopen(method, redirect_location, **kw)  # type: ignore[no-any-return]
 
+    async def _urlopen_coalesced(
+        self, method: str, url: str, redirect: bool, **kw: typing.Any
+    ) -> AsyncHTTPResponse:
+        """Issue the request, or wait for the identical one already in flight, and return a response of our own."""
+        assert self._request_coalescer is not None
+
+        key = coalescing_key(method, url, redirect, kw.get("headers", self.headers))
+
+        async def _request() -> BufferedResponse:
+            response = await self.urlopen(
+                method, url, redirect, **{**kw, "preload_content": False}
+            )
+
+            return await BufferedResponse.from_async_response(response)
+
+        # a follower does not wait on the leader longer than its own request could have lasted.
+        timeout = wait_bound(kw.get("timeout", self.connection_pool_kw.get("timeout")))
+
+        buffered = await self._request_coalescer.get_or_request(key, _request, timeout)
+
+        decode_content = kw.get("decode_content", True)
+
+        response = AsyncHTTPResponse(
+            **buffered.response_kw(decode_content=decode_content, preload_content=False)
+        )
+        response._body = await response.read(decode_content=decode_content)
+
+        return response
+
     def __repr__(self) -> str:
         inner_repr = "; ".join(repr(p) for p in self.pools._registry.values())
 
@@ -1015,3 +1604,46 @@ class AsyncProxyManager(AsyncPoolManager):
 
 def proxy_from_url(url: str, **kw: typing.Any) -> AsyncProxyManager:
     return AsyncProxyManager(proxy_url=url, **kw)
+
+
+async def _buffered_in_batch(
+    response: typing.Awaitable[AsyncHTTPResponse],
+    request_kw: typing.Mapping[str, typing.Any],
+) -> HTTPResponse:
+    """Receive the whole body and hand it over as a (synchronous) HTTPResponse."""
+    buffered = await BufferedResponse.from_async_response(await response)
+
+    return HTTPResponse(
+        **buffered.response_kw(
+            decode_content=request_kw.get("decode_content", True),
+            preload_content=request_kw.get("preload_content", True),
+        )
+    )
+
+
+class _BatchPoolManager(AsyncPoolManager):
+    """Serve :meth:`urllib3.PoolManager.urlopen_many`, its responses are :class:`~urllib3.HTTPResponse`."""
+
+    async def _request_in_batch(  # type: ignore[override]
+        self, method: str, url: str, request_kw: typing.Mapping[str, typing.Any]
+    ) -> HTTPResponse:
+        return await _buffered_in_batch(
+            super()._request_in_batch(
+                method, url, {**request_kw, "preload_content": False}
+            ),
+            request_kw,
+        )
+
+
+class _BatchProxyManager(AsyncProxyManager):
+    """Serve :meth:`urllib3.ProxyManager.urlopen_many`, its responses are :class:`~urllib3.HTTPResponse`."""
+
+    async def _request_in_batch(  # type: ignore[override]
+        self, method: str, url: str, request_kw: typing.Mapping[str, typing.Any]
+    ) -> HTTPResponse:
+        return await _buffered_in_batch(
+            super()._request_in_batch(
+                method, url, {**request_kw, "preload_content": False}
+            ),
+            request_kw,
+        )
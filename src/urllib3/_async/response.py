@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import io
 import json as _json
+import os
 import sys
 import typing
 import warnings
@@ -27,8 +28,18 @@ from ..exceptions import (
     SSLError,
     MustRedialError,
 )
-from ..response import ContentDecoder, HTTPResponse
-from ..util.response import is_fp_closed, BytesQueueBuffer
+from ..response import (
+    JSON_SEQ_SEPARATOR,
+    ContentDecoder,
+    HTTPResponse,
+    _is_json_seq,
+)
+from ..util.response import (
+    is_fp_closed,
+    BytesQueueBuffer,
+    DownloadSink,
+    RecordSplitter,
+)
 from ..util.retry import Retry
 from .connection import AsyncHTTPConnection
 
@@ -38,6 +49,7 @@ if typing.TYPE_CHECKING:
     from .._async.connectionpool import AsyncHTTPConnectionPool
     from ..contrib.webextensions._async import AsyncExtensionFromHTTP
     from ..util._async.traffic_police import AsyncTrafficPolice
+    from ..util.response import _Hasher
 
 
 class AsyncHTTPResponse(HTTPResponse):
@@ -255,17 +267,21 @@ class AsyncHTTPResponse(HTTPResponse):
 
         self._extension = item
 
-    async def json(self) -> typing.Any:
+    async def json(
+        self, loads: typing.Callable[[bytes], typing.Any] | None = None
+    ) -> typing.Any:
         """
         Parses the body of the HTTP response as JSON.
 
-        To use a custom JSON decoder pass the result of :attr:`HTTPResponse.data` to the decoder.
+        To use a custom JSON decoder, such as ``orjson.loads`` or ``msgspec.json.decode``,
+        pass it as ``loads``. It is given the body as bytes, without going through a ``str``.
 
-        This method can raise either `UnicodeDecodeError` or `json.JSONDecodeError`.
+        This method can raise either `UnicodeDecodeError` or `json.JSONDecodeError`
+        (or whatever the custom decoder raises).
 
         Read more :ref:`here <json>`.
         """
-        return _json.loads(await self.data)
+        return (loads or _json.loads)(await self.data)
 
     @property
     async def data(self) -> bytes:  # type: ignore[override]
@@ -607,6 +623,50 @@ class AsyncHTTPResponse(HTTPResponse):
             if data:
                 yield data
 
+    async def iter_json_lines(  # type: ignore[override]
+        self, loads: typing.Callable[[bytes], typing.Any] | None = None
+    ) -> typing.AsyncIterator[typing.Any]:
+        """
+        Parses the body as a stream of JSON records, see :meth:`HTTPResponse.iter_json_lines`.
+        """
+        loads = loads or _json.loads
+        splitter = RecordSplitter(
+            JSON_SEQ_SEPARATOR if _is_json_seq(self.headers) else b"\n"
+        )
+
+        async for chunk in self.stream(-1, decode_content=True):
+            for record in splitter.feed(chunk):
+                yield loads(record)
+
+        for record in splitter.close():
+            yield loads(record)
+
+    async def download_to(  # type: ignore[override]
+        self,
+        file: str | os.PathLike[str] | int,
+        *,
+        hashes: typing.Iterable[_Hasher] = (),
+        fsync: bool | int = False,
+        decode_content: bool | None = None,
+        chunk_size: int = 2**16,
+    ) -> int:
+        """
+        Write the body to the given file as it is received, see :meth:`HTTPResponse.download_to`.
+        The writes are done by the event loop thread, they are not offloaded.
+        """
+        sink = DownloadSink(file, self._download_length(decode_content), hashes, fsync)
+
+        try:
+            async for chunk in self.stream(chunk_size, decode_content=decode_content):
+                sink.write(chunk)
+        except BaseException:
+            sink.close(failed=True)
+            raise
+
+        sink.close()
+
+        return sink.written
+
     async def close(self) -> None:  # type: ignore[override]
         if self.extension is not None and not self.extension.closed:
             await self.extension.close()
@@ -21,6 +21,7 @@ if typing.TYPE_CHECKING:
 __all__ = [
     "RecentlyUsedContainer",
     "HTTPHeaderDict",
+    "LazyHTTPHeaderDict",
     "GroupedDict",
 ]
 
@@ -445,6 +446,219 @@ class HTTPHeaderDict(typing.MutableMapping[str, str]):
         return False
 
 
+@lru_cache(maxsize=64)
+def _lower_bytes_wrapper(string: str) -> bytes | None:
+    """Same reasoning as _lower_wrapper, but we want the wire representation of the key."""
+    try:
+        return string.lower().encode("ascii")
+    except UnicodeEncodeError:
+        # a header name is ascii only, this key cannot exist.
+        return None
+
+
+class LazyHTTPHeaderDict(HTTPHeaderDict):
+    """
+    A :class:`HTTPHeaderDict` that is directly backed by the raw header block
+    yielded by our protocol state machines (``list[tuple[bytes, bytes]]``).
+
+    Most responses are only queried for two or three headers, therefore we
+    do not decode nor lowercase anything ahead of time. A tiny index (lowered name to
+    first position) is computed on the first lookup, and only the values
+    being asked for are decoded.
+
+    Any mutation, or a call that needs the whole container, materializes
+    the regular ``HTTPHeaderDict`` storage. From there the instance behave exactly
+    like its parent.
+
+    >>> headers = LazyHTTPHeaderDict.from_raw([(b"Content-Type", b"text/plain"), (b"set-cookie", b"a=b")])
+    >>> headers['content-type']
+    'text/plain'
+    """
+
+    _raw: typing.Sequence[tuple[bytes, bytes]] | None
+    _names: list[bytes] | None
+    _index: dict[bytes, int] | None
+    _materialized: typing.MutableMapping[str, list[str]] | None
+
+    def __init__(self, headers: ValidHTTPHeaderSource | None = None, **kwargs: str):
+        self._raw = None
+        self._names = None
+        self._index = None
+        self._materialized = None
+        super().__init__(headers, **kwargs)
+
+    @classmethod
+    def from_raw(cls, raw: typing.Sequence[tuple[bytes, bytes]]) -> LazyHTTPHeaderDict:
+        """Wrap a raw header block without copying it. The given list MUST NOT
+        contain pseudo headers (e.g. ``:status``) and MUST NOT be mutated afterward."""
+        headers = cls.__new__(cls)
+        headers._raw = raw
+        headers._names = None
+        headers._index = None
+        headers._materialized = None
+        return headers
+
+    @property
+    def _container(self) -> typing.MutableMapping[str, list[str]]:
+        if self._materialized is None:
+            self._materialize()
+        return self._materialized  # type: ignore[return-value]
+
+    @_container.setter
+    def _container(self, value: typing.MutableMapping[str, list[str]]) -> None:
+        self._raw = None
+        self._names = None
+        self._index = None
+        self._materialized = value
+
+    def _materialize(self) -> None:
+        raw = self._raw
+        self._container = {}
+
+        if raw:
+            for raw_header, raw_value in raw:
+                HTTPHeaderDict.add(
+                    self, raw_header.decode("ascii"), raw_value.decode("iso-8859-1")
+                )
+
+    def _build_index(self) -> dict[bytes, int]:
+        assert self._raw is not None
+
+        self._names = [raw_header.lower() for raw_header, _ in self._raw]
+        self._index = {}
+
+        for position, name in enumerate(self._names):
+            if name not in self._index:
+                self._index[name] = position
+
+        return self._index
+
+    def _lazy_values(self, key: str) -> list[str] | None:
+        """Only called while not materialized. None means key is absent."""
+        index = self._index if self._index is not None else self._build_index()
+
+        lowered_key = _lower_bytes_wrapper(key)
+
+        if lowered_key is None:
+            return None
+
+        position = index.get(lowered_key)
+
+        if position is None:
+            return None
+
+        raw = self._raw
+        names = self._names
+
+        assert raw is not None and names is not None
+
+        # fast path, the vast majority of headers are not repeated.
+        if len(index) == len(names):
+            return [raw[position][1].decode("iso-8859-1")]
+
+        return [
+            raw[cursor][1].decode("iso-8859-1")
+            for cursor in range(position, len(names))
+            if names[cursor] == lowered_key
+        ]
+
+    def __getitem__(self, key: str) -> str:
+        if self._materialized is not None:
+            return super().__getitem__(key)
+
+        if isinstance(key, bytes):
+            key = key.decode("latin-1")
+
+        values = self._lazy_values(key)
+
+        if values is None:
+            raise KeyError(key)
+
+        return ", ".join(values)
+
+    def __contains__(self, key: object) -> bool:
+        if self._materialized is not None:
+            return super().__contains__(key)
+
+        if isinstance(key, bytes):
+            key = key.decode("latin-1")
+        if isinstance(key, str):
+            index = self._index if self._index is not None else self._build_index()
+            lowered_key = _lower_bytes_wrapper(key)
+            return lowered_key is not None and lowered_key in index
+        return False
+
+    def __len__(self) -> int:
+        if self._materialized is not None:
+            return super().__len__()
+
+        index = self._index if self._index is not None else self._build_index()
+
+        return len(index)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        if self._materialized is not None:
+            yield from super().__iter__()
+            return
+
+        index = self._index if self._index is not None else self._build_index()
+        raw = self._raw
+
+        assert raw is not None
+
+        # dict preserve insertion order, thus the first seen case-sensitive key.
+        for position in index.values():
+            yield raw[position][0].decode("ascii")
+
+    @typing.overload
+    def getlist(self, key: str) -> list[str]: ...
+
+    @typing.overload
+    def getlist(self, key: str, default: _DT) -> list[str] | _DT: ...
+
+    def getlist(
+        self, key: str, default: _Sentinel | _DT = _Sentinel.not_passed
+    ) -> list[str] | _DT:
+        if self._materialized is not None:
+            if default is _Sentinel.not_passed:
+                return super().getlist(key)
+            return super().getlist(key, default)
+
+        if isinstance(key, bytes):
+            key = key.decode("latin-1")
+
+        values = self._lazy_values(key)
+
+        if values is None:
+            if default is _Sentinel.not_passed:
+                return []
+            return default
+
+        return values
+
+    # Backwards compatibility for httplib
+    getheaders = getlist
+    getallmatchingheaders = getlist
+    iget = getlist
+
+    # Backwards compatibility for http.cookiejar
+    get_all = getlist
+
+    def __repr__(self) -> str:
+        # we are meant to be a transparent drop-in for HTTPHeaderDict.
+        return f"HTTPHeaderDict({dict(self.itermerged())})"
+
+    def copy(self) -> HTTPHeaderDict:
+        if self._materialized is None:
+            assert self._raw is not None
+            # the raw block is never mutated, sharing it is safe.
+            return type(self).from_raw(self._raw)
+
+        clone = HTTPHeaderDict()
+        clone._copy_from(self)
+        return clone
+
+
 _GK = typing.TypeVar("_GK", bound=typing.Hashable)
 _GV = typing.TypeVar("_GV")
 
@@ -240,6 +240,11 @@ except OSError:  # Defensive: should be unreachable, overly protective.
 
 TCP_DEFAULT_BLOCKSIZE: int = DEFAULT_BLOCKSIZE
 
+#: The adaptive receive size of a stream connection starts (and never go below) one TLS record.
+MINIMAL_RECV_BLOCKSIZE: int = 16384
+#: Consecutive short reads (at most half the receive size) before it is halved.
+RECV_BLOCKSIZE_SHRINK_AFTER: int = 8
+
 UDP_LINUX_GRO: int = 104
 UDP_LINUX_SEGMENT: int = 103
 
@@ -256,6 +261,20 @@ MINIMAL_KEEPALIVE_IDLE_WINDOW: float = 1.0
 
 DEFAULT_TCP_KEEPALIVE_ATTEMPT_COUNT: int = 2
 
+# Hedged requests, see ``hedge_after`` in HTTPConnectionPool.urlopen
+HEDGEABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
+DEFAULT_HEDGE_DELAY: float = 0.1
+HEDGE_LATENCY_SAMPLES: int = 128
+HEDGE_LATENCY_MIN_SAMPLES: int = 16
+HEDGE_POLL_INTERVAL: float = 0.005
+#: Streams we reset ourselves that are remembered per connection to drop their late events.
+MAX_ABORTED_STREAMS: int = 128
+
+# QUIC session resumption, see QuicSessionTicketStore
+DEFAULT_QUIC_SESSION_TICKETS: int = 128
+#: Only safe methods are sent in 0-RTT, early data can be replayed (RFC 8470).
+EARLY_DATA_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 C_INT_MAX = 2**31 - 1
 CHUNK_AMT_MAX = 2**28
 
@@ -4,15 +4,15 @@ import json as _json
 import typing
 from urllib.parse import urlencode
 
-from ._async.response import AsyncHTTPResponse
 from ._collections import HTTPHeaderDict
 from ._typing import _TYPE_ASYNC_BODY, _TYPE_BODY, _TYPE_ENCODE_URL_FIELDS, _TYPE_FIELDS
-from .filepost import encode_multipart_formdata
+from .filepost import MultipartEncoder
 from .response import HTTPResponse
 
 if typing.TYPE_CHECKING:
     from typing_extensions import Literal
 
+    from ._async.response import AsyncHTTPResponse
     from .backend import ResponsePromise
 
 __all__ = ["RequestMethods", "AsyncRequestMethods"]
@@ -295,6 +295,11 @@ class RequestMethods:
         When uploading a file, providing a filename (the first parameter of the
         tuple) is optional but recommended to best mimic behavior of browsers.
 
+        The data of a file tuple can also be a binary file object, e.g.
+        ``('video.mp4', open('video.mp4', 'rb'))``. It is then streamed in chunks
+        through :class:`urllib3.filepost.MultipartEncoder` instead of being loaded
+        in memory, the ``Content-Length`` being computed upfront.
+
         Note that if ``headers`` are supplied, the 'Content-Type' header will
         be overwritten because it depends on the dynamic random boundary string
         which is used to compose the body of the request. The random boundary
@@ -304,7 +309,7 @@ class RequestMethods:
             headers = self.headers
 
         extra_kw: dict[str, typing.Any] = {"headers": HTTPHeaderDict(headers)}
-        body: bytes | str
+        body: bytes | str | MultipartEncoder
 
         if fields:
             if "body" in urlopen_kw:
@@ -313,9 +318,12 @@ class RequestMethods:
                 )
 
             if encode_multipart:
-                body, content_type = encode_multipart_formdata(
-                    fields, boundary=multipart_boundary
-                )
+                body = MultipartEncoder(fields, boundary=multipart_boundary)
+                content_type = body.content_type
+
+                # file objects are read lazily while sending, the rest is as cheap as bytes.
+                if not body.streaming:
+                    body = body.read()
             else:
                 body, content_type = (
                     urlencode(fields),  # type: ignore[arg-type]
@@ -607,6 +615,11 @@ class AsyncRequestMethods:
         When uploading a file, providing a filename (the first parameter of the
         tuple) is optional but recommended to best mimic behavior of browsers.
 
+        The data of a file tuple can also be a binary file object, e.g.
+        ``('video.mp4', open('video.mp4', 'rb'))``. It is then streamed in chunks
+        through :class:`urllib3.filepost.MultipartEncoder` instead of being loaded
+        in memory, the ``Content-Length`` being computed upfront.
+
         Note that if ``headers`` are supplied, the 'Content-Type' header will
         be overwritten because it depends on the dynamic random boundary string
         which is used to compose the body of the request. The random boundary
@@ -616,7 +629,7 @@ class AsyncRequestMethods:
             headers = self.headers
 
         extra_kw: dict[str, typing.Any] = {"headers": HTTPHeaderDict(headers)}
-        body: bytes | str
+        body: bytes | str | MultipartEncoder
 
         if fields:
             if "body" in urlopen_kw:
@@ -625,9 +638,12 @@ class AsyncRequestMethods:
                 )
 
             if encode_multipart:
-                body, content_type = encode_multipart_formdata(
-                    fields, boundary=multipart_boundary
-                )
+                body = MultipartEncoder(fields, boundary=multipart_boundary)
+                content_type = body.content_type
+
+                # file objects are read lazily while sending, the rest is as cheap as bytes.
+                if not body.streaming:
+                    body = body.read()
             else:
                 body, content_type = (
                     urlencode(fields),  # type: ignore[arg-type]
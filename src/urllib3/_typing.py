@@ -4,7 +4,6 @@ import typing
 from enum import Enum
 
 from .backend import LowLevelResponse
-from .backend._async import AsyncLowLevelResponse
 from .fields import RequestField
 from .util.request import _TYPE_FAILEDTELL
 from .util.timeout import _TYPE_DEFAULT, Timeout
@@ -12,6 +11,8 @@ from .util.timeout import _TYPE_DEFAULT, Timeout
 if typing.TYPE_CHECKING:
     import ssl
 
+    from .backend._async import AsyncLowLevelResponse
+
     from typing_extensions import Literal, TypedDict
 
     class _TYPE_PEER_CERT_RET_DICT(TypedDict, total=False):
@@ -27,7 +28,7 @@ _TYPE_BODY: typing.TypeAlias = typing.Union[
     typing.Iterable[str],
     str,
     LowLevelResponse,
-    AsyncLowLevelResponse,
+    "AsyncLowLevelResponse",
 ]
 
 _TYPE_ASYNC_BODY: typing.TypeAlias = typing.Union[
@@ -36,10 +37,13 @@ _TYPE_ASYNC_BODY: typing.TypeAlias = typing.Union[
 ]
 
 _TYPE_FIELD_VALUE: typing.TypeAlias = typing.Union[str, bytes]
+_TYPE_FIELD_DATA: typing.TypeAlias = typing.Union[
+    _TYPE_FIELD_VALUE, typing.IO[bytes], typing.IO[str]
+]
 _TYPE_FIELD_VALUE_TUPLE: typing.TypeAlias = typing.Union[
-    _TYPE_FIELD_VALUE,
-    typing.Tuple[str, _TYPE_FIELD_VALUE],
-    typing.Tuple[str, _TYPE_FIELD_VALUE, str],
+    _TYPE_FIELD_DATA,
+    typing.Tuple[str, _TYPE_FIELD_DATA],
+    typing.Tuple[str, _TYPE_FIELD_DATA, str],
 ]
 
 _TYPE_FIELDS_SEQUENCE: typing.TypeAlias = typing.Sequence[
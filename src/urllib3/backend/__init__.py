@@ -6,8 +6,10 @@ from ._base import (
     HttpVersion,
     LowLevelResponse,
     QuicPreemptiveCacheType,
+    QuicSessionTicketStore,
     ResponsePromise,
 )
+from ..contrib.hface import MemoryBudget
 from .hface import HfaceBackend
 
 __all__ = (
@@ -15,6 +17,8 @@ __all__ = (
     "HfaceBackend",
     "HttpVersion",
     "QuicPreemptiveCacheType",
+    "QuicSessionTicketStore",
+    "MemoryBudget",
     "LowLevelResponse",
     "ConnectionInfo",
     "ResponsePromise",
@@ -338,6 +338,19 @@ class AsyncBaseBackend(BaseBackend):
         """
         raise NotImplementedError
 
+    async def wait_for_response(  # type: ignore[override]
+        self, promise: ResponsePromise, timeout: float
+    ) -> bool:
+        raise NotImplementedError
+
+    async def wait_for_any_response(  # type: ignore[override]
+        self, promises: typing.Sequence[ResponsePromise], timeout: float | None = None
+    ) -> ResponsePromise | None:
+        raise NotImplementedError
+
+    async def abort_promise(self, promise: ResponsePromise) -> None:  # type: ignore[override]
+        raise NotImplementedError
+
     async def close(self) -> None:  # type: ignore[override]
         """End the connection, do some reinit, closing of fd, etc..."""
         raise NotImplementedError
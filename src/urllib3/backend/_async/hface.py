@@ -9,15 +9,17 @@ from socket import timeout as SocketTimeout
 
 from ...contrib.anytls import ssl, Certificate
 
-from ..._collections import HTTPHeaderDict
+from ..._collections import HTTPHeaderDict, LazyHTTPHeaderDict
 from ..._constant import (
     DEFAULT_BLOCKSIZE,
     DEFAULT_KEEPALIVE_DELAY,
+    MAX_ABORTED_STREAMS,
     UDP_DEFAULT_BLOCKSIZE,
     responses,
     HTTP1_ONLY_HEADERS,
     DEFAULT_BACKGROUND_WATCH_WINDOW,
     DEFAULT_KEEPALIVE_IDLE_WINDOW,
+    EARLY_DATA_METHODS,
 )
 from ...contrib.hface import (
     HTTP1Protocol,
@@ -26,6 +28,7 @@ from ...contrib.hface import (
     HTTPOverQUICProtocol,
     HTTPOverTCPProtocol,
     HTTPProtocolFactory,
+    MemoryBudget,
     QuicTLSConfig,
 )
 from ...contrib.hface.events import (
@@ -48,13 +51,17 @@ from ...exceptions import (
     SSLError,
 )
 from ...util import parse_alt_svc, resolve_cert_reqs, parse_url
+from ...util.ssl_ import _TrustStore
 from ...util.socket_state import enable_keepalive
 from ...util.sub_timeout import AsyncSubTimeout
 from .._base import (
     ConnectionInfo,
     HttpVersion,
     QuicPreemptiveCacheType,
+    QuicSessionTicketStore,
     ResponsePromise,
+    _quic_tls_context,
+    _resumed_peer_is_trusted,
 )
 from ..hface import _HAS_HTTP3_SUPPORT, _HAS_SYS_AUDIT
 from ._base import AsyncBaseBackend, AsyncDirectStreamAccess, AsyncLowLevelResponse
@@ -83,6 +90,9 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         keepalive_delay: float | int | None = DEFAULT_KEEPALIVE_DELAY,
         background_watch_delay: int | float | None = DEFAULT_BACKGROUND_WATCH_WINDOW,
         keepalive_idle_window: int | float | None = DEFAULT_KEEPALIVE_IDLE_WINDOW,
+        quic_session_tickets: QuicSessionTicketStore | None = None,
+        flow_control_budget: int | None = None,
+        memory_budget: MemoryBudget | None = None,
     ):
         if not _HAS_HTTP3_SUPPORT() or not _HAS_DGRAM_SUPPORT:
             if disabled_svn is None:
@@ -101,6 +111,9 @@ class AsyncHfaceBackend(AsyncBaseBackend):
             keepalive_delay=keepalive_delay,
             background_watch_delay=background_watch_delay,
             keepalive_idle_window=keepalive_idle_window,
+            quic_session_tickets=quic_session_tickets,
+            flow_control_budget=flow_control_budget,
+            memory_budget=memory_budget,
         )
 
         self._proxy_protocol: HTTPOverTCPProtocol | None = None
@@ -118,12 +131,23 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         self.__authority_bit_set: bool = False
         self.__legacy_host_entry: bytes | None = None
         self.__protocol_bit_set: bool = False
+        #: RFC 9218 Priority field value of the request being prepared, if any.
+        self.__priority: bytes | None = None
 
         # h3 specifics
         self.__custom_tls_settings: QuicTLSConfig | None = None
         self.__alt_authority: tuple[str, int] | None = None
         self.__origin_port: int | None = None
 
+        # QUIC session resumption, the (host, port) and TLS verification context the ticket belongs to.
+        self.__quic_authority: tuple[str, int] | None = None
+        self.__quic_tls_context: typing.Hashable = None
+        #: The handshake is left unfinished so that safe requests go in 0-RTT.
+        self._early_data_pending: bool = False
+        self.__early_data_sent: bool = False
+        #: What we knew of the peer when the session ticket was issued.
+        self.__resumed_conn_info: ConnectionInfo | None = None
+
         # automatic upgrade shield against errors!
         self._max_tolerable_delay_for_upgrade: float | None = None
 
@@ -346,12 +370,7 @@ class AsyncHfaceBackend(AsyncBaseBackend):
             and ca_cert_data is None
             and not ssl_ctx_have_certs
         ):
-            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-
-            if hasattr(ssl_context, "load_default_certs"):
-                ssl_context.load_default_certs()
-            else:
-                ssl_context = None
+            ssl_context = _TrustStore.default_context()
 
         if ssl_context:
             cert_use_common_name = (
@@ -362,18 +381,7 @@ class AsyncHfaceBackend(AsyncBaseBackend):
                 allow_insecure = True
 
             if ca_certs is None and ca_cert_dir is None and ca_cert_data is None:
-                try:
-                    ctx_root_certificates: list[bytes] = ssl_context.get_ca_certs(True)
-                except (
-                    AttributeError,
-                    NotImplementedError,
-                ):  # Defensive: in case of ssl monkeypatch
-                    ctx_root_certificates = []
-
-                if ctx_root_certificates:
-                    ca_cert_data = "\n".join(
-                        ssl.DER_cert_to_PEM_cert(cert) for cert in ctx_root_certificates
-                    )
+                ca_cert_data = _TrustStore.ca_bundle(ssl_context)
 
             if (
                 assert_hostname is None
@@ -471,7 +479,11 @@ class AsyncHfaceBackend(AsyncBaseBackend):
 
                 if alpn is not None:
                     if alpn == "h2":
-                        self._protocol = HTTPProtocolFactory.new(HTTP2Protocol)  # type: ignore[type-abstract]
+                        self._protocol = HTTPProtocolFactory.new(
+                            HTTP2Protocol,  # type: ignore[type-abstract]
+                            flow_control_budget=self._flow_control_budget,
+                            memory_budget=self._memory_budget,
+                        )
                         self._svn = HttpVersion.h2
                     elif alpn == "http/1.1":
                         self._protocol = HTTPProtocolFactory.new(HTTP1Protocol)  # type: ignore[type-abstract]
@@ -487,7 +499,11 @@ class AsyncHfaceBackend(AsyncBaseBackend):
                         self._protocol = HTTPProtocolFactory.new(HTTP1Protocol)  # type: ignore[type-abstract]
                         self._svn = HttpVersion.h11
                     elif HttpVersion.h2 not in self._disabled_svn:
-                        self._protocol = HTTPProtocolFactory.new(HTTP2Protocol)  # type: ignore[type-abstract]
+                        self._protocol = HTTPProtocolFactory.new(
+                            HTTP2Protocol,  # type: ignore[type-abstract]
+                            flow_control_budget=self._flow_control_budget,
+                            memory_budget=self._memory_budget,
+                        )
                         self._svn = HttpVersion.h2
                     else:
                         raise RuntimeError(
@@ -501,7 +517,11 @@ class AsyncHfaceBackend(AsyncBaseBackend):
                     self._protocol = HTTPProtocolFactory.new(HTTP1Protocol)  # type: ignore[type-abstract]
                     self._svn = HttpVersion.h11
                 elif HttpVersion.h2 not in self._disabled_svn:
-                    self._protocol = HTTPProtocolFactory.new(HTTP2Protocol)  # type: ignore[type-abstract]
+                    self._protocol = HTTPProtocolFactory.new(
+                        HTTP2Protocol,  # type: ignore[type-abstract]
+                        flow_control_budget=self._flow_control_budget,
+                        memory_budget=self._memory_budget,
+                    )
                     self._svn = HttpVersion.h2
                 else:
                     raise RuntimeError(
@@ -510,7 +530,11 @@ class AsyncHfaceBackend(AsyncBaseBackend):
                     )
         else:
             if self._svn == HttpVersion.h2:
-                self._protocol = HTTPProtocolFactory.new(HTTP2Protocol)  # type: ignore[type-abstract]
+                self._protocol = HTTPProtocolFactory.new(
+                    HTTP2Protocol,  # type: ignore[type-abstract]
+                    flow_control_budget=self._flow_control_budget,
+                    memory_budget=self._memory_budget,
+                )
             elif self._svn == HttpVersion.h3:
                 assert self.__custom_tls_settings is not None
 
@@ -520,6 +544,51 @@ class AsyncHfaceBackend(AsyncBaseBackend):
                 else:
                     server, port = self.host, self.port
 
+                # resume a previous session if we can. we don't with a client certificate
+                # as the ticket store is shared between pools that may not share the identity.
+                if (
+                    self._quic_session_tickets is not None
+                    and not self.__custom_tls_settings.certfile
+                ):
+                    self.__quic_authority = (server, int(port))
+                    self.__quic_tls_context = _quic_tls_context(
+                        self.__custom_tls_settings
+                    )
+                    resumable = self._quic_session_tickets.pop(
+                        self.__quic_authority, tls_context=self.__quic_tls_context
+                    )
+
+                    # the certificate will not be verified again, it must pass our assertions.
+                    if resumable is not None and not _resumed_peer_is_trusted(
+                        resumable[1], self.__custom_tls_settings, server
+                    ):
+                        resumable = None
+
+                    if resumable is not None:
+                        (
+                            self.__custom_tls_settings.session_ticket,
+                            self.__resumed_conn_info,
+                        ) = resumable
+                    else:
+                        self.__custom_tls_settings.session_ticket = None
+
+                    self._early_data_pending = (
+                        self.__custom_tls_settings.session_ticket is not None
+                        and bool(
+                            getattr(
+                                self.__custom_tls_settings.session_ticket,
+                                "max_early_data_size",
+                                None,
+                            )
+                        )
+                        and self._max_tolerable_delay_for_upgrade is None
+                        and self._quic_session_tickets.allow_early_data(
+                            self.__quic_authority
+                        )
+                    )
+                else:
+                    self.__custom_tls_settings.session_ticket = None
+
                 self._protocol = HTTPProtocolFactory.new(
                     HTTP3Protocol,  # type: ignore[type-abstract]
                     remote_address=(
@@ -530,6 +599,8 @@ class AsyncHfaceBackend(AsyncBaseBackend):
                     ),
                     server_name=server,
                     tls_config=self.__custom_tls_settings,
+                    flow_control_budget=self._flow_control_budget,
+                    memory_budget=self._memory_budget,
                 )
 
         self.conn_info = ConnectionInfo()
@@ -618,7 +689,11 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         # fallback to http/1.1
         if self._protocol is None or self._svn == HttpVersion.h11:
             if self._protocol is None and HttpVersion.h11 in self._disabled_svn:
-                self._protocol = HTTPProtocolFactory.new(HTTP2Protocol)  # type: ignore[type-abstract]
+                self._protocol = HTTPProtocolFactory.new(
+                    HTTP2Protocol,  # type: ignore[type-abstract]
+                    flow_control_budget=self._flow_control_budget,
+                    memory_budget=self._memory_budget,
+                )
                 self._svn = HttpVersion.h2
             else:
                 self._protocol = HTTPProtocolFactory.new(HTTP1Protocol)  # type: ignore[type-abstract]
@@ -645,6 +720,17 @@ class AsyncHfaceBackend(AsyncBaseBackend):
             self._connected_at = time.monotonic()
             return
 
+        if self._early_data_pending:
+            # 0-RTT: only the first flight leaves now, safe requests will follow right away.
+            # the handshake is completed later on, see __complete_early_handshake().
+            while True:
+                data_out = self._protocol.bytes_to_send()
+                if not data_out:
+                    break
+                await self.sock.sendall(data_out)
+            self._connected_at = time.monotonic()
+            return
+
         # we want to purposely mitigate the following scenario:
         #   "A server yield its support for HTTP/2 or HTTP/3 through Alt-Svc, but
         #    it cannot connect to the alt-svc, thus confusing the end-user on why it
@@ -700,23 +786,63 @@ class AsyncHfaceBackend(AsyncBaseBackend):
             None  # upgrade went fine. discard the value!
         )
 
+        self.__populate_quic_conn_info()
+
+    def __populate_quic_conn_info(self) -> None:
+        """Populating ConnectionInfo using QUIC TLS interfaces, once the handshake is done."""
+        assert self.conn_info is not None and self.sock is not None
+
         if isinstance(self._protocol, HTTPOverQUICProtocol):
-            self.conn_info.certificate_der = self._protocol.getpeercert(
-                binary_form=True
-            )
-            self.conn_info.certificate_dict = self._protocol.getpeercert(
-                binary_form=False
-            )
+            self.conn_info.tls_session_resumed = self._protocol.session_resumed()
+
+            # the peer does not present its certificate again on a resumed session.
+            if (
+                self.conn_info.tls_session_resumed
+                and self.__resumed_conn_info is not None
+            ):
+                self.conn_info.certificate_der = (
+                    self.__resumed_conn_info.certificate_der
+                )
+                self.conn_info.certificate_dict = (
+                    self.__resumed_conn_info.certificate_dict
+                )
+                self.conn_info.issuer_certificate_der = (
+                    self.__resumed_conn_info.issuer_certificate_der
+                )
+                self.conn_info.issuer_certificate_dict = (
+                    self.__resumed_conn_info.issuer_certificate_dict
+                )
+            else:
+                self.conn_info.certificate_der = self._protocol.getpeercert(
+                    binary_form=True
+                )
+                self.conn_info.certificate_dict = self._protocol.getpeercert(
+                    binary_form=False
+                )
+                self.conn_info.issuer_certificate_dict = self._protocol.getissuercert(
+                    binary_form=False
+                )
+                self.conn_info.issuer_certificate_der = self._protocol.getissuercert(
+                    binary_form=True
+                )
+
             self.conn_info.destination_address = self.sock.getpeername()[:2]
             self.conn_info.cipher = self._protocol.cipher()
             self.conn_info.tls_version = ssl.TLSVersion.TLSv1_3
             self.conn_info.tls_ech_accepted = self._protocol.ech_accepted()
-            self.conn_info.issuer_certificate_dict = self._protocol.getissuercert(
-                binary_form=False
-            )
-            self.conn_info.issuer_certificate_der = self._protocol.getissuercert(
-                binary_form=True
-            )
+
+            if self.__early_data_sent:
+                self.conn_info.tls_early_data_accepted = (
+                    self._protocol.early_data_accepted()
+                )
+
+                # the QUIC state machine replays the early requests. no need to try again.
+                if (
+                    not self.conn_info.tls_early_data_accepted
+                    and self._quic_session_tickets is not None
+                    and self.__quic_authority is not None
+                ):
+                    self._quic_session_tickets.reject_early_data(self.__quic_authority)
 
         if (
             self.conn_info.certificate_der
@@ -727,6 +853,19 @@ class AsyncHfaceBackend(AsyncBaseBackend):
                 datetime.now(tz=timezone.utc) - self._connect_timings[-1]
             )
 
+    async def __complete_early_handshake(self) -> None:
+        """Wait for the handshake we left unfinished to send requests in 0-RTT."""
+        self._early_data_pending = False
+
+        await self.__exchange_until(
+            HandshakeCompleted,
+            receive_first=False,
+            event_type_collectable=(HandshakeCompleted,),
+        )
+
+        self._connected_at = time.monotonic()
+        self.__populate_quic_conn_info()
+
     def set_tunnel(
         self,
         host: str,
@@ -871,6 +1010,95 @@ class AsyncHfaceBackend(AsyncBaseBackend):
 
         return self._protocol.has_pending_event()
 
+    async def wait_for_response(  # type: ignore[override]
+        self, promise: ResponsePromise, timeout: float
+    ) -> bool:
+        """Pump incoming data until the response of given promise start arriving or timeout
+        expires. Return True if getresponse(promise=...) can be called without waiting on
+        the network. Unlike getresponse(), it never raise on a socket timeout."""
+        return await self.wait_for_any_response((promise,), timeout) is not None
+
+    async def wait_for_any_response(  # type: ignore[override]
+        self, promises: typing.Sequence[ResponsePromise], timeout: float | None = None
+    ) -> ResponsePromise | None:
+        """Pump incoming data until the response of any given promise start arriving.
+        Every stream of the connection is served in a single pass, the data received for
+        other streams is kept aside. Return the first promise for which getresponse(promise=...)
+        can be called without waiting on the network, or None once timeout expires.
+        Without a timeout, the socket timeout is raised instead."""
+        if self.sock is None or self._protocol is None:
+            return promises[0]  # let getresponse() raise properly.
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            for promise in promises:
+                if self._protocol.has_pending_event(stream_id=promise.stream_id):
+                    return promise
+
+            bck_timeout = self.sock.gettimeout()
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    return None
+
+                if bck_timeout is None or remaining < bck_timeout:
+                    self.sock.settimeout(remaining)
+
+            try:
+                data_in = await self.sock.recv(self.blocksize)
+            except (TimeoutError, SocketTimeout):
+                if deadline is None:
+                    raise
+                continue
+            except OSError:
+                return promises[0]  # let getresponse() raise properly.
+            finally:
+                self.sock.settimeout(bck_timeout)
+
+            # connection loss or protocol error, getresponse() will tell.
+            if not data_in:
+                return promises[0]
+
+            try:
+                if isinstance(data_in, list):
+                    for gro_segment in data_in:
+                        self._protocol.bytes_received(gro_segment)
+                else:
+                    self._protocol.bytes_received(data_in)
+            except self._protocol.exceptions():
+                return promises[0]
+
+            while True:
+                data_out = self._protocol.bytes_to_send()
+
+                if not data_out:
+                    break
+
+                await self.sock.sendall(data_out)
+
+            self._last_used_at = time.monotonic()
+
+    async def abort_promise(self, promise: ResponsePromise) -> None:  # type: ignore[override]
+        """Reset the stream of a request that we no longer want the response of."""
+        if promise.uid not in self._promises:
+            return
+
+        del self._promises[promise.uid]
+        self._promises_per_stream.pop(promise.stream_id, None)
+
+        if self.sock is None or self._protocol is None:
+            return
+
+        if not self.is_multiplexed:
+            # there is no such thing as a stream reset in HTTP/1.1
+            await self.close()
+            return
+
+        await self.__abort_st(promise.stream_id)
+
     async def __exchange_until(
         self,
         event_type: type[Event] | tuple[type[Event], ...],
@@ -886,6 +1114,9 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         Can be used for the initial handshake for instance."""
         assert self.sock is not None and self._protocol is not None
 
+        if self._early_data_pending and event_type is not HandshakeCompleted:
+            await self.__complete_early_handshake()
+
         protocol = self._protocol
         sock = self.sock
         blocksize = self.blocksize
@@ -929,7 +1160,9 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         while True:
             reach_socket: bool = False
             if not protocol.has_pending_event(stream_id=stream_id):
-                if not receive_first:
+                # credit held back under memory pressure may have been freed by
+                # the events just consumed. it must reach the remote before we wait.
+                if not receive_first or self._memory_budget is not None:
                     await send_pending()
 
                 next_timer = protocol.next_timer() if _has_next_timer else None  # type: ignore[union-attr]
@@ -1021,6 +1254,18 @@ class AsyncHfaceBackend(AsyncBaseBackend):
             for event in protocol.events(stream_id=stream_id):  # type: Event
                 stream_related_event: bool = hasattr(event, "stream_id")
 
+                # late events for a stream we reset ourselves. nobody is waiting for them.
+                if (
+                    stream_related_event
+                    and self._aborted_streams
+                    and event.stream_id in self._aborted_streams  # type: ignore[attr-defined]
+                ):
+                    if isinstance(event, StreamResetReceived) or getattr(
+                        event, "end_stream", False
+                    ):
+                        self._aborted_streams.discard(event.stream_id)  # type: ignore[attr-defined]
+                    continue
+
                 if not stream_related_event and isinstance(event, ConnectionTerminated):
                     self._protocol = (
                         None  # the state machine protocol reached final state and
@@ -1207,6 +1452,7 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         self.__legacy_host_entry = None
         self.__authority_bit_set = False
         self.__protocol_bit_set = False
+        self.__priority = None
 
         self._start_last_request = datetime.now(tz=timezone.utc)
 
@@ -1260,6 +1506,22 @@ class AsyncHfaceBackend(AsyncBaseBackend):
             )
 
     def putheader(self, header: str, *values: str) -> None:
+        # fast path: static headers (e.g. pool defaults, User-Agent) are already
+        # validated and encoded. We just have to splice them into the header list.
+        if self._headers_template is not None and len(values) == 1:
+            precompiled = self._headers_template.get(header, values[0])
+
+            if precompiled is not None:
+                if precompiled[0] == b"priority":
+                    self.__priority = precompiled[1]
+                if (
+                    self._svn is HttpVersion.h11
+                    or self._svn is None
+                    or precompiled[0] not in HTTP1_ONLY_HEADERS
+                ):
+                    self.__headers.append(precompiled)
+                return
+
         # note: requests allow passing headers as bytes (seen in requests/tests)
         # warn: always lowercase header names, quic transport crash if not lowercase.
         header = header.lower()
@@ -1285,6 +1547,12 @@ class AsyncHfaceBackend(AsyncBaseBackend):
                 raise ProtocolError(
                     f"Invalid content-length set. Given '{values[0]}' when only digits are allowed."
                 )
+        elif encoded_header == b"priority":
+            self.__priority = (
+                values[0].encode("ascii")
+                if isinstance(values[0], str)
+                else bytes(values[0])
+            )
         elif self.__legacy_host_entry is None and encoded_header == b"host":
             if isinstance(values[0], str):
                 self.__legacy_host_entry = values[0].encode("idna")
@@ -1348,6 +1616,12 @@ class AsyncHfaceBackend(AsyncBaseBackend):
 
         assert self.sock is not None and self._protocol is not None
 
+        if self._early_data_pending:
+            if self.__headers[0][1].decode() in EARLY_DATA_METHODS:
+                self.__early_data_sent = True
+            else:
+                await self.__complete_early_handshake()
+
         # only h2 and h3 support streams, it is faked/simulated for h1.
         self._stream_id = self._protocol.get_available_stream_id()
         # unless anything hint the opposite, the request head frame is the end stream
@@ -1381,6 +1655,9 @@ class AsyncHfaceBackend(AsyncBaseBackend):
             )
 
         try:
+            if self.__priority is not None:
+                self._protocol.submit_priority(self._stream_id, self.__priority)
+
             self._protocol.submit_headers(
                 self._stream_id,
                 self.__headers,
@@ -1484,6 +1761,11 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         assert self.sock is not None
 
         self._protocol.submit_stream_reset(stream_id=__stream_id)
+        self._aborted_streams.add(__stream_id)
+
+        # the peer may never send anything for it again, forget the oldest ones.
+        if len(self._aborted_streams) > MAX_ABORTED_STREAMS:
+            self._aborted_streams.discard(min(self._aborted_streams))
 
         while True:
             data_out = self._protocol.bytes_to_send()
@@ -1504,6 +1786,19 @@ class AsyncHfaceBackend(AsyncBaseBackend):
 
         self._last_used_at = time.monotonic()
 
+    def __refresh_flow_control_info(self) -> None:
+        """Expose the receive windows, they may have grown since the connection was established."""
+        if self._protocol is None or self.conn_info is None:
+            return
+
+        windows = self._protocol.flow_control_windows()
+
+        if windows is not None:
+            (
+                self.conn_info.flow_control_window,
+                self.conn_info.flow_control_stream_window,
+            ) = windows
+
     async def __read_st(
         self,
         __amt: int | None,
@@ -1553,6 +1848,7 @@ class AsyncHfaceBackend(AsyncBaseBackend):
 
         if events and events[-1].end_stream:
             eot = True
+            self.__refresh_flow_control_info()
 
             try:
                 del self._pending_responses[__stream_id]  # type: ignore[arg-type]
@@ -1580,16 +1876,14 @@ class AsyncHfaceBackend(AsyncBaseBackend):
             # http-trailers SHOULD be received LAST!
             # but we should tolerate a DataReceived of len=0 last, just in case.
             if idx is not None:
-                trailers = HTTPHeaderDict()
-
-                for raw_header, raw_value in events[idx].headers:  # type: ignore[union-attr]
-                    # ignore...them? special headers. aka. starting with semicolon
-                    if raw_header[0] == 0x3A:
-                        continue
-                    else:
-                        trailers.add(
-                            raw_header.decode("ascii"), raw_value.decode("iso-8859-1")
-                        )
+                # ignore...them? special headers. aka. starting with semicolon
+                trailers = LazyHTTPHeaderDict.from_raw(
+                    [
+                        (raw_header, raw_value)
+                        for raw_header, raw_value in events[idx].headers  # type: ignore[union-attr]
+                        if raw_header[0] != 0x3A
+                    ]
+                )
 
                 events.pop(idx)
 
@@ -1614,7 +1908,6 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         if self.sock is None or self._protocol is None or not self._promises:
             raise ResponseNotReady()  # Defensive: Comply with http.client, actually tested but not reported?
 
-        headers = HTTPHeaderDict()
         status: int | None = None
 
         if not self.is_multiplexed:
@@ -1642,13 +1935,22 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         # ...in the sense that we spoke with the remote peer.
         self._last_used_at = time.monotonic()
 
-        for raw_header, raw_value in head_event.headers:
+        raw_headers = head_event.headers
+        pseudo_header_count: int = 0
+
+        for raw_header, raw_value in raw_headers:
             # special headers that represent (usually) the HTTP response status, version and reason.
-            if status is None and raw_header[0] == 0x3A:
-                if raw_header == b":status":
-                    status = int(raw_value)
-            else:
-                headers.add(raw_header.decode("ascii"), raw_value.decode("iso-8859-1"))
+            # they always come first, in every supported protocol.
+            if raw_header[0] != 0x3A:
+                break
+            if status is None and raw_header == b":status":
+                status = int(raw_value)
+            pseudo_header_count += 1
+
+        # decoding is deferred to the first access, most callers only read a couple of them.
+        headers = LazyHTTPHeaderDict.from_raw(
+            raw_headers[pseudo_header_count:] if pseudo_header_count else raw_headers
+        )
 
         # 101 = Switching Protocol! It's our final HTTP response, but the stream remains open!
         is_early_response = (
@@ -1732,6 +2034,8 @@ class AsyncHfaceBackend(AsyncBaseBackend):
             stream_abort=self.__abort_st,
         )
 
+        self.__refresh_flow_control_info()
+
         promise.response = self._response
         self._response.from_promise = promise
 
@@ -1896,6 +2200,19 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         self._last_used_at = time.monotonic()
 
     async def close(self) -> None:  # type: ignore[override]
+        if (
+            self._quic_session_tickets is not None
+            and self.__quic_authority is not None
+            and isinstance(self._protocol, HTTPOverQUICProtocol)
+            and self._protocol.session_ticket is not None
+        ):
+            self._quic_session_tickets.put(
+                self.__quic_authority,
+                self._protocol.session_ticket,
+                self.conn_info,
+                tls_context=self.__quic_tls_context,
+            )
+
         if self.sock:
             if self._protocol is not None:
                 try:
@@ -1929,7 +2246,13 @@ class AsyncHfaceBackend(AsyncBaseBackend):
         self._promises = {}
         self._promises_per_stream = {}
         self._pending_responses = {}
+        self._aborted_streams = set()
         self.__custom_tls_settings = None
+        self.__quic_authority = None
+        self.__quic_tls_context = None
+        self._early_data_pending = False
+        self.__early_data_sent = False
+        self.__resumed_conn_info = None
         self.conn_info = None
         self.__expected_body_length = None
         self.__remaining_body_length = None
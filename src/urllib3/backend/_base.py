@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import enum
+import re
 import socket
+import threading
 import time
 import typing
 from base64 import b64encode
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from secrets import token_bytes
 
 if typing.TYPE_CHECKING:
     from ssl import SSLSocket, SSLContext, TLSVersion
     from .._typing import _TYPE_SOCKET_OPTIONS
+    from ..contrib.hface import MemoryBudget, QuicTLSConfig
     from ._async import AsyncLowLevelResponse
 
 from .._collections import HTTPHeaderDict
@@ -19,8 +23,16 @@ from .._constant import (
     DEFAULT_KEEPALIVE_DELAY,
     DEFAULT_BACKGROUND_WATCH_WINDOW,
     DEFAULT_KEEPALIVE_IDLE_WINDOW,
+    DEFAULT_QUIC_SESSION_TICKETS,
+    MINIMAL_RECV_BLOCKSIZE,
+    RECV_BLOCKSIZE_SHRINK_AFTER,
 )
+from ..exceptions import SSLError
+from ..util.fork import register_fork_aware
+from ..util.request import SKIP_HEADER
 from ..util.response import BytesQueueBuffer
+from ..util.ssl_ import assert_fingerprint
+from ..util.ssl_match_hostname import CertificateError, match_hostname
 
 
 class HttpVersion(str, enum.Enum):
@@ -69,6 +81,14 @@ class ConnectionInfo:
         self.tls_ech_accepted: bool | None = None
         #: Time taken to encode and send the whole request through the socket.
         self.request_sent_latency: timedelta | None = None
+        #: Whether the TLS session was resumed from a previously issued ticket. (QUIC only)
+        self.tls_session_resumed: bool | None = None
+        #: Whether the requests sent in 0-RTT (early data) were accepted. None if not attempted.
+        self.tls_early_data_accepted: bool | None = None
+        #: Receive window granted to the remote peer on the whole connection. (HTTP/2 and HTTP/3 only)
+        self.flow_control_window: int | None = None
+        #: Receive window granted to the remote peer for each stream. (HTTP/2 and HTTP/3 only)
+        self.flow_control_stream_window: int | None = None
 
     def __repr__(self) -> str:
         return str(
@@ -83,6 +103,10 @@ class ConnectionInfo:
                 "tls_version": self.tls_version,
                 "tls_handshake_latency": self.tls_handshake_latency,
                 "tls_ech_accepted": self.tls_ech_accepted,
+                "tls_session_resumed": self.tls_session_resumed,
+                "tls_early_data_accepted": self.tls_early_data_accepted,
+                "flow_control_window": self.flow_control_window,
+                "flow_control_stream_window": self.flow_control_stream_window,
                 "http_version": self.http_version,
                 "resolution_latency": self.resolution_latency,
                 "request_sent_latency": self.request_sent_latency,
@@ -468,12 +492,267 @@ class ResponsePromise:
         self._parameters.update(data)
 
 
+class RequestHeadersTemplate:
+    """Pre-validated and pre-encoded static request headers owned by a connection pool.
+
+    Every request used to re-encode the pool default headers and the User-Agent through
+    putheader. The template keeps the validated (lowercase name, value) bytes pairs
+    so that the backend can splice them directly into the header list. Headers that
+    are not part of the template (or fail validation) take the regular path.
+
+    The HPACK/QPACK compression itself is still done by jh2/qh3 for each request: their
+    encoders only accept header pairs and the dynamic table is a per-connection state,
+    a block encoded once for the whole pool could not be reused as-is.
+    """
+
+    __slots__ = ("source", "_lookup")
+
+    #: RFC 9110 token and field-value. Anything else is left to the regular path.
+    _FIELD_NAME_RE = re.compile(rb"^[!#$%&'*+\-.^_`|~0-9a-zA-Z]+$")
+    _FIELD_VALUE_RE = re.compile(
+        rb"^(?:[\x21-\x7e\x80-\xff](?:[\t\x20-\x7e\x80-\xff]*[\x21-\x7e\x80-\xff])?)?$"
+    )
+
+    #: Those drive the request framing or the authority, they must never be spliced blindly.
+    _EXCLUDED_HEADERS = frozenset({b"host", b"content-length"})
+
+    def __init__(
+        self,
+        headers: typing.Mapping[str, str] | None,
+        defaults: typing.Iterable[tuple[str, str]] = (),
+    ) -> None:
+        #: The mapping this template was compiled from (compared by identity).
+        self.source = headers
+        self._lookup: dict[tuple[str, str], tuple[bytes, bytes]] = {}
+
+        for name, value in (*defaults, *(headers.items() if headers else ())):
+            if (
+                not isinstance(name, str)
+                or not isinstance(value, str)
+                or value == SKIP_HEADER
+            ):
+                continue
+
+            try:
+                encoded_name = name.lower().encode("ascii")
+                encoded_value = value.encode("iso-8859-1")
+            except UnicodeEncodeError:
+                continue
+
+            if (
+                encoded_name in self._EXCLUDED_HEADERS
+                or self._FIELD_NAME_RE.match(encoded_name) is None
+                or self._FIELD_VALUE_RE.match(encoded_value) is None
+            ):
+                continue
+
+            self._lookup[(name, value)] = (encoded_name, encoded_value)
+
+    def __len__(self) -> int:
+        return len(self._lookup)
+
+    def get(self, name: str, value: typing.Any) -> tuple[bytes, bytes] | None:
+        """Retrieve the precompiled entry for a given header, if any."""
+        try:
+            return self._lookup.get((name, value))
+        except TypeError:  # Defensive: unhashable value
+            return None
+
+
+class AdaptiveReceiveBuffer:
+    """Reusable receive buffer for a stream socket, read with recv_into.
+
+    A fixed blocksize either wastes a large allocation on every small read or caps
+    bulk transfers. Here the read size doubles, up to the connection blocksize, each
+    time a read fills the buffer entirely, and is halved after a run of short reads.
+    """
+
+    __slots__ = ("minimum", "maximum", "size", "_buffer", "_view", "_short_reads")
+
+    def __init__(self, maximum: int, minimum: int = MINIMAL_RECV_BLOCKSIZE) -> None:
+        self.maximum = maximum
+        self.minimum = minimum if minimum < maximum else maximum
+        #: How many bytes the next read may return at most.
+        self.size = self.minimum
+
+        self._buffer = bytearray(self.size)
+        self._view = memoryview(self._buffer)
+        self._short_reads = 0
+
+    def _resize(self, size: int) -> None:
+        self._view.release()
+
+        self.size = size
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._short_reads = 0
+
+    def recv(self, sock: socket.socket) -> bytes:
+        """Read once from given socket. The returned bytes never alias the reused buffer."""
+        received = sock.recv_into(self._view, self.size)
+
+        data = self._view[:received].tobytes()
+
+        if received == self.size:
+            if self.size < self.maximum:
+                self._resize(min(self.size * 2, self.maximum))
+            else:
+                self._short_reads = 0
+        elif received <= self.size // 2:
+            self._short_reads += 1
+
+            if (
+                self._short_reads >= RECV_BLOCKSIZE_SHRINK_AFTER
+                and self.size > self.minimum
+            ):
+                self._resize(max(self.size // 2, self.minimum))
+        else:
+            self._short_reads = 0
+
+        return data
+
+
 _HostPortType: typing.TypeAlias = typing.Tuple[str, int]
 QuicPreemptiveCacheType: typing.TypeAlias = typing.MutableMapping[
     _HostPortType, typing.Optional[_HostPortType]
 ]
 
 
+class QuicSessionTicketStore:
+    """
+    Bounded and thread safe store of QUIC session tickets, per (host, port) and TLS
+    verification context. A ticket is handed out to a single new connection, then
+    the connection gives back the freshest ticket it received when it closes.
+
+    A resumed session skips the certificate verification, so a ticket is only
+    handed to a connection that would have verified the peer the very same way
+    (trust store, hostname and fingerprint assertions) as the one it came from.
+    The ConnectionInfo of that connection is kept along with the ticket, as the
+    resumed session does not carry the peer certificate.
+
+    :param maxsize: Maximum number of tickets to remember. The least recently used is discarded first.
+    :param early_data: Allow sending safe requests (e.g. GET) in 0-RTT with a resumed session.
+        Early data can be replayed by an attacker, only enable it if the target servers are fine with that.
+    """
+
+    def __init__(
+        self, maxsize: int = DEFAULT_QUIC_SESSION_TICKETS, *, early_data: bool = False
+    ) -> None:
+        self.maxsize = maxsize
+        self.early_data = early_data
+
+        self._tickets: OrderedDict[
+            tuple[_HostPortType, typing.Hashable],
+            tuple[typing.Any, ConnectionInfo | None],
+        ] = OrderedDict()
+        self._early_data_rejected: set[_HostPortType] = set()
+        self._lock = threading.Lock()
+
+        # tickets remain valid in a forked child, only the lock must be renewed.
+        register_fork_aware(self)
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tickets)
+
+    def __contains__(self, authority: object) -> bool:
+        with self._lock:
+            return any(key[0] == authority for key in self._tickets)
+
+    def put(
+        self,
+        authority: _HostPortType,
+        ticket: typing.Any,
+        conn_info: ConnectionInfo | None = None,
+        *,
+        tls_context: typing.Hashable = None,
+    ) -> None:
+        """Remember the given ticket for (host, port) and TLS verification context,
+        replacing any previous one."""
+        key = (authority, tls_context)
+
+        with self._lock:
+            self._tickets[key] = (ticket, conn_info)
+            self._tickets.move_to_end(key)
+
+            while len(self._tickets) > self.maxsize:
+                self._tickets.popitem(last=False)
+
+    def pop(
+        self, authority: _HostPortType, *, tls_context: typing.Hashable = None
+    ) -> tuple[typing.Any, ConnectionInfo | None] | None:
+        """Take out the ticket for (host, port) and TLS verification context, along with
+        the ConnectionInfo that came with it. Return None if none or expired."""
+        with self._lock:
+            entry = self._tickets.pop((authority, tls_context), None)
+
+        if entry is not None and getattr(entry[0], "is_valid", True) is False:
+            return None
+
+        return entry
+
+    def allow_early_data(self, authority: _HostPortType) -> bool:
+        """Determine if requests can be sent in 0-RTT to (host, port)."""
+        if not self.early_data:
+            return False
+
+        with self._lock:
+            return authority not in self._early_data_rejected
+
+    def reject_early_data(self, authority: _HostPortType) -> None:
+        """The server refused our early data, stop trying with (host, port)."""
+        with self._lock:
+            self._early_data_rejected.add(authority)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tickets.clear()
+            self._early_data_rejected.clear()
+
+
+def _quic_tls_context(tls_config: QuicTLSConfig) -> typing.Hashable:
+    """Everything that drives the verification of the peer certificate of a QUIC connection."""
+    return (
+        tls_config.insecure,
+        tls_config.cafile,
+        tls_config.capath,
+        tls_config.cadata,
+        tls_config.cert_fingerprint,
+        tls_config.cert_use_common_name,
+        tls_config.verify_hostname,
+        tls_config.assert_hostname,
+    )
+
+
+def _resumed_peer_is_trusted(
+    conn_info: ConnectionInfo | None, tls_config: QuicTLSConfig, server_hostname: str
+) -> bool:
+    """A resumed session does not present the peer certificate again. Run the fingerprint
+    and hostname assertions against the certificate received when the ticket was issued."""
+    if tls_config.insecure and not tls_config.cert_fingerprint:
+        return True
+
+    if conn_info is None or conn_info.certificate_der is None:
+        return False
+
+    try:
+        if tls_config.cert_fingerprint:
+            assert_fingerprint(conn_info.certificate_der, tls_config.cert_fingerprint)
+        elif tls_config.verify_hostname:
+            match_hostname(
+                conn_info.certificate_dict,  # type: ignore[arg-type]
+                (tls_config.assert_hostname or server_hostname).strip("[]"),
+                tls_config.cert_use_common_name,
+            )
+    except (SSLError, CertificateError):
+        return False
+
+    return True
+
+
 class BaseBackend:
     """
     The goal here is to detach ourselves from the http.client package.
@@ -514,6 +793,9 @@ class BaseBackend:
         keepalive_delay: float | int | None = DEFAULT_KEEPALIVE_DELAY,
         background_watch_delay: int | float | None = DEFAULT_BACKGROUND_WATCH_WINDOW,
         keepalive_idle_window: int | float | None = DEFAULT_KEEPALIVE_IDLE_WINDOW,
+        quic_session_tickets: QuicSessionTicketStore | None = None,
+        flow_control_budget: int | None = None,
+        memory_budget: MemoryBudget | None = None,
     ):
         self.host = host
         self.port = port
@@ -535,6 +817,11 @@ class BaseBackend:
 
         self._disabled_svn = disabled_svn if disabled_svn is not None else set()
         self._preemptive_quic_cache = preemptive_quic_cache
+        self._quic_session_tickets = quic_session_tickets
+        #: Maximum receive window (bytes) granted per connection for HTTP/2 and HTTP/3.
+        self._flow_control_budget = flow_control_budget
+        #: Shared budget for the received data not consumed yet (HTTP/2 and HTTP/3).
+        self._memory_budget = memory_budget
 
         if self._disabled_svn:
             if len(self._disabled_svn) == len(list(HttpVersion)):
@@ -550,6 +837,11 @@ class BaseBackend:
         self._pending_responses: dict[
             int, LowLevelResponse | AsyncLowLevelResponse
         ] = {}
+        #: Streams we reset ourselves, late events for them are silently dropped.
+        self._aborted_streams: set[int] = set()
+
+        #: Pool owned precompiled static headers, if any. Set by the connection pool.
+        self._headers_template: RequestHeadersTemplate | None = None
 
         self._start_last_request: datetime | None = None
 
@@ -706,6 +998,22 @@ class BaseBackend:
         """
         raise NotImplementedError
 
+    def wait_for_response(self, promise: ResponsePromise, timeout: float) -> bool:
+        """Wait, at most timeout seconds, for the response of given promise to start arriving.
+        Return True as soon as getresponse() can be called without waiting on the network."""
+        raise NotImplementedError
+
+    def wait_for_any_response(
+        self, promises: typing.Sequence[ResponsePromise], timeout: float | None = None
+    ) -> ResponsePromise | None:
+        """Wait for the response of any given promise to start arriving. Return the first one
+        for which getresponse() can be called without waiting on the network, None on timeout."""
+        raise NotImplementedError
+
+    def abort_promise(self, promise: ResponsePromise) -> None:
+        """Discard a request for which the response was not retrieved yet. The stream is reset."""
+        raise NotImplementedError
+
     def close(self) -> None:
         """End the connection, do some reinit, closing of fd, etc..."""
         raise NotImplementedError
@@ -11,15 +11,17 @@ from socket import timeout as SocketTimeout
 
 from ..contrib.anytls import ssl, Certificate
 
-from .._collections import HTTPHeaderDict
+from .._collections import HTTPHeaderDict, LazyHTTPHeaderDict
 from .._constant import (
     DEFAULT_BLOCKSIZE,
     DEFAULT_KEEPALIVE_DELAY,
+    MAX_ABORTED_STREAMS,
     UDP_DEFAULT_BLOCKSIZE,
     responses,
     HTTP1_ONLY_HEADERS,
     DEFAULT_BACKGROUND_WATCH_WINDOW,
     DEFAULT_KEEPALIVE_IDLE_WINDOW,
+    EARLY_DATA_METHODS,
 )
 from ..contrib.hface import (
     HTTP1Protocol,
@@ -28,6 +30,7 @@ from ..contrib.hface import (
     HTTPOverQUICProtocol,
     HTTPOverTCPProtocol,
     HTTPProtocolFactory,
+    MemoryBudget,
     QuicTLSConfig,
 )
 from ..contrib.hface.events import (
@@ -57,16 +60,21 @@ from ..exceptions import (
     SSLError,
 )
 from ..util import parse_alt_svc, resolve_cert_reqs, parse_url
+from ..util.ssl_ import _TrustStore
 from ..util.socket_state import enable_keepalive
 from ..util.sub_timeout import SubTimeout
 from ._base import (
+    AdaptiveReceiveBuffer,
     BaseBackend,
     ConnectionInfo,
     DirectStreamAccess,
     HttpVersion,
     LowLevelResponse,
     QuicPreemptiveCacheType,
+    QuicSessionTicketStore,
     ResponsePromise,
+    _quic_tls_context,
+    _resumed_peer_is_trusted,
 )
 
 if typing.TYPE_CHECKING:
@@ -108,6 +116,9 @@ class HfaceBackend(BaseBackend):
         keepalive_delay: float | int | None = DEFAULT_KEEPALIVE_DELAY,
         background_watch_delay: int | float | None = DEFAULT_BACKGROUND_WATCH_WINDOW,
         keepalive_idle_window: int | float | None = DEFAULT_KEEPALIVE_IDLE_WINDOW,
+        quic_session_tickets: QuicSessionTicketStore | None = None,
+        flow_control_budget: int | None = None,
+        memory_budget: MemoryBudget | None = None,
     ):
         if not _HAS_HTTP3_SUPPORT():
             if disabled_svn is None:
@@ -126,6 +137,9 @@ class HfaceBackend(BaseBackend):
             keepalive_delay=keepalive_delay,
             background_watch_delay=background_watch_delay,
             keepalive_idle_window=keepalive_idle_window,
+            quic_session_tickets=quic_session_tickets,
+            flow_control_budget=flow_control_budget,
+            memory_budget=memory_budget,
         )
 
         self._proxy_protocol: HTTPOverTCPProtocol | None = None
@@ -143,12 +157,23 @@ class HfaceBackend(BaseBackend):
         self.__authority_bit_set: bool = False
         self.__legacy_host_entry: bytes | None = None
         self.__protocol_bit_set: bool = False
+        #: RFC 9218 Priority field value of the request being prepared, if any.
+        self.__priority: bytes | None = None
 
         # h3 specifics
         self.__custom_tls_settings: QuicTLSConfig | None = None
         self.__alt_authority: tuple[str, int] | None = None
         self.__origin_port: int | None = None
 
+        # QUIC session resumption, the (host, port) and TLS verification context the ticket belongs to.
+        self.__quic_authority: tuple[str, int] | None = None
+        self.__quic_tls_context: typing.Hashable = None
+        #: The handshake is left unfinished so that safe requests go in 0-RTT.
+        self._early_data_pending: bool = False
+        self.__early_data_sent: bool = False
+        #: What we knew of the peer when the session ticket was issued.
+        self.__resumed_conn_info: ConnectionInfo | None = None
+
         # automatic upgrade shield against errors!
         self._max_tolerable_delay_for_upgrade: float | None = None
 
@@ -156,6 +181,9 @@ class HfaceBackend(BaseBackend):
         self._dgram_gro_enabled: bool = False
         self._dgram_gso_enabled: bool = False
 
+        #: Stream sockets only, set in _post_conn().
+        self._recv_buffer: AdaptiveReceiveBuffer | None = None
+
     @property
     def is_saturated(self) -> bool:
         if self._protocol is None:
@@ -368,12 +396,7 @@ class HfaceBackend(BaseBackend):
             and ca_cert_data is None
             and not ssl_ctx_have_certs
         ):
-            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-
-            if hasattr(ssl_context, "load_default_certs"):
-                ssl_context.load_default_certs()
-            else:
-                ssl_context = None
+            ssl_context = _TrustStore.default_context()
 
         if ssl_context:
             cert_use_common_name = (
@@ -384,18 +407,7 @@ class HfaceBackend(BaseBackend):
                 allow_insecure = True
 
             if ca_certs is None and ca_cert_dir is None and ca_cert_data is None:
-                try:
-                    ctx_root_certificates: list[bytes] = ssl_context.get_ca_certs(True)
-                except (
-                    AttributeError,
-                    NotImplementedError,
-                ):  # Defensive: in case of ssl monkeypatch
-                    ctx_root_certificates = []
-
-                if ctx_root_certificates:
-                    ca_cert_data = "\n".join(
-                        ssl.DER_cert_to_PEM_cert(cert) for cert in ctx_root_certificates
-                    )
+                ca_cert_data = _TrustStore.ca_bundle(ssl_context)
 
             if (
                 assert_hostname is None
@@ -497,7 +509,11 @@ class HfaceBackend(BaseBackend):
                     alpn = negotiated
 
             if alpn == "h2":
-                self._protocol = HTTPProtocolFactory.new(HTTP2Protocol)  # type: ignore[type-abstract]
+                self._protocol = HTTPProtocolFactory.new(
+                    HTTP2Protocol,  # type: ignore[type-abstract]
+                    flow_control_budget=self._flow_control_budget,
+                    memory_budget=self._memory_budget,
+                )
                 self._svn = HttpVersion.h2
             elif alpn == "http/1.1":
                 self._protocol = HTTPProtocolFactory.new(HTTP1Protocol)  # type: ignore[type-abstract]
@@ -512,7 +528,11 @@ class HfaceBackend(BaseBackend):
                 self._protocol = HTTPProtocolFactory.new(HTTP1Protocol)  # type: ignore[type-abstract]
                 self._svn = HttpVersion.h11
             elif HttpVersion.h2 not in self._disabled_svn:
-                self._protocol = HTTPProtocolFactory.new(HTTP2Protocol)  # type: ignore[type-abstract]
+                self._protocol = HTTPProtocolFactory.new(
+                    HTTP2Protocol,  # type: ignore[type-abstract]
+                    flow_control_budget=self._flow_control_budget,
+                    memory_budget=self._memory_budget,
+                )
                 self._svn = HttpVersion.h2
             else:
                 raise RuntimeError(
@@ -521,7 +541,11 @@ class HfaceBackend(BaseBackend):
                 )
         else:  # we or someone manually set the SVN / http version, so load the protocol regardless of what we know.
             if self._svn == HttpVersion.h2:
-                self._protocol = HTTPProtocolFactory.new(HTTP2Protocol)  # type: ignore[type-abstract]
+                self._protocol = HTTPProtocolFactory.new(
+                    HTTP2Protocol,  # type: ignore[type-abstract]
+                    flow_control_budget=self._flow_control_budget,
+                    memory_budget=self._memory_budget,
+                )
             elif self._svn == HttpVersion.h3:
                 assert self.__custom_tls_settings is not None
 
@@ -531,6 +555,51 @@ class HfaceBackend(BaseBackend):
                 else:
                     server, port = self.host, self.port
 
+                # resume a previous session if we can. we don't with a client certificate
+                # as the ticket store is shared between pools that may not share the identity.
+                if (
+                    self._quic_session_tickets is not None
+                    and not self.__custom_tls_settings.certfile
+                ):
+                    self.__quic_authority = (server, int(port))
+                    self.__quic_tls_context = _quic_tls_context(
+                        self.__custom_tls_settings
+                    )
+                    resumable = self._quic_session_tickets.pop(
+                        self.__quic_authority, tls_context=self.__quic_tls_context
+                    )
+
+                    # the certificate will not be verified again, it must pass our assertions.
+                    if resumable is not None and not _resumed_peer_is_trusted(
+                        resumable[1], self.__custom_tls_settings, server
+                    ):
+                        resumable = None
+
+                    if resumable is not None:
+                        (
+                            self.__custom_tls_settings.session_ticket,
+                            self.__resumed_conn_info,
+                        ) = resumable
+                    else:
+                        self.__custom_tls_settings.session_ticket = None
+
+                    self._early_data_pending = (
+                        self.__custom_tls_settings.session_ticket is not None
+                        and bool(
+                            getattr(
+                                self.__custom_tls_settings.session_ticket,
+                                "max_early_data_size",
+                                None,
+                            )
+                        )
+                        and self._max_tolerable_delay_for_upgrade is None
+                        and self._quic_session_tickets.allow_early_data(
+                            self.__quic_authority
+                        )
+                    )
+                else:
+                    self.__custom_tls_settings.session_ticket = None
+
                 self._protocol = HTTPProtocolFactory.new(
                     HTTP3Protocol,  # type: ignore[type-abstract]
                     remote_address=(
@@ -541,6 +610,8 @@ class HfaceBackend(BaseBackend):
                     ),
                     server_name=server,
                     tls_config=self.__custom_tls_settings,
+                    flow_control_budget=self._flow_control_budget,
+                    memory_budget=self._memory_budget,
                 )
 
         self.conn_info = ConnectionInfo()
@@ -549,9 +620,11 @@ class HfaceBackend(BaseBackend):
         if self.sock.type == SOCK_DGRAM:
             self._dgram_gro_enabled = _sock_has_gro(self.sock)
             self._dgram_gso_enabled = _sock_has_gso(self.sock)
+            self._recv_buffer = None
         else:
             self._dgram_gro_enabled = False
             self._dgram_gso_enabled = False
+            self._recv_buffer = AdaptiveReceiveBuffer(self.blocksize)
 
         if hasattr(self, "_connect_timings") and self._connect_timings:
             self.conn_info.resolution_latency = self._connect_timings[0]
@@ -674,7 +747,11 @@ class HfaceBackend(BaseBackend):
         # fallback to http/1.1 or http/2 with prior knowledge!
         if self._protocol is None or self._svn == HttpVersion.h11:
             if self._protocol is None and HttpVersion.h11 in self._disabled_svn:
-                self._protocol = HTTPProtocolFactory.new(HTTP2Protocol)  # type: ignore[type-abstract]
+                self._protocol = HTTPProtocolFactory.new(
+                    HTTP2Protocol,  # type: ignore[type-abstract]
+                    flow_control_budget=self._flow_control_budget,
+                    memory_budget=self._memory_budget,
+                )
                 self._svn = HttpVersion.h2
             else:
                 self._protocol = HTTPProtocolFactory.new(HTTP1Protocol)  # type: ignore[type-abstract]
@@ -701,6 +778,17 @@ class HfaceBackend(BaseBackend):
             self._connected_at = time.monotonic()
             return
 
+        if self._early_data_pending:
+            # 0-RTT: only the first flight leaves now, safe requests will follow right away.
+            # the handshake is completed later on, see __complete_early_handshake().
+            while True:
+                data_out = self._protocol.bytes_to_send()
+                if not data_out:
+                    break
+                sync_send_dgram(self.sock, data_out)
+            self._connected_at = time.monotonic()
+            return
+
         # we want to purposely mitigate the following scenario:
         #   "A server yield its support for HTTP/2 or HTTP/3 through Alt-Svc, but
         #    it cannot connect to the alt-svc, thus confusing the end-user on why it
@@ -755,24 +843,63 @@ class HfaceBackend(BaseBackend):
             None  # upgrade went fine. discard the value!
         )
 
-        #: Populating ConnectionInfo using QUIC TLS interfaces
+        self.__populate_quic_conn_info()
+
+    def __populate_quic_conn_info(self) -> None:
+        """Populating ConnectionInfo using QUIC TLS interfaces, once the handshake is done."""
+        assert self.conn_info is not None and self.sock is not None
+
         if isinstance(self._protocol, HTTPOverQUICProtocol):
-            self.conn_info.certificate_der = self._protocol.getpeercert(
-                binary_form=True
-            )
-            self.conn_info.certificate_dict = self._protocol.getpeercert(
-                binary_form=False
-            )
+            self.conn_info.tls_session_resumed = self._protocol.session_resumed()
+
+            # the peer does not present its certificate again on a resumed session.
+            if (
+                self.conn_info.tls_session_resumed
+                and self.__resumed_conn_info is not None
+            ):
+                self.conn_info.certificate_der = (
+                    self.__resumed_conn_info.certificate_der
+                )
+                self.conn_info.certificate_dict = (
+                    self.__resumed_conn_info.certificate_dict
+                )
+                self.conn_info.issuer_certificate_der = (
+                    self.__resumed_conn_info.issuer_certificate_der
+                )
+                self.conn_info.issuer_certificate_dict = (
+                    self.__resumed_conn_info.issuer_certificate_dict
+                )
+            else:
+                self.conn_info.certificate_der = self._protocol.getpeercert(
+                    binary_form=True
+                )
+                self.conn_info.certificate_dict = self._protocol.getpeercert(
+                    binary_form=False
+                )
+                self.conn_info.issuer_certificate_dict = self._protocol.getissuercert(
+                    binary_form=False
+                )
+                self.conn_info.issuer_certificate_der = self._protocol.getissuercert(
+                    binary_form=True
+                )
+
             self.conn_info.destination_address = self.sock.getpeername()[:2]
             self.conn_info.cipher = self._protocol.cipher()
             self.conn_info.tls_ech_accepted = self._protocol.ech_accepted()
             self.conn_info.tls_version = ssl.TLSVersion.TLSv1_3
-            self.conn_info.issuer_certificate_dict = self._protocol.getissuercert(
-                binary_form=False
-            )
-            self.conn_info.issuer_certificate_der = self._protocol.getissuercert(
-                binary_form=True
-            )
+
+            if self.__early_data_sent:
+                self.conn_info.tls_early_data_accepted = (
+                    self._protocol.early_data_accepted()
+                )
+
+                # the QUIC state machine replays the early requests. no need to try again.
+                if (
+                    not self.conn_info.tls_early_data_accepted
+                    and self._quic_session_tickets is not None
+                    and self.__quic_authority is not None
+                ):
+                    self._quic_session_tickets.reject_early_data(self.__quic_authority)
 
         if (
             self.conn_info.certificate_der
@@ -784,6 +911,19 @@ class HfaceBackend(BaseBackend):
                 datetime.now(tz=timezone.utc) - self._connect_timings[-1]
             )
 
+    def __complete_early_handshake(self) -> None:
+        """Wait for the handshake we left unfinished to send requests in 0-RTT."""
+        self._early_data_pending = False
+
+        self.__exchange_until(
+            HandshakeCompleted,
+            receive_first=False,
+            event_type_collectable=(HandshakeCompleted,),
+        )
+
+        self._connected_at = time.monotonic()
+        self.__populate_quic_conn_info()
+
     def set_tunnel(
         self,
         host: str,
@@ -893,6 +1033,8 @@ class HfaceBackend(BaseBackend):
         try:
             if self._dgram_gro_enabled:
                 peek_data = sync_recv_gro(self.sock, self.blocksize)
+            elif self._recv_buffer is not None:
+                peek_data = self._recv_buffer.recv(self.sock)
             else:
                 peek_data = self.sock.recv(self.blocksize)
         except (OSError, TimeoutError, socket.timeout):
@@ -931,6 +1073,98 @@ class HfaceBackend(BaseBackend):
 
         return self._protocol.has_pending_event()
 
+    def wait_for_response(self, promise: ResponsePromise, timeout: float) -> bool:
+        """Pump incoming data until the response of given promise start arriving or timeout
+        expires. Return True if getresponse(promise=...) can be called without waiting on
+        the network. Unlike getresponse(), it never raise on a socket timeout."""
+        return self.wait_for_any_response((promise,), timeout) is not None
+
+    def wait_for_any_response(
+        self, promises: typing.Sequence[ResponsePromise], timeout: float | None = None
+    ) -> ResponsePromise | None:
+        """Pump incoming data until the response of any given promise start arriving.
+        Every stream of the connection is served in a single pass, the data received for
+        other streams is kept aside. Return the first promise for which getresponse(promise=...)
+        can be called without waiting on the network, or None once timeout expires.
+        Without a timeout, the socket timeout is raised instead."""
+        if self.sock is None or self._protocol is None:
+            return promises[0]  # let getresponse() raise properly.
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            for promise in promises:
+                if self._protocol.has_pending_event(stream_id=promise.stream_id):
+                    return promise
+
+            bck_timeout = self.sock.gettimeout()
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    return None
+
+                if bck_timeout is None or remaining < bck_timeout:
+                    self.sock.settimeout(remaining)
+
+            try:
+                if self._dgram_gro_enabled:
+                    data_in = sync_recv_gro(self.sock, self.blocksize)
+                elif self._recv_buffer is not None:
+                    data_in = self._recv_buffer.recv(self.sock)
+                else:
+                    data_in = self.sock.recv(self.blocksize)
+            except (TimeoutError, SocketTimeout):
+                if deadline is None:
+                    raise
+                continue
+            except OSError:
+                return promises[0]  # let getresponse() raise properly.
+            finally:
+                self.sock.settimeout(bck_timeout)
+
+            # connection loss or protocol error, getresponse() will tell.
+            if not data_in:
+                return promises[0]
+
+            try:
+                if isinstance(data_in, list):
+                    for gro_segment in data_in:
+                        self._protocol.bytes_received(gro_segment)
+                else:
+                    self._protocol.bytes_received(data_in)
+            except self._protocol.exceptions():
+                return promises[0]
+
+            while True:
+                data_out = self._protocol.bytes_to_send()
+
+                if not data_out:
+                    break
+
+                self.sock.sendall(data_out)
+
+            self._last_used_at = time.monotonic()
+
+    def abort_promise(self, promise: ResponsePromise) -> None:
+        """Reset the stream of a request that we no longer want the response of."""
+        if promise.uid not in self._promises:
+            return
+
+        del self._promises[promise.uid]
+        self._promises_per_stream.pop(promise.stream_id, None)
+
+        if self.sock is None or self._protocol is None:
+            return
+
+        if not self.is_multiplexed:
+            # there is no such thing as a stream reset in HTTP/1.1
+            self.close()
+            return
+
+        self.__abort_st(promise.stream_id)
+
     def __exchange_until(
         self,
         event_type: type[Event] | tuple[type[Event], ...],
@@ -946,10 +1180,14 @@ class HfaceBackend(BaseBackend):
         Can be used for the initial handshake for instance."""
         assert self.sock is not None and self._protocol is not None
 
+        if self._early_data_pending and event_type is not HandshakeCompleted:
+            self.__complete_early_handshake()
+
         protocol = self._protocol
         sock = self.sock
         gso_enabled = self._dgram_gso_enabled
         gro_enabled = self._dgram_gro_enabled
+        recv_buffer = self._recv_buffer
         blocksize = self.blocksize
         is_quic = self._svn is HttpVersion.h3
 
@@ -1007,7 +1245,9 @@ class HfaceBackend(BaseBackend):
         while True:
             reach_socket: bool = False
             if not protocol.has_pending_event(stream_id=stream_id):
-                if not receive_first:
+                # credit held back under memory pressure may have been freed by
+                # the events just consumed. it must reach the remote before we wait.
+                if not receive_first or self._memory_budget is not None:
                     send_pending()
 
                 next_timer = protocol.next_timer() if _has_next_timer else None  # type: ignore[union-attr]
@@ -1016,6 +1256,8 @@ class HfaceBackend(BaseBackend):
                     with sub:
                         if gro_enabled:
                             data_in = sync_recv_gro(sock, blocksize)
+                        elif recv_buffer is not None:
+                            data_in = recv_buffer.recv(sock)
                         else:
                             data_in = sock.recv(blocksize)
                 except (
@@ -1108,6 +1350,18 @@ class HfaceBackend(BaseBackend):
             for event in protocol.events(stream_id=stream_id):  # type: Event
                 stream_related_event: bool = hasattr(event, "stream_id")
 
+                # late events for a stream we reset ourselves. nobody is waiting for them.
+                if (
+                    stream_related_event
+                    and self._aborted_streams
+                    and event.stream_id in self._aborted_streams  # type: ignore[attr-defined]
+                ):
+                    if isinstance(event, StreamResetReceived) or getattr(
+                        event, "end_stream", False
+                    ):
+                        self._aborted_streams.discard(event.stream_id)  # type: ignore[attr-defined]
+                    continue
+
                 if not stream_related_event and isinstance(event, ConnectionTerminated):
                     self._protocol = None
                     self.close()
@@ -1304,6 +1558,7 @@ class HfaceBackend(BaseBackend):
         self.__legacy_host_entry = None
         self.__authority_bit_set = False
         self.__protocol_bit_set = False
+        self.__priority = None
 
         self._start_last_request = datetime.now(tz=timezone.utc)
 
@@ -1356,6 +1611,22 @@ class HfaceBackend(BaseBackend):
             )
 
     def putheader(self, header: str, *values: str) -> None:
+        # fast path: static headers (e.g. pool defaults, User-Agent) are already
+        # validated and encoded. We just have to splice them into the header list.
+        if self._headers_template is not None and len(values) == 1:
+            precompiled = self._headers_template.get(header, values[0])
+
+            if precompiled is not None:
+                if precompiled[0] == b"priority":
+                    self.__priority = precompiled[1]
+                if (
+                    self._svn is HttpVersion.h11
+                    or self._svn is None
+                    or precompiled[0] not in HTTP1_ONLY_HEADERS
+                ):
+                    self.__headers.append(precompiled)
+                return
+
         # note: requests allow passing headers as bytes (seen in requests/tests)
         # warn: always lowercase header names, quic transport crash if not lowercase.
         header = header.lower()
@@ -1381,6 +1652,12 @@ class HfaceBackend(BaseBackend):
                 raise ProtocolError(
                     f"Invalid content-length set. Given '{values[0]}' when only digits are allowed."
                 )
+        elif encoded_header == b"priority":
+            self.__priority = (
+                values[0].encode("ascii")
+                if isinstance(values[0], str)
+                else bytes(values[0])
+            )
         elif self.__legacy_host_entry is None and encoded_header == b"host":
             if isinstance(values[0], str):
                 self.__legacy_host_entry = values[0].encode("idna")
@@ -1444,6 +1721,12 @@ class HfaceBackend(BaseBackend):
 
         assert self.sock is not None and self._protocol is not None
 
+        if self._early_data_pending:
+            if self.__headers[0][1].decode() in EARLY_DATA_METHODS:
+                self.__early_data_sent = True
+            else:
+                self.__complete_early_handshake()
+
         # only h2 and h3 support streams, it is faked/simulated for h1.
         self._stream_id = self._protocol.get_available_stream_id()
         # unless anything hint the opposite, the request head frame is the end stream
@@ -1477,6 +1760,9 @@ class HfaceBackend(BaseBackend):
             )
 
         try:
+            if self.__priority is not None:
+                self._protocol.submit_priority(self._stream_id, self.__priority)
+
             self._protocol.submit_headers(
                 self._stream_id,
                 self.__headers,
@@ -1560,6 +1846,8 @@ class HfaceBackend(BaseBackend):
             with sub:
                 if self._dgram_gro_enabled:
                     data_in = sync_recv_gro(self.sock, self.blocksize)
+                elif self._recv_buffer is not None:
+                    data_in = self._recv_buffer.recv(self.sock)
                 else:
                     data_in = self.sock.recv(self.blocksize)
 
@@ -1596,6 +1884,11 @@ class HfaceBackend(BaseBackend):
         assert self.sock is not None
 
         self._protocol.submit_stream_reset(stream_id=__stream_id)
+        self._aborted_streams.add(__stream_id)
+
+        # the peer may never send anything for it again, forget the oldest ones.
+        if len(self._aborted_streams) > MAX_ABORTED_STREAMS:
+            self._aborted_streams.discard(min(self._aborted_streams))
 
         while True:
             data_out = self._protocol.bytes_to_send()
@@ -1616,6 +1909,19 @@ class HfaceBackend(BaseBackend):
 
         self._last_used_at = time.monotonic()
 
+    def __refresh_flow_control_info(self) -> None:
+        """Expose the receive windows, they may have grown since the connection was established."""
+        if self._protocol is None or self.conn_info is None:
+            return
+
+        windows = self._protocol.flow_control_windows()
+
+        if windows is not None:
+            (
+                self.conn_info.flow_control_window,
+                self.conn_info.flow_control_stream_window,
+            ) = windows
+
     def __read_st(
         self,
         __amt: int | None,
@@ -1662,6 +1968,7 @@ class HfaceBackend(BaseBackend):
 
         if events and events[-1].end_stream:
             eot = True
+            self.__refresh_flow_control_info()
 
             try:
                 del self._pending_responses[__stream_id]  # type: ignore[arg-type]
@@ -1689,16 +1996,14 @@ class HfaceBackend(BaseBackend):
             # http-trailers SHOULD be received LAST!
             # but we should tolerate a DataReceived of len=0 last, just in case.
             if idx is not None:
-                trailers = HTTPHeaderDict()
-
-                for raw_header, raw_value in events[idx].headers:  # type: ignore[union-attr]
-                    # ignore...them? special headers. aka. starting with semicolon
-                    if raw_header[0] == 0x3A:
-                        continue
-                    else:
-                        trailers.add(
-                            raw_header.decode("ascii"), raw_value.decode("iso-8859-1")
-                        )
+                # ignore...them? special headers. aka. starting with semicolon
+                trailers = LazyHTTPHeaderDict.from_raw(
+                    [
+                        (raw_header, raw_value)
+                        for raw_header, raw_value in events[idx].headers  # type: ignore[union-attr]
+                        if raw_header[0] != 0x3A
+                    ]
+                )
 
                 events.pop(idx)
 
@@ -1749,16 +2054,24 @@ class HfaceBackend(BaseBackend):
         # ...in the sense that we spoke with the remote peer.
         self._last_used_at = time.monotonic()
 
-        headers = HTTPHeaderDict()
         status: int | None = None
 
-        for raw_header, raw_value in head_event.headers:
+        raw_headers = head_event.headers
+        pseudo_header_count: int = 0
+
+        for raw_header, raw_value in raw_headers:
             # special headers that represent (usually) the HTTP response status, version and reason.
-            if status is None and raw_header[0] == 0x3A:
-                if raw_header == b":status":
-                    status = int(raw_value)
-            else:
-                headers.add(raw_header.decode("ascii"), raw_value.decode("iso-8859-1"))
+            # they always come first, in every supported protocol.
+            if raw_header[0] != 0x3A:
+                break
+            if status is None and raw_header == b":status":
+                status = int(raw_value)
+            pseudo_header_count += 1
+
+        # decoding is deferred to the first access, most callers only read a couple of them.
+        headers = LazyHTTPHeaderDict.from_raw(
+            raw_headers[pseudo_header_count:] if pseudo_header_count else raw_headers
+        )
 
         # this should be unreachable
         if status is None:
@@ -1845,6 +2158,8 @@ class HfaceBackend(BaseBackend):
             dsa=dsa,
             stream_abort=self.__abort_st if not eot else None,
         )
+        self.__refresh_flow_control_info()
+
         promise.response = self._response
         self._response.from_promise = promise
 
@@ -1903,6 +2218,8 @@ class HfaceBackend(BaseBackend):
                 with sub:
                     if self._dgram_gro_enabled:
                         data_in = sync_recv_gro(self.sock, self.blocksize)
+                    elif self._recv_buffer is not None:
+                        data_in = self._recv_buffer.recv(self.sock)
                     else:
                         data_in = self.sock.recv(self.blocksize)
 
@@ -2034,7 +2351,34 @@ class HfaceBackend(BaseBackend):
 
         self._last_used_at = time.monotonic()
 
+    def _after_fork_in_child(self) -> None:
+        """Let go of a connection inherited from the parent process. The socket is shared
+        with the parent, a goodbye frame or a shutdown would break its connection, so only
+        our file descriptor is released."""
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:  # Defensive: should be unreachable
+                pass
+
+        self.sock = None
+        self._protocol = None
+        self._recv_buffer = None
+
     def close(self) -> None:
+        if (
+            self._quic_session_tickets is not None
+            and self.__quic_authority is not None
+            and isinstance(self._protocol, HTTPOverQUICProtocol)
+            and self._protocol.session_ticket is not None
+        ):
+            self._quic_session_tickets.put(
+                self.__quic_authority,
+                self._protocol.session_ticket,
+                self.conn_info,
+                tls_context=self.__quic_tls_context,
+            )
+
         if self.sock:
             if self._protocol is not None:
                 try:
@@ -2070,7 +2414,13 @@ class HfaceBackend(BaseBackend):
         self._promises = {}
         self._promises_per_stream = {}
         self._pending_responses = {}
+        self._aborted_streams = set()
         self.__custom_tls_settings = None
+        self.__quic_authority = None
+        self.__quic_tls_context = None
+        self._early_data_pending = False
+        self.__early_data_sent = False
+        self.__resumed_conn_info = None
         self.conn_info = None
         self.__expected_body_length = None
         self.__remaining_body_length = None
@@ -2080,4 +2430,5 @@ class HfaceBackend(BaseBackend):
         self._last_used_at = time.monotonic()
         self._dgram_gro_enabled = False
         self._dgram_gso_enabled = False
+        self._recv_buffer = None
         self._ech_config = None
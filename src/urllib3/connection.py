@@ -35,7 +35,14 @@ from .util.util import to_str
 from .contrib.anytls import ssl
 
 from ._version import __version__
-from .backend import HfaceBackend, HttpVersion, QuicPreemptiveCacheType, ResponsePromise
+from .backend import (
+    HfaceBackend,
+    HttpVersion,
+    MemoryBudget,
+    QuicPreemptiveCacheType,
+    QuicSessionTicketStore,
+    ResponsePromise,
+)
 from .contrib.resolver import BaseResolver, ResolverDescription
 from .exceptions import BaseSSLError  # noqa
 from .exceptions import ConnectTimeoutError, EarlyResponse
@@ -137,6 +144,9 @@ class HTTPConnection(HfaceBackend):
         proxy_config: ProxyConfig | None = None,
         disabled_svn: set[HttpVersion] | None = None,
         preemptive_quic_cache: QuicPreemptiveCacheType | None = None,
+        quic_session_tickets: QuicSessionTicketStore | None = None,
+        flow_control_budget: int | None = None,
+        memory_budget: MemoryBudget | None = None,
         resolver: BaseResolver | None = None,
         socket_family: socket.AddressFamily = socket.AF_UNSPEC,
         keepalive_delay: float | int | None = DEFAULT_KEEPALIVE_DELAY,
@@ -150,6 +160,9 @@ class HTTPConnection(HfaceBackend):
             socket_options=socket_options,
             disabled_svn=disabled_svn,
             preemptive_quic_cache=preemptive_quic_cache,
+            quic_session_tickets=quic_session_tickets,
+            flow_control_budget=flow_control_budget,
+            memory_budget=memory_budget,
             keepalive_delay=keepalive_delay,
         )
         self.proxy = proxy
@@ -368,7 +381,7 @@ class HTTPConnection(HfaceBackend):
 
     def putheader(self, header: str, *values: str) -> None:
         """"""
-        if not any(isinstance(v, str) and v == SKIP_HEADER for v in values):
+        if SKIP_HEADER not in values:
             super().putheader(header, *values)
         elif to_str(header.lower()) not in SKIPPABLE_HEADERS:
             skippable_headers = "', '".join(
@@ -701,6 +714,9 @@ class HTTPSConnection(HTTPConnection):
         | None = HTTPConnection.default_socket_options,
         disabled_svn: set[HttpVersion] | None = None,
         preemptive_quic_cache: QuicPreemptiveCacheType | None = None,
+        quic_session_tickets: QuicSessionTicketStore | None = None,
+        flow_control_budget: int | None = None,
+        memory_budget: MemoryBudget | None = None,
         resolver: BaseResolver | None = None,
         socket_family: socket.AddressFamily = socket.AF_UNSPEC,
         keepalive_delay: float | int | None = DEFAULT_KEEPALIVE_DELAY,
@@ -745,6 +761,9 @@ class HTTPSConnection(HTTPConnection):
             proxy_config=proxy_config,
             disabled_svn=disabled_svn,
             preemptive_quic_cache=preemptive_quic_cache,
+            quic_session_tickets=quic_session_tickets,
+            flow_control_budget=flow_control_budget,
+            memory_budget=memory_budget,
             resolver=resolver,
             socket_family=socket_family,
             keepalive_delay=keepalive_delay,
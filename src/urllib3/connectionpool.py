@@ -11,6 +11,7 @@ import time
 import typing
 import warnings
 from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from itertools import zip_longest
 from socket import timeout as SocketTimeout
@@ -22,17 +23,24 @@ from ._constant import (
     DEFAULT_BACKGROUND_WATCH_WINDOW,
     DEFAULT_KEEPALIVE_DELAY,
     DEFAULT_KEEPALIVE_IDLE_WINDOW,
+    DEFAULT_HEDGE_DELAY,
+    HEDGE_LATENCY_MIN_SAMPLES,
+    HEDGE_LATENCY_SAMPLES,
+    HEDGE_POLL_INTERVAL,
+    HEDGEABLE_METHODS,
     MINIMAL_BACKGROUND_WATCH_WINDOW,
     MINIMAL_KEEPALIVE_IDLE_WINDOW,
 )
 from ._request_methods import RequestMethods
 from ._typing import _TYPE_BODY, _TYPE_BODY_POSITION, _TYPE_TIMEOUT, ProxyConfig
 from .backend import ConnectionInfo, ResponsePromise
+from .backend._base import RequestHeadersTemplate
 from .connection import (
     BrokenPipeError,
     DummyConnection,
     HTTPConnection,
     HTTPSConnection,
+    _get_default_user_agent,
     _wrap_proxy_error,
 )
 from .connection import port_by_scheme as port_by_scheme
@@ -48,6 +56,7 @@ from .exceptions import (
     EmptyPoolError,
     FullPoolError,
     HostChangedError,
+    HTTPError,
     InsecureRequestWarning,
     LocationValueError,
     MaxRetryError,
@@ -63,11 +72,12 @@ from .exceptions import (
 from .response import HTTPResponse
 from .util.connection import is_connection_dropped
 from .util.proxy import connection_requires_http_tunnel
-from .util.request import NOT_FORWARDABLE_HEADERS, set_file_position
+from .util.request import NOT_FORWARDABLE_HEADERS, make_headers, set_file_position
 from .util.retry import Retry
-from .util.ssl_match_hostname import CertificateError
+from .util.ssl_match_hostname import CertificateError, match_hostname
 from .util.timeout import _DEFAULT_TIMEOUT, Timeout
-from .util.traffic_police import TrafficPolice, UnavailableTraffic
+from .util.fork import register_fork_aware
+from .util.traffic_police import ItemPlaceholder, TrafficPolice, UnavailableTraffic
 from .util.url import Url, _encode_target
 from .util.url import _normalize_host as normalize_host
 from .util.url import parse_url
@@ -286,6 +296,13 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         a connection is marked as idle we should send out a
         ping to the remote peer.
 
+    :param thread_affinity:
+        Have each thread prefer the connection it used last. It keeps consecutive
+        requests of a thread on the same connection (and CPU caches warm) and shortens
+        the time spent holding the pool lock when many threads share the pool, which
+        matters on the free-threaded build. When that connection is busy or gone, any
+        available connection is taken. Default, set to False.
+
     :param \\**conn_kw:
         Additional parameters are used to create fresh :class:`urllib3.connection.HTTPConnection`,
         :class:`urllib3.connection.HTTPSConnection` instances.
@@ -294,6 +311,10 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
     scheme = "http"
     ConnectionCls: type[HTTPConnection] | type[HTTPSConnection] = HTTPConnection
 
+    #: Methods eligible to ``hedge_after``, only the safe ones by default. PUT and DELETE
+    #: are idempotent but a duplicate still reach the server, add them here to opt in.
+    hedgeable_methods: frozenset[str] = HEDGEABLE_METHODS
+
     def __init__(
         self,
         host: str,
@@ -316,6 +337,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         background_watch_delay: int | float | None = DEFAULT_BACKGROUND_WATCH_WINDOW,
         keepalive_delay: int | float | None = DEFAULT_KEEPALIVE_DELAY,
         keepalive_idle_window: int | float | None = DEFAULT_KEEPALIVE_IDLE_WINDOW,
+        thread_affinity: bool = False,
         **conn_kw: typing.Any,
     ):
         ConnectionPool.__init__(self, host, port)
@@ -347,9 +369,18 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         self.block = block
 
+        queue_kw: dict[str, typing.Any] = {
+            "concurrency": False,
+            "strict_maxsize": not self.block,
+        }
+
+        # only passed when enabled, custom QueueCls may not know about it.
+        if thread_affinity:
+            queue_kw["affinity"] = True
+
         try:
             self.pool: TrafficPolice[HTTPConnection] | None = self.QueueCls(
-                maxsize, concurrency=False, strict_maxsize=not self.block
+                maxsize, **queue_kw
             )
         except TypeError:
             self.pool = self.QueueCls(maxsize)
@@ -364,6 +395,12 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         self.num_pings = 0
         self.num_background_watch_iter = 0
 
+        #: Observed delays before response headers, used to learn the hedging delay.
+        self._response_latencies: deque[float] = deque(maxlen=HEDGE_LATENCY_SAMPLES)
+
+        #: Precompiled static request headers, handed to every connection we use.
+        self._headers_template: RequestHeadersTemplate | None = None
+
         self.conn_kw = conn_kw
 
         if self.proxy:
@@ -431,6 +468,10 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         self.conn_kw["keepalive_delay"] = keepalive_delay
 
         self._background_monitoring_stop = threading.Event()
+        #: (watch delay, keepalive delay, keepalive idle window) of the background task, if enabled.
+        self._background_monitoring_args: (
+            tuple[float, int | float | None, int | float | None] | None
+        ) = None
 
         if (
             background_watch_delay is not None
@@ -451,19 +492,46 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             ):
                 background_watch_delay = keepalive_idle_window
 
-            self._background_monitoring: threading.Thread | None = threading.Thread(
-                target=idle_conn_watch_task,
-                args=(
-                    proxy(self),
-                    background_watch_delay,
-                    keepalive_delay,
-                    keepalive_idle_window,
-                ),
+            self._background_monitoring_args = (
+                background_watch_delay,
+                keepalive_delay,
+                keepalive_idle_window,
             )
-            self._background_monitoring.daemon = True  # don't hang on exit.
-            self._background_monitoring.start()
-        else:
-            self._background_monitoring = None
+
+        self._background_monitoring: threading.Thread | None = (
+            self._start_background_monitoring()
+        )
+
+        register_fork_aware(self)
+
+    def _start_background_monitoring(self) -> threading.Thread | None:
+        if self._background_monitoring_args is None:
+            return None
+
+        background_monitoring = threading.Thread(
+            target=idle_conn_watch_task,
+            args=(proxy(self), *self._background_monitoring_args),
+        )
+        background_monitoring.daemon = True  # don't hang on exit.
+        background_monitoring.start()
+
+        return background_monitoring
+
+    def _after_fork_in_child(self) -> None:
+        """Drop the connections inherited from the parent process, they cannot be shared
+        with it. Everything else is kept. The background monitoring task did not survive
+        the fork, it is started again."""
+        if self.pool is None:
+            return
+
+        for conn in self.pool._after_fork_in_child(forget_registered=True):
+            if not isinstance(conn, ItemPlaceholder):
+                conn._after_fork_in_child()
+
+        self._background_monitoring_stop = threading.Event()
+
+        if self._background_monitoring is not None:
+            self._background_monitoring = self._start_background_monitoring()
 
     @property
     def is_idle(self) -> bool:
@@ -750,6 +818,195 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 self.pool.put(conn, immediately_unavailable=True)
             return conn
 
+    def _get_headers_template(self) -> RequestHeadersTemplate:
+        """
+        Retrieve the precompiled static headers (pool default headers and User-Agent).
+        They are compiled again whenever the pool default headers are replaced.
+        """
+        if (
+            self._headers_template is None
+            or self._headers_template.source is not self.headers
+        ):
+            self._headers_template = RequestHeadersTemplate(
+                self.headers,
+                defaults=(("User-Agent", _get_default_user_agent()),),
+            )
+
+        return self._headers_template
+
+    def _get_hedge_delay(self, hedge_after: float | bool) -> float:
+        """Static hedging delay, or the 95th percentile of observed response latencies."""
+        if hedge_after is not True:
+            return float(hedge_after)
+
+        if len(self._response_latencies) < HEDGE_LATENCY_MIN_SAMPLES:
+            return DEFAULT_HEDGE_DELAY
+
+        latencies = sorted(self._response_latencies)
+
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+    def _wait_for_promise(self, promise: ResponsePromise, timeout: float) -> bool:
+        """Return True if the response of given promise can be retrieved right away."""
+        if self.pool is None:
+            return True
+
+        try:
+            with self.pool.borrow(promise, block=True, not_idle_only=True) as conn:
+                return conn.wait_for_response(promise, timeout)
+        except UnavailableTraffic:
+            return True  # let get_response() sort it out.
+
+    def _wait_for_first_promise(
+        self, promises: list[ResponsePromise], timeout: float | None
+    ) -> ResponsePromise | None:
+        """Return the first of given promises which response can be retrieved right away, or
+        None once timeout expires. The promises carried by the connection of the first one
+        are waited on at once. Those on another connection are only checked in between
+        short waits, we cannot wait on several connections at once."""
+        if self.pool is None:
+            return promises[0]
+
+        try:
+            with self.pool.borrow(promises[0], block=True, not_idle_only=True) as conn:
+                carried = [promise for promise in promises if promise in conn]
+
+                if len(carried) < len(promises) and (
+                    timeout is None or timeout > HEDGE_POLL_INTERVAL
+                ):
+                    timeout = HEDGE_POLL_INTERVAL
+
+                try:
+                    ready = conn.wait_for_any_response(carried, timeout)
+                except (TimeoutError, SocketTimeout):
+                    ready = None
+        except UnavailableTraffic:
+            return promises[0]  # let get_response() sort it out.
+
+        if ready is not None:
+            return ready
+
+        for promise in promises:
+            if promise not in carried and self._wait_for_promise(
+                promise, HEDGE_POLL_INTERVAL
+            ):
+                return promise
+
+        return None
+
+    def _wait_for_any_promise(self, promises: list[ResponsePromise]) -> ResponsePromise:
+        """Return the first of given promises which response can be retrieved right away.
+        Every stream of the connection holding the first promise is served at once."""
+        if self.pool is None:
+            return promises[0]
+
+        try:
+            with self.pool.borrow(promises[0], block=True, not_idle_only=True) as conn:
+                try:
+                    ready = conn.wait_for_any_response(
+                        [promise for promise in promises if promise in conn]
+                    )
+                except (TimeoutError, SocketTimeout) as e:
+                    raise ReadTimeoutError(
+                        self,
+                        typing.cast(str, promises[0].get_parameter("url")),
+                        f"Read timed out. (read timeout={conn.timeout})",
+                    ) from e
+        except UnavailableTraffic:
+            return promises[0]  # let get_response() sort it out.
+
+        return ready if ready is not None else promises[0]
+
+    def _abort_promise(self, promise: ResponsePromise) -> None:
+        """Reset the stream of a request we no longer want the response of."""
+        if self.pool is None:
+            return
+
+        try:
+            with self.pool.borrow(promise, block=True, not_idle_only=True) as conn:
+                conn.abort_promise(promise)
+        except UnavailableTraffic:
+            pass
+
+        self.pool.forget(promise)
+
+    def _urlopen_hedged(
+        self,
+        method: str,
+        url: str,
+        hedge_after: float | bool,
+        **urlopen_kw: typing.Any,
+    ) -> HTTPResponse:
+        """Send the request, then a duplicate of it if no response started to arrive
+        within the hedging delay. The first response wins, the other stream is reset."""
+        started_at = time.monotonic()
+
+        primary = self.urlopen(method, url, multiplexed=True, **urlopen_kw)
+
+        # not a multiplexed connection, there is nothing to hedge.
+        if not isinstance(primary, ResponsePromise):
+            return primary
+
+        #: when each request was sent, the latency of the winner is measured from its own.
+        sent_at = {primary.uid: time.monotonic()}
+        winner: ResponsePromise | None = primary
+
+        if not self._wait_for_promise(primary, self._get_hedge_delay(hedge_after)):
+            try:
+                secondary = self.urlopen(method, url, multiplexed=True, **urlopen_kw)
+            except HTTPError as e:
+                log.debug("Unable to hedge %s %s: %r", method, url, e)
+                winner = None
+            else:
+                if not isinstance(secondary, ResponsePromise):
+                    self._abort_promise(primary)
+                    return secondary
+
+                sent_at[secondary.uid] = time.monotonic()
+
+                log.debug(
+                    "Hedged %s %s after %.3fs",
+                    method,
+                    url,
+                    sent_at[secondary.uid] - started_at,
+                )
+
+                read_timeout = self._get_timeout(
+                    urlopen_kw.get("timeout", _DEFAULT_TIMEOUT)
+                ).read_timeout
+                deadline = (
+                    started_at + read_timeout
+                    if isinstance(read_timeout, (int, float))
+                    else None
+                )
+
+                # the first one to receive a response win. past the read timeout, we let
+                # get_response() on the primary request raise as it would without hedging.
+                winner = None
+
+                while winner is None and (
+                    deadline is None or time.monotonic() < deadline
+                ):
+                    winner = self._wait_for_first_promise(
+                        [primary, secondary],
+                        deadline - time.monotonic() if deadline is not None else None,
+                    )
+
+                self._abort_promise(primary if winner is secondary else secondary)
+
+        if winner is None:
+            return typing.cast(HTTPResponse, self.get_response(promise=primary))
+
+        self._record_latency(method, time.monotonic() - sent_at[winner.uid])
+
+        return typing.cast(HTTPResponse, self.get_response(promise=winner))
+
+    def _record_latency(self, method: str, latency: float) -> None:
+        """Keep the time a response took to start arriving, once its request was sent.
+        The hedging delay is learned from them, only the hedgeable methods are kept."""
+        if method.upper() in self.hedgeable_methods:
+            self._response_latencies.append(latency)
+
     def _put_conn(self, conn: HTTPConnection) -> None:
         """
         Put a connection back into the pool.
@@ -971,6 +1228,11 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         self.pool.forget(from_promise)
 
+        promise_retries = from_promise.get_parameter("retries")
+
+        if isinstance(promise_retries, Retry):
+            promise_retries.record_success(self)
+
         # Retrieve request ctx
         method = typing.cast(str, from_promise.get_parameter("method"))
         redirect = typing.cast(bool, from_promise.get_parameter("redirect"))
@@ -1053,6 +1315,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 decode_content=decode_content,
                 multiplexed=True,
                 extension=from_promise.get_parameter("extension"),
+                coalescing=from_promise.get_parameter("coalescing"),
                 **response_kw,
             )
 
@@ -1118,6 +1381,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 decode_content=decode_content,
                 multiplexed=True,
                 extension=from_promise.get_parameter("extension"),
+                coalescing=from_promise.get_parameter("coalescing"),
                 **response_kw,
             )
 
@@ -1139,6 +1403,28 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         return response
 
+    def iter_responses(
+        self, promises: typing.Iterable[ResponsePromise]
+    ) -> typing.Iterator[HTTPResponse]:
+        """
+        Retrieve the responses of given promises in the order they arrive rather than
+        the order the requests were issued. Every stream of a connection is served in a single
+        pass, so a slow response does not hold back the ones that are already there.
+        """
+        pending = list(promises)
+
+        for promise in pending:
+            if not isinstance(promise, ResponsePromise):
+                raise TypeError(
+                    f"iter_responses only support ResponsePromise but received {type(promise)} instead."
+                )
+
+        while pending:
+            promise = self._wait_for_any_promise(pending)
+            pending.remove(promise)
+
+            yield typing.cast(HTTPResponse, self.get_response(promise=promise))
+
     @typing.overload
     def _make_request(
         self,
@@ -1379,6 +1665,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 except ValueError:  # We can forbid it entirely
                     pass
 
+        conn._headers_template = self._get_headers_template()
+
         try:
             rp = conn.request(
                 method,
@@ -1404,6 +1692,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             if e.errno != errno.EPROTOTYPE:
                 raise
 
+        sent_at = time.monotonic()
+
         # Reset the timeout for the recv() on the socket
         read_timeout = timeout_obj.read_timeout
 
@@ -1464,6 +1754,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 finally:
                     self.pool.forget(rp)
 
+        self._record_latency(method, time.monotonic() - sent_at)
+
         # Set properties that are used by the pooling layer.
         response.retries = retries
         response._pool = self
@@ -1538,6 +1830,74 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         return (scheme, host, port) == (self.scheme, self.host, self.port)
 
+    def _is_coalescable(
+        self, conn: HTTPConnection, host: str, addresses: typing.Collection[str]
+    ) -> bool:
+        """
+        Tell whether an established HTTP/2 or HTTP/3 connection may carry the requests for another
+        ``host`` (RFC 9113 section 9.1.1, RFC 9114 section 3.3). The connection must be reached
+        through one of the ``addresses`` the host resolve to and its peer certificate must cover the host.
+        """
+        conn_info = getattr(conn, "conn_info", None)
+
+        if (
+            conn_info is None
+            or not conn_info.certificate_dict
+            or conn_info.destination_address is None
+            or conn.is_closed
+            or not conn.is_multiplexed
+        ):
+            return False
+
+        if conn_info.destination_address[0] not in addresses:
+            return False
+
+        try:
+            match_hostname(conn_info.certificate_dict, host)
+        except CertificateError:
+            return False
+
+        return True
+
+    def _can_coalesce(self, host: str, addresses: typing.Collection[str]) -> bool:
+        """Tell whether one of our established connections may carry the requests for another ``host``."""
+        if self.pool is None or self.scheme != "https":
+            return False
+
+        return any(
+            self._is_coalescable(conn, host, addresses)
+            for conn in list(self.pool._registry.values())
+        )
+
+    def _get_coalescing_conn(
+        self, host: str, addresses: typing.Collection[str]
+    ) -> HTTPConnection:
+        """
+        Take hold of an established connection that may carry the requests for another ``host``.
+        Unlike :meth:`_get_conn`, no other connection is ever handed out and none is opened,
+        :class:`urllib3.exceptions.EmptyPoolError` is raised when none is available.
+        """
+        if self.pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+
+        for conn in list(self.pool._registry.values()):
+            if not self._is_coalescable(conn, host, addresses):
+                continue
+
+            # precisely that one, should it be busy no other may carry the request instead.
+            if not self.pool.take(conn):
+                continue
+
+            # it may have been closed meanwhile by another thread.
+            if self._is_coalescable(conn, host, addresses):
+                return conn
+
+            self.pool.release()
+
+        raise EmptyPoolError(
+            self, f"No established connection may carry the requests for {host}."
+        )
+
     @typing.overload  # type: ignore[override]
     def urlopen(
         self,
@@ -1562,6 +1922,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         extension: ExtensionFromHTTP | None = ...,
         *,
         multiplexed: Literal[False] = ...,
+        hedge_after: float | bool | None = ...,
+        priority: int | tuple[int, bool] | None = ...,
         **response_kw: typing.Any,
     ) -> HTTPResponse: ...
 
@@ -1589,6 +1951,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         extension: ExtensionFromHTTP | None = ...,
         *,
         multiplexed: Literal[True],
+        priority: int | tuple[int, bool] | None = ...,
         **response_kw: typing.Any,
     ) -> ResponsePromise: ...
 
@@ -1614,6 +1977,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         on_early_response: typing.Callable[[HTTPResponse], None] | None = None,
         extension: ExtensionFromHTTP | None = None,
         multiplexed: bool = False,
+        hedge_after: float | bool | None = None,
+        priority: int | tuple[int, bool] | None = None,
+        coalescing: tuple[str, typing.Collection[str]] | None = None,
         **response_kw: typing.Any,
     ) -> HTTPResponse | ResponsePromise:
         """
@@ -1731,7 +2097,63 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             Dispatch the request in a non-blocking way, this means that the
             response will be retrieved in the future with the get_response()
             method.
+
+        :param hedge_after:
+            Only for the methods in ``hedgeable_methods`` (GET, HEAD, OPTIONS and TRACE by
+            default) over a multiplexed connection (HTTP/2 or HTTP/3).
+            If no response started to arrive within that delay (in seconds), a duplicate
+            request is sent and the first response to come wins. The other stream is reset.
+            Pass ``True`` to use the 95th percentile of the latencies observed by this pool.
+
+        :param priority:
+            The urgency of the request, from 0 (most urgent) to 7, or a tuple (urgency, incremental).
+            It is sent as the ``Priority`` header (RFC 9218), unless already set. Over HTTP/2
+            and HTTP/3, a PRIORITY_UPDATE frame is sent as well and, when several responses
+            are awaited on the same connection, the most urgent ones are served first.
+
+        :param coalescing:
+            Internal, used by :class:`urllib3.PoolManager` connection coalescing. A tuple of the
+            host and the addresses it resolve to. The request is only sent over an established
+            HTTP/2 or HTTP/3 connection that may carry the requests of that host, otherwise
+            :class:`urllib3.exceptions.EmptyPoolError` is raised.
         """
+        if priority is not None:
+            headers = HTTPHeaderDict(headers if headers is not None else self.headers)
+
+            if "priority" not in headers:
+                headers.update(make_headers(priority=priority))
+
+        if (
+            hedge_after is not None
+            and hedge_after is not False
+            and not multiplexed
+            and extension is None
+            and method.upper() in self.hedgeable_methods
+            and (body is None or isinstance(body, (bytes, str)))
+        ):
+            return self._urlopen_hedged(
+                method,
+                url,
+                hedge_after,
+                body=body,
+                headers=headers,
+                retries=retries,
+                redirect=redirect,
+                assert_same_host=assert_same_host,
+                timeout=timeout,
+                pool_timeout=pool_timeout,
+                release_conn=release_conn,
+                chunked=chunked,
+                body_pos=body_pos,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                on_post_connection=on_post_connection,
+                on_upload_body=on_upload_body,
+                on_early_response=on_early_response,
+                coalescing=coalescing,
+                **response_kw,
+            )
+
         parsed_url = parse_url(url)
         destination_scheme = parsed_url.scheme
 
@@ -1748,6 +2170,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         if assert_same_host and not self.is_same_host(url):
             raise HostChangedError(self, url, retries)
 
+        # Fail fast if the upstream is known to be down.
+        retries.admit(self)
+
         # Ensure that the URL we're connecting to is properly encoded
         if url.startswith("/"):
             url = to_str(_encode_target(url))
@@ -1794,10 +2219,13 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             # Request a connection from the queue.
             timeout_obj = self._get_timeout(timeout)
 
-            try:
-                conn = self._get_conn(timeout=pool_timeout, heb_timeout=timeout_obj)
-            except TypeError:  # Defensive: 3rd party conn hacks
-                conn = self._get_conn(timeout=pool_timeout)
+            if coalescing is not None:
+                conn = self._get_coalescing_conn(*coalescing)
+            else:
+                try:
+                    conn = self._get_conn(timeout=pool_timeout, heb_timeout=timeout_obj)
+                except TypeError:  # Defensive: 3rd party conn hacks
+                    conn = self._get_conn(timeout=pool_timeout)
 
             conn.timeout = timeout_obj.connect_timeout  # type: ignore[assignment]
 
@@ -1857,6 +2285,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 response.set_parameter("assert_same_host", assert_same_host)
                 response.set_parameter("chunked", chunked)
                 response.set_parameter("body_pos", body_pos)
+                response.set_parameter("coalescing", coalescing)
 
             # Everything went great!
             clean_exit = True
@@ -1970,6 +2399,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 on_post_connection=on_post_connection,
                 multiplexed=multiplexed,
                 extension=extension,
+                coalescing=coalescing,
                 **response_kw,
             )
 
@@ -1977,6 +2407,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             assert isinstance(response, ResponsePromise)
             return response  # actually a response promise!
 
+        retries.record_success(self)
+
         # we are relaxing that constraint to behave properly
         # with 3rd party mocking tool such as vcrpy.
         # see https://github.com/jawah/urllib3.future/issues/320
@@ -2035,6 +2467,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 decode_content=decode_content,
                 multiplexed=False,
                 extension=extension,
+                coalescing=coalescing,
                 **response_kw,
             )
 
@@ -2069,6 +2502,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 decode_content=decode_content,
                 multiplexed=False,
                 extension=extension,
+                coalescing=coalescing,
                 **response_kw,
             )
 
@@ -25,6 +25,7 @@ from .protocols import (
     HTTPOverTCPProtocol,
     HTTPProtocol,
     HTTPProtocolFactory,
+    MemoryBudget,
 )
 
 __all__ = (
@@ -36,4 +37,5 @@ __all__ = (
     "HTTPOverTCPProtocol",
     "HTTPProtocol",
     "HTTPProtocolFactory",
+    "MemoryBudget",
 )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+#: RFC 9218 section 4.1, 0 is the most urgent and 7 the least.
+DEFAULT_URGENCY: int = 3
+MAX_URGENCY: int = 7
+
+
+def parse_priority(value: bytes) -> tuple[int, bool]:
+    """Extract the urgency and incremental parameters from a Priority field value (RFC 9218 section 5).
+    Invalid or unknown members are ignored as the specification requires."""
+    urgency, incremental = DEFAULT_URGENCY, False
+
+    for member in value.split(b","):
+        # parameters of a member are meaningless to us.
+        member = member.partition(b";")[0]
+        key, _, item = member.partition(b"=")
+        key, item = key.strip(), item.strip()
+
+        if key == b"u":
+            if item.isdigit() and int(item) <= MAX_URGENCY:
+                urgency = int(item)
+        elif key == b"i":
+            if not item or item == b"?1":
+                incremental = True
+            elif item == b"?0":
+                incremental = False
+
+    return urgency, incremental
@@ -3,7 +3,8 @@ from __future__ import annotations
 import typing
 from collections import deque
 
-from .events import Event
+from ._priority import DEFAULT_URGENCY
+from .events import Event, StreamReset
 
 
 class StreamMatrix:
@@ -14,6 +15,7 @@ class StreamMatrix:
         "_count",
         "_event_cursor_id",
         "_stream_count",
+        "_priorities",
     )
 
     def __init__(self) -> None:
@@ -21,6 +23,8 @@ class StreamMatrix:
         self._count: int = 0
         self._stream_count: int = 0
         self._event_cursor_id: int = 0
+        #: stream_id -> (urgency, incremental), only for streams that were given one.
+        self._priorities: dict[int, tuple[int, bool]] = {}
 
     def __len__(self) -> int:
         return self._count
@@ -89,6 +93,31 @@ class StreamMatrix:
 
         self._count += 1
 
+    def prioritize(self, stream_id: int, urgency: int, incremental: bool) -> None:
+        """Serve the events of given stream according to its priority (RFC 9218) instead of arrival order."""
+        self._priorities[stream_id] = (urgency, incremental)
+
+    def _most_urgent_stream(self) -> int:
+        elected: int | None = None
+        elected_urgency: int = DEFAULT_URGENCY + 1
+
+        # lowest urgency first, then the oldest stream. incremental ones are
+        # moved at the back once served so that they share the bandwidth.
+        for stream_id in self._matrix:
+            if stream_id is None:
+                continue
+
+            urgency = (
+                self._priorities[stream_id][0]
+                if stream_id in self._priorities
+                else DEFAULT_URGENCY
+            )
+
+            if urgency < elected_urgency:
+                elected, elected_urgency = stream_id, urgency
+
+        return elected  # type: ignore[return-value]
+
     def popleft(self, stream_id: int | None = None) -> Event | None:
         if self._count == 0:
             return None
@@ -99,13 +128,16 @@ class StreamMatrix:
         )
 
         if stream_id is None and any_stream_event:
-            matrix_dict_iter = self._matrix.__iter__()
-
-            stream_id = next(matrix_dict_iter)
+            if self._priorities:
+                stream_id = self._most_urgent_stream()
+            else:
+                matrix_dict_iter = self._matrix.__iter__()
 
-            if stream_id is None:
                 stream_id = next(matrix_dict_iter)
 
+                if stream_id is None:
+                    stream_id = next(matrix_dict_iter)
+
         if (
             stream_id is not None
             and have_global_event
@@ -128,6 +160,12 @@ class StreamMatrix:
                 del self._matrix[stream_id]
                 self._stream_count -= 1
 
+            if stream_id is not None and stream_id in self._priorities:
+                if getattr(ev, "end_stream", False) or isinstance(ev, StreamReset):
+                    del self._priorities[stream_id]
+                elif self._priorities[stream_id][1] and stream_id in self._matrix:
+                    self._matrix[stream_id] = self._matrix.pop(stream_id)
+
         return ev
 
     def count(
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 from ._factories import HTTPProtocolFactory
+from ._flow_control import MemoryBudget
 from ._protocols import (
     HTTP1Protocol,
     HTTP2Protocol,
@@ -34,4 +35,5 @@ __all__ = (
     "HTTPOverTCPProtocol",
     "HTTPProtocol",
     "HTTPProtocolFactory",
+    "MemoryBudget",
 )
@@ -0,0 +1,295 @@
+# Copyright 2024 Ahmed Tahri
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+
+#: Upper bound of the receive window we are willing to grant on a single connection.
+#: Whatever the remote can push without waiting for us has to be buffered in memory.
+DEFAULT_FLOW_CONTROL_BUDGET: int = 67108864
+
+#: Smallest receive window allowed by HTTP/2 (RFC 9113 section 6.9.2).
+MINIMAL_FLOW_CONTROL_WINDOW: int = 65535
+
+# The window grows when a probe shows that at least BDP_GROWTH_THRESHOLD
+# of it was consumed within a round-trip. We then grant BDP_GROWTH_FACTOR
+# times the sample. Same values as gRPC BDP estimator.
+BDP_GROWTH_THRESHOLD: float = 2 / 3
+BDP_GROWTH_FACTOR: int = 2
+BDP_RTT_SMOOTHING: float = 0.9
+
+
+class BDPEstimator:
+    """Bandwidth-delay product estimator used to size our receive windows.
+
+    A probe (PING) is started with the first data received, every byte that
+    arrive until its acknowledgement is accounted as one round-trip worth of
+    data. When the sample gets close to the current window the pipe is
+    throttled by us and the window is grown, up to the given budget.
+
+    Windows never shrink. QUIC does not allow taking credit back (RFC 9000 section 4.1)
+    and over HTTP/2 the credit already granted stays granted. Memory pressure is handled
+    by MemoryBudget instead, which holds back the credit of the streams that pile up data.
+    """
+
+    __slots__ = (
+        "window",
+        "budget",
+        "rtt",
+        "_sample",
+        "_probe_sent_at",
+        "_bandwidth_max",
+    )
+
+    def __init__(self, window: int, budget: int | None = None) -> None:
+        if budget is None:
+            budget = DEFAULT_FLOW_CONTROL_BUDGET
+
+        if budget < MINIMAL_FLOW_CONTROL_WINDOW:
+            raise ValueError(
+                f"flow control budget must be at least {MINIMAL_FLOW_CONTROL_WINDOW} bytes, got {budget}"
+            )
+
+        #: The receive window currently granted to the remote peer.
+        self.window: int = min(window, budget)
+        #: Maximum receive window we accept to grant.
+        self.budget: int = budget
+        #: Smoothed round-trip time (in seconds) observed by the probes.
+        self.rtt: float | None = None
+
+        self._sample: int = 0
+        self._probe_sent_at: float | None = None
+        self._bandwidth_max: float = 0.0
+
+    @property
+    def probing(self) -> bool:
+        return self._probe_sent_at is not None
+
+    def on_data_received(self, size: int, now: float) -> bool:
+        """Account for received data. Return True if a probe must be sent now."""
+        if self._probe_sent_at is not None:
+            self._sample += size
+            return False
+
+        # nothing to learn once we reached our budget.
+        if self.window >= self.budget:
+            return False
+
+        self._sample = size
+        self._probe_sent_at = now
+
+        return True
+
+    def on_probe_acknowledged(self, now: float) -> int | None:
+        """Conclude the ongoing probe. Return the new window if it should grow."""
+        if self._probe_sent_at is None:
+            return None
+
+        rtt_sample = max(now - self._probe_sent_at, 1e-6)
+        self._probe_sent_at = None
+
+        if self.rtt is None:
+            self.rtt = rtt_sample
+        else:
+            self.rtt += (rtt_sample - self.rtt) * BDP_RTT_SMOOTHING
+
+        bandwidth = self._sample / self.rtt
+
+        if (
+            self._sample < self.window * BDP_GROWTH_THRESHOLD
+            or bandwidth < self._bandwidth_max
+        ):
+            return None
+
+        self._bandwidth_max = bandwidth
+
+        window = min(self._sample * BDP_GROWTH_FACTOR, self.budget)
+
+        if window <= self.window:
+            return None
+
+        self.window = window
+
+        return window
+
+
+class MemoryBudget:
+    """Memory that many connections share to buffer the data they received, but that
+    was not consumed yet. Crossing the limit does not drop anything, the connections
+    stop granting flow control credit to the streams that keep piling up data instead.
+
+    It is thread safe, a single instance is meant to be shared across a whole PoolManager.
+
+    Only the data still held by the connections (their pending events) is accounted. Once
+    handed to a response, e.g. the surplus of a read(amt) kept in the response own buffer,
+    it is released from the budget even if not read by the user yet.
+
+    :param limit: Amount of buffered bytes (across every connection) above which we start applying backpressure.
+    """
+
+    __slots__ = (
+        "limit",
+        "_usage",
+        "_peak",
+        "_lock",
+    )
+
+    def __init__(self, limit: int) -> None:
+        if limit < MINIMAL_FLOW_CONTROL_WINDOW:
+            raise ValueError(
+                f"memory budget must be at least {MINIMAL_FLOW_CONTROL_WINDOW} bytes, got {limit}"
+            )
+
+        self.limit: int = limit
+
+        self._usage: int = 0
+        self._peak: int = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<MemoryBudget {self._usage}/{self.limit}>"
+
+    @property
+    def usage(self) -> int:
+        """Bytes currently buffered, waiting to be consumed."""
+        return self._usage
+
+    @property
+    def peak(self) -> int:
+        """Highest usage observed so far."""
+        return self._peak
+
+    @property
+    def exceeded(self) -> bool:
+        return self._usage > self.limit
+
+    def acquire(self, size: int) -> None:
+        with self._lock:
+            self._usage += size
+
+            if self._usage > self._peak:
+                self._peak = self._usage
+
+    def release(self, size: int) -> None:
+        with self._lock:
+            self._usage -= size
+
+    def _after_fork_in_child(self) -> None:
+        # the buffered data belonged to the connections that the child dropped.
+        self._lock = threading.Lock()
+        self._usage = 0
+
+
+class StreamBufferLedger:
+    """Per connection view of a MemoryBudget. Keep track of what each stream has buffered
+    and of the credit we held back while the budget is exceeded.
+
+    A stream that has nothing left buffered always gets its credit back, someone is
+    actively waiting on it. Otherwise, we could starve the very reader that would bring
+    the usage down.
+    """
+
+    __slots__ = (
+        "budget",
+        "_streams",
+        "_withheld",
+        "_closed",
+    )
+
+    def __init__(self, budget: MemoryBudget) -> None:
+        self.budget: MemoryBudget = budget
+
+        #: stream_id -> bytes buffered
+        self._streams: dict[int, int] = {}
+        #: stream_id -> credit held back
+        self._withheld: dict[int, int] = {}
+        self._closed: bool = False
+
+    @property
+    def withholding(self) -> bool:
+        return bool(self._withheld)
+
+    def buffered(self, stream_id: int | None = None) -> int:
+        """Bytes buffered for given stream, or the whole connection if unspecified."""
+        if stream_id is None:
+            return sum(self._streams.values())
+
+        return self._streams.get(stream_id, 0)
+
+    def is_withheld(self, stream_id: int) -> bool:
+        return stream_id in self._withheld
+
+    def on_data_buffered(self, stream_id: int, size: int) -> None:
+        if not size or self._closed:
+            return
+
+        self._streams[stream_id] = self._streams.get(stream_id, 0) + size
+        self.budget.acquire(size)
+
+    def on_data_consumed(self, stream_id: int, size: int) -> None:
+        buffered = self._streams.get(stream_id)
+
+        # already released, e.g. the connection was terminated.
+        if buffered is None or not size:
+            return
+
+        size = min(size, buffered)
+
+        if buffered == size:
+            del self._streams[stream_id]
+        else:
+            self._streams[stream_id] = buffered - size
+
+        self.budget.release(size)
+
+    def should_withhold(self, stream_id: int, credit: int) -> bool:
+        """Determine if the credit for data just buffered on given stream must be held back.
+        If so, it is remembered and will be handed out by release_credit() later on."""
+        if stream_id not in self._withheld and not self.budget.exceeded:
+            return False
+
+        self._withheld[stream_id] = self._withheld.get(stream_id, 0) + credit
+
+        return True
+
+    def release_credit(self) -> list[tuple[int, int]]:
+        """Give back the (stream_id, credit) that no longer need to be held back."""
+        if not self._withheld:
+            return []
+
+        exceeded = self.budget.exceeded
+
+        released = [
+            (stream_id, credit)
+            for stream_id, credit in self._withheld.items()
+            if not exceeded or stream_id not in self._streams
+        ]
+
+        for stream_id, _ in released:
+            del self._withheld[stream_id]
+
+        return released
+
+    def clear(self) -> None:
+        """Release everything, the connection is gone."""
+        self._closed = True
+
+        buffered = sum(self._streams.values())
+
+        self._streams.clear()
+        self._withheld.clear()
+
+        if buffered:
+            self.budget.release(buffered)
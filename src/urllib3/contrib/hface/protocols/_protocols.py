@@ -68,6 +68,13 @@ class BaseProtocol(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def flow_control_windows(self) -> tuple[int, int] | None:
+        """
+        The receive windows (connection, stream) currently granted to the remote peer.
+        None if the protocol has no flow control.
+        """
+        return None
+
 
 class OverTCPProtocol(BaseProtocol, metaclass=ABCMeta):
     """
@@ -132,6 +139,14 @@ class OverQUICProtocol(OverUDPProtocol):
     def ech_accepted(self) -> bool:
         raise NotImplementedError
 
+    def session_resumed(self) -> bool:
+        """Whether the TLS session was resumed using the given session ticket."""
+        return False
+
+    def early_data_accepted(self) -> bool:
+        """Whether the data sent prior to the handshake completion (0-RTT) was accepted."""
+        return False
+
 
 class HTTPProtocol(metaclass=ABCMeta):
     """
@@ -233,6 +248,18 @@ class HTTPProtocol(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def submit_priority(self, stream_id: int, priority: bytes) -> None:
+        """
+        Signal the priority of a stream (RFC 9218 Priority field value, e.g. ``u=1, i``).
+
+        The remote peer is informed with a PRIORITY_UPDATE frame when the protocol
+        support it and the events of the most urgent streams are served first.
+        Does nothing by default.
+
+        :param stream_id: stream ID
+        :param priority: the Priority field value
+        """
+
     @abstractmethod
     def submit_close(self, error_code: int = 0) -> None:
         """
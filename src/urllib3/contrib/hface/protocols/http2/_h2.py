@@ -18,6 +18,7 @@ from __future__ import annotations
 
 from collections import deque
 from secrets import token_bytes
+from time import monotonic
 from typing import Iterator
 
 import jh2.config  # type: ignore
@@ -29,6 +30,7 @@ import jh2.settings  # type: ignore
 
 from jh2 import __version__ as jh2_version
 
+from ..._priority import parse_priority
 from ..._stream_matrix import StreamMatrix
 from ..._typing import HeadersType
 from ...events import (
@@ -41,6 +43,12 @@ from ...events import (
     HeadersReceived,
     StreamResetReceived,
 )
+from .._flow_control import (
+    DEFAULT_FLOW_CONTROL_BUDGET,
+    BDPEstimator,
+    MemoryBudget,
+    StreamBufferLedger,
+)
 from .._protocols import HTTP2Protocol
 
 
@@ -52,6 +60,16 @@ JH2_NOT_RFC_COMPLIANT_SETTINGS: bool = tuple(
     int(p) for p in jh2_version.split(".", maxsplit=3)[:3]
 ) <= (5, 0, 11)
 
+#: Our initial receive windows, they grow afterward (see BDPEstimator) if the link requires it.
+INITIAL_STREAM_WINDOW_SIZE: int = 6291456
+INITIAL_CONNECTION_WINDOW_SIZE: int = 15728640
+
+#: RFC 9218 section 7.1, not known to jh2.
+PRIORITY_UPDATE_FRAME_TYPE: int = 0x10
+
+#: Opaque data of the PING frames used to measure the bandwidth-delay product.
+BDP_PING_DATA: bytes = b"\x00urllib3"
+
 
 class _PatchedH2Connection(jh2.connection.H2Connection):  # type: ignore[misc]
     """
@@ -63,6 +81,7 @@ class _PatchedH2Connection(jh2.connection.H2Connection):  # type: ignore[misc]
         self,
         config: jh2.config.H2Configuration | None = None,
         observable_impl: HTTP2ProtocolHyperImpl | None = None,
+        initial_window_size: int = INITIAL_STREAM_WINDOW_SIZE,
     ) -> None:
         super().__init__(config=config)
         # by default CONNECT is disabled
@@ -71,7 +90,7 @@ class _PatchedH2Connection(jh2.connection.H2Connection):  # type: ignore[misc]
             initial_settings = {
                 jh2.settings.SettingCodes.HEADER_TABLE_SIZE: 65536,
                 jh2.settings.SettingCodes.ENABLE_PUSH: 0,  # we don't support it anyway for now.
-                jh2.settings.SettingCodes.INITIAL_WINDOW_SIZE: 6291456,
+                jh2.settings.SettingCodes.INITIAL_WINDOW_SIZE: initial_window_size,
                 jh2.settings.SettingCodes.MAX_HEADER_LIST_SIZE: 262144,
             }
         else:
@@ -149,7 +168,21 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
         validate_inbound_headers: bool = False,
         normalize_outbound_headers: bool = False,
         normalize_inbound_headers: bool = True,
+        flow_control_budget: int | None = None,
+        memory_budget: MemoryBudget | None = None,
     ) -> None:
+        if memory_budget is not None:
+            # we cannot grant a connection more than what we accept to buffer overall.
+            flow_control_budget = min(
+                flow_control_budget or DEFAULT_FLOW_CONTROL_BUDGET, memory_budget.limit
+            )
+
+        self._bdp: BDPEstimator = BDPEstimator(
+            INITIAL_STREAM_WINDOW_SIZE, flow_control_budget
+        )
+        self._ledger: StreamBufferLedger | None = (
+            StreamBufferLedger(memory_budget) if memory_budget is not None else None
+        )
         self._connection: jh2.connection.H2Connection = _PatchedH2Connection(
             jh2.config.H2Configuration(
                 client_side=True,
@@ -159,13 +192,27 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
                 normalize_inbound_headers=normalize_inbound_headers,
             ),
             observable_impl=self,
+            initial_window_size=self._bdp.window,
         )
         self._open_stream_count: int = 0
         self._connection.initiate_connection()
         if JH2_NOT_RFC_COMPLIANT_SETTINGS:
-            self._connection.increment_flow_control_window(2**24)
+            # we are stuck with the default stream window, only the connection one can grow.
+            self._bdp.window = self._connection.local_settings.initial_window_size
+            self._connection_window: int = min(
+                2**24 + self._bdp.window, self._bdp.budget
+            )
         else:
-            self._connection.increment_flow_control_window(15663105)
+            self._connection_window = min(
+                INITIAL_CONNECTION_WINDOW_SIZE, self._bdp.budget
+            )
+        if self._connection_window > 65535:
+            self._connection.increment_flow_control_window(
+                self._connection_window - 65535
+            )
+        # the first SETTINGS acknowledgement marks the end of the handshake.
+        # the following ones are our window adjustments.
+        self._settings_acknowledged: bool = False
         self._events: StreamMatrix = StreamMatrix()
         self._terminated: bool = False
         self._goaway_to_honor: bool = False
@@ -210,6 +257,8 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
 
     def submit_close(self, error_code: int = 0) -> None:
         self._connection.close_connection(error_code)
+        if self._ledger is not None:
+            self._ledger.clear()
 
     def submit_headers(
         self, stream_id: int, headers: HeadersType, end_stream: bool = False
@@ -225,8 +274,27 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
     def submit_stream_reset(self, stream_id: int, error_code: int = 0) -> None:
         self._connection.reset_stream(stream_id, error_code)
 
+    def submit_priority(self, stream_id: int, priority: bytes) -> None:
+        self._events.prioritize(stream_id, *parse_priority(priority))
+
+        # jh2 is unaware of PRIORITY_UPDATE, the frame is written as-is. It can
+        # precede the HEADERS of the stream it references (idle stream).
+        payload = stream_id.to_bytes(4, "big") + priority
+
+        self._connection._data_to_send += (
+            len(payload).to_bytes(3, "big")
+            + PRIORITY_UPDATE_FRAME_TYPE.to_bytes(1, "big")
+            + b"\x00\x00\x00\x00\x00"  # no flags, on the connection control stream
+            + payload
+        )
+
     def next_event(self, stream_id: int | None = None) -> Event | None:
-        return self._events.popleft(stream_id=stream_id)
+        ev = self._events.popleft(stream_id=stream_id)
+
+        if self._ledger is not None and ev.__class__ is DataReceived:
+            self._ledger.on_data_consumed(ev.stream_id, len(ev.data))
+
+        return ev
 
     def has_pending_event(
         self,
@@ -256,7 +324,23 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
                     self._open_stream_count -= 1
                     stream = conn.streams.pop(stream_id)
                     conn._closed_streams[stream_id] = stream.closed_by
-                conn.acknowledge_received_data(e.flow_controlled_length, stream_id)
+                if self._ledger is None:
+                    conn.acknowledge_received_data(e.flow_controlled_length, stream_id)
+                else:
+                    self._ledger.on_data_buffered(stream_id, len(e.data))
+
+                    # the connection window is always replenished, only the offending
+                    # streams are held back. Otherwise, we would starve every stream.
+                    self._acknowledge_connection_data(e.flow_controlled_length)
+
+                    if not self._ledger.should_withhold(
+                        stream_id, e.flow_controlled_length
+                    ):
+                        self._acknowledge_stream_data(
+                            stream_id, e.flow_controlled_length
+                        )
+                if self._bdp.on_data_received(e.flow_controlled_length, monotonic()):
+                    conn.ping(BDP_PING_DATA)
                 yield DataReceived(stream_id, e.data, end_stream=end_stream)
             elif ev_type is jh2.events.InformationalResponseReceived:
                 yield EarlyHeadersReceived(
@@ -285,13 +369,67 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
                     self._terminated = True
                     yield ConnectionTerminated(e.error_code, None)
             elif ev_type in SETTINGS_EVENT_SET:
+                if ev_type is jh2.events.SettingsAcknowledged:
+                    if self._settings_acknowledged:
+                        continue
+                    self._settings_acknowledged = True
                 yield HandshakeCompleted(alpn_protocol="h2")
             elif ev_type is jh2.events.PingAckReceived:
                 uid = e.ping_data
 
-                if uid in self._pending_ping_ack:
+                if uid == BDP_PING_DATA:
+                    self._grow_windows(self._bdp.on_probe_acknowledged(monotonic()))
+                elif uid in self._pending_ping_ack:
                     self._pending_ping_ack.remove(uid)
 
+    def _grow_windows(self, window: int | None) -> None:
+        if window is None:
+            return
+
+        if window > self._connection_window:
+            self._connection.increment_flow_control_window(
+                window - self._connection_window
+            )
+            self._connection_window = window
+
+        if JH2_NOT_RFC_COMPLIANT_SETTINGS:
+            return
+
+        # applies to the open streams as well, once acknowledged by the remote.
+        self._connection.update_settings(
+            {jh2.settings.SettingCodes.INITIAL_WINDOW_SIZE: window}
+        )
+
+    def _acknowledge_connection_data(self, size: int) -> None:
+        conn = self._connection
+        window_manager = getattr(conn, "_inbound_flow_control_window_manager", None)
+
+        if window_manager is None:  # Defensive: jh2 internals changed
+            conn.increment_flow_control_window(size)
+            return
+
+        increment = window_manager.process_bytes(size)
+
+        if increment:
+            frame = jh2.connection.WindowUpdateFrame(0)
+            frame.window_increment = increment
+            conn._prepare_for_sending([frame])
+
+    def _acknowledge_stream_data(self, stream_id: int, size: int) -> None:
+        stream = self._connection.streams.get(stream_id)
+
+        # no point incrementing the window of a closed stream.
+        if stream is not None and stream.open:
+            self._connection._prepare_for_sending(
+                stream.acknowledge_received_data(size)
+            )
+
+    def flow_control_windows(self) -> tuple[int, int] | None:
+        return (
+            self._connection_window,
+            self._connection.local_settings.initial_window_size,
+        )
+
     def connection_lost(self) -> None:
         self._connection_terminated()
 
@@ -321,6 +459,10 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
             self._max_frame_size = self._connection.remote_settings.max_frame_size
 
     def bytes_to_send(self) -> bytes:
+        if self._ledger is not None and self._ledger.withholding:
+            for stream_id, credit in self._ledger.release_credit():
+                self._acknowledge_stream_data(stream_id, credit)
+
         return self._connection.data_to_send()  # type: ignore[no-any-return]
 
     def _connection_terminated(
@@ -330,6 +472,8 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
             return
         error_code = int(error_code)  # Convert h2 IntEnum to an actual int
         self._terminated = True
+        if self._ledger is not None:
+            self._ledger.clear()
         self._events.append(ConnectionTerminated(error_code, message))
 
     def should_wait_remote_flow_control(
@@ -346,6 +490,8 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
 
     def reshelve(self, *events: Event) -> None:
         for ev in reversed(events):
+            if self._ledger is not None and ev.__class__ is DataReceived:
+                self._ledger.on_data_buffered(ev.stream_id, len(ev.data))
             self._events.appendleft(ev)
 
     def ping(self) -> None:
@@ -40,9 +40,17 @@ from qh3 import (
     h3_events,
     quic_events,
 )
+from qh3._hazmat import encode_uint_var
+from qh3.h3.connection import encode_frame
 from qh3.quic.connection import QuicConnectionState
 
+try:
+    from qh3.quic.connection import Limit
+except ImportError:  # Defensive: qh3 internals changed
+    Limit = None  # type: ignore[assignment,misc]
+
 from ..._configuration import QuicTLSConfig
+from ..._priority import parse_priority
 from ..._stream_matrix import StreamMatrix
 from ..._typing import AddressType, HeadersType
 from ...events import (
@@ -57,6 +65,12 @@ from ...events import (
     HeadersReceived,
     StreamResetReceived,
 )
+from .._flow_control import (
+    DEFAULT_FLOW_CONTROL_BUDGET,
+    BDPEstimator,
+    MemoryBudget,
+    StreamBufferLedger,
+)
 from .._protocols import HTTP3Protocol
 
 
@@ -82,6 +96,49 @@ _SHORT_NAME_ASSOC = {
 # v1.8+ introduced H3 Goaway event
 _QH3_H3_HAVE_GA_EV: bool = hasattr(h3_events, "GoawayReceived")
 
+#: Our initial receive windows, they grow afterward (see BDPEstimator) if the link requires it.
+INITIAL_STREAM_WINDOW_SIZE: int = 6291456
+INITIAL_CONNECTION_WINDOW_SIZE: int = 15728640
+
+#: RFC 9218 section 7.2, PRIORITY_UPDATE for a request stream.
+PRIORITY_UPDATE_FRAME_TYPE: int = 0xF0700
+
+#: PING unique id used to measure the bandwidth-delay product. Keepalive ones count from zero.
+BDP_PING_UID: int = -1
+
+
+def _can_tune_windows(quic: QuicConnection) -> bool:
+    """The receive windows are tuned through qh3 internals. Make sure that they still
+    look the way we expect, otherwise the windows are left to qh3 entirely."""
+    max_data = getattr(quic, "_local_max_data", None)
+
+    return (
+        Limit is not None
+        and isinstance(max_data, Limit)
+        and all(hasattr(max_data, a) for a in ("frame_type", "name", "value", "used"))
+        and isinstance(getattr(quic, "_local_max_stream_data_bidi_local", None), int)
+    )
+
+
+class _BudgetedLimit(Limit):
+    """qh3 double the connection receive window whenever half of it was consumed.
+    This keeps the credit granted to the remote peer within our memory budget."""
+
+    def __init__(self, budget: int, frame_type: int, name: str, value: int) -> None:
+        self._budget = budget
+        self._value = value
+        super().__init__(frame_type, name, value)
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, new_value: int) -> None:
+        if new_value > self._value:
+            new_value = max(self._value, min(new_value, self.used + self._budget))
+        self._value = new_value
+
 
 class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
     implementation: str = "qh3"
@@ -92,7 +149,22 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
         remote_address: AddressType,
         server_name: str,
         tls_config: QuicTLSConfig,
+        flow_control_budget: int | None = None,
+        memory_budget: MemoryBudget | None = None,
     ) -> None:
+        if memory_budget is not None:
+            # we cannot grant a connection more than what we accept to buffer overall.
+            flow_control_budget = min(
+                flow_control_budget or DEFAULT_FLOW_CONTROL_BUDGET, memory_budget.limit
+            )
+
+        self._bdp: BDPEstimator = BDPEstimator(
+            INITIAL_STREAM_WINDOW_SIZE, flow_control_budget
+        )
+        self._ledger: StreamBufferLedger | None = (
+            StreamBufferLedger(memory_budget) if memory_budget is not None else None
+        )
+
         keylogfile_path: str | None = environ.get("SSLKEYLOGFILE", None)
         qlogdir_path: str | None = environ.get("QUICLOGDIR", None)
 
@@ -111,8 +183,8 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
             secrets_log_file=open(keylogfile_path, "w") if keylogfile_path else None,  # type: ignore[arg-type]
             quic_logger=QuicFileLogger(qlogdir_path) if qlogdir_path else None,
             idle_timeout=tls_config.idle_timeout,
-            max_data=15728640,
-            max_stream_data=6291456,
+            max_data=min(INITIAL_CONNECTION_WINDOW_SIZE, self._bdp.budget),
+            max_stream_data=self._bdp.window,
         )
 
         # infer support for encrypted hello!
@@ -145,7 +217,20 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
                 tls_config.keypassword,
             )
 
-        self._quic: QuicConnection = QuicConnection(configuration=self._configuration)
+        self._quic: QuicConnection = QuicConnection(
+            configuration=self._configuration,
+            session_ticket_handler=self._session_ticket_handler,
+        )
+        self._tunable_windows: bool = _can_tune_windows(self._quic)
+        if self._tunable_windows:
+            self._quic._local_max_data = _BudgetedLimit(
+                self._bdp.budget,
+                frame_type=self._quic._local_max_data.frame_type,
+                name=self._quic._local_max_data.name,
+                value=self._quic._local_max_data.value,
+            )
+        else:  # Defensive: no point probing the link if we cannot act upon it.
+            self._bdp.window = self._bdp.budget
         self._connection_ids: set[bytes] = set()
         self._remote_address = remote_address
         self._events: StreamMatrix = StreamMatrix()
@@ -161,6 +246,10 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
         self._last_ping_uid: int = 0
         self._pending_ping_ack: deque[int] = deque()
 
+        self._received_session_ticket: SessionTicket | None = None
+        self._session_resumed: bool = False
+        self._early_data_accepted: bool = False
+
     def next_timer(self) -> float | None:
         self._next_timer = self._quic.get_timer()
         return self._next_timer
@@ -204,10 +293,21 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
             self._terminated or self._goaway_to_honor
         ) and not self._events.stream_count
 
+    def _session_ticket_handler(self, ticket: SessionTicket) -> None:
+        self._received_session_ticket = ticket
+
     @property
     def session_ticket(self) -> SessionTicket | None:
+        if self._received_session_ticket is not None:
+            return self._received_session_ticket
         return self._quic.tls.session_ticket if self._quic and self._quic.tls else None
 
+    def session_resumed(self) -> bool:
+        return self._session_resumed
+
+    def early_data_accepted(self) -> bool:
+        return self._early_data_accepted
+
     def get_available_stream_id(self) -> int:
         return self._quic.get_next_available_stream_id()
 
@@ -223,6 +323,8 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
         # > to signal an error with the application that uses QUIC.
         frame_type = 0x1D if error_code else 0x1C
         self._quic.close(error_code=error_code, frame_type=frame_type)
+        if self._ledger is not None:
+            self._ledger.clear()
 
     def submit_headers(
         self, stream_id: int, headers: HeadersType, end_stream: bool = False
@@ -241,8 +343,26 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
     def submit_stream_reset(self, stream_id: int, error_code: int = 0) -> None:
         self._quic.reset_stream(stream_id, error_code)
 
+    def submit_priority(self, stream_id: int, priority: bytes) -> None:
+        self._events.prioritize(stream_id, *parse_priority(priority))
+
+        if self._http is None or self._http._local_control_stream_id is None:
+            return
+
+        self._quic.send_stream_data(
+            self._http._local_control_stream_id,
+            encode_frame(
+                PRIORITY_UPDATE_FRAME_TYPE, encode_uint_var(stream_id) + priority
+            ),
+        )
+
     def next_event(self, stream_id: int | None = None) -> Event | None:
-        return self._events.popleft(stream_id=stream_id)
+        ev = self._events.popleft(stream_id=stream_id)
+
+        if self._ledger is not None and ev.__class__ is DataReceived:
+            self._ledger.on_data_consumed(ev.stream_id, len(ev.data))
+
+        return ev
 
     def has_pending_event(
         self,
@@ -254,6 +374,8 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
 
     def connection_lost(self) -> None:
         self._terminated = True
+        if self._ledger is not None:
+            self._ledger.clear()
         self._events.append(ConnectionTerminated())
 
     def bytes_received(self, data: bytes) -> None:
@@ -276,6 +398,8 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
         timer_expired = self._next_timer is not None and now >= self._next_timer
 
         if not self._packets or timer_expired:
+            if self._ledger is not None and self._ledger.withholding:
+                self._withhold_stream_limits()
             if timer_expired:
                 try:
                     self._quic.handle_timer(now)
@@ -315,9 +439,13 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
             return
 
         if ev_type is quic_events.HandshakeCompleted:
+            self._session_resumed = quic_event.session_resumed  # type: ignore[attr-defined]
+            self._early_data_accepted = quic_event.early_data_accepted  # type: ignore[attr-defined]
             yield _HandshakeCompleted(quic_event.alpn_protocol)  # type: ignore[attr-defined]
         elif ev_type is quic_events.ConnectionTerminated:
             self._terminated = True
+            if self._ledger is not None:
+                self._ledger.clear()
             yield ConnectionTerminated(
                 quic_event.error_code,  # type: ignore[attr-defined]
                 quic_event.reason_phrase  # type: ignore[attr-defined]
@@ -327,9 +455,61 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
             self._open_stream_count -= 1
             yield StreamResetReceived(quic_event.stream_id, quic_event.error_code)  # type: ignore[attr-defined]
         elif ev_type is quic_events.PingAcknowledged:
-            if quic_event.uid in self._pending_ping_ack:  # type: ignore[attr-defined]
+            if quic_event.uid == BDP_PING_UID:  # type: ignore[attr-defined]
+                self._grow_windows(self._bdp.on_probe_acknowledged(monotonic()))
+            elif quic_event.uid in self._pending_ping_ack:  # type: ignore[attr-defined]
                 self._pending_ping_ack.remove(quic_event.uid)  # type: ignore[attr-defined]
 
+    def _grow_windows(self, window: int | None) -> None:
+        if window is None or not self._tunable_windows:
+            return
+
+        quic = self._quic
+
+        # streams opened from now on start with the new window,
+        # the open ones are extended by qh3 itself as they get consumed.
+        if window > quic._local_max_stream_data_bidi_local:
+            quic._local_max_stream_data_bidi_local = window
+
+        max_data = quic._local_max_data
+
+        if max_data.used + window > max_data.value:
+            max_data.value = max_data.used + window
+
+    def _withhold_stream_limits(self) -> None:
+        """qh3 raises MAX_STREAM_DATA as soon as data arrives, not when it is consumed.
+        Keep the offending streams out of its pending limits until our budget allows it."""
+        assert self._ledger is not None
+
+        quic = self._quic
+        dirty_limits: set[Any] | None = getattr(quic, "_streams_dirty_limits", None)
+
+        streams: dict[int, Any] = getattr(quic, "_streams", {})
+
+        for stream_id, _ in self._ledger.release_credit():
+            stream = streams.get(stream_id)
+
+            if stream is not None and dirty_limits is not None:
+                dirty_limits.add(stream)
+
+        if not dirty_limits:
+            return
+
+        for stream in [
+            s for s in dirty_limits if self._ledger.is_withheld(s.stream_id)
+        ]:
+            dirty_limits.discard(stream)
+
+    def flow_control_windows(self) -> tuple[int, int] | None:
+        if not self._tunable_windows:  # Defensive: qh3 internals changed
+            return None
+
+        max_data = self._quic._local_max_data
+        return (
+            max_data.value - max_data.used,
+            self._quic._local_max_stream_data_bidi_local,
+        )
+
     def _map_h3_event(self, h3_event: h3_events.H3Event) -> Iterable[Event]:
         ev_type = h3_event.__class__
 
@@ -344,6 +524,11 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
         elif ev_type is h3_events.DataReceived:
             if h3_event.stream_ended:  # type: ignore[attr-defined]
                 self._open_stream_count -= 1
+            if self._bdp.on_data_received(len(h3_event.data), monotonic()):  # type: ignore[attr-defined]
+                self._quic.send_ping(BDP_PING_UID)
+            if self._ledger is not None:
+                self._ledger.on_data_buffered(h3_event.stream_id, len(h3_event.data))  # type: ignore[attr-defined]
+                self._ledger.should_withhold(h3_event.stream_id, len(h3_event.data))  # type: ignore[attr-defined]
             yield DataReceived(h3_event.stream_id, h3_event.data, h3_event.stream_ended)  # type: ignore[attr-defined]
         elif ev_type is h3_events.InformationalHeadersReceived:
             yield EarlyHeadersReceived(
@@ -576,6 +761,8 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
 
     def reshelve(self, *events: Event) -> None:
         for ev in reversed(events):
+            if self._ledger is not None and ev.__class__ is DataReceived:
+                self._ledger.on_data_buffered(ev.stream_id, len(ev.data))
             self._events.appendleft(ev)
 
     def ping(self) -> None:
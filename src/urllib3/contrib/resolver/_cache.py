@@ -10,6 +10,8 @@ from concurrent.futures import Future
 from dataclasses import dataclass
 from time import monotonic
 
+from ...util.fork import register_fork_aware
+
 AddrInfo = typing.Tuple[
     socket.AddressFamily,
     socket.SocketKind,
@@ -108,6 +110,13 @@ class ResolverCache:
         self._inflight: dict[CacheKey, Future[tuple[AddrInfo, ...]]] = {}
         self._lock = threading.Lock()
 
+        register_fork_aware(self)
+
+    def _after_fork_in_child(self) -> None:
+        # resolutions in flight belonged to threads that did not survive the fork.
+        self._lock = threading.Lock()
+        self._inflight = {}
+
     def get_or_resolve(
         self,
         key: CacheKey,
@@ -10,6 +10,8 @@ except ImportError:
     WebSocketExtensionFromHTTP = None  # type: ignore[misc, assignment]
     WebSocketExtensionFromMultiplexedHTTP = None  # type: ignore[misc, assignment]
 
+from .ws_native import WebSocketNativeExtensionFromHTTP
+
 from typing import TypeVar
 
 T = TypeVar("T")
@@ -55,6 +57,7 @@ __all__ = (
     "RawExtensionFromHTTP",
     "WebSocketExtensionFromHTTP",
     "WebSocketExtensionFromMultiplexedHTTP",
+    "WebSocketNativeExtensionFromHTTP",
     "ServerSideEventExtensionFromHTTP",
     "load_extension",
 )
@@ -13,6 +13,7 @@ except ImportError:
     AsyncWebSocketExtensionFromHTTP = None  # type: ignore[misc, assignment]
     AsyncWebSocketExtensionFromMultiplexedHTTP = None  # type: ignore[misc, assignment]
 
+from .ws_native import AsyncWebSocketNativeExtensionFromHTTP
 from .. import recursive_subclasses
 
 
@@ -46,6 +47,7 @@ __all__ = (
     "AsyncRawExtensionFromHTTP",
     "AsyncWebSocketExtensionFromHTTP",
     "AsyncWebSocketExtensionFromMultiplexedHTTP",
+    "AsyncWebSocketNativeExtensionFromHTTP",
     "AsyncServerSideEventExtensionFromHTTP",
     "load_extension",
 )
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-import codecs
 import typing
 
 if typing.TYPE_CHECKING:
     from ...._async.response import AsyncHTTPResponse
 
 from ....backend import HttpVersion
-from ..sse import ServerSentEvent
+from ..sse import ServerSentEvent, ServerSentEventParser
 from .protocol import AsyncExtensionFromHTTP
 
 
@@ -17,9 +16,7 @@ class AsyncServerSideEventExtensionFromHTTP(AsyncExtensionFromHTTP):
         super().__init__()
 
         self._next_value_task: asyncio.Task[bytes] | None = None
-        self._last_event_id: str | None = None
-        self._buffer: str = ""
-        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._parser = ServerSentEventParser()
         self._stream: typing.AsyncGenerator[bytes, None] | None = None
 
     @staticmethod
@@ -77,76 +74,51 @@ class AsyncServerSideEventExtensionFromHTTP(AsyncExtensionFromHTTP):
         if self._response is None or self._stream is None:
             raise OSError("The HTTP extension is closed or uninitialized")
 
-        while True:
-            # Read chunks until the buffer contains at least one complete event
-            # (terminated by a blank line: \n\n or \r\n\r\n).
-            while "\n\n" not in self._buffer and "\r\n\r\n" not in self._buffer:
-                try:
-                    self._next_value_task = asyncio.create_task(
-                        self._stream.__anext__()
-                    )
-                    chunk = await self._next_value_task
-                    self._buffer += self._decoder.decode(chunk)
-                except asyncio.CancelledError:
-                    return None
-                except StopAsyncIteration:
-                    last_chunk = self._decoder.decode(b"", final=True)
-                    if not last_chunk:
-                        await self._stream.aclose()
-                        self._stream = None
-                        self._decoder.reset()
-                        return None
-                    self._buffer += last_chunk
-                finally:
-                    self._next_value_task = None
-
-            # Locate the first event boundary.
-            lf = self._buffer.find("\n\n")
-            crlf = self._buffer.find("\r\n\r\n")
-
-            if crlf != -1 and (lf == -1 or crlf < lf):
-                boundary, sep = crlf, "\r\n\r\n"
-            else:
-                boundary, sep = lf, "\n\n"
-
-            event_text = self._buffer[:boundary]
-            self._buffer = self._buffer[boundary + len(sep) :]
-
-            kwargs: dict[str, typing.Any] = {}
-
-            for line in event_text.splitlines():
-                if not line:
-                    continue
-                key, _, value = line.partition(":")
-                if key not in {"event", "data", "retry", "id"}:
-                    continue
-                if value.startswith(" "):
-                    value = value[1:]
-                if key == "id":
-                    if "\u0000" in value:
-                        continue
-                if key == "retry":
-                    try:
-                        value = int(value)  # type: ignore[assignment]
-                    except (ValueError, TypeError):
-                        continue
-                kwargs[key] = value
-
-            if not kwargs:
-                continue
-
-            if "id" not in kwargs and self._last_event_id is not None:
-                kwargs["id"] = self._last_event_id
-
-            event = ServerSentEvent(**kwargs)
-
-            if event.id:
-                self._last_event_id = event.id
-
-            if raw is True:
-                return event_text + sep
-
-            return event
+        if not await self._fill():
+            return None
+
+        return self._parser.next_event(raw=raw)  # type: ignore[call-overload,no-any-return]
+
+    @typing.overload
+    async def next_payloads(self, *, raw: typing.Literal[True]) -> list[str]: ...
+
+    @typing.overload
+    async def next_payloads(
+        self, *, raw: typing.Literal[False] = False
+    ) -> list[ServerSentEvent]: ...
+
+    async def next_payloads(
+        self, *, raw: bool = False
+    ) -> list[ServerSentEvent] | list[str]:
+        """Unpack every complete message/payload received so far. Wait for at least one
+        if none is available yet. An empty list means that the remote closed the stream."""
+        if self._response is None or self._stream is None:
+            raise OSError("The HTTP extension is closed or uninitialized")
+
+        if not await self._fill():
+            return []
+
+        return self._parser.events(raw=raw)  # type: ignore[call-overload,no-any-return]
+
+    async def _fill(self) -> bool:
+        """Read from the stream until at least one event is complete. Return False on end of stream."""
+        while not self._parser:
+            if self._stream is None:
+                return False
+            try:
+                self._next_value_task = asyncio.create_task(self._stream.__anext__())
+                self._parser.feed(await self._next_value_task)
+            except asyncio.CancelledError:
+                return False
+            except StopAsyncIteration:
+                # an incomplete event at the end of the stream is discarded.
+                self._parser.feed(b"", final=True)
+                await self._stream.aclose()
+                self._stream = None
+            finally:
+                self._next_value_task = None
+
+        return True
 
     async def send_payload(self, buf: str | bytes) -> None:
         """Dispatch a buffer to remote."""
@@ -11,7 +11,6 @@ from wsproto.events import (
     BytesMessage,
     CloseConnection,
     Ping,
-    Pong,
     Request,
     TextMessage,
 )
@@ -148,91 +147,90 @@ class AsyncWebSocketExtensionFromHTTP(AsyncExtensionFromHTTP):
 
     async def next_payload(self) -> str | bytes | None:
         """Unpack the next received message/payload from remote."""
+        payloads = await self.next_payloads(1)
+
+        return payloads[0] if payloads else None
+
+    async def next_payloads(self, max_n: int | None = None) -> list[str | bytes]:
+        """Unpack every message/payload already received from remote (up to max_n) at once.
+        Wait for at least one if none is pending. An empty list means that the remote
+        closed the (extension) pipeline."""
         if self._dsa is None or self._response is None or self._police_officer is None:
             raise OSError("The HTTP extension is closed or uninitialized")
 
+        payloads: list[str | bytes] = []
         text_buf: list[str] = []
-        bytes_buf: list[bytes] = []
+        bytes_buf: list[bytes | bytearray] = []
+        remote_shutdown: bool = False
 
         async with self._police_officer.borrow(self._response):
-            # wsproto uses bare ``assert`` statements inside ``events()`` and
-            # the per-message-deflate inbound decompression to validate frame
-            # payloads. We treat such failures as a protocol violation.
-            try:
-                for event in self._protocol.events():
-                    if isinstance(event, TextMessage):
-                        if event.message_finished and not text_buf:
-                            return event.data
-                        text_buf.append(event.data)
-                        if event.message_finished:
-                            return "".join(text_buf)
-                    elif isinstance(event, BytesMessage):
-                        if event.message_finished and not bytes_buf:
-                            return event.data
-                        bytes_buf.append(event.data)
-                        if event.message_finished:
-                            return b"".join(bytes_buf)
-                    elif isinstance(event, CloseConnection):
-                        self._remote_shutdown = True
-                        await self.close()
-                        return None
-                    elif isinstance(event, Ping):
-                        try:
-                            data_to_send: bytes = self._protocol.send(event.response())
-                        except WebSocketProtocolError as e:
-                            await self.close()
-                            raise ProtocolError from e
-
-                        async with self._write_error_catcher():
-                            await self._dsa.sendall(data_to_send)
-            except AssertionError as e:
-                await self.close()
-                raise ProtocolError from e
-
             while True:
-                async with self._read_error_catcher():
-                    data, eot, _ = await self._dsa.recv_extended(None)
-
-                try:
-                    self._protocol.receive_data(data)
-                except WebSocketProtocolError as e:
-                    await self.close()
-                    raise ProtocolError from e
-
+                # we may have pending event to unpack!
+                # wsproto uses bare ``assert`` statements inside ``events()`` and
+                # the per-message-deflate inbound decompression to validate frame
+                # payloads. We treat such failures as a protocol violation.
                 try:
                     for event in self._protocol.events():
                         if isinstance(event, TextMessage):
                             if event.message_finished and not text_buf:
-                                return event.data
-                            text_buf.append(event.data)
-                            if event.message_finished:
-                                return "".join(text_buf)
+                                payloads.append(event.data)
+                            else:
+                                text_buf.append(event.data)
+                                if event.message_finished:
+                                    payloads.append("".join(text_buf))
+                                    text_buf.clear()
                         elif isinstance(event, BytesMessage):
                             if event.message_finished and not bytes_buf:
-                                return event.data
-                            bytes_buf.append(event.data)
-                            if event.message_finished:
-                                return b"".join(bytes_buf)
+                                payloads.append(bytes(event.data))
+                            else:
+                                bytes_buf.append(event.data)
+                                if event.message_finished:
+                                    payloads.append(b"".join(bytes_buf))
+                                    bytes_buf.clear()
                         elif isinstance(event, CloseConnection):
-                            self._remote_shutdown = True
-                            await self.close()
-                            return None
+                            remote_shutdown = True
+                            break
                         elif isinstance(event, Ping):
                             try:
-                                data_to_send = self._protocol.send(event.response())
+                                data_to_send: bytes = self._protocol.send(
+                                    event.response()
+                                )
                             except WebSocketProtocolError as e:
                                 await self.close()
                                 raise ProtocolError from e
+
                             async with self._write_error_catcher():
                                 await self._dsa.sendall(data_to_send)
-                        elif isinstance(event, Pong):
-                            continue
+
+                        if max_n is not None and len(payloads) >= max_n:
+                            break
                 except AssertionError as e:
                     await self.close()
                     raise ProtocolError from e
 
+                if remote_shutdown:
+                    self._remote_shutdown = True
+                    await self.close()
+                    return payloads
+
+                if payloads:
+                    return payloads
+
+                async with self._read_error_catcher():
+                    data, eot, _ = await self._dsa.recv_extended(None)
+
+                try:
+                    self._protocol.receive_data(data)
+                except WebSocketProtocolError as e:
+                    await self.close()
+                    raise ProtocolError from e
+
     async def send_payload(self, buf: str | bytes) -> None:
         """Dispatch a buffer to remote."""
+        await self.send_payloads((buf,))
+
+    async def send_payloads(self, bufs: typing.Iterable[str | bytes]) -> None:
+        """Dispatch many buffers to remote, each as its own message, in a single write."""
         if self._dsa is None or self._response is None or self._police_officer is None:
             raise OSError("The HTTP extension is closed or uninitialized")
 
@@ -241,14 +239,23 @@ class AsyncWebSocketExtensionFromHTTP(AsyncExtensionFromHTTP):
             # protect against compressing a CONTINUATION frame; treat such a
             # failure as a protocol violation.
             try:
-                if isinstance(buf, str):
-                    data_to_send: bytes = self._protocol.send(TextMessage(buf))
-                else:
-                    data_to_send = self._protocol.send(BytesMessage(buf))
+                data_to_send: bytes = b"".join(
+                    [
+                        self._protocol.send(
+                            TextMessage(buf)
+                            if isinstance(buf, str)
+                            else BytesMessage(buf)
+                        )
+                        for buf in bufs
+                    ]
+                )
             except (WebSocketProtocolError, AssertionError) as e:
                 await self.close()
                 raise ProtocolError from e
 
+            if not data_to_send:
+                return
+
             async with self._write_error_catcher():
                 await self._dsa.sendall(data_to_send)
 
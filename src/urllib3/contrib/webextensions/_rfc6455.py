@@ -0,0 +1,325 @@
+"""
+Minimal client side WebSocket (RFC 6455) frame codec. No extension (e.g. permessage-deflate)
+is ever negotiated, so frames are written and read without any transformation besides masking.
+"""
+
+from __future__ import annotations
+
+import os
+import typing
+from base64 import b64encode
+from functools import lru_cache
+from hashlib import sha1
+
+from ...exceptions import ProtocolError
+
+OPCODE_CONTINUATION: int = 0x0
+OPCODE_TEXT: int = 0x1
+OPCODE_BINARY: int = 0x2
+OPCODE_CLOSE: int = 0x8
+OPCODE_PING: int = 0x9
+OPCODE_PONG: int = 0xA
+
+CLOSE_NORMAL: int = 1000
+CLOSE_PROTOCOL_ERROR: int = 1002
+CLOSE_INVALID_PAYLOAD: int = 1007
+CLOSE_MESSAGE_TOO_BIG: int = 1009
+
+#: Largest frame, and message once reassembled, accepted from the remote by default.
+DEFAULT_MAX_MESSAGE_SIZE: int = 16777216
+
+#: RFC 6455 section 1.3
+WEBSOCKET_ACCEPT_GUID: bytes = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+@lru_cache(maxsize=256)
+def _xor_table(key: int) -> bytes:
+    return bytes(b ^ key for b in range(256))
+
+
+def mask_payload(key: bytes, payload: bytes) -> bytearray:
+    """Apply the 4 bytes masking key to given payload. Every fourth byte shares the same
+    key byte, so the XOR is done by slices through a precomputed translation table."""
+    masked = bytearray(payload)
+
+    for i in range(min(4, len(payload))):
+        masked[i::4] = payload[i::4].translate(_xor_table(key[i]))
+
+    return masked
+
+
+def _frame_header(opcode: int, length: int) -> bytes:
+    # FIN and MASK bits are always set, we never fragment what we send.
+    if length < 126:
+        return bytes((0x80 | opcode, 0x80 | length))
+    if length < 65536:
+        return bytes((0x80 | opcode, 0xFE)) + length.to_bytes(2, "big")
+    return bytes((0x80 | opcode, 0xFF)) + length.to_bytes(8, "big")
+
+
+class WebSocketFrameCodec:
+    """Encode outgoing messages and decode incoming frames for the client side of a WebSocket.
+
+    :param max_frame_size: Largest frame accepted from the remote, in bytes. None for no limit.
+    :param max_message_size: Largest message accepted from the remote once its fragments
+        are reassembled, in bytes. None for no limit.
+
+    Both limits are checked as soon as the frame header is received, a frame that exceeds
+    them is never buffered. The WebSocket is then closed with the status code 1009.
+    """
+
+    __slots__ = (
+        "max_frame_size",
+        "max_message_size",
+        "close_code",
+        "_key",
+        "_buffer",
+        "_offset",
+        "_fragments",
+        "_fragments_size",
+        "_fragment_opcode",
+    )
+
+    def __init__(
+        self,
+        max_frame_size: int | None = DEFAULT_MAX_MESSAGE_SIZE,
+        max_message_size: int | None = DEFAULT_MAX_MESSAGE_SIZE,
+    ) -> None:
+        self.max_frame_size = max_frame_size
+        self.max_message_size = max_message_size
+
+        #: status code sent when we initiate the closing handshake, it tells the remote why.
+        self.close_code: int = CLOSE_NORMAL
+
+        self._key: str = b64encode(os.urandom(16)).decode("ascii")
+
+        self._buffer: bytearray = bytearray()
+        #: position of the first byte not yet decoded in _buffer.
+        self._offset: int = 0
+
+        self._fragments: list[bytes] = []
+        self._fragments_size: int = 0
+        self._fragment_opcode: int | None = None
+
+    def handshake_headers(self) -> dict[str, str]:
+        """Headers to be sent with the HTTP/1.1 upgrade request."""
+        return {
+            "upgrade": "websocket",
+            "connection": "upgrade",
+            "sec-websocket-key": self._key,
+            "sec-websocket-version": "13",
+        }
+
+    def accept_token(self) -> str:
+        """The expected 'Sec-WebSocket-Accept' value in the server response."""
+        return b64encode(
+            sha1(self._key.encode("ascii") + WEBSOCKET_ACCEPT_GUID).digest()
+        ).decode("ascii")
+
+    def verify_handshake(self, headers: typing.Mapping[str, str]) -> None:
+        """Make sure that the server accepted the upgrade request we made."""
+        accept_token: str | None = headers.get("Sec-Websocket-Accept")
+
+        if accept_token is None:
+            raise ProtocolError(
+                "The WebSocket HTTP extension requires 'Sec-Websocket-Accept' header in the server response but was not present."
+            )
+
+        if accept_token != self.accept_token():
+            raise ProtocolError(
+                "The WebSocket HTTP extension received an invalid 'Sec-Websocket-Accept' header from the server."
+            )
+
+        if "sec-websocket-extensions" in headers:
+            raise ProtocolError(
+                "The WebSocket server enabled an extension that was not offered."
+            )
+
+    def encode(self, opcode: int, payload: bytes) -> bytes:
+        """Serialize a single (masked) frame."""
+        key = os.urandom(4)
+
+        return _frame_header(opcode, len(payload)) + key + mask_payload(key, payload)
+
+    def encode_messages(self, bufs: typing.Iterable[str | bytes]) -> bytes:
+        """Serialize many messages, one frame each, into a single buffer."""
+        messages = [
+            (OPCODE_TEXT, buf.encode("utf-8"))
+            if isinstance(buf, str)
+            else (OPCODE_BINARY, buf)
+            for buf in bufs
+        ]
+
+        # draw every masking key at once, it's one syscall instead of len(messages).
+        keys = os.urandom(4 * len(messages))
+        chunks: list[bytes | bytearray] = []
+
+        for i, (opcode, payload) in enumerate(messages):
+            key = keys[i * 4 : i * 4 + 4]
+
+            chunks.append(_frame_header(opcode, len(payload)))
+            chunks.append(key)
+            chunks.append(mask_payload(key, payload))
+
+        return b"".join(chunks)
+
+    def encode_close(self, code: int | None = None, reason: str = "") -> bytes:
+        if code is None:
+            code = self.close_code
+
+        return self.encode(
+            OPCODE_CLOSE, code.to_bytes(2, "big") + reason.encode("utf-8")
+        )
+
+    def receive_data(self, data: bytes) -> None:
+        if self._offset:
+            del self._buffer[: self._offset]
+            self._offset = 0
+
+        self._buffer += data
+
+    def next_messages(
+        self, max_n: int | None = None
+    ) -> tuple[list[str | bytes], bytes, bool]:
+        """Decode the messages already received, up to max_n. Return them along with what must
+        be sent back to the remote (pongs, closing handshake) and whether the remote closed."""
+        messages: list[str | bytes] = []
+        replies: list[bytes] = []
+
+        try:
+            for opcode, data in self.events():
+                if opcode == OPCODE_PING:
+                    replies.append(self.encode(OPCODE_PONG, data))  # type: ignore[arg-type]
+                elif opcode == OPCODE_CLOSE:
+                    # echo the status code as RFC 6455 section 5.5.1 suggests.
+                    replies.append(self.encode(OPCODE_CLOSE, data[:2]))  # type: ignore[arg-type]
+                    return messages, b"".join(replies), True
+                elif opcode != OPCODE_PONG:
+                    messages.append(data)
+
+                    if max_n is not None and len(messages) >= max_n:
+                        break
+        except ProtocolError:
+            if self.close_code == CLOSE_NORMAL:
+                self.close_code = CLOSE_PROTOCOL_ERROR
+            raise
+
+        return messages, b"".join(replies), False
+
+    def _too_big(self, what: str, size: int, limit: int) -> ProtocolError:
+        self.close_code = CLOSE_MESSAGE_TOO_BIG
+
+        return ProtocolError(
+            f"WebSocket {what} of {size} bytes exceeds the limit of {limit} bytes"
+        )
+
+    def events(self) -> typing.Iterator[tuple[int, str | bytes]]:
+        """Yield every complete message (opcode, data) and control frame (opcode, payload) received.
+        Text messages are given as str, everything else as bytes."""
+        buf = self._buffer
+        size = len(buf)
+
+        while size - self._offset >= 2:
+            offset = self._offset
+
+            fin = buf[offset] & 0x80
+            opcode = buf[offset] & 0x0F
+
+            if buf[offset] & 0x70:
+                raise ProtocolError(
+                    "WebSocket frame has reserved bits set while no extension was negotiated"
+                )
+
+            if buf[offset + 1] & 0x80:
+                raise ProtocolError("WebSocket frame from server must not be masked")
+
+            length = buf[offset + 1] & 0x7F
+            header_size = 2
+
+            # control frames are checked upfront, their length always fit the first bytes.
+            if opcode >= OPCODE_CLOSE:
+                if opcode not in (OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG):
+                    raise ProtocolError(f"Unknown WebSocket control opcode {opcode}")
+                if not fin or length > 125:
+                    raise ProtocolError("WebSocket control frame is invalid")
+
+            if length == 126:
+                header_size = 4
+            elif length == 127:
+                header_size = 10
+
+            if size - offset < header_size:
+                break
+
+            if header_size != 2:
+                length = int.from_bytes(buf[offset + 2 : offset + header_size], "big")
+
+            # refuse oversized frames before their payload is even received.
+            if opcode < OPCODE_CLOSE:
+                if self.max_frame_size is not None and length > self.max_frame_size:
+                    raise self._too_big("frame", length, self.max_frame_size)
+
+                if (
+                    self.max_message_size is not None
+                    and self._fragments_size + length > self.max_message_size
+                ):
+                    raise self._too_big(
+                        "message", self._fragments_size + length, self.max_message_size
+                    )
+
+            end = offset + header_size + length
+
+            if end > size:
+                break
+
+            payload = bytes(buf[offset + header_size : end])
+            self._offset = end
+
+            if opcode >= OPCODE_CLOSE:
+                yield opcode, payload
+                continue
+
+            if opcode == OPCODE_CONTINUATION:
+                if self._fragment_opcode is None:
+                    raise ProtocolError(
+                        "WebSocket continuation frame received outside of a fragmented message"
+                    )
+
+                self._fragments.append(payload)
+                self._fragments_size += length
+
+                if not fin:
+                    continue
+
+                opcode = self._fragment_opcode
+                payload = b"".join(self._fragments)
+
+                self._fragments = []
+                self._fragments_size = 0
+                self._fragment_opcode = None
+            elif opcode in (OPCODE_TEXT, OPCODE_BINARY):
+                if self._fragment_opcode is not None:
+                    raise ProtocolError(
+                        "WebSocket fragmented message interrupted by a new message"
+                    )
+
+                if not fin:
+                    self._fragment_opcode = opcode
+                    self._fragments = [payload]
+                    self._fragments_size = length
+                    continue
+            else:
+                raise ProtocolError(f"Unknown WebSocket data opcode {opcode}")
+
+            if opcode == OPCODE_TEXT:
+                try:
+                    text = payload.decode("utf-8")
+                except UnicodeDecodeError as e:
+                    self.close_code = CLOSE_INVALID_PAYLOAD
+                    raise ProtocolError(
+                        "WebSocket text message is not valid UTF-8"
+                    ) from e
+
+                yield opcode, text
+            else:
+                yield opcode, payload
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import codecs
 import json
+import re
 import typing
+from collections import deque
 from threading import RLock
 
 if typing.TYPE_CHECKING:
@@ -11,6 +13,9 @@ if typing.TYPE_CHECKING:
 from ...backend import HttpVersion
 from .protocol import ExtensionFromHTTP
 
+#: WHATWG allows CRLF, lone LF and lone CR as line terminator.
+_LINE_TERMINATOR = re.compile(r"(\r\n|\r|\n)")
+
 
 class ServerSentEvent:
     def __init__(
@@ -64,13 +69,183 @@ class ServerSentEvent:
         return f"ServerSentEvent({', '.join(pieces)})"
 
 
+class ServerSentEventParser:
+    """Incremental parser for the text/event-stream format as described in the
+    WHATWG HTML Living Standard (section 9.2.6 "Interpreting an event stream").
+
+    Each byte fed is looked at a constant amount of times, no matter how the
+    stream is chunked. Complete events are queued until retrieved."""
+
+    __slots__ = (
+        "_decoder",
+        "_started",
+        "_skip_lf",
+        "_pending",
+        "_raw",
+        "_data",
+        "_event",
+        "_retry",
+        "_dispatchable",
+        "_last_event_id",
+        "_events",
+    )
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._started: bool = False
+        #: the previous chunk ended with a CR, a LF right after belongs to it.
+        self._skip_lf: bool = False
+        #: pieces of the line not yet terminated.
+        self._pending: list[str] = []
+
+        # state of the event being built
+        self._raw: list[str] = []
+        self._data: list[str] = []
+        self._event: str | None = None
+        self._retry: int | None = None
+        self._dispatchable: bool = False
+
+        self._last_event_id: str | None = None
+        self._events: deque[tuple[ServerSentEvent, str]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def last_event_id(self) -> str | None:
+        return self._last_event_id
+
+    def feed(self, data: bytes, final: bool = False) -> None:
+        """Submit received bytes. Incomplete lines or events are kept until completed."""
+        text = self._decoder.decode(data, final=final)
+
+        if not text:
+            return
+
+        if not self._started:
+            self._started = True
+
+            if text[0] == "\ufeff":
+                text = text[1:]
+
+        if self._skip_lf:
+            self._skip_lf = False
+
+            if text[0] == "\n":
+                text = text[1:]
+
+                if self._raw:
+                    self._raw[-1] += "\n"
+                elif self._events:
+                    event, raw = self._events[-1]
+                    self._events[-1] = event, raw + "\n"
+
+        parts = _LINE_TERMINATOR.split(text)
+        tail = parts.pop()
+
+        if parts:
+            if self._pending:
+                self._pending.append(parts[0])
+                parts[0] = "".join(self._pending)
+                self._pending.clear()
+
+            for i in range(0, len(parts), 2):
+                self._process_line(parts[i], parts[i + 1])
+
+            if not tail and parts[-1] == "\r":
+                self._skip_lf = True
+
+        if tail:
+            self._pending.append(tail)
+
+    def _process_line(self, line: str, terminator: str) -> None:
+        if not line:
+            self._dispatch(terminator)
+            return
+
+        self._raw.append(line + terminator)
+
+        if line[0] == ":":
+            return
+
+        field, _, value = line.partition(":")
+
+        if value[:1] == " ":
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+            self._dispatchable = True
+        elif field == "event":
+            self._event = value
+        elif field == "id":
+            if "\u0000" not in value:
+                self._last_event_id = value
+        elif field == "retry":
+            if value.isascii() and value.isdigit():
+                self._retry = int(value)
+
+    def _dispatch(self, terminator: str) -> None:
+        # an event without any data line is not dispatched, the last event
+        # id and the reconnection time it may carry are kept nonetheless.
+        if self._dispatchable:
+            self._events.append(
+                (
+                    ServerSentEvent(
+                        event=self._event,
+                        data="\n".join(self._data),
+                        id=self._last_event_id,
+                        retry=self._retry,
+                    ),
+                    "".join(self._raw) + terminator,
+                )
+            )
+            self._retry = None
+
+        self._raw = []
+        self._data = []
+        self._event = None
+        self._dispatchable = False
+
+    @typing.overload
+    def next_event(self, *, raw: typing.Literal[True]) -> str | None: ...
+
+    @typing.overload
+    def next_event(
+        self, *, raw: typing.Literal[False] = False
+    ) -> ServerSentEvent | None: ...
+
+    def next_event(self, *, raw: bool = False) -> ServerSentEvent | str | None:
+        """Pop the oldest complete event, if any."""
+        if not self._events:
+            return None
+
+        event, raw_event = self._events.popleft()
+
+        return raw_event if raw else event
+
+    @typing.overload
+    def events(self, *, raw: typing.Literal[True]) -> list[str]: ...
+
+    @typing.overload
+    def events(
+        self, *, raw: typing.Literal[False] = False
+    ) -> list[ServerSentEvent]: ...
+
+    def events(self, *, raw: bool = False) -> list[ServerSentEvent] | list[str]:
+        """Pop every complete event."""
+        idx = 1 if raw else 0
+        events = [e[idx] for e in self._events]
+        self._events.clear()
+
+        return events  # type: ignore[return-value]
+
+
 class ServerSideEventExtensionFromHTTP(ExtensionFromHTTP):
     def __init__(self) -> None:
         super().__init__()
 
-        self._last_event_id: str | None = None
-        self._buffer: str = ""
-        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._parser = ServerSentEventParser()
         self._lock = RLock()
         self._stream: typing.Generator[bytes, None, None] | None = None
 
@@ -125,67 +300,43 @@ class ServerSideEventExtensionFromHTTP(ExtensionFromHTTP):
         if self._response is None or self._stream is None:
             raise OSError("The HTTP extension is closed or uninitialized")
         with self._lock:
-            while True:
-                # Read chunks until the buffer contains at least one complete
-                # event (terminated by a blank line: \n\n or \r\n\r\n).
-                while "\n\n" not in self._buffer and "\r\n\r\n" not in self._buffer:
-                    try:
-                        self._buffer += self._decoder.decode(next(self._stream))
-                    except StopIteration:
-                        last_chunk = self._decoder.decode(b"", final=True)
-                        if not last_chunk:
-                            self._stream = None
-                            self._decoder.reset()
-                            return None
-                        self._buffer += last_chunk
-
-                # Locate the first event boundary.
-                lf = self._buffer.find("\n\n")
-                crlf = self._buffer.find("\r\n\r\n")
-
-                if crlf != -1 and (lf == -1 or crlf < lf):
-                    boundary, sep = crlf, "\r\n\r\n"
-                else:
-                    boundary, sep = lf, "\n\n"
-
-                event_text = self._buffer[:boundary]
-                self._buffer = self._buffer[boundary + len(sep) :]
-
-                kwargs: dict[str, typing.Any] = {}
-
-                for line in event_text.splitlines():
-                    if not line:
-                        continue
-                    key, _, value = line.partition(":")
-                    if key not in {"event", "data", "retry", "id"}:
-                        continue
-                    if value.startswith(" "):
-                        value = value[1:]
-                    if key == "id":
-                        if "\u0000" in value:
-                            continue
-                    if key == "retry":
-                        try:
-                            value = int(value)  # type: ignore[assignment]
-                        except (ValueError, TypeError):
-                            continue
-                    kwargs[key] = value
-
-                if not kwargs:
-                    continue
-
-                if "id" not in kwargs and self._last_event_id is not None:
-                    kwargs["id"] = self._last_event_id
-
-                event = ServerSentEvent(**kwargs)
-
-                if event.id:
-                    self._last_event_id = event.id
-
-                if raw is True:
-                    return event_text + sep
-
-                return event
+            if not self._fill():
+                return None
+
+            return self._parser.next_event(raw=raw)  # type: ignore[call-overload,no-any-return]
+
+    @typing.overload
+    def next_payloads(self, *, raw: typing.Literal[True]) -> list[str]: ...
+
+    @typing.overload
+    def next_payloads(
+        self, *, raw: typing.Literal[False] = False
+    ) -> list[ServerSentEvent]: ...
+
+    def next_payloads(self, *, raw: bool = False) -> list[ServerSentEvent] | list[str]:
+        """Unpack every complete message/payload received so far. Wait for at least one
+        if none is available yet. An empty list means that the remote closed the stream."""
+        if self._response is None or self._stream is None:
+            raise OSError("The HTTP extension is closed or uninitialized")
+        with self._lock:
+            if not self._fill():
+                return []
+
+            return self._parser.events(raw=raw)  # type: ignore[call-overload,no-any-return]
+
+    def _fill(self) -> bool:
+        """Read from the stream until at least one event is complete. Return False on end of stream."""
+        while not self._parser:
+            if self._stream is None:
+                return False
+            try:
+                self._parser.feed(next(self._stream))
+            except StopIteration:
+                # an incomplete event at the end of the stream is discarded.
+                self._parser.feed(b"", final=True)
+                self._stream = None
+
+        return True
 
     def send_payload(self, buf: str | bytes) -> None:
         """Dispatch a buffer to remote."""
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from ...response import HTTPResponse
+
+from ...backend import HttpVersion
+from ...exceptions import ProtocolError
+from ...util.traffic_police import UnavailableTraffic
+from ._rfc6455 import (
+    DEFAULT_MAX_MESSAGE_SIZE,
+    OPCODE_PING,
+    WebSocketFrameCodec,
+)
+from .protocol import ExtensionFromHTTP
+
+
+class WebSocketNativeExtensionFromHTTP(ExtensionFromHTTP):
+    """
+    Plugin that support doing WebSocket over HTTP/1.1 with our built-in frame codec.
+    It does not require wsproto and is noticeably cheaper per message, but it never
+    negotiates the permessage-deflate extension. Select it with ``ws+native://`` or ``wss+native://``.
+
+    :param max_frame_size: Largest frame accepted from the remote, in bytes. None for no limit.
+    :param max_message_size: Largest message accepted from the remote, in bytes. None for no limit.
+        Exceeding either closes the WebSocket with the status code 1009 and raise ProtocolError.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_frame_size: int | None = DEFAULT_MAX_MESSAGE_SIZE,
+        max_message_size: int | None = DEFAULT_MAX_MESSAGE_SIZE,
+    ) -> None:
+        super().__init__()
+        self._codec = WebSocketFrameCodec(max_frame_size, max_message_size)
+        self._remote_shutdown: bool = False
+
+    @staticmethod
+    def supported_svn() -> set[HttpVersion]:
+        return {HttpVersion.h11}
+
+    @staticmethod
+    def implementation() -> str:
+        return "native"
+
+    def start(self, response: HTTPResponse) -> None:
+        super().start(response)
+
+        self._codec.verify_handshake(response.headers)
+
+    def headers(self, http_version: HttpVersion) -> dict[str, str]:
+        """Specific HTTP headers required (request) before the 101 status response."""
+        return self._codec.handshake_headers()
+
+    def close(self) -> None:
+        """End/Notify close for sub protocol."""
+        if self._dsa is not None:
+            if self._police_officer is not None:
+                try:
+                    with self._police_officer.borrow(self._response):
+                        # close() must be tolerant: the peer may already be gone.
+                        if self._remote_shutdown is False:
+                            try:
+                                self._dsa.sendall(self._codec.encode_close())
+                            except (OSError, AssertionError):
+                                pass
+                        try:
+                            self._dsa.close()
+                        except (OSError, AssertionError):
+                            pass
+                        self._dsa = None
+                except UnavailableTraffic:
+                    self._dsa = None
+            else:
+                self._dsa = None
+        if self._response is not None:
+            if self._police_officer is not None:
+                self._police_officer.forget(self._response)
+            else:
+                self._response.close()
+            self._response = None
+
+        self._police_officer = None
+
+    def next_payload(self) -> str | bytes | None:
+        """Unpack the next received message/payload from remote."""
+        payloads = self.next_payloads(1)
+
+        return payloads[0] if payloads else None
+
+    def next_payloads(self, max_n: int | None = None) -> list[str | bytes]:
+        """Unpack every message/payload already received from remote (up to max_n) at once.
+        Wait for at least one if none is pending. An empty list means that the remote
+        closed the (extension) pipeline."""
+        if self._dsa is None or self._response is None or self._police_officer is None:
+            raise OSError("The HTTP extension is closed or uninitialized")
+
+        with self._police_officer.borrow(self._response):
+            while True:
+                try:
+                    payloads, data_to_send, remote_closed = self._codec.next_messages(
+                        max_n
+                    )
+                except ProtocolError:
+                    self.close()
+                    raise
+
+                if remote_closed:
+                    try:
+                        self._dsa.sendall(data_to_send)
+                    except OSError:
+                        pass
+
+                    self._remote_shutdown = True
+                    self.close()
+                    return payloads
+
+                if data_to_send:
+                    with self._write_error_catcher():
+                        self._dsa.sendall(data_to_send)
+
+                if payloads:
+                    return payloads
+
+                with self._read_error_catcher():
+                    data, eot, _ = self._dsa.recv_extended(None)
+
+                if not data and eot:
+                    # the connection ended without a closing handshake.
+                    self._remote_shutdown = True
+                    self.close()
+                    return payloads
+
+                self._codec.receive_data(data)
+
+    def send_payload(self, buf: str | bytes) -> None:
+        """Dispatch a buffer to remote."""
+        self.send_payloads((buf,))
+
+    def send_payloads(self, bufs: typing.Iterable[str | bytes]) -> None:
+        """Dispatch many buffers to remote, each as its own message, in a single write."""
+        if self._dsa is None or self._response is None or self._police_officer is None:
+            raise OSError("The HTTP extension is closed or uninitialized")
+
+        data_to_send = self._codec.encode_messages(bufs)
+
+        if not data_to_send:
+            return
+
+        with self._police_officer.borrow(self._response):
+            with self._write_error_catcher():
+                self._dsa.sendall(data_to_send)
+
+    def ping(self) -> None:
+        if self._dsa is None or self._response is None or self._police_officer is None:
+            raise OSError("The HTTP extension is closed or uninitialized")
+
+        with self._police_officer.borrow(self._response):
+            if self._remote_shutdown is False:
+                with self._write_error_catcher():
+                    self._dsa.sendall(self._codec.encode(OPCODE_PING, b""))
+
+    @staticmethod
+    def supported_schemes() -> set[str]:
+        return {"ws", "wss"}
+
+    @staticmethod
+    def scheme_to_http_scheme(scheme: str) -> str:
+        return {"ws": "http", "wss": "https"}[scheme]
@@ -194,6 +194,24 @@ class NameResolutionError(NewConnectionError):
         return self.__class__, (None, None, None)
 
 
+class CircuitOpenError(PoolError):
+    """Raised when the circuit breaker of the targeted upstream is open.
+    Requests fail fast until the breaker let a probe request through."""
+
+    def __init__(
+        self, pool: ConnectionPool | AsyncConnectionPool, retry_after: float
+    ) -> None:
+        self.retry_after = retry_after
+        super().__init__(
+            pool,
+            f"Circuit breaker is open. Upstream will be probed again in {retry_after:.2f}s.",
+        )
+
+    def __reduce__(self) -> _TYPE_REDUCE_RESULT:
+        # For pickling purposes.
+        return self.__class__, (None, self.retry_after)
+
+
 class EmptyPoolError(PoolError):
     """Raised when a pool runs out of connections and no more are allowed."""
 
@@ -352,6 +370,10 @@ class UnrewindableBodyError(HTTPError):
     """urllib3 encountered an error when trying to rewind a body"""
 
 
+class DownloadError(HTTPError):
+    """A segmented download could not be completed, e.g. the resource changed in the meantime"""
+
+
 class EarlyResponse(HTTPError):
     """urllib3 received a response prior to sending the whole body"""
 
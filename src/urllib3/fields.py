@@ -5,7 +5,7 @@ import mimetypes
 import typing
 
 if typing.TYPE_CHECKING:
-    from ._typing import _TYPE_FIELD_VALUE, _TYPE_FIELD_VALUE_TUPLE
+    from ._typing import _TYPE_FIELD_DATA, _TYPE_FIELD_VALUE, _TYPE_FIELD_VALUE_TUPLE
 
 
 def guess_content_type(
@@ -107,7 +107,8 @@ class RequestField:
     :param name:
         The name of this request field. Must be unicode.
     :param data:
-        The data/value body.
+        The data/value body. A binary file object is streamed by
+        :class:`~urllib3.filepost.MultipartEncoder`.
     :param filename:
         An optional filename of the request field. Must be unicode.
     :param headers:
@@ -121,7 +122,7 @@ class RequestField:
     def __init__(
         self,
         name: str,
-        data: _TYPE_FIELD_VALUE,
+        data: _TYPE_FIELD_DATA,
         filename: str | None = None,
         headers: typing.Mapping[str, str] | None = None,
         header_formatter: typing.Callable[[str, _TYPE_FIELD_VALUE], str] | None = None,
@@ -163,7 +164,7 @@ class RequestField:
         """
         filename: str | None
         content_type: str | None
-        data: _TYPE_FIELD_VALUE
+        data: _TYPE_FIELD_DATA
 
         if isinstance(value, tuple):
             if len(value) == 3:
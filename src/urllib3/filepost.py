@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import binascii
 import codecs
+import io
 import os
 import typing
-from io import BytesIO
 
 from ._typing import _TYPE_FIELD_VALUE_TUPLE, _TYPE_FIELDS
 from .fields import RequestField
@@ -41,42 +41,232 @@ def iter_field_objects(fields: _TYPE_FIELDS) -> typing.Iterable[RequestField]:
             yield RequestField.from_tuples(*field)
 
 
-def encode_multipart_formdata(
-    fields: _TYPE_FIELDS, boundary: str | None = None
-) -> tuple[bytes, str]:
+class MultipartEncoder:
     """
-    Encode a dictionary of ``fields`` using the multipart/form-data MIME format.
+    Lazily encode ``fields`` using the multipart/form-data MIME format.
+
+    Behave like a read-only binary file. Boundaries and part headers are
+    rendered upfront, but file objects given as field data are only read,
+    in ``blocksize`` chunks, as the body is consumed. The exact length of
+    the body is known beforehand (``len(encoder)``) so that the request can
+    be sent with a ``Content-Length`` instead of chunked.
+
+    The encoder can be rewound (``seek``) so that the body can be sent again
+    on retries and redirects.
 
     :param fields:
         Dictionary of fields or list of (key, :class:`~urllib3.fields.RequestField`).
         Values are processed by :func:`urllib3.fields.RequestField.from_tuples`.
+        A field data can be a binary file object. Non-seekable or text file
+        objects are read entirely in memory as their size is unknown.
 
     :param boundary:
         If not specified, then a random boundary will be generated using
         :func:`urllib3.filepost.choose_boundary`.
+
+    :param blocksize:
+        Size of the chunks read from file objects when iterating over the encoder.
     """
-    body = BytesIO()
-    if boundary is None:
-        boundary = choose_boundary()
 
-    for field in iter_field_objects(fields):
-        body.write(f"--{boundary}\r\n".encode("latin-1"))
+    def __init__(
+        self,
+        fields: _TYPE_FIELDS,
+        boundary: str | None = None,
+        blocksize: int = 65536,
+    ) -> None:
+        if boundary is None:
+            boundary = choose_boundary()
 
-        writer(body).write(field.render_headers())
-        data = field.data
+        self.boundary: str = boundary
+        self.content_type: str = f"multipart/form-data; boundary={boundary}"
+        self.blocksize: int = blocksize
 
-        if isinstance(data, int):
-            data = str(data)  # Backwards compatibility
+        # every segment is either an in-memory chunk of bytes or a range of a file object.
+        # (data, file object, file start position, size)
+        self._segments: list[tuple[bytes, typing.IO[bytes] | None, int, int]] = []
+        self._length: int = 0
 
-        if isinstance(data, str):
-            writer(body).write(data)
-        else:
-            body.write(data)
+        self._position: int = 0
+        self._cursor: int = 0
+        self._cursor_offset: int = 0
+
+        buffered: list[bytes] = []
+
+        for field in iter_field_objects(fields):
+            buffered.append(f"--{boundary}\r\n".encode("latin-1"))
+            buffered.append(field.render_headers().encode("utf-8"))
+
+            data = field.data
+
+            if isinstance(data, int):
+                data = str(data)  # Backwards compatibility
+
+            if isinstance(data, str):
+                buffered.append(data.encode("utf-8"))
+            elif isinstance(data, (bytes, bytearray, memoryview)):
+                buffered.append(bytes(data))
+            else:
+                fp, start, size = self._measure(data)
+
+                if fp is None:
+                    content = data.read()
+                    buffered.append(
+                        content.encode("utf-8") if isinstance(content, str) else content
+                    )
+                elif size:
+                    self._append(b"".join(buffered))
+                    buffered = []
+                    self._segments.append((b"", fp, start, size))
+                    self._length += size
+
+            buffered.append(b"\r\n")
+
+        buffered.append(f"--{boundary}--\r\n".encode("latin-1"))
+
+        self._append(b"".join(buffered))
+
+    @staticmethod
+    def _measure(
+        fp: typing.IO[typing.Any],
+    ) -> tuple[typing.IO[bytes] | None, int, int]:
+        """Find out the remaining size of a binary and seekable file object."""
+        if isinstance(fp, io.TextIOBase) or "b" not in getattr(fp, "mode", "b"):
+            return None, 0, 0
+
+        try:
+            start = fp.tell()
+            end = fp.seek(0, os.SEEK_END)
+            fp.seek(start)
+        except (AttributeError, OSError, ValueError):
+            return None, 0, 0
+
+        return fp, start, end - start
+
+    def _append(self, data: bytes) -> None:
+        if data:
+            self._segments.append((data, None, 0, len(data)))
+            self._length += len(data)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def streaming(self) -> bool:
+        """Whether at least one part is read from a file object."""
+        return any(fp is not None for _, fp, _, _ in self._segments)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+
+        if offset < 0:
+            raise OSError(f"Invalid negative position {offset}")
+
+        self._position = min(offset, self._length)
+        self._cursor = 0
+
+        remaining = self._position
+
+        # locate the segment holding the new position.
+        for data, fp, start, size in self._segments:
+            if remaining < size:
+                break
+            remaining -= size
+            self._cursor += 1
+
+        self._cursor_offset = remaining
 
-        body.write(b"\r\n")
+        if self._cursor < len(self._segments):
+            _, fp, start, _ = self._segments[self._cursor]
 
-    body.write(f"--{boundary}--\r\n".encode("latin-1"))
+            if fp is not None:
+                fp.seek(start + remaining)
 
-    content_type = f"multipart/form-data; boundary={boundary}"
+        return self._position
+
+    def read(self, amt: int | None = -1) -> bytes:
+        """Read up to amt bytes of the encoded body. Read everything remaining if amt is omitted or negative."""
+        if amt is None or amt < 0:
+            amt = self._length - self._position
+
+        pieces: list[bytes] = []
+
+        while amt > 0 and self._cursor < len(self._segments):
+            data, fp, start, size = self._segments[self._cursor]
+
+            take = min(amt, size - self._cursor_offset)
+
+            if fp is None:
+                piece = (
+                    data
+                    if take == size
+                    else data[self._cursor_offset : self._cursor_offset + take]
+                )
+            else:
+                piece = fp.read(take)
+
+                if not piece:
+                    raise OSError(
+                        "multipart file part ended before its announced size, was it modified while uploading?"
+                    )
+
+            pieces.append(piece)
+
+            amt -= len(piece)
+            self._position += len(piece)
+            self._cursor_offset += len(piece)
+
+            if self._cursor_offset == size:
+                self._cursor += 1
+                self._cursor_offset = 0
+
+                # position the next file object, it may share the descriptor with a previous part.
+                if self._cursor < len(self._segments):
+                    _, next_fp, next_start, _ = self._segments[self._cursor]
+
+                    if next_fp is not None:
+                        next_fp.seek(next_start)
+
+        if len(pieces) == 1:
+            return pieces[0]
+
+        return b"".join(pieces)
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        while True:
+            chunk = self.read(self.blocksize)
+
+            if not chunk:
+                break
+
+            yield chunk
+
+
+def encode_multipart_formdata(
+    fields: _TYPE_FIELDS, boundary: str | None = None
+) -> tuple[bytes, str]:
+    """
+    Encode a dictionary of ``fields`` using the multipart/form-data MIME format.
+
+    :param fields:
+        Dictionary of fields or list of (key, :class:`~urllib3.fields.RequestField`).
+        Values are processed by :func:`urllib3.fields.RequestField.from_tuples`.
+
+    :param boundary:
+        If not specified, then a random boundary will be generated using
+        :func:`urllib3.filepost.choose_boundary`.
+    """
+    encoder = MultipartEncoder(fields, boundary=boundary)
 
-    return body.getvalue(), content_type
+    return encoder.read(), encoder.content_type
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import functools
+import itertools
 import logging
+import os
 import socket
+import threading
+import time
 import typing
 import warnings
+from collections import OrderedDict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from types import TracebackType
 from urllib.parse import urljoin
 
@@ -18,7 +25,13 @@ from ._typing import (
     _TYPE_TIMEOUT,
     ProxyConfig,
 )
-from .backend import HttpVersion, QuicPreemptiveCacheType, ResponsePromise
+from .backend import (
+    HttpVersion,
+    MemoryBudget,
+    QuicPreemptiveCacheType,
+    QuicSessionTicketStore,
+    ResponsePromise,
+)
 from .connectionpool import HTTPConnectionPool, HTTPSConnectionPool, port_by_scheme
 from .contrib.resolver import (
     BaseResolver,
@@ -26,16 +39,29 @@ from .contrib.resolver import (
     ProtocolResolver,
     ResolverDescription,
 )
+from .contrib.resolver._cache import ResolutionResult
 from .exceptions import (
+    DownloadError,
+    EmptyPoolError,
+    HTTPError,
     LocationValueError,
     MaxRetryError,
     ProxySchemeUnknown,
     URLSchemeUnknown,
 )
 from .response import HTTPResponse
+from .util.download import Segment, SegmentedDownload
+from .util.fork import register_before_fork, register_fork_aware
 from .util.proxy import connection_requires_http_tunnel
 from .util.request import NOT_FORWARDABLE_HEADERS
-from .util.retry import Retry
+from .util.retry import CircuitBreaker, Retry, RetryBudget
+from .util.singleflight import (
+    BufferedResponse,
+    RequestCoalescer,
+    coalescing_key,
+    is_coalescable,
+    wait_bound,
+)
 from .util.timeout import Timeout
 from .util.traffic_police import TrafficPolice, UnavailableTraffic
 from .util.url import Url, parse_extension, parse_url
@@ -45,7 +71,9 @@ if typing.TYPE_CHECKING:
 
     from typing_extensions import Literal
 
-__all__ = ["PoolManager", "ProxyManager", "proxy_from_url"]
+    from ._async.poolmanager import AsyncBatchResult, AsyncPoolManager
+
+__all__ = ["BatchResult", "PoolManager", "ProxyManager", "proxy_from_url"]
 
 
 log = logging.getLogger(__name__)
@@ -121,6 +149,8 @@ class PoolKey(typing.NamedTuple):
     key_background_watch_delay: float | int | None
     key_keepalive_delay: float | int | None
     key_keepalive_idle_window: float | int | None
+    key_flow_control_budget: int | None
+    key_thread_affinity: bool | None
 
 
 @functools.lru_cache(maxsize=8)
@@ -181,6 +211,190 @@ def _default_key_normalizer(
     return key_class(**empty_default_ctx)
 
 
+#: Each mutation of a ``connection_pool_kw`` is assigned a process-wide unique
+#: generation so that PoolKey memo entries computed beforehand are never reused.
+_pool_kwargs_generation = itertools.count()
+
+#: Upper bound of memoized PoolKey entries per (Async)PoolManager.
+_POOL_KEY_MEMO_MAXSIZE = 1024
+
+#: Seconds during which the addresses resolved for a coalesced host are trusted, at most.
+#: A shorter DNS TTL, when the resolver tells it, takes precedence.
+_COALESCED_ADDRESSES_MAX_AGE = 5.0
+
+
+class _ConnectionPoolKw(typing.Dict[str, typing.Any]):
+    """A plain ``dict`` that keep track of its own mutations.
+
+    The PoolManager rely on it to know when its memoized PoolKey become stale.
+    Nested mutable values (e.g. ``headers``) can be altered in place without
+    going through the dict, their keys are remembered so that the memo snapshot them."""
+
+    __slots__ = ("generation", "mutable_keys")
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._mutated()
+
+    def _mutated(self) -> None:
+        self.generation: int = next(_pool_kwargs_generation)
+        self.mutable_keys: tuple[str, ...] = tuple(
+            k
+            for k, v in self.items()
+            if isinstance(v, (typing.MutableMapping, list, set, bytearray))
+        )
+
+    def __setitem__(self, key: str, value: typing.Any) -> None:
+        super().__setitem__(key, value)
+        self._mutated()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._mutated()
+
+    def __ior__(self, other: typing.Any) -> _ConnectionPoolKw:  # type: ignore[override,misc]
+        super().__ior__(other)
+        self._mutated()
+        return self
+
+    def update(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().update(*args, **kwargs)
+        self._mutated()
+
+    def setdefault(self, key: str, default: typing.Any = None) -> typing.Any:
+        value = super().setdefault(key, default)
+        self._mutated()
+        return value
+
+    def pop(self, key: str, *args: typing.Any) -> typing.Any:
+        value = super().pop(key, *args)
+        self._mutated()
+        return value
+
+    def popitem(self) -> tuple[str, typing.Any]:
+        item = super().popitem()
+        self._mutated()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._mutated()
+
+    def copy(self) -> dict[str, typing.Any]:
+        return dict(self)
+
+
+def _freeze_pool_kwargs(
+    pool_kwargs: typing.Mapping[str, typing.Any] | None,
+) -> typing.Hashable | None:
+    """Produce a hashable equivalent of per-request pool kwargs. Return None if not possible."""
+    if not pool_kwargs:
+        return ()
+
+    frozen: list[tuple[str, typing.Any]] = []
+
+    try:
+        for k, v in pool_kwargs.items():
+            if isinstance(v, typing.Mapping):
+                v = frozenset(v.items())
+            elif isinstance(v, (set, frozenset)):
+                v = frozenset(v)
+            elif isinstance(v, list):
+                v = tuple(v)
+            elif isinstance(v, bytearray):
+                v = bytes(v)
+            frozen.append((k, v))
+
+        return frozenset(frozen)
+    except TypeError:
+        return None
+
+
+class _PoolKeyMemo:
+    """Bounded memo from (scheme, host, port, frozen pool kwargs) to a computed PoolKey.
+
+    Computing a PoolKey means copying, normalizing and freezing the whole request
+    context. Doing it for the same handful of origins over and over is wasteful.
+    Entries are invalidated by the ``connection_pool_kw`` generation, by a snapshot of
+    its nested mutable values and by the key function in use, so that a change to
+    any of them never serve a stale key."""
+
+    __slots__ = ("_store", "_maxsize")
+
+    def __init__(self, maxsize: int = _POOL_KEY_MEMO_MAXSIZE) -> None:
+        self._store: typing.OrderedDict[typing.Hashable, PoolKey] = OrderedDict()
+        self._maxsize = maxsize
+
+    @staticmethod
+    def key(
+        scheme: str,
+        host: str,
+        port: int | None,
+        pool_kwargs: typing.Mapping[str, typing.Any] | None,
+        key_fn: typing.Callable[[dict[str, typing.Any]], PoolKey],
+        connection_pool_kw: typing.Mapping[str, typing.Any],
+    ) -> typing.Hashable | None:
+        if not isinstance(connection_pool_kw, _ConnectionPoolKw):
+            return None
+
+        frozen_kwargs = _freeze_pool_kwargs(pool_kwargs)
+
+        if frozen_kwargs is None:
+            return None
+
+        if connection_pool_kw.mutable_keys:
+            nested_kwargs = _freeze_pool_kwargs(
+                {k: connection_pool_kw[k] for k in connection_pool_kw.mutable_keys}
+            )
+
+            if nested_kwargs is None:
+                return None
+        else:
+            nested_kwargs = ()
+
+        try:
+            hash(key_fn)
+        except TypeError:
+            return None
+
+        return (
+            scheme,
+            host,
+            port,
+            frozen_kwargs,
+            key_fn,
+            connection_pool_kw.generation,
+            nested_kwargs,
+        )
+
+    def get(self, key: typing.Hashable) -> PoolKey | None:
+        pool_key = self._store.get(key)
+
+        if pool_key is not None:
+            # least recently used first, a hit moves the entry to the end.
+            try:
+                self._store.move_to_end(key)
+            except KeyError:  # Defensive: concurrent eviction
+                pass
+
+        return pool_key
+
+    def put(self, key: typing.Hashable, pool_key: PoolKey) -> None:
+        if len(self._store) >= self._maxsize:
+            # evict the least recently used entry.
+            try:
+                self._store.popitem(last=False)
+            except KeyError:  # Defensive: concurrent eviction
+                pass
+        self._store[key] = pool_key
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
 #: A dictionary that maps a scheme to a callable that creates a pool key.
 #: This can be used to alter the way pool keys are constructed, if desired.
 #: Each PoolManager makes a copy of this dictionary so they can be configured
@@ -193,6 +407,64 @@ key_fn_by_scheme = {
 pool_classes_by_scheme = {"http": HTTPConnectionPool, "https": HTTPSConnectionPool}
 
 
+def _apply_retry_policies(
+    retries: Retry | bool | int | None,
+    redirect: bool | int | None,
+    retry_budget: RetryBudget | None,
+    circuit_breaker: CircuitBreaker | None,
+) -> Retry:
+    """Attach the manager wide retry budget and circuit breaker to given retries
+    unless it already carries its own."""
+    retries = Retry.from_int(retries, redirect=redirect)
+
+    if (retry_budget is None or retries.retry_budget is not None) and (
+        circuit_breaker is None or retries.circuit_breaker is not None
+    ):
+        return retries
+
+    return retries.new(
+        retry_budget=retries.retry_budget or retry_budget,
+        circuit_breaker=retries.circuit_breaker or circuit_breaker,
+    )
+
+
+#: A URL (GET), a (method, url) pair or a (method, url, request keyword arguments) triple.
+BatchRequest = typing.Union[
+    str,
+    typing.Tuple[str, str],
+    typing.Tuple[str, str, typing.Mapping[str, typing.Any]],
+]
+
+
+class BatchResult(typing.NamedTuple):
+    """Outcome of one of the requests of a batch. Exactly one of response and error is set."""
+
+    #: the request, as it was given.
+    request: BatchRequest
+    response: HTTPResponse | None
+    error: Exception | None
+
+
+def _unpack_batch_request(
+    request: BatchRequest,
+) -> tuple[str, str, typing.Mapping[str, typing.Any]]:
+    if isinstance(request, str):
+        return "GET", request, {}
+
+    if len(request) == 2:
+        return request[0], request[1], {}
+
+    return request
+
+
+def _batch_host_key(url: str) -> tuple[str, str | None, int | None]:
+    """Requests sharing this key end up in the same pool (unless their keyword arguments tell otherwise)."""
+    u = parse_url(url)
+    scheme = (u.scheme or "http").lower()
+
+    return scheme, u.host, u.port or port_by_scheme.get(scheme)
+
+
 class PoolManager(RequestMethods):
     """
     Allows for arbitrary requests while transparently keeping track of
@@ -206,6 +478,38 @@ class PoolManager(RequestMethods):
         Headers to include with all requests, unless other headers are given
         explicitly.
 
+    :param retry_budget:
+        A :class:`~urllib3.util.retry.RetryBudget` shared by every request
+        issued through this manager, unless their retries carry their own.
+
+    :param circuit_breaker:
+        A :class:`~urllib3.util.retry.CircuitBreaker` shared by every request
+        issued through this manager, unless their retries carry their own.
+
+    :param quic_session_tickets:
+        A :class:`~urllib3.backend.QuicSessionTicketStore` to resume HTTP/3 sessions
+        when reconnecting. One is created by default, pass ``False`` to disable resumption.
+        Use ``QuicSessionTicketStore(early_data=True)`` to send safe requests in 0-RTT.
+
+    :param memory_budget:
+        Amount of bytes (or a :class:`~urllib3.backend.MemoryBudget`) that every HTTP/2 and HTTP/3
+        connection of this manager may buffer, all together, for the responses that are not read yet.
+        Beyond it, the streams that keep piling up data stop receiving flow control credit until
+        they are consumed. Its usage is exposed by :attr:`memory_budget`. Unlimited by default.
+        The data a response already pulled into its own buffer is no longer accounted.
+
+    :param connection_coalescing:
+        Let the requests for a host ride an established HTTP/2 or HTTP/3 connection of another host
+        instead of opening a new one, provided that both resolve to the same address and that the
+        peer certificate covers the two of them. A ``421 Misdirected Request`` answer sends the
+        request again through a dedicated connection. Disabled by default.
+
+    :param request_coalescing:
+        Let concurrent ``GET`` and ``HEAD`` requests with identical URL and headers share a single
+        upstream request (singleflight). Each caller gets a response of its own over the same
+        buffered body. Requests with a body or a streamed response (``preload_content=False``)
+        are never coalesced. Disabled by default.
+
     :param \\**connection_pool_kw:
         Additional parameters are used to create fresh
         :class:`urllib3.connectionpool.ConnectionPool` instances.
@@ -235,12 +539,18 @@ class PoolManager(RequestMethods):
         num_pools: int = 10,
         headers: typing.Mapping[str, str] | None = None,
         preemptive_quic_cache: QuicPreemptiveCacheType | None = None,
+        quic_session_tickets: QuicSessionTicketStore | Literal[False] | None = None,
         resolver: ResolverDescription
         | list[ResolverDescription]
         | str
         | list[str]
         | BaseResolver
         | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        memory_budget: int | MemoryBudget | None = None,
+        connection_coalescing: bool = False,
+        request_coalescing: bool = False,
         **connection_pool_kw: typing.Any,
     ) -> None:
         super().__init__(headers)
@@ -261,6 +571,16 @@ class PoolManager(RequestMethods):
                 connection_pool_kw = connection_pool_kw.copy()
                 connection_pool_kw["retries"] = retries
 
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
+
+        if retry_budget is not None or circuit_breaker is not None:
+            connection_pool_kw = connection_pool_kw.copy()
+            connection_pool_kw["retries"] = _apply_retry_policies(
+                connection_pool_kw.get("retries"), True, retry_budget, circuit_breaker
+            )
+
+        self._pool_key_memo = _PoolKeyMemo()
         self.connection_pool_kw = connection_pool_kw
 
         self._num_pools = num_pools
@@ -282,6 +602,37 @@ class PoolManager(RequestMethods):
 
         self._preemptive_quic_cache = preemptive_quic_cache
 
+        #: QUIC session tickets, so that reconnecting to an HTTP/3 origin resume the TLS session.
+        self._quic_session_tickets: QuicSessionTicketStore | None = (
+            QuicSessionTicketStore()
+            if quic_session_tickets is None
+            else quic_session_tickets
+            if quic_session_tickets is not False
+            else None
+        )
+
+        #: Shared by every connection, monitor the buffered bytes with ``memory_budget.usage``.
+        self.memory_budget: MemoryBudget | None = (
+            MemoryBudget(memory_budget)
+            if isinstance(memory_budget, int)
+            else memory_budget
+        )
+
+        self._connection_coalescing = connection_coalescing
+        #: addresses resolved for the hosts that ride the connection of another host, until when they are trusted.
+        self._coalesced_addresses: dict[PoolKey, tuple[frozenset[str], float]] = {}
+        #: hosts that answered 421 Misdirected Request, they always get a connection of their own.
+        self._coalescing_denied: set[PoolKey] = set()
+
+        #: identical GET/HEAD requests in flight, shared between the concurrent callers.
+        self._request_coalescer: RequestCoalescer | None = (
+            RequestCoalescer() if request_coalescing else None
+        )
+
+        #: event loop and AsyncPoolManager that drive urlopen_many(), created on first use.
+        self._batch: tuple[asyncio.AbstractEventLoop, AsyncPoolManager] | None = None
+        self._batch_lock = threading.RLock()
+
         self._own_resolver = not isinstance(resolver, BaseResolver)
 
         if resolver is None:
@@ -335,6 +686,72 @@ class PoolManager(RequestMethods):
             else resolver
         )
 
+        #: urls to prewarm right before the next fork, see prewarm(before_fork=True).
+        self._prewarm_before_fork: list[str] = []
+        self._prewarm_lock = threading.Lock()
+
+        register_fork_aware(self)
+
+    def _after_fork_in_child(self) -> None:
+        # every pool resets itself (dropping its connections), we just have to
+        # give them back, the one borrowed by a thread of the parent included.
+        self.pools._after_fork_in_child(forget_registered=False)
+
+        if self.memory_budget is not None:
+            self.memory_budget._after_fork_in_child()
+
+        # the event loop (and its selector) belong to the parent.
+        self._batch = None
+        self._batch_lock = threading.RLock()
+
+    def _before_fork(self) -> None:
+        with self._prewarm_lock:
+            urls, self._prewarm_before_fork = self._prewarm_before_fork, []
+
+        if urls:
+            self.prewarm(urls)
+
+    def prewarm(self, urls: typing.Iterable[str], *, before_fork: bool = False) -> None:
+        """
+        Issue a ``HEAD`` request to each URL so that the caches this manager keep across
+        an ``os.fork()`` are filled: the resolved names (when the resolver caches them), the
+        SSL contexts, the Alt-Svc (HTTP/3) discoveries and the QUIC session tickets.
+        Meant for pre-fork servers, the children then skip that work on their first request.
+        The connections themselves are never inherited, a child always opens its own.
+
+        Failures are ignored, a prewarm is only a best effort.
+
+        :param urls: Origins to warm up.
+        :param before_fork: Do not issue the requests now but right before the next
+            fork of the process instead. Only once, the URLs of successive calls are queued.
+        """
+        urls = list(urls)
+
+        if before_fork:
+            if not hasattr(os, "register_at_fork"):  # Defensive: Windows
+                return
+
+            with self._prewarm_lock:
+                self._prewarm_before_fork.extend(urls)
+
+            register_before_fork(self)
+            return
+
+        for url in urls:
+            try:
+                self.request("HEAD", url, redirect=False, retries=False).close()
+            except HTTPError as e:
+                log.debug("Unable to prewarm %s: %s", url, e)
+
+    @property
+    def connection_pool_kw(self) -> dict[str, typing.Any]:
+        return self._connection_pool_kw
+
+    @connection_pool_kw.setter
+    def connection_pool_kw(self, value: typing.Mapping[str, typing.Any]) -> None:
+        self._connection_pool_kw = _ConnectionPoolKw(value)
+        self._pool_key_memo.clear()
+
     def __enter__(self: _SelfT) -> _SelfT:
         return self
 
@@ -385,6 +802,10 @@ class PoolManager(RequestMethods):
                 request_context.pop(kw, None)
 
         request_context["preemptive_quic_cache"] = self._preemptive_quic_cache
+        request_context["quic_session_tickets"] = self._quic_session_tickets
+
+        if self.memory_budget is not None:
+            request_context["memory_budget"] = self.memory_budget
 
         if not self._resolver.is_available():
             self._resolver = self._resolver.recycle()
@@ -405,10 +826,23 @@ class PoolManager(RequestMethods):
         reused after completion.
         """
         self.pools.clear()
+        self._coalesced_addresses.clear()
 
         if self._own_resolver and self._resolver.is_available():
             self._resolver.close()
 
+        with self._batch_lock:
+            if self._batch is not None:
+                loop, manager = self._batch
+                self._batch = None
+
+                try:
+                    # the batches left unfinished, and their requests in flight.
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+                    loop.run_until_complete(manager.clear())
+                finally:
+                    loop.close()
+
     def connection_from_host(
         self,
         host: str | None,
@@ -436,7 +870,60 @@ class PoolManager(RequestMethods):
         request_context["port"] = port
         request_context["host"] = host
 
-        return self.connection_from_context(request_context)
+        # a subclass may customize connection_from_context, the memo must not bypass it.
+        if (
+            type(self).connection_from_context
+            is not PoolManager.connection_from_context
+        ):
+            return self.connection_from_context(request_context)
+
+        pool_key = self._memoized_pool_key(request_context, pool_kwargs)
+
+        if pool_key is None:
+            return self.connection_from_context(request_context)
+
+        if self._preemptive_quic_cache is not None:
+            request_context["preemptive_quic_cache"] = self._preemptive_quic_cache
+
+        return self.connection_from_pool_key(pool_key, request_context=request_context)
+
+    def _memoized_pool_key(
+        self,
+        request_context: dict[str, typing.Any],
+        pool_kwargs: dict[str, typing.Any] | None,
+    ) -> PoolKey | None:
+        """Retrieve (or compute then remember) the PoolKey for a given request context.
+        Return None when the context cannot be memoized, e.g. an extension scheme like wss://
+        that rewrite the context or unhashable pool kwargs."""
+        pool_key_constructor = self.key_fn_by_scheme.get(
+            request_context["scheme"].lower()
+        )
+
+        if pool_key_constructor is None:
+            return None
+
+        memo_key = _PoolKeyMemo.key(
+            request_context["scheme"],
+            request_context["host"],
+            request_context["port"],
+            pool_kwargs,
+            pool_key_constructor,
+            self.connection_pool_kw,
+        )
+
+        if memo_key is None:
+            return None
+
+        if "strict" in request_context:
+            request_context.pop("strict")
+
+        pool_key = self._pool_key_memo.get(memo_key)
+
+        if pool_key is None:
+            pool_key = pool_key_constructor(request_context)
+            self._pool_key_memo.put(memo_key, pool_key)
+
+        return pool_key
 
     def connection_from_context(
         self, request_context: dict[str, typing.Any]
@@ -568,6 +1055,85 @@ class PoolManager(RequestMethods):
             u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
         )
 
+    def _connection_from_coalescing(
+        self, host: str, port: int | None, pool_kwargs: dict[str, typing.Any] | None
+    ) -> tuple[PoolKey, HTTPConnectionPool, frozenset[str]] | None:
+        """
+        Find the pool of another host with a connection able to carry the requests for given host.
+        It is only looked after as long as the host has no pool of its own. Return the pool key
+        of the host, the pool to use and the addresses the host resolve to, or None if no connection
+        can be coalesced.
+        """
+        request_context = self._merge_pool_kwargs(pool_kwargs)
+        request_context["scheme"] = "https"
+        request_context["port"] = port or port_by_scheme["https"]
+        request_context["host"] = host
+
+        pool_key = self._memoized_pool_key(request_context, pool_kwargs)
+
+        if (
+            pool_key is None
+            or pool_key in self._coalescing_denied
+            or self.pools.beacon(pool_key)
+        ):
+            return None
+
+        # the pools that only differ by their host are eligible, the TLS settings must match.
+        with self.pools._lock:
+            candidates = [
+                (key, pool)
+                for key, pool in self.pools._map.items()
+                if type(key) is type(pool_key)
+                and key != pool_key
+                and key._replace(key_host=pool_key.key_host) == pool_key
+            ]
+
+        if not candidates:
+            return None
+
+        now = time.monotonic()
+        addresses, trusted_until = self._coalesced_addresses.get(
+            pool_key, (frozenset(), now)
+        )
+
+        if trusted_until <= now:
+            try:
+                records = self._resolver.getaddrinfo(
+                    host,
+                    request_context["port"],
+                    socket.AF_UNSPEC,
+                    socket.SOCK_STREAM,
+                )
+            except OSError:
+                return None
+
+            addresses = frozenset(str(info[-1][0]) for info in records)
+            trusted_until = now + (
+                min(records.ttl, _COALESCED_ADDRESSES_MAX_AGE)
+                if isinstance(records, ResolutionResult)
+                else _COALESCED_ADDRESSES_MAX_AGE
+            )
+
+        for carrier_key, carrier in candidates:
+            if not carrier._can_coalesce(host, addresses):
+                continue
+
+            self._coalesced_addresses[pool_key] = addresses, trusted_until
+
+            request_context["host"] = carrier_key.key_host
+
+            return (
+                pool_key,
+                self.connection_from_pool_key(
+                    carrier_key, request_context=request_context
+                ),
+                addresses,
+            )
+
+        self._coalesced_addresses.pop(pool_key, None)
+
+        return None
+
     def _merge_pool_kwargs(
         self, override: dict[str, typing.Any] | None
     ) -> dict[str, typing.Any]:
@@ -656,6 +1222,47 @@ class PoolManager(RequestMethods):
         method = typing.cast(str, from_promise.get_parameter("method"))
         redirect = typing.cast(bool, from_promise.get_parameter("pm_redirect"))
 
+        coalesced_key = from_promise.get_parameter("pm_coalesced")
+
+        # The server refused to answer for that host on a coalesced connection.
+        if coalesced_key is not None and response.status == 421:
+            url = typing.cast(str, from_promise.get_parameter("pm_url"))
+            direct_headers = HTTPHeaderDict(from_promise.get_parameter("headers"))
+            direct_headers.discard("Host")
+            response_kw = typing.cast(
+                typing.MutableMapping[str, typing.Any],
+                from_promise.get_parameter("response_kw"),
+            )
+
+            log.info("Misdirected request %s, retrying on a dedicated connection", url)
+
+            self._coalescing_denied.add(coalesced_key)
+            response.drain_conn()
+
+            new_promise = self.urlopen(
+                method,
+                url,
+                redirect,
+                body=from_promise.get_parameter("body"),
+                headers=direct_headers,
+                retries=from_promise.get_parameter("retries"),
+                timeout=from_promise.get_parameter("timeout"),
+                pool_timeout=from_promise.get_parameter("pool_timeout"),
+                release_conn=True,
+                chunked=from_promise.get_parameter("chunked"),
+                body_pos=from_promise.get_parameter("body_pos"),
+                preload_content=from_promise.get_parameter("preload_content"),
+                decode_content=from_promise.get_parameter("decode_content"),
+                multiplexed=True,
+                **response_kw,
+            )
+
+            # the dedicated connection may not be multiplexed.
+            if not isinstance(new_promise, ResponsePromise):
+                return new_promise
+
+            return self.get_response(promise=new_promise if promise else None)
+
         # Handle redirect?
         if redirect and response.get_redirect_location():
             url = typing.cast(str, from_promise.get_parameter("pm_url"))
@@ -666,6 +1273,12 @@ class PoolManager(RequestMethods):
                 typing.Union[HTTPHeaderDict, None],
                 from_promise.get_parameter("headers"),
             )
+
+            # the authority was set for the coalesced connection.
+            if coalesced_key is not None:
+                headers = HTTPHeaderDict(headers)
+                headers.discard("Host")
+
             preload_content = typing.cast(
                 bool, from_promise.get_parameter("preload_content")
             )
@@ -748,6 +1361,12 @@ class PoolManager(RequestMethods):
                 typing.Union[HTTPHeaderDict, None],
                 from_promise.get_parameter("headers"),
             )
+
+            # the authority was set for the coalesced connection.
+            if coalesced_key is not None:
+                headers = HTTPHeaderDict(headers)
+                headers.discard("Host")
+
             preload_content = typing.cast(
                 bool, from_promise.get_parameter("preload_content")
             )
@@ -815,6 +1434,40 @@ class PoolManager(RequestMethods):
 
         return response
 
+    def iter_responses(
+        self, promises: typing.Iterable[ResponsePromise]
+    ) -> typing.Iterator[HTTPResponse]:
+        """
+        Retrieve the responses of given promises as they arrive on their connection rather
+        than in the order the requests were issued. Every stream of a connection is served in
+        a single pass, so a slow response does not hold back the ones of the same connection
+        that are already there.
+
+        Promises may span over several pools, but only the connection holding the oldest pending
+        promise is waited on. A response already there on another connection is retrieved
+        after that promise got its own.
+        """
+        pending = list(promises)
+
+        for promise in pending:
+            if not isinstance(promise, ResponsePromise):
+                raise TypeError(
+                    f"iter_responses only support ResponsePromise but received {type(promise)} instead."
+                )
+
+        while pending:
+            try:
+                with self.pools.borrow(
+                    pending[0], block=False, not_idle_only=True
+                ) as pool:
+                    promise = pool._wait_for_any_promise(pending)
+            except UnavailableTraffic:
+                promise = pending[0]  # let get_response() raise properly.
+
+            pending.remove(promise)
+
+            yield typing.cast(HTTPResponse, self.get_response(promise=promise))
+
     @typing.overload  # type: ignore[override]
     def urlopen(
         self,
@@ -848,6 +1501,9 @@ class PoolManager(RequestMethods):
         The given ``url`` parameter must be absolute, such that an appropriate
         :class:`urllib3.connectionpool.ConnectionPool` can be chosen for it.
         """
+        if self._request_coalescer is not None and is_coalescable(method, url, kw):
+            return self._urlopen_coalesced(method, url, redirect, **kw)
+
         u = parse_url(url)
 
         if u.scheme is None:
@@ -881,9 +1537,36 @@ class PoolManager(RequestMethods):
 
             pool_kwargs["disabled_svn"] = disabled_svn
 
-        conn = self.connection_from_host(
-            u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
-        )
+        if "headers" not in kw:
+            kw["headers"] = self.headers
+
+        coalesced = None
+
+        if (
+            self._connection_coalescing
+            and extension is None
+            and self.proxy is None
+            and u.scheme == "https"
+            and u.host is not None
+            and "host" not in (k.lower() for k in kw["headers"])
+        ):
+            coalesced = self._connection_from_coalescing(u.host, u.port, pool_kwargs)
+
+        if coalesced is not None:
+            coalesced_key, conn, addresses = coalesced
+
+            # the connection was established for another host, the authority must be ours.
+            headers = kw["headers"]
+            kw["headers"] = HTTPHeaderDict(headers)
+            kw["headers"]["Host"] = u.netloc
+            # and the request must go over a connection verified to be able to carry it.
+            kw["coalescing"] = u.host, addresses
+        else:
+            coalesced_key = None
+
+            conn = self.connection_from_host(
+                u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
+            )
 
         if u.scheme is not None and u.scheme.lower() not in ("http", "https"):
             from .contrib.webextensions import load_extension
@@ -895,20 +1578,49 @@ class PoolManager(RequestMethods):
         kw["assert_same_host"] = False
         kw["redirect"] = False
 
-        if "headers" not in kw:
-            kw["headers"] = self.headers
+        if kw.get("retries") is not None and (
+            self._retry_budget is not None or self._circuit_breaker is not None
+        ):
+            kw["retries"] = _apply_retry_policies(
+                kw["retries"], redirect, self._retry_budget, self._circuit_breaker
+            )
 
-        if self._proxy_requires_url_absolute_form(u):
-            response = conn.urlopen(method, url, **kw)
-        else:
-            response = conn.urlopen(method, u.request_uri, **kw)
+        request_url = (
+            url if self._proxy_requires_url_absolute_form(u) else u.request_uri
+        )
+
+        try:
+            response = conn.urlopen(method, request_url, **kw)
+        except EmptyPoolError:
+            if coalesced_key is None:
+                raise
+
+            # the connection able to carry the request is busy or went away meanwhile.
+            self.pools.release()
+
+            log.debug("No connection to coalesce %s onto, using a dedicated one", url)
+
+            coalesced_key = None
+            del kw["coalescing"]
+            kw["headers"] = headers
+
+            conn = self.connection_from_host(
+                u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
+            )
+            response = conn.urlopen(method, request_url, **kw)
 
         self.pools.release()
 
+        if coalesced_key is not None:
+            # whatever comes next (redirect, retry) is not bound to the coalesced connection.
+            del kw["coalescing"]
+            kw["headers"] = headers
+
         if kw.get("multiplexed"):
             if isinstance(response, ResponsePromise):
                 response.set_parameter("pm_redirect", redirect)
                 response.set_parameter("pm_url", url)
+                response.set_parameter("pm_coalesced", coalesced_key)
 
                 return response
 
@@ -922,6 +1634,16 @@ class PoolManager(RequestMethods):
         # assert isinstance(response, HTTPResponse)
         response = typing.cast(HTTPResponse, response)
 
+        if coalesced_key is not None and response.status == 421:
+            log.info("Misdirected request %s, retrying on a dedicated connection", url)
+
+            self._coalescing_denied.add(coalesced_key)
+            response.drain_conn()
+
+            kw["redirect"] = redirect
+
+            return self.urlopen(method, url, **kw)  # type: ignore[no-any-return]
+
         redirect_location = redirect and response.get_redirect_location()
         if not redirect_location:
             return response
@@ -970,6 +1692,318 @@ class PoolManager(RequestMethods):
         response.drain_conn()
         return self.urlopen(method, redirect_location, **kw)  # type: ignore[no-any-return]
 
+    def download(
+        self,
+        url: str,
+        file: str | os.PathLike[str] | int,
+        *,
+        segments: int = 4,
+        min_segment_size: int = 2**20,
+        max_segment_retries: int = 3,
+        headers: typing.Mapping[str, str] | None = None,
+        progress: typing.Callable[[int, int | None], None] | None = None,
+    ) -> int:
+        """
+        Download the resource at given URL into a file, as ``segments`` concurrent ``Range``
+        requests when the server supports them. Return the number of bytes written.
+
+        The resource is probed with a ``HEAD`` request first. Each segment is fetched by a thread
+        of its own and written in place as it is received. A connection streaming a segment is held
+        by its thread, so the segments spread over several connections (whatever the protocol) and the
+        download is not bound to the throughput of a single one. Mind ``maxsize`` with ``block=True``.
+
+        The segments must all come from the version of the resource seen by the probe
+        (``If-Range``), otherwise :class:`~urllib3.exceptions.DownloadError` is raised.
+        A segment interrupted by an error is resumed where it stopped, on its own.
+        Without support for ranges (or for a small resource) this is a regular download.
+
+        A path is created (or truncated). A file descriptor is written from its current
+        position and left open. On error, the file is left incomplete.
+
+        :param url: The resource to download.
+        :param file: A path or a file descriptor.
+        :param segments: Maximum number of segments, fetched concurrently.
+        :param min_segment_size: The resource is not split in segments smaller than that.
+        :param max_segment_retries: How many times a given segment may be resumed.
+        :param headers: Sent with every request, instead of the headers of the manager.
+        :param progress: Called with the amount of bytes received so far and the total (None if unknown),
+            by the thread that received them.
+        """
+        if segments < 1:
+            raise ValueError(f"segments must be at least 1, got {segments}")
+
+        if headers is None:
+            headers = self.headers
+
+        probe = self.request("HEAD", url, headers=headers)
+
+        if isinstance(file, int):
+            fd, owned = file, False
+        else:
+            fd = os.open(
+                file,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                0o666,
+            )
+            owned = True
+
+        try:
+            download = SegmentedDownload(
+                fd,
+                probe.status,
+                probe.headers,
+                segments=segments,
+                min_segment_size=min_segment_size,
+                progress=progress,
+            )
+            download.preallocate()
+
+            if len(download.segments) == 1:
+                self._download_segment(
+                    url, download, download.segments[0], headers, max_segment_retries
+                )
+            else:
+                with ThreadPoolExecutor(max_workers=len(download.segments)) as executor:
+                    tasks = [
+                        executor.submit(
+                            self._download_segment,
+                            url,
+                            download,
+                            segment,
+                            headers,
+                            max_segment_retries,
+                        )
+                        for segment in download.segments
+                    ]
+
+                    done, _ = wait(tasks, return_when=FIRST_EXCEPTION)
+
+                    for task in done:
+                        error = task.exception()
+
+                        if error is not None:
+                            # the others stop as soon as they receive something.
+                            download.failed = True
+                            raise error
+        finally:
+            if owned:
+                os.close(fd)
+
+        return download.received
+
+    def _download_segment(
+        self,
+        url: str,
+        download: SegmentedDownload,
+        segment: Segment,
+        headers: typing.Mapping[str, str],
+        max_retries: int,
+    ) -> None:
+        attempt = 0
+
+        while True:
+            try:
+                # the response comes right away (no promise) when the connection cannot multiplex.
+                promise = self.request(
+                    "GET",
+                    url,
+                    headers=download.request_headers(segment, headers),
+                    preload_content=False,
+                    multiplexed=True,
+                )
+
+                response = (
+                    self.get_response(promise=promise)
+                    if isinstance(promise, ResponsePromise)
+                    else promise
+                )
+
+                assert isinstance(response, HTTPResponse)
+
+                try:
+                    download.check(segment, response.status, response.headers)
+
+                    for chunk in response.stream():
+                        download.write(segment, chunk)
+                except BaseException:
+                    response.close()
+                    raise
+
+                response.release_conn()
+                return
+            except DownloadError:
+                raise
+            except HTTPError as e:
+                if not download.ranged or download.failed or attempt >= max_retries:
+                    raise
+
+                attempt += 1
+
+                log.debug(
+                    "Segment %d-%s of %s interrupted (%s), resuming at %d",
+                    segment.start,
+                    segment.end,
+                    url,
+                    e,
+                    segment.offset,
+                )
+
+    def urlopen_many(
+        self,
+        requests: typing.Iterable[BatchRequest],
+        *,
+        concurrency: int = 16,
+        per_host: int | None = None,
+    ) -> typing.Iterator[BatchResult]:
+        """
+        Issue a batch of requests, at most ``concurrency`` at a time, and yield their
+        outcome as they complete. A failed request yields its error instead of
+        interrupting the batch. This is the synchronous counterpart of
+        :meth:`~urllib3.AsyncPoolManager.request_many`, see it for the details.
+
+        No thread is spawned. The requests are driven from the calling thread by a private
+        event loop that waits on every socket at once, so that many HTTP/1.1 connections
+        (their establishment and TLS handshake included) make progress concurrently.
+        Those connections belong to an :class:`~urllib3.AsyncPoolManager` configured like
+        this manager and kept for the next batches, they are not shared with :meth:`urlopen`.
+
+        Each response is received in full before being yielded, ``preload_content=False``
+        only defers its decoding. Batches issued by several threads share the event loop,
+        each thread drives it in turn while it waits for its next result.
+        Cannot be called from a thread that runs an event loop, nor when this manager was
+        given a resolver instance (:class:`ValueError`), pass its description instead.
+
+        :param requests: Each being a URL (GET), a ``(method, url)`` pair or a
+            ``(method, url, kwargs)`` triple, ``kwargs`` being forwarded to :meth:`request`.
+        :param concurrency: Maximum number of requests in flight.
+        :param per_host: Maximum number of requests in flight per (scheme, host, port). Unlimited by default.
+        """
+        with self._batch_lock:
+            if self._batch is None:
+                loop = asyncio.new_event_loop()
+
+                try:
+                    self._batch = (
+                        loop,
+                        loop.run_until_complete(self._new_batch_manager()),
+                    )
+                except BaseException:
+                    loop.close()
+                    raise
+
+            loop, manager = self._batch
+
+            batch = typing.cast(
+                typing.AsyncGenerator["AsyncBatchResult", None],
+                manager.request_many(
+                    requests, concurrency=concurrency, per_host=per_host
+                ),
+            )
+
+        # never held across a yield, the caller may not resume (nor close) the iterator.
+        try:
+            while True:
+                with self._batch_lock:
+                    if self._batch is None or self._batch[0] is not loop:
+                        raise RuntimeError(
+                            "The batch was interrupted, its PoolManager got cleared"
+                        )
+
+                    try:
+                        result = loop.run_until_complete(batch.__anext__())
+                    except StopAsyncIteration:
+                        return
+
+                # served by _BatchPoolManager, the responses are synchronous ones.
+                yield BatchResult(
+                    result.request,
+                    typing.cast(typing.Optional[HTTPResponse], result.response),
+                    result.error,
+                )
+        finally:
+            with self._batch_lock:
+                if loop.is_closed():
+                    pass  # clear() already closed every batch.
+                elif (
+                    loop.is_running()
+                ):  # collected by this very thread, while it steps the loop.
+                    loop.create_task(batch.aclose())
+                else:
+                    loop.run_until_complete(batch.aclose())
+
+    def _batch_manager_kw(self) -> dict[str, typing.Any]:
+        """The configuration of this manager, for the AsyncPoolManager behind :meth:`urlopen_many`."""
+        from .contrib.resolver._async import AsyncResolverDescription
+
+        # a resolver instance is synchronous, it cannot serve the async stack and no other may
+        # silently take its place (e.g. it pins addresses, or keeps the queries off the system resolver).
+        if not self._own_resolver:
+            raise ValueError(
+                "urlopen_many() cannot use the resolver instance given to this PoolManager. "
+                "Pass it as a ResolverDescription (or its URL) instead, e.g. resolver='doh+google://'."
+            )
+
+        kw = self.connection_pool_kw.copy()
+
+        kw.update(
+            num_pools=self._num_pools,
+            headers=self.headers,
+            preemptive_quic_cache=self._preemptive_quic_cache,
+            quic_session_tickets=self._quic_session_tickets or False,
+            retry_budget=self._retry_budget,
+            circuit_breaker=self._circuit_breaker,
+            memory_budget=self.memory_budget,
+            connection_coalescing=self._connection_coalescing,
+            request_coalescing=self._request_coalescer is not None,
+        )
+
+        kw["resolver"] = [
+            AsyncResolverDescription(
+                rd.protocol,
+                rd.specifier,
+                rd.implementation,
+                rd.server,
+                rd.port,
+                *rd.host_patterns,
+                **rd.kwargs,
+            )
+            for rd in self._resolvers
+        ]
+
+        return kw
+
+    async def _new_batch_manager(self) -> AsyncPoolManager:
+        # created within the loop, so that whatever it binds to the running loop is the right one.
+        from ._async.poolmanager import _BatchPoolManager
+
+        return _BatchPoolManager(**self._batch_manager_kw())
+
+    def _urlopen_coalesced(
+        self, method: str, url: str, redirect: bool, **kw: typing.Any
+    ) -> HTTPResponse:
+        """Issue the request, or wait for the identical one already in flight, and return a response of our own."""
+        assert self._request_coalescer is not None
+
+        key = coalescing_key(method, url, redirect, kw.get("headers", self.headers))
+
+        def _request() -> BufferedResponse:
+            response = self.urlopen(
+                method, url, redirect, **{**kw, "preload_content": False}
+            )
+
+            return BufferedResponse.from_response(response)
+
+        # a follower does not wait on the leader longer than its own request could have lasted.
+        timeout = wait_bound(kw.get("timeout", self.connection_pool_kw.get("timeout")))
+
+        buffered = self._request_coalescer.get_or_request(key, _request, timeout)
+
+        return HTTPResponse(
+            **buffered.response_kw(
+                decode_content=kw.get("decode_content", True), preload_content=True
+            )
+        )
+
     def __repr__(self) -> str:
         with self.pools._lock:
             inner_repr = "; ".join(repr(p) for p in self.pools._registry.values())
@@ -1102,6 +2136,27 @@ class ProxyManager(PoolManager):
             pool_kwargs=pool_kwargs,
         )
 
+    async def _new_batch_manager(self) -> AsyncPoolManager:
+        from ._async.poolmanager import _BatchProxyManager
+
+        assert self.proxy is not None and self.proxy_config is not None
+
+        kw = self._batch_manager_kw()
+
+        # set again by the AsyncProxyManager itself.
+        for key in ("_proxy", "_proxy_headers", "_proxy_config"):
+            kw.pop(key, None)
+
+        return _BatchProxyManager(
+            self.proxy.url,
+            proxy_headers=self.proxy_headers,
+            proxy_ssl_context=self.proxy_ssl_context,
+            use_forwarding_for_https=self.proxy_config.use_forwarding_for_https,
+            proxy_assert_hostname=self.proxy_config.assert_hostname,
+            proxy_assert_fingerprint=self.proxy_config.assert_fingerprint,
+            **kw,
+        )
+
     def _set_proxy_headers(
         self, url: str, headers: typing.Mapping[str, str] | None = None
     ) -> typing.Mapping[str, str]:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import io
 import json as _json
 import logging
+import os
 import re
 import sys
 import typing
@@ -64,7 +65,12 @@ from .exceptions import (
     SSLError,
     MustRedialError,
 )
-from .util.response import is_fp_closed, BytesQueueBuffer
+from .util.response import (
+    is_fp_closed,
+    BytesQueueBuffer,
+    DownloadSink,
+    RecordSplitter,
+)
 from .util.retry import Retry
 
 if typing.TYPE_CHECKING:
@@ -75,6 +81,7 @@ if typing.TYPE_CHECKING:
     from .connection import HTTPConnection
     from .connectionpool import HTTPConnectionPool
     from .contrib.webextensions import ExtensionFromHTTP
+    from .util.response import _Hasher
     from .util.traffic_police import TrafficPolice
 
 log = logging.getLogger(__name__)
@@ -431,6 +438,16 @@ def _get_decoder(mode: str) -> ContentDecoder:
     raise DecodeError(f"Unsupported content encoding: {mode}")
 
 
+#: JSON text sequences (RFC 7464) prefix each record with the record separator (RS).
+JSON_SEQ_SEPARATOR = b"\x1e"
+
+
+def _is_json_seq(headers: HTTPHeaderDict) -> bool:
+    content_type = headers.get("content-type") or ""
+
+    return content_type.split(";", 1)[0].strip().lower() == "application/json-seq"
+
+
 class HTTPResponse(io.IOBase):
     """
     HTTP Response container.
@@ -637,17 +654,21 @@ class HTTPResponse(io.IOBase):
 
         self._extension = item
 
-    def json(self) -> typing.Any:
+    def json(
+        self, loads: typing.Callable[[bytes], typing.Any] | None = None
+    ) -> typing.Any:
         """
         Parses the body of the HTTP response as JSON.
 
-        To use a custom JSON decoder pass the result of :attr:`HTTPResponse.data` to the decoder.
+        To use a custom JSON decoder, such as ``orjson.loads`` or ``msgspec.json.decode``,
+        pass it as ``loads``. It is given the body as bytes, without going through a ``str``.
 
-        This method can raise either `UnicodeDecodeError` or `json.JSONDecodeError`.
+        This method can raise either `UnicodeDecodeError` or `json.JSONDecodeError`
+        (or whatever the custom decoder raises).
 
         Read more :ref:`here <json>`.
         """
-        return _json.loads(self.data)
+        return (loads or _json.loads)(self.data)
 
     @property
     def retries(self) -> Retry | None:
@@ -1266,6 +1287,95 @@ class HTTPResponse(io.IOBase):
             if data:
                 yield data
 
+    def iter_json_lines(
+        self, loads: typing.Callable[[bytes], typing.Any] | None = None
+    ) -> typing.Iterator[typing.Any]:
+        """
+        Parses the body as a stream of JSON records, yielding each of them as soon as it
+        is received. The body is never held in memory as a whole, only the record being received.
+
+        Newline delimited JSON (NDJSON, JSON Lines) is expected, unless the response is
+        ``application/json-seq`` (:rfc:`7464`) whose records are separated by the RS character.
+        Blank lines are skipped.
+
+        :param loads:
+            A custom JSON decoder, such as ``orjson.loads``, it is given each record as bytes.
+        """
+        loads = loads or _json.loads
+        splitter = RecordSplitter(
+            JSON_SEQ_SEPARATOR if _is_json_seq(self.headers) else b"\n"
+        )
+
+        for chunk in self.stream(-1, decode_content=True):
+            for record in splitter.feed(chunk):
+                yield loads(record)
+
+        for record in splitter.close():
+            yield loads(record)
+
+    def download_to(
+        self,
+        file: str | os.PathLike[str] | int,
+        *,
+        hashes: typing.Iterable[_Hasher] = (),
+        fsync: bool | int = False,
+        decode_content: bool | None = None,
+        chunk_size: int = 2**16,
+    ) -> int:
+        """
+        Write the body to the given file as it is received, return the number of bytes written.
+
+        A path is created (or truncated). A file descriptor is written at its current position
+        and left open. When the length of the body is known, the space is reserved on disk
+        upfront (``posix_fallocate``), so that a full disk is reported before the download.
+
+        The body is written chunk by chunk, as yielded by :meth:`stream`. Each chunk is a ``bytes``
+        object built by the protocol layer, written as-is. It is not copied into a reusable buffer,
+        this would add a copy without saving the allocation.
+
+        :param file:
+            A path or a file descriptor.
+
+        :param hashes:
+            ``hashlib`` objects (or anything with an ``update`` method), such as ``hashlib.sha256()``,
+            fed with the body as it is written. Read their digest afterward.
+
+        :param fsync:
+            ``True`` to flush the file to disk once written. An integer to also do it each time
+            that many bytes got written. Disabled by default.
+
+        :param decode_content:
+            If True, will attempt to decode the body based on the
+            'content-encoding' header.
+
+        :param chunk_size:
+            How much of the content to read at once.
+        """
+        sink = DownloadSink(file, self._download_length(decode_content), hashes, fsync)
+
+        try:
+            for chunk in self.stream(chunk_size, decode_content=decode_content):
+                sink.write(chunk)
+        except BaseException:
+            sink.close(failed=True)
+            raise
+
+        sink.close()
+
+        return sink.written
+
+    def _download_length(self, decode_content: bool | None) -> int | None:
+        """Length of what download_to() is about to write, if known."""
+        if decode_content is None:
+            decode_content = self.decode_content
+
+        content_encoding = self.headers.get("content-encoding", "").strip().lower()
+
+        if decode_content and content_encoding not in ("", "identity"):
+            return None
+
+        return self.length_remaining
+
     # Overrides from io.IOBase
     def readable(self) -> bool:
         return True
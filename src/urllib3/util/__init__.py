@@ -4,7 +4,7 @@ from __future__ import annotations
 from .connection import is_connection_dropped
 from .request import SKIP_HEADER, SKIPPABLE_HEADERS, make_headers
 from .response import is_fp_closed, parse_alt_svc
-from .retry import Retry
+from .retry import CircuitBreaker, Retry, RetryBudget
 from .ssl_ import (
     ALPN_PROTOCOLS,
     SSLContext,
@@ -12,6 +12,7 @@ from .ssl_ import (
     create_urllib3_context,
     resolve_cert_reqs,
     resolve_ssl_version,
+    ssl_context_cache_info,
     ssl_wrap_socket,
 )
 from .timeout import Timeout
@@ -22,6 +23,8 @@ __all__ = (
     "SSLContext",
     "ALPN_PROTOCOLS",
     "Retry",
+    "RetryBudget",
+    "CircuitBreaker",
     "Timeout",
     "Url",
     "assert_fingerprint",
@@ -33,6 +36,7 @@ __all__ = (
     "resolve_cert_reqs",
     "resolve_ssl_version",
     "ssl_wrap_socket",
+    "ssl_context_cache_info",
     "wait_for_read",
     "wait_for_write",
     "SKIP_HEADER",
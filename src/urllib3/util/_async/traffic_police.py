@@ -886,6 +886,31 @@ class AsyncTrafficPolice(typing.Generic[T]):
 
         return conn_or_pool
 
+    def take(self, conn_or_pool: T) -> bool:
+        """Take hold of that very conn_or_pool, without waiting. Return False when it is
+        in use by another task or saturated."""
+        if self._cursor is not None:
+            raise AtomicTraffic(
+                "One connection/pool active per task at a given time. "
+                "Call release prior to calling this method."
+            )
+
+        obj_id = id(conn_or_pool)
+
+        if (
+            obj_id not in self._container
+            or traffic_state_of(conn_or_pool) is TrafficState.SATURATED
+            or self._signals.should_queue_read_operation(conn_or_pool)
+        ):
+            return False
+
+        self._cursors[_current_task_or_die()] = ActiveCursor(obj_id, conn_or_pool)
+
+        if not self.concurrency:
+            del self._container[obj_id]
+
+        return True
+
     def memorize(
         self, traffic_indicator: MappableTraffic, conn_or_pool: T | None = None
     ) -> None:
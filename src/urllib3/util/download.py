@@ -0,0 +1,205 @@
+"""
+Segmented downloads, see :meth:`urllib3.PoolManager.download`. The resource is split into
+byte ranges that are fetched concurrently and written in place, each at its own offset.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import typing
+from dataclasses import dataclass
+
+from .._collections import HTTPHeaderDict
+from ..exceptions import DownloadError
+
+_CONTENT_RANGE = re.compile(r"^bytes\s+(\d+)-(\d+)/(\d+|\*)$", re.IGNORECASE)
+
+
+@dataclass
+class Segment:
+    """A byte range of the resource, both ends inclusive. The end is unknown (None)
+    when the resource is fetched as a whole, without a Range request."""
+
+    start: int
+    end: int | None
+    #: bytes received so far, an interrupted segment resumes right after them.
+    received: int = 0
+
+    @property
+    def offset(self) -> int:
+        return self.start + self.received
+
+
+def plan_segments(length: int, segments: int, min_segment_size: int) -> list[Segment]:
+    """Split ``length`` bytes into at most ``segments`` ranges of (nearly) the same size,
+    none being smaller than ``min_segment_size``, unless there is only one."""
+    count = max(1, min(segments, length // max(min_segment_size, 1)))
+    size, extra = divmod(length, count)
+
+    plan = []
+    start = 0
+
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0) - 1
+        plan.append(Segment(start, end))
+        start = end + 1
+
+    return plan
+
+
+class SegmentedDownload:
+    """Shared state of the segments of a download: the version of the resource
+    they must all come from, where they land in the file and the progress."""
+
+    def __init__(
+        self,
+        fd: int,
+        probe_status: int,
+        probe_headers: HTTPHeaderDict,
+        *,
+        segments: int,
+        min_segment_size: int,
+        progress: typing.Callable[[int, int | None], None] | None = None,
+    ) -> None:
+        self.fd = fd
+
+        content_length = probe_headers.get("content-length")
+
+        #: length of the resource, if announced by the probe.
+        self.length: int | None = (
+            int(content_length)
+            if probe_status == 200
+            and content_length is not None
+            and content_length.isdigit()
+            else None
+        )
+
+        self.etag = probe_headers.get("etag")
+
+        # If-Range only accepts a strong validator.
+        self.if_range = (
+            self.etag
+            if self.etag and not self.etag.startswith("W/")
+            else probe_headers.get("last-modified")
+        )
+
+        try:
+            #: a file descriptor is written from its current position.
+            self._base: int | None = os.lseek(fd, 0, os.SEEK_CUR)
+        except OSError:  # a pipe, only written sequentially.
+            self._base = None
+
+        accept_ranges = probe_headers.get("accept-ranges", "").lower()
+        content_encoding = probe_headers.get("content-encoding", "").strip().lower()
+
+        #: fetched with Range requests, otherwise with a single plain request.
+        self.ranged = (
+            bool(self.length)
+            and self._base is not None
+            and "bytes" in accept_ranges
+            and content_encoding in ("", "identity")
+        )
+
+        self.segments = (
+            plan_segments(self.length, segments, min_segment_size)  # type: ignore[arg-type]
+            if self.ranged
+            else [Segment(0, None)]
+        )
+
+        #: bytes received so far, all segments together.
+        self.received = 0
+        #: set once a segment gave up, so that the others stop as well.
+        self.failed = False
+
+        self._progress = progress
+        self._lock = threading.Lock()
+
+    def preallocate(self) -> None:
+        """Reserve the space upfront, it limits fragmentation and reports a full disk early."""
+        if not self.ranged or not hasattr(os, "posix_fallocate"):
+            return
+
+        try:
+            os.posix_fallocate(self.fd, self._base, self.length)  # type: ignore[arg-type]
+        except OSError:  # a filesystem that does not support it.
+            pass
+
+    def request_headers(
+        self, segment: Segment, headers: typing.Mapping[str, str]
+    ) -> HTTPHeaderDict:
+        request_headers = HTTPHeaderDict(headers)
+
+        if self.ranged:
+            request_headers["Range"] = f"bytes={segment.offset}-{segment.end}"
+
+            # the server answers the whole (new) resource instead of a range if it changed.
+            if self.if_range:
+                request_headers["If-Range"] = self.if_range
+
+        return request_headers
+
+    def check(self, segment: Segment, status: int, headers: HTTPHeaderDict) -> None:
+        """Make sure that the response carries the expected part of the expected resource."""
+        if not self.ranged:
+            if not 200 <= status < 300:
+                raise DownloadError(f"Unexpected status {status}")
+            return
+
+        if status != 206:
+            raise DownloadError(
+                f"Expected 206 Partial Content for bytes {segment.offset}-{segment.end}, got {status}. "
+                "The resource changed or the server stopped honoring Range requests."
+            )
+
+        etag = headers.get("etag")
+
+        if self.etag and etag and etag != self.etag:
+            raise DownloadError(
+                f"The resource changed during the download, ETag {self.etag} became {etag}"
+            )
+
+        content_range = _CONTENT_RANGE.match(headers.get("content-range", "").strip())
+
+        if (
+            content_range is None
+            or int(content_range.group(1)) != segment.offset
+            or int(content_range.group(2)) != segment.end
+            or content_range.group(3) not in ("*", str(self.length))
+        ):
+            raise DownloadError(
+                f"Expected bytes {segment.offset}-{segment.end}/{self.length}, "
+                f"got {headers.get('content-range')!r}"
+            )
+
+    def write(self, segment: Segment, data: bytes) -> None:
+        if self.failed:
+            raise DownloadError("Aborted, another segment failed")
+
+        view = memoryview(data)
+
+        if self._base is None:
+            while view:
+                view = view[os.write(self.fd, view) :]
+        elif hasattr(os, "pwrite"):
+            offset = self._base + segment.offset
+
+            while view:
+                written = os.pwrite(self.fd, view, offset)
+                view = view[written:]
+                offset += written
+        else:  # Defensive: Windows
+            with self._lock:
+                os.lseek(self.fd, self._base + segment.offset, os.SEEK_SET)
+
+                while view:
+                    view = view[os.write(self.fd, view) :]
+
+        segment.received += len(data)
+
+        with self._lock:
+            self.received += len(data)
+
+            if self._progress is not None:
+                self._progress(self.received, self.length)
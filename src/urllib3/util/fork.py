@@ -0,0 +1,57 @@
+"""
+Long-lived objects (pools, caches) keep sockets, locks and threads that do not survive
+an ``os.fork()``. They register here and their ``_after_fork_in_child()`` is called in
+the child, right after the fork, before anything else get a chance to use them.
+Those with work to do in the parent, right before the fork, register for ``_before_fork()``.
+"""
+
+from __future__ import annotations
+
+import os
+import typing
+import weakref
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Protocol
+
+    class _ForkAware(Protocol):
+        def _after_fork_in_child(self) -> None: ...
+
+    class _BeforeForkAware(Protocol):
+        def _before_fork(self) -> None: ...
+
+
+_FORK_AWARE: weakref.WeakSet[_ForkAware] = weakref.WeakSet()
+_BEFORE_FORK_AWARE: weakref.WeakSet[_BeforeForkAware] = weakref.WeakSet()
+
+
+def register_fork_aware(obj: _ForkAware) -> None:
+    """Have ``obj._after_fork_in_child()`` called in every child forked from now on, as long as obj is alive."""
+    _FORK_AWARE.add(obj)
+
+
+def register_before_fork(obj: _BeforeForkAware) -> None:
+    """Have ``obj._before_fork()`` called in the parent before every fork from now on, as long as obj is alive."""
+    _BEFORE_FORK_AWARE.add(obj)
+
+
+def _before_fork() -> None:
+    for obj in list(_BEFORE_FORK_AWARE):
+        try:
+            obj._before_fork()
+        except Exception:  # Defensive: a faulty object must not prevent the fork.
+            pass
+
+
+def _after_fork_in_child() -> None:
+    for obj in list(_FORK_AWARE):
+        try:
+            obj._after_fork_in_child()
+        except (
+            Exception
+        ):  # Defensive: a faulty object must not prevent the others from being reset.
+            pass
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_before_fork, after_in_child=_after_fork_in_child)
@@ -80,6 +80,7 @@ def make_headers(
     basic_auth: str | None = None,
     proxy_basic_auth: str | None = None,
     disable_cache: bool | None = None,
+    priority: int | tuple[int, bool] | None = None,
 ) -> dict[str, str]:
     """
     Shortcuts for generating request headers.
@@ -111,6 +112,10 @@ def make_headers(
     :param disable_cache:
         If ``True``, adds 'cache-control: no-cache' header.
 
+    :param priority:
+        The urgency, from 0 (most urgent) to 7, or a tuple (urgency, incremental).
+        Adds the 'priority' header as defined in RFC 9218, e.g. 'u=1, i'.
+
     Example:
 
     .. code-block:: python
@@ -151,6 +156,18 @@ def make_headers(
     if disable_cache:
         headers["cache-control"] = "no-cache"
 
+    if priority is not None:
+        urgency, incremental = (
+            priority if isinstance(priority, tuple) else (priority, False)
+        )
+
+        if not isinstance(urgency, int) or not 0 <= urgency <= 7:
+            raise ValueError(
+                f"priority urgency must be an integer between 0 and 7, got {urgency!r}"
+            )
+
+        headers["priority"] = f"u={urgency}, i" if incremental else f"u={urgency}"
+
     return headers
 
 
@@ -347,7 +364,9 @@ def body_to_chunks(
     # File-like object, TODO: use seek() and tell() for length?
     elif hasattr(body, "read") and not hasattr(body, "__aiter__"):
         chunks = chunk_readable()
-        content_length = None
+        # some readable objects know their exact length in advance
+        # e.g. urllib3.filepost.MultipartEncoder
+        content_length = len(body) if hasattr(body, "__len__") else None
     elif hasattr(body, "__aiter__"):
         chunks = chunk_areadable()
         content_length = None
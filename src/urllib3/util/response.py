@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import collections
 import io
+import os
 import re
 import typing
 
 if typing.TYPE_CHECKING:
     import http.client as httplib
 
+    from typing_extensions import Protocol
+
+    class _Hasher(Protocol):
+        def update(self, __data: bytes) -> None: ...
+
 
 def is_fp_closed(obj: object) -> bool:
     """
@@ -119,6 +125,123 @@ class BytesQueueBuffer:
         return ret.getvalue()
 
 
+class RecordSplitter:
+    """Split a byte stream into records, as it is received.
+
+    Each chunk is looked at once for its last separator, the bytes that follow it are kept
+    aside until the next separator shows up. Hence, a stream is never scanned again from the
+    start, and only the record being received (plus one chunk) is held in memory.
+    Surrounding whitespaces are stripped and blank records are skipped.
+    """
+
+    def __init__(self, separator: bytes = b"\n") -> None:
+        self._separator = separator
+        self._pending = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Return the records completed by given chunk."""
+        head, separator, tail = chunk.rpartition(self._separator)
+
+        if not separator:
+            self._pending += chunk
+            return []
+
+        self._pending += head
+        records = bytes(self._pending).split(self._separator)
+        self._pending = bytearray(tail)
+
+        return [record for record in map(bytes.strip, records) if record]
+
+    def close(self) -> list[bytes]:
+        """Return the last record, in case the stream does not end with a separator."""
+        record = bytes(self._pending).strip()
+        self._pending = bytearray()
+
+        return [record] if record else []
+
+
+class DownloadSink:
+    """Write a body to a file as it is received, see :meth:`~urllib3.HTTPResponse.download_to`.
+
+    A path is created (or truncated) and closed afterward. A file descriptor is written
+    at its current position and left open.
+    """
+
+    def __init__(
+        self,
+        file: str | os.PathLike[str] | int,
+        expected_length: int | None = None,
+        hashes: typing.Iterable[_Hasher] = (),
+        fsync: bool | int = False,
+    ) -> None:
+        if isinstance(file, int):
+            self.fd = file
+            self._owned = False
+        else:
+            self.fd = os.open(
+                file,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                0o666,
+            )
+            self._owned = True
+
+        self._hashes = list(hashes)
+        self._fsync = fsync
+        self._unsynced = 0
+
+        #: bytes written so far.
+        self.written = 0
+
+        self._preallocated_at: int | None = None
+        #: size of the file before the reservation, what was already there is never cut.
+        self._size_before = 0
+
+        # reserving the space upfront limits fragmentation and reports a full disk early.
+        if expected_length and hasattr(os, "posix_fallocate"):
+            try:
+                offset = os.lseek(self.fd, 0, os.SEEK_CUR)
+                size_before = os.fstat(self.fd).st_size
+                os.posix_fallocate(self.fd, offset, expected_length)
+            except OSError:  # a pipe, or a filesystem that does not support it.
+                pass
+            else:
+                self._preallocated_at = offset
+                self._size_before = size_before
+
+    def write(self, chunk: bytes) -> None:
+        view = memoryview(chunk)
+
+        while view:
+            view = view[os.write(self.fd, view) :]
+
+        for hasher in self._hashes:
+            hasher.update(chunk)
+
+        self.written += len(chunk)
+
+        if self._fsync is not True and self._fsync:
+            self._unsynced += len(chunk)
+
+            if self._unsynced >= self._fsync:
+                os.fsync(self.fd)
+                self._unsynced = 0
+
+    def close(self, failed: bool = False) -> None:
+        try:
+            if failed:
+                # do not leave the reserved (zeroed) space behind as if it had been received.
+                if self._preallocated_at is not None:
+                    os.ftruncate(
+                        self.fd,
+                        max(self._size_before, self._preallocated_at + self.written),
+                    )
+            elif self._fsync:
+                os.fsync(self.fd)
+        finally:
+            if self._owned:
+                os.close(self.fd)
+
+
 def assert_header_parsing(
     headers: httplib.HTTPMessage,
 ) -> None:  # Defensive: dead code from http.client era
@@ -5,12 +5,14 @@ import email
 import logging
 import random
 import re
+import threading
 import time
 import typing
 from itertools import takewhile
 from types import TracebackType
 
 from ..exceptions import (
+    CircuitOpenError,
     ConnectTimeoutError,
     InvalidHeader,
     MaxRetryError,
@@ -40,6 +42,208 @@ class RequestHistory(typing.NamedTuple):
     redirect_location: str | None
 
 
+_UpstreamType: typing.TypeAlias = typing.Tuple[str, str, typing.Optional[int]]
+
+
+def _upstream_of(
+    pool: ConnectionPool | AsyncConnectionPool | None,
+) -> _UpstreamType | None:
+    """Identify the upstream targeted by a given pool. Return None if not possible."""
+    if pool is None:
+        return None
+
+    scheme = getattr(pool, "scheme", None)
+
+    if scheme is None or pool.host is None:
+        return None
+
+    return scheme, pool.host, pool.port
+
+
+class RetryBudget:
+    """Token bucket, per upstream, limiting retries to a fraction of the successful traffic.
+
+    Each upstream starts with ``max_tokens`` tokens. A successful response deposit ``ratio``
+    token and a retry withdraw one. Once the bucket is empty, retries are denied
+    until enough requests succeed again. First attempts are never affected.
+
+    The budget is meant to be shared (e.g. across a whole :class:`~urllib3.PoolManager`)
+    so that a degraded upstream does not see its load amplified by concurrent retries.
+
+    .. code-block:: python
+
+        retries = Retry(3, retry_budget=RetryBudget(ratio=0.1))
+        http = PoolManager(retries=retries)
+
+    :param float ratio:
+        Amount of token earned per successful response. ``0.1`` means that
+        one retry is allowed every ten successful requests.
+
+    :param int max_tokens:
+        Capacity of the bucket. This is also the initial amount of retries allowed
+        before any successful response is observed.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: int = 10) -> None:
+        if ratio < 0 or max_tokens < 0:
+            raise ValueError("RetryBudget ratio and max_tokens must be positive")
+
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+
+        self._tokens: dict[_UpstreamType, float] = {}
+        self._lock = threading.Lock()
+
+    def tokens(self, upstream: _UpstreamType) -> float:
+        """Amount of tokens currently available for given upstream."""
+        with self._lock:
+            return self._tokens.get(upstream, float(self.max_tokens))
+
+    def deposit(self, upstream: _UpstreamType) -> None:
+        """Record a successful response."""
+        with self._lock:
+            tokens = self._tokens.get(upstream)
+
+            if tokens is None:
+                return
+
+            tokens += self.ratio
+
+            if tokens >= self.max_tokens:
+                del self._tokens[upstream]
+            else:
+                self._tokens[upstream] = tokens
+
+    def withdraw(self, upstream: _UpstreamType) -> bool:
+        """Try to spend a token for a retry. Return False if the budget is exhausted."""
+        with self._lock:
+            tokens = self._tokens.get(upstream, float(self.max_tokens))
+
+            if tokens < 1:
+                return False
+
+            self._tokens[upstream] = tokens - 1
+
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(ratio={self.ratio}, max_tokens={self.max_tokens})"
+        )
+
+
+class _CircuitState:
+    __slots__ = ("failures", "opened_at", "probes")
+
+    def __init__(self) -> None:
+        self.failures: int = 0
+        self.opened_at: float | None = None
+        self.probes: int = 0
+
+
+class CircuitBreaker:
+    """Per upstream circuit breaker.
+
+    The circuit opens after ``failure_threshold`` consecutive connect/read failures. While
+    open, every request to that upstream fails fast with :class:`~urllib3.exceptions.CircuitOpenError`.
+    After ``recovery_timeout`` seconds, it half-opens and let up to ``half_open_probes`` requests
+    through. The first successful response close the circuit, a failure open it again.
+
+    .. code-block:: python
+
+        http = PoolManager(circuit_breaker=CircuitBreaker(failure_threshold=5))
+
+    :param int failure_threshold:
+        Consecutive connect/read failures needed to open the circuit.
+
+    :param float recovery_timeout:
+        Seconds to wait, once open, before probing the upstream again.
+
+    :param int half_open_probes:
+        How many probe requests are allowed per ``recovery_timeout`` window while half-open.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+    ) -> None:
+        if failure_threshold < 1 or half_open_probes < 1:
+            raise ValueError(
+                "CircuitBreaker failure_threshold and half_open_probes must be at least 1"
+            )
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+
+        self._states: dict[_UpstreamType, _CircuitState] = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, upstream: _UpstreamType) -> bool:
+        """Determine if the circuit is (half-)open for given upstream."""
+        with self._lock:
+            state = self._states.get(upstream)
+            return state is not None and state.opened_at is not None
+
+    def admit(self, upstream: _UpstreamType) -> float | None:
+        """Ask permission to send a request. Return None if allowed,
+        otherwise the remaining delay in seconds before a probe will be allowed."""
+        with self._lock:
+            state = self._states.get(upstream)
+
+            if state is None or state.opened_at is None:
+                return None
+
+            now = time.monotonic()
+            elapsed = now - state.opened_at
+
+            if elapsed < self.recovery_timeout:
+                if state.probes == 0 or state.probes >= self.half_open_probes:
+                    return self.recovery_timeout - elapsed
+            else:
+                # New probing window. Stalled probes, if any, are forgotten.
+                state.opened_at = now
+                state.probes = 0
+
+            state.probes += 1
+
+        return None
+
+    def record_success(self, upstream: _UpstreamType) -> None:
+        """A response was received, the circuit is closed."""
+        with self._lock:
+            if upstream in self._states:
+                del self._states[upstream]
+
+    def record_failure(self, upstream: _UpstreamType) -> None:
+        """A connect/read failure occurred."""
+        with self._lock:
+            state = self._states.get(upstream)
+
+            if state is None:
+                state = self._states[upstream] = _CircuitState()
+
+            state.failures += 1
+
+            if state.opened_at is not None or state.failures >= self.failure_threshold:
+                if state.opened_at is None:
+                    log.warning(
+                        "Circuit breaker opened for %s://%s:%s after %d consecutive failures",
+                        *upstream,
+                        state.failures,
+                    )
+                state.opened_at = time.monotonic()
+                state.probes = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(failure_threshold={self.failure_threshold}, "
+            f"recovery_timeout={self.recovery_timeout}, half_open_probes={self.half_open_probes})"
+        )
+
+
 class Retry:
     """Retry configuration.
 
@@ -185,6 +389,15 @@ class Retry:
         Retry-After headers. Defaults to :attr:`Retry.DEFAULT_RETRY_AFTER_MAX`.
         Any Retry-After headers larger than this value will be limited to this
         value.
+
+    :param RetryBudget retry_budget: A shared :class:`RetryBudget`. Retries
+        that would exceed the budget of the upstream are not attempted and
+        raise :class:`~urllib3.exceptions.MaxRetryError` instead.
+        Redirects never consume the budget.
+
+    :param CircuitBreaker circuit_breaker: A shared :class:`CircuitBreaker`.
+        Requests to an upstream whose circuit is open fail fast with
+        :class:`~urllib3.exceptions.CircuitOpenError`.
     """
 
     #: Default methods to be used for ``allowed_methods``
@@ -231,6 +444,8 @@ class Retry:
         ] = DEFAULT_REMOVE_HEADERS_ON_REDIRECT,
         backoff_jitter: float = 0.0,
         retry_after_max: int = DEFAULT_RETRY_AFTER_MAX,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         self.total = total
         self.connect = connect
@@ -256,6 +471,8 @@ class Retry:
         )
         self.backoff_jitter = backoff_jitter
         self.retry_after_max = retry_after_max
+        self.retry_budget = retry_budget
+        self.circuit_breaker = circuit_breaker
 
     def new(self, **kw: typing.Any) -> Retry:
         params = dict(
@@ -276,6 +493,8 @@ class Retry:
             respect_retry_after_header=self.respect_retry_after_header,
             backoff_jitter=self.backoff_jitter,
             retry_after_max=self.retry_after_max,
+            retry_budget=self.retry_budget,
+            circuit_breaker=self.circuit_breaker,
         )
 
         params.update(kw)
@@ -446,6 +665,41 @@ class Retry:
             and (status_code in self.RETRY_AFTER_STATUS_CODES)
         )
 
+    def admit(self, _pool: ConnectionPool | AsyncConnectionPool | None = None) -> None:
+        """Verify that a request can be sent to the upstream behind given pool.
+
+        :raises ~urllib3.exceptions.CircuitOpenError: If the circuit breaker is open.
+        """
+        if self.circuit_breaker is None:
+            return
+
+        upstream = _upstream_of(_pool)
+
+        if upstream is None:
+            return
+
+        retry_after = self.circuit_breaker.admit(upstream)
+
+        if retry_after is not None:
+            raise CircuitOpenError(_pool, retry_after)  # type: ignore[arg-type]
+
+    def record_success(
+        self, _pool: ConnectionPool | AsyncConnectionPool | None = None
+    ) -> None:
+        """Notify the budget and circuit breaker that a response was received from the upstream."""
+        if self.retry_budget is None and self.circuit_breaker is None:
+            return
+
+        upstream = _upstream_of(_pool)
+
+        if upstream is None:
+            return
+
+        if self.retry_budget is not None:
+            self.retry_budget.deposit(upstream)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success(upstream)
+
     def is_exhausted(self) -> bool:
         """Are we out of retries?"""
         retry_counts = [
@@ -484,6 +738,16 @@ class Retry:
 
         :return: A new ``Retry`` object.
         """
+        if (
+            self.circuit_breaker is not None
+            and error
+            and (self._is_connection_error(error) or self._is_read_error(error))
+        ):
+            upstream = _upstream_of(_pool)
+
+            if upstream is not None:
+                self.circuit_breaker.record_failure(upstream)
+
         if self.total is False and error:
             if not isinstance(error, RecoverableError):
                 # Disabled, indicate to re-raise the error.
@@ -559,6 +823,18 @@ class Retry:
             reason = error or ResponseError(cause)
             raise MaxRetryError(_pool, url, reason) from reason  # type: ignore[arg-type]
 
+        if (
+            self.retry_budget is not None
+            and redirect_location is None
+            and isinstance(error, RecoverableError) is False
+        ):
+            upstream = _upstream_of(_pool)
+
+            if upstream is not None and not self.retry_budget.withdraw(upstream):
+                log.debug("Retry budget exhausted for (url='%s')", url)
+                reason = error or ResponseError("retry budget exhausted")
+                raise MaxRetryError(_pool, url, reason) from reason  # type: ignore[arg-type]
+
         log.debug("Incremented Retry for (url='%s'): %r", url, new_retry)
 
         return new_retry
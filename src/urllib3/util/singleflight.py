@@ -0,0 +1,275 @@
+"""
+Coalesce identical requests that are in flight at the same time. The first caller
+(the leader) issues the request, the others wait for it. Every caller then gets a
+response of its own, reading from the same fully buffered body.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+import typing
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+
+from .._collections import HTTPHeaderDict
+from ..exceptions import TimeoutError
+from .fork import register_fork_aware
+from .timeout import _DEFAULT_TIMEOUT, Timeout
+
+if typing.TYPE_CHECKING:
+    from .._async.response import AsyncHTTPResponse
+    from .._typing import _TYPE_TIMEOUT
+    from ..response import HTTPResponse
+    from .retry import Retry
+
+#: method, url, whether redirects are followed and every request header (lowercased names, sorted).
+CoalescingKey = typing.Tuple[str, str, bool, typing.Tuple[typing.Tuple[str, str], ...]]
+
+#: only safe methods without body are eligible.
+COALESCABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+def is_coalescable(method: str, url: str, kw: typing.Mapping[str, typing.Any]) -> bool:
+    """Only plain GET and HEAD requests, without body, whose response is preloaded can be coalesced.
+    A caller that streams the response may not want it to be buffered in memory."""
+    return (
+        method.upper() in COALESCABLE_METHODS
+        and kw.get("body") is None
+        and kw.get("extension") is None
+        and not kw.get("multiplexed")
+        and kw.get("preload_content", True)
+        and url[:8].lower().startswith(("http://", "https://"))
+    )
+
+
+def coalescing_key(
+    method: str,
+    url: str,
+    redirect: bool,
+    headers: typing.Mapping[str, str] | None,
+) -> CoalescingKey:
+    """Every header is considered relevant, we cannot know what the server varies its response on."""
+    return (
+        method.upper(),
+        url,
+        redirect,
+        tuple(sorted((k.lower(), v) for k, v in headers.items())) if headers else (),
+    )
+
+
+def wait_bound(timeout: _TYPE_TIMEOUT) -> float | None:
+    """How long a caller may wait for the identical request in flight: the total of its own
+    timeout, or its connect and read timeouts together. None if it did not bound its request."""
+    if timeout is None or timeout is _DEFAULT_TIMEOUT:
+        return None
+
+    if not isinstance(timeout, Timeout):
+        timeout = Timeout.from_float(timeout)
+
+    if timeout.total is not None and timeout.total is not _DEFAULT_TIMEOUT:
+        return timeout.total
+
+    connect = Timeout.resolve_default_timeout(timeout._connect)
+    read = Timeout.resolve_default_timeout(timeout._read)
+
+    if connect is None or read is None:
+        return None
+
+    return connect + read
+
+
+def _own_exception(e: BaseException) -> BaseException:
+    """A distinct copy of the exception the leader got, for one of its followers. Raising the
+    very same instance from several callers would mix up their tracebacks. Unlike copy.copy()
+    it does not go through __reduce__, which some of our exceptions implement lossily."""
+    try:
+        clone = type(e).__new__(type(e), *e.args)
+        clone.__dict__.update(e.__dict__)
+    except (
+        Exception
+    ):  # Defensive: an exotic exception type, share it rather than lose it.
+        return e
+
+    clone.__cause__ = e
+    return clone
+
+
+@dataclass(frozen=True)
+class BufferedResponse:
+    """Outcome of a coalesced request. The body is kept as received (not decoded) so that
+    each view decodes it according to its own wishes."""
+
+    body: bytes
+    headers: HTTPHeaderDict
+    status: int
+    version: int
+    reason: str | None
+    retries: Retry | None
+    request_method: str | None
+    request_url: str | None
+
+    @classmethod
+    def from_response(cls, response: HTTPResponse) -> BufferedResponse:
+        """Read the whole (raw) body of given response and give its connection back."""
+        try:
+            body = response.read(decode_content=False)
+        finally:
+            response.release_conn()
+
+        return cls._from(response, body)
+
+    @classmethod
+    async def from_async_response(cls, response: AsyncHTTPResponse) -> BufferedResponse:
+        """Read the whole (raw) body of given response and give its connection back."""
+        try:
+            body = await response.read(decode_content=False)
+        finally:
+            response.release_conn()
+
+        return cls._from(response, body)
+
+    @classmethod
+    def _from(
+        cls, response: HTTPResponse | AsyncHTTPResponse, body: bytes | None
+    ) -> BufferedResponse:
+        return cls(
+            body=body or b"",
+            headers=HTTPHeaderDict(response.headers),
+            status=response.status,
+            version=response.version,
+            reason=response.reason,
+            retries=response.retries,
+            request_method=response._request_method,
+            request_url=response._request_url,
+        )
+
+    def response_kw(
+        self, decode_content: bool, preload_content: bool
+    ) -> dict[str, typing.Any]:
+        """Keyword arguments to construct an independent (HTTP/AsyncHTTP)Response view."""
+        return {
+            # BytesIO does not copy the initial bytes, every view share the same buffer.
+            "body": io.BytesIO(self.body),
+            "headers": HTTPHeaderDict(self.headers),
+            "status": self.status,
+            "version": self.version,
+            "reason": self.reason,
+            "preload_content": preload_content,
+            "decode_content": decode_content,
+            "retries": self.retries,
+            "request_method": self.request_method,
+            "request_url": self.request_url,
+        }
+
+
+class RequestCoalescer:
+    """Keep track of the requests in flight, like :class:`~urllib3.contrib.resolver._cache.ResolverCache`
+    does for DNS resolutions."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[CoalescingKey, Future[BufferedResponse]] = {}
+        self._lock = threading.Lock()
+
+        register_fork_aware(self)
+
+    def _after_fork_in_child(self) -> None:
+        # requests in flight belonged to threads that did not survive the fork.
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def get_or_request(
+        self,
+        key: CoalescingKey,
+        requester: typing.Callable[[], BufferedResponse],
+        timeout: float | None = None,
+    ) -> BufferedResponse:
+        """Issue the request, or wait at most ``timeout`` seconds for the identical one in flight."""
+        leader = False
+
+        with self._lock:
+            future = self._inflight.get(key)
+
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                leader = True
+
+        if not leader:
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                raise TimeoutError(
+                    f"Timed out after {timeout}s waiting for the identical request in flight"
+                ) from None
+            except Exception as e:
+                raise _own_exception(e)
+
+        try:
+            buffered = requester()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(buffered)
+            return buffered
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+class AsyncRequestCoalescer:
+    def __init__(self) -> None:
+        self._inflight: dict[CoalescingKey, asyncio.Task[BufferedResponse]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def get_or_request(
+        self,
+        key: CoalescingKey,
+        requester: typing.Callable[[], typing.Awaitable[BufferedResponse]],
+        timeout: float | None = None,
+    ) -> BufferedResponse:
+        """Issue the request, or wait at most ``timeout`` seconds for the identical one in flight."""
+        # no await between the lookup and the insertion, no lock needed.
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.create_task(self._request(key, requester))
+            task.add_done_callback(self._consume_exception)
+            self._inflight[key] = task
+
+        try:
+            # a cancelled caller must not cancel the request the others are waiting on.
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Timed out after {timeout}s waiting for the identical request in flight"
+            ) from None
+        except Exception as e:
+            if task.done() and not task.cancelled() and task.exception() is e:
+                raise _own_exception(e)
+            raise
+
+    async def _request(
+        self,
+        key: CoalescingKey,
+        requester: typing.Callable[[], typing.Awaitable[BufferedResponse]],
+    ) -> BufferedResponse:
+        try:
+            return await requester()
+        finally:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _consume_exception(task: asyncio.Task[BufferedResponse]) -> None:
+        try:
+            task.exception()
+        except BaseException:
+            pass
@@ -8,8 +8,10 @@ import os
 import socket
 import sys
 import threading
+import time
 import typing
 import warnings
+import weakref
 import enum
 import traceback
 from binascii import unhexlify
@@ -18,6 +20,7 @@ from pathlib import Path
 from .._constant import MOZ_INTERMEDIATE_CIPHERS
 from ..contrib.imcc import load_cert_chain as _ctx_load_cert_chain
 from ..exceptions import ProxySchemeUnsupported, SSLError
+from .fork import register_fork_aware
 from .url import _BRACELESS_IPV6_ADDRZ_RE, _IPV4_RE
 
 from ..contrib.anytls import ssl, IS_NONSTDLIB
@@ -124,6 +127,26 @@ def _compute_key_ctx_build(
     return hash(key)
 
 
+class SSLContextCacheInfo(typing.NamedTuple):
+    """Statistics of the process-wide SSLContext caches, see :func:`ssl_context_cache_info`."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    #: Seconds spent building (and loading the trust store of) the contexts that missed.
+    build_time: float
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+#: Every SSLContext cache alive in the process.
+_SSL_CONTEXT_CACHES: weakref.WeakSet[_CacheableSSLContext] = weakref.WeakSet()
+
+
 class _CacheableSSLContext:
     def __init__(self, maxsize: int | None = 32) -> None:
         self._maxsize = maxsize
@@ -131,11 +154,41 @@ class _CacheableSSLContext:
         self._cursor: int | None = None
         self._lock: threading.RLock = threading.RLock()
 
+        self._hits: int = 0
+        self._misses: int = 0
+        self._build_time: float = 0.0
+        self._build_started_at: float | None = None
+
+        _SSL_CONTEXT_CACHES.add(self)
+        register_fork_aware(self)
+
     def clear(self) -> None:
         with self._lock:
             self._cursor = None
             self._container = {}
 
+            self._hits = 0
+            self._misses = 0
+            self._build_time = 0.0
+            self._build_started_at = None
+
+    def cache_info(self) -> SSLContextCacheInfo:
+        with self._lock:
+            return SSLContextCacheInfo(
+                self._hits,
+                self._misses,
+                self._maxsize,
+                len(self._container),
+                self._build_time,
+            )
+
+    def _after_fork_in_child(self) -> None:
+        # the lock may have been held by another thread at the moment of the fork.
+        # the contexts themselves remain usable in the child.
+        self._lock = threading.RLock()
+        self._cursor = None
+        self._build_started_at = None
+
     @contextlib.contextmanager
     def lock(
         self,
@@ -162,8 +215,12 @@ class _CacheableSSLContext:
                 raise OSError("You MUST start WITH lock()")
 
             if self._cursor in self._container:
+                self._hits += 1
                 return self._container[self._cursor]
 
+            self._misses += 1
+            self._build_started_at = time.perf_counter()
+
             return None
 
     def save(
@@ -176,6 +233,10 @@ class _CacheableSSLContext:
 
             self._container[self._cursor] = ctx
 
+            if self._build_started_at is not None:
+                self._build_time += time.perf_counter() - self._build_started_at
+                self._build_started_at = None
+
             if self._maxsize and len(self._container) > self._maxsize:
                 self._container.pop(next(self._container.keys().__iter__()))
 
@@ -183,6 +244,103 @@ class _CacheableSSLContext:
 _SSLContextCache = _CacheableSSLContext()
 
 
+def ssl_context_cache_info() -> SSLContextCacheInfo:
+    """Aggregated statistics of the process-wide SSLContext caches (sync and async).
+    Contexts are shared by every pool and PoolManager that use the same TLS parameters."""
+    hits, misses, currsize, build_time = 0, 0, 0, 0.0
+    maxsize: int | None = 0
+
+    for cache in list(_SSL_CONTEXT_CACHES):
+        info = cache.cache_info()
+
+        hits += info.hits
+        misses += info.misses
+        currsize += info.currsize
+        build_time += info.build_time
+        maxsize = (
+            None if maxsize is None or info.maxsize is None else maxsize + info.maxsize
+        )
+
+    return SSLContextCacheInfo(hits, misses, maxsize, currsize, build_time)
+
+
+class _TrustStoreRegistry:
+    """Process-wide memory of the CA certificates trusted by a SSLContext, in PEM.
+
+    The QUIC stack cannot use a SSLContext, so it is handed the CA bundle instead.
+    Exporting and re-encoding it (or loading the OS trust store when there is
+    no context) is done once per context instead of once per connection."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._default_context: ssl.SSLContext | None = None
+        self._bundles: weakref.WeakKeyDictionary[ssl.SSLContext, tuple[int, str]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def default_context(self) -> ssl.SSLContext | None:
+        """A verifying context loaded with the OS default CA certificates. None if unsupported."""
+        with self._lock:
+            if self._default_context is None:
+                ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+                if not hasattr(ctx, "load_default_certs"):
+                    return None
+
+                ctx.load_default_certs()
+                self._default_context = ctx
+
+            return self._default_context
+
+    def ca_bundle(self, ctx: ssl.SSLContext) -> str | None:
+        """The CA certificates trusted by given context, in PEM. None if there is none."""
+        try:
+            # certificates may be added to the context after the fact.
+            ca_count: int = ctx.cert_store_stats()["x509_ca"]
+        except (
+            AttributeError,
+            NotImplementedError,
+            KeyError,
+        ):  # Defensive: in case of ssl monkeypatch
+            ca_count = -1
+
+        with self._lock:
+            try:
+                cached = self._bundles.get(ctx)
+            except TypeError:  # Defensive: context that cannot be weakly referenced
+                cached = None
+
+            if cached is not None and cached[0] == ca_count:
+                return cached[1] or None
+
+        try:
+            ctx_root_certificates: list[bytes] = ctx.get_ca_certs(True)
+        except (
+            AttributeError,
+            NotImplementedError,
+        ):  # Defensive: in case of ssl monkeypatch
+            ctx_root_certificates = []
+
+        bundle = "\n".join(
+            ssl.DER_cert_to_PEM_cert(cert) for cert in ctx_root_certificates
+        )
+
+        with self._lock:
+            try:
+                self._bundles[ctx] = (ca_count, bundle)
+            except TypeError:  # Defensive: context that cannot be weakly referenced
+                pass
+
+        return bundle or None
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+
+
+_TrustStore = _TrustStoreRegistry()
+register_fork_aware(_TrustStore)
+
+
 def _is_bpo_43522_fixed(
     implementation_name: str, version_info: _TYPE_VERSION_INFO
 ) -> bool:
@@ -6,7 +6,7 @@ import typing
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from threading import RLock, Event, get_ident
+from threading import RLock, Event, get_ident, local
 
 from .._collections import GroupedDict
 
@@ -124,17 +124,22 @@ class TrafficPolice(typing.Generic[T]):
         maxsize: int | None = None,
         concurrency: bool = False,
         strict_maxsize: bool = True,
+        affinity: bool = False,
     ):
         """
         :param maxsize: Maximum number of items that can be contained.
         :param concurrency: Whether to allow a single item to be used across multiple threads.
             Delegating thread safety to another level.
         :param strict_maxsize: If True the scheduler does not increase maxsize for a temporary increase.
+        :param affinity: Whether each thread should get back the conn_or_pool it released last, when available.
         """
         self.maxsize = maxsize
         self.concurrency = concurrency
         self.strict_maxsize = strict_maxsize
 
+        #: remember, per thread, the obj_id of the conn_or_pool released last.
+        self._affinity: local | None = local() if affinity else None
+
         self._original_maxsize = maxsize
 
         #: the registry contain the conn_or_pool administrated
@@ -188,6 +193,9 @@ class TrafficPolice(typing.Generic[T]):
         active_cursor = self._cursor.pop(current_key)
         cursor_state = traffic_state_of(active_cursor.conn_or_pool)
 
+        if self._affinity is not None:
+            self._affinity.obj_id = active_cursor.obj_id
+
         next_signal: PendingSignal[T] | None = None
 
         for pending_signal in self._signals:
@@ -580,6 +588,42 @@ class TrafficPolice(typing.Generic[T]):
             not_idle_only=not_idle_only,
         )
 
+    def _get_preferred(
+        self, non_saturated_only: bool = False, not_idle_only: bool = False
+    ) -> T | None:
+        """Affinity fast path. Hand the conn_or_pool released last by the current thread back to it,
+        provided it is still available. Otherwise, None is returned and the shared container is searched."""
+        obj_id: int | None = getattr(self._affinity, "obj_id", None)
+
+        # a single dict lookup is atomic, the peek does not need the lock. Most of the time
+        # the answer is right, if another thread was faster, the claim below notices it.
+        if obj_id is None or obj_id not in self._container:
+            return None
+
+        cursor_key = get_ident()
+
+        # the claim is O(1) but made under the lock. The container is iterated under it
+        # elsewhere and a removal behind their back would break those iterations.
+        with self._lock:
+            conn_or_pool = self._container.get(obj_id)
+
+            if conn_or_pool is None or cursor_key in self._cursor:
+                return None
+
+            state = traffic_state_of(conn_or_pool)
+
+            if (non_saturated_only and state is TrafficState.SATURATED) or (
+                not_idle_only and state is TrafficState.IDLE
+            ):
+                return None
+
+            if not self.concurrency:
+                del self._container[obj_id]
+
+            self._cursor[cursor_key] = ActiveCursor(obj_id, conn_or_pool)
+
+            return conn_or_pool
+
     def get(
         self,
         block: bool = True,
@@ -587,6 +631,12 @@ class TrafficPolice(typing.Generic[T]):
         non_saturated_only: bool = False,
         not_idle_only: bool = False,
     ) -> T | None:
+        if self._affinity is not None:
+            conn_or_pool = self._get_preferred(non_saturated_only, not_idle_only)
+
+            if conn_or_pool is not None:
+                return conn_or_pool
+
         if self.busy:
             raise AtomicTraffic(
                 "One connection/pool active per thread at a given time. "
@@ -690,6 +740,31 @@ class TrafficPolice(typing.Generic[T]):
 
         raise UnavailableTraffic("No connection available")
 
+    def take(self, conn_or_pool: T) -> bool:
+        """Take hold of that very conn_or_pool, without waiting. Return False when it is
+        in use by another thread or saturated."""
+        if self.busy:
+            raise AtomicTraffic(
+                "One connection/pool active per thread at a given time. "
+                "Call release prior to calling this method."
+            )
+
+        obj_id = id(conn_or_pool)
+
+        with self._lock:
+            if (
+                obj_id not in self._container
+                or traffic_state_of(conn_or_pool) is TrafficState.SATURATED
+            ):
+                return False
+
+            if not self.concurrency:
+                del self._container[obj_id]
+
+            self._cursor[get_ident()] = ActiveCursor(obj_id, conn_or_pool)
+
+        return True
+
     def memorize(
         self, traffic_indicator: MappableTraffic, conn_or_pool: T | None = None
     ) -> None:
@@ -1048,6 +1123,38 @@ class TrafficPolice(typing.Generic[T]):
             if not self._registry:
                 self._shutdown = False
 
+    def _after_fork_in_child(self, *, forget_registered: bool) -> list[T]:
+        """Start afresh in a forked child. The other threads did not survive the fork, so
+        the lock they may have held, their cursors and their pending signals are void.
+
+        :param forget_registered: Let go of every conn_or_pool administrated and return them.
+            Otherwise, they are all made available again (spot reservations are dropped).
+        """
+        self._lock = RLock()
+        self._cursor = {}
+        self._signals = deque()
+        self._shutdown = False
+
+        if forget_registered:
+            released = list(self._registry.values())
+
+            self._registry = {}
+            self._container = {}
+            self._map = GroupedDict(key_fn=id)
+            self._map_types = GroupedDict()
+            self.maxsize = self._original_maxsize
+
+            return released
+
+        for obj_id, conn_or_pool in list(self._registry.items()):
+            if isinstance(conn_or_pool, ItemPlaceholder):
+                self._map_clear(conn_or_pool)
+                del self._registry[obj_id]
+
+        self._container = dict(self._registry)
+
+        return []
+
     def qsize(self) -> int:
         with self._lock:
             return len(self._container)
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import jh2.config  # type: ignore[import-untyped]
+import jh2.connection  # type: ignore[import-untyped]
+import pytest
+
+from urllib3.contrib.hface.events import DataReceived, HandshakeCompleted
+from urllib3.contrib.hface.protocols._flow_control import (
+    BDPEstimator,
+    MemoryBudget,
+    StreamBufferLedger,
+)
+from urllib3.contrib.hface.protocols.http2._h2 import (
+    JH2_NOT_RFC_COMPLIANT_SETTINGS,
+    HTTP2ProtocolHyperImpl,
+)
+
+
+def test_bdp_estimator_grows_when_window_limited() -> None:
+    bdp = BDPEstimator(65535, 1048576)
+
+    assert bdp.on_data_received(16384, 0.0) is True
+    assert bdp.probing is True
+
+    # only one probe at a time.
+    assert bdp.on_data_received(40000, 0.01) is False
+
+    assert bdp.on_probe_acknowledged(0.1) == 2 * 56384
+    assert bdp.window == 2 * 56384
+    assert bdp.rtt == pytest.approx(0.1)
+    assert bdp.probing is False
+
+
+def test_bdp_estimator_steady_when_not_window_limited() -> None:
+    bdp = BDPEstimator(65535, 1048576)
+
+    assert bdp.on_data_received(1024, 0.0) is True
+    assert bdp.on_probe_acknowledged(0.1) is None
+    assert bdp.window == 65535
+
+
+def test_bdp_estimator_respect_budget() -> None:
+    bdp = BDPEstimator(1048576, 131072)
+
+    assert bdp.window == 131072
+
+    # we cannot grow anymore, no need to probe.
+    assert bdp.on_data_received(131072, 0.0) is False
+    assert bdp.on_probe_acknowledged(0.1) is None
+
+    with pytest.raises(ValueError):
+        BDPEstimator(65535, 1024)
+
+
+def test_memory_budget_usage() -> None:
+    budget = MemoryBudget(65535)
+
+    budget.acquire(60000)
+    assert budget.usage == 60000
+    assert budget.exceeded is False
+
+    budget.acquire(10000)
+    assert budget.exceeded is True
+
+    budget.release(70000)
+    assert budget.usage == 0
+    assert budget.peak == 70000
+
+    with pytest.raises(ValueError):
+        MemoryBudget(1024)
+
+
+def test_ledger_withhold_offending_streams() -> None:
+    budget = MemoryBudget(65535)
+    ledger = StreamBufferLedger(budget)
+
+    ledger.on_data_buffered(1, 40000)
+    assert ledger.should_withhold(1, 40000) is False
+
+    ledger.on_data_buffered(3, 40000)
+    assert ledger.should_withhold(3, 40000) is True
+
+    ledger.on_data_buffered(1, 1000)
+    assert ledger.should_withhold(1, 1000) is True
+
+    assert ledger.buffered() == 81000
+    assert budget.usage == 81000
+
+    # stream 3 was drained, someone waits on it. stream 1 is still offending.
+    ledger.on_data_consumed(3, 40000)
+    assert budget.exceeded is False
+
+    ledger.on_data_buffered(5, 30000)
+    assert budget.exceeded is True
+
+    assert ledger.release_credit() == [(3, 40000)]
+    assert ledger.is_withheld(1)
+
+    ledger.on_data_consumed(5, 30000)
+    assert ledger.release_credit() == [(1, 1000)]
+    assert ledger.withholding is False
+
+    ledger.clear()
+    assert budget.usage == 0
+
+    # the connection is gone, late data is not accounted anymore.
+    ledger.on_data_buffered(1, 1000)
+    assert budget.usage == 0
+
+
+def _exchange(
+    client: HTTP2ProtocolHyperImpl, server: jh2.connection.H2Connection
+) -> None:
+    while True:
+        to_server = client.bytes_to_send()
+        if to_server:
+            server.receive_data(to_server)
+        to_client = server.data_to_send()
+        if to_client:
+            client.bytes_received(to_client)
+        if not to_server and not to_client:
+            break
+
+
+@pytest.mark.skipif(
+    JH2_NOT_RFC_COMPLIANT_SETTINGS, reason="stream window is locked on this jh2"
+)
+def test_h2_windows_grow_within_budget() -> None:
+    budget = 8388608
+
+    client = HTTP2ProtocolHyperImpl(flow_control_budget=budget)
+    server = jh2.connection.H2Connection(jh2.config.H2Configuration(client_side=False))
+    server.initiate_connection()
+
+    assert client.flow_control_windows() == (budget, 6291456)
+
+    _exchange(client, server)
+
+    assert client.flow_control_windows() == (budget, 6291456)
+    assert sum(isinstance(e, HandshakeCompleted) for e in client.events()) >= 1
+
+    stream_id = client.get_available_stream_id()
+
+    client.submit_headers(
+        stream_id,
+        [
+            (b":method", b"GET"),
+            (b":scheme", b"https"),
+            (b":authority", b"example.com"),
+            (b":path", b"/"),
+        ],
+        end_stream=True,
+    )
+
+    _exchange(client, server)
+
+    server.send_headers(stream_id, [(b":status", b"200")])
+
+    # fill the whole stream window within a single round-trip.
+    remaining = server.local_flow_control_window(stream_id)
+
+    while remaining:
+        chunk = min(remaining, server.max_outbound_frame_size)
+        server.send_data(stream_id, b"\x00" * chunk)
+        remaining -= chunk
+
+    _exchange(client, server)
+
+    assert client.flow_control_windows() == (budget, budget)
+
+    received = sum(
+        len(e.data)
+        for e in client.events(stream_id=stream_id)
+        if isinstance(e, DataReceived)
+    )
+
+    assert received == 6291456
+    # our window adjustments are not mistaken for a new handshake.
+    assert not any(isinstance(e, HandshakeCompleted) for e in client.events())
+
+
+@pytest.mark.skipif(
+    JH2_NOT_RFC_COMPLIANT_SETTINGS, reason="stream window is locked on this jh2"
+)
+def test_h2_withhold_stream_credit_over_memory_budget() -> None:
+    budget = MemoryBudget(4194304)
+    # other connections already went over the budget.
+    budget.acquire(5242880)
+
+    client = HTTP2ProtocolHyperImpl(memory_budget=budget)
+
+    # the windows never exceed what we accept to buffer.
+    assert client.flow_control_windows() == (4194304, 4194304)
+    server = jh2.connection.H2Connection(jh2.config.H2Configuration(client_side=False))
+    server.initiate_connection()
+
+    _exchange(client, server)
+    list(client.events())
+
+    stream_id = client.get_available_stream_id()
+
+    client.submit_headers(
+        stream_id,
+        [
+            (b":method", b"GET"),
+            (b":scheme", b"https"),
+            (b":authority", b"example.com"),
+            (b":path", b"/"),
+        ],
+        end_stream=True,
+    )
+
+    _exchange(client, server)
+
+    server.send_headers(stream_id, [(b":status", b"200")])
+
+    # enough to trigger a WINDOW_UPDATE normally.
+    remaining = 2097152
+
+    while remaining:
+        chunk = min(remaining, server.max_outbound_frame_size)
+        server.send_data(stream_id, b"\x00" * chunk)
+        remaining -= chunk
+
+    _exchange(client, server)
+
+    assert budget.usage == 5242880 + 2097152
+    assert budget.exceeded is True
+
+    # the connection window is replenished, not the stream one.
+    assert server.outbound_flow_control_window == 4194304
+    assert server.local_flow_control_window(stream_id) == 4194304 - 2097152
+
+    received = sum(
+        len(e.data)
+        for e in client.events(stream_id=stream_id)
+        if isinstance(e, DataReceived)
+    )
+
+    assert received == 2097152
+    assert budget.usage == 5242880
+    assert budget.exceeded is True
+
+    # still over budget, but nothing is left buffered for this stream. someone waits on it.
+    _exchange(client, server)
+
+    assert server.local_flow_control_window(stream_id) == 4194304
+
+
+def test_h3_windows_left_to_qh3_when_internals_changed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from urllib3.contrib.hface import QuicTLSConfig
+    from urllib3.contrib.hface.protocols.http3 import _qh3
+
+    def new_client() -> _qh3.HTTP3ProtocolAioQuicImpl:
+        return _qh3.HTTP3ProtocolAioQuicImpl(
+            remote_address=("127.0.0.1", 443),
+            server_name="example.com",
+            tls_config=QuicTLSConfig(),
+            flow_control_budget=8388608,
+        )
+
+    assert new_client().flow_control_windows() is not None
+
+    monkeypatch.setattr(_qh3, "Limit", None)
+
+    client = new_client()
+
+    assert client.flow_control_windows() is None
+    # no probe is started as the windows cannot grow anyway.
+    assert client._bdp.on_data_received(65535, 0.0) is False
+
+    client._grow_windows(8388608)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import jh2.config  # type: ignore[import-untyped]
+import jh2.connection  # type: ignore[import-untyped]
+import jh2.events  # type: ignore[import-untyped]
+import pytest
+
+from urllib3.contrib.hface._priority import parse_priority
+from urllib3.contrib.hface.protocols.http2._h2 import (
+    PRIORITY_UPDATE_FRAME_TYPE,
+    HTTP2ProtocolHyperImpl,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (b"", (3, False)),
+        (b"u=0", (0, False)),
+        (b"u=5, i", (5, True)),
+        (b"i, u=1", (1, True)),
+        (b"u=2, i=?0", (2, False)),
+        (b"u=2;foo=bar, i=?1", (2, True)),
+        (b"u=9", (3, False)),
+        (b"u=-1, i=1", (3, False)),
+        (b"foo, u=4", (4, False)),
+    ],
+)
+def test_parse_priority(value: bytes, expected: tuple[int, bool]) -> None:
+    assert parse_priority(value) == expected
+
+
+def test_h2_priority_update_frame() -> None:
+    client = HTTP2ProtocolHyperImpl()
+    server = jh2.connection.H2Connection(jh2.config.H2Configuration(client_side=False))
+    server.initiate_connection()
+
+    stream_id = client.get_available_stream_id()
+
+    client.submit_priority(stream_id, b"u=1, i")
+    client.submit_headers(
+        stream_id,
+        [
+            (b":method", b"GET"),
+            (b":scheme", b"https"),
+            (b":authority", b"example.com"),
+            (b":path", b"/"),
+            (b"priority", b"u=1, i"),
+        ],
+        end_stream=True,
+    )
+
+    events = server.receive_data(client.bytes_to_send())
+
+    unknown_frames = [
+        e for e in events if isinstance(e, jh2.events.UnknownFrameReceived)
+    ]
+
+    assert len(unknown_frames) == 1
+    assert unknown_frames[0].frame.type == PRIORITY_UPDATE_FRAME_TYPE
+    assert unknown_frames[0].frame.body == stream_id.to_bytes(4, "big") + b"u=1, i"
+
+    # the frame does not disturb the stream that follows.
+    assert any(isinstance(e, jh2.events.RequestReceived) for e in events)
+
+    assert client._events._priorities[stream_id] == (1, True)
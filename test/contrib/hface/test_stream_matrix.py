@@ -155,3 +155,56 @@ def test_extend_matrix_stream() -> None:
     assert cursor_ev.stream_id == 4
 
     assert isinstance(sm.popleft(), ConnectionTerminated)
+
+
+def test_prioritized_stream_matrix() -> None:
+    sm = StreamMatrix()
+
+    sm.append(HeadersReceived(1, (), False))
+    sm.append(HeadersReceived(3, (), False))
+    sm.append(DataReceived(1, b"foo", True))
+    sm.append(DataReceived(3, b"bar", True))
+
+    sm.prioritize(3, 0, False)
+
+    cursor_ev = sm.popleft()
+    assert isinstance(cursor_ev, HeadersReceived)
+    assert cursor_ev.stream_id == 3
+
+    cursor_ev = sm.popleft()
+    assert isinstance(cursor_ev, DataReceived)
+    assert cursor_ev.stream_id == 3
+
+    # priority is forgotten once the stream ended.
+    assert 3 not in sm._priorities
+
+    cursor_ev = sm.popleft()
+    assert isinstance(cursor_ev, HeadersReceived)
+    assert cursor_ev.stream_id == 1
+
+
+def test_incremental_stream_matrix() -> None:
+    sm = StreamMatrix()
+
+    sm.append(DataReceived(1, b"a", False))
+    sm.append(DataReceived(1, b"b", False))
+    sm.append(DataReceived(3, b"c", False))
+    sm.append(DataReceived(3, b"d", False))
+
+    sm.prioritize(1, 3, True)
+    sm.prioritize(3, 3, True)
+
+    assert [sm.popleft().stream_id for _ in range(4)] == [1, 3, 1, 3]  # type: ignore[union-attr]
+
+
+def test_prioritized_stream_matrix_global_event_first() -> None:
+    sm = StreamMatrix()
+
+    sm.append(HandshakeCompleted("h2"))
+    sm.append(HeadersReceived(1, (), True))
+
+    sm.prioritize(1, 0, False)
+
+    assert isinstance(sm.popleft(), HandshakeCompleted)
+    assert isinstance(sm.popleft(), HeadersReceived)
+    assert sm.popleft() is None
@@ -246,3 +246,50 @@ class TestAsyncWebSocketFragmentation:
 
         assert await ext.next_payload() == msg1
         assert await ext.next_payload() == msg2
+
+
+class TestWebSocketBatch:
+    """Verify next_payloads()/send_payloads() handle many messages per call."""
+
+    def test_next_payloads(self) -> None:
+        ext = WebSocketExtensionFromHTTP()
+        server = _complete_handshake(ext._protocol)
+        frames = [
+            b"".join(server.send(TextMessage(data=f"m{i}")) for i in range(5))
+            + b"".join(_build_fragmented_frames(server, b"\x00" * 300, chunk_size=100))
+        ]
+        _wire_sync_ext(ext, frames)
+
+        assert ext.next_payloads(max_n=2) == ["m0", "m1"]
+        assert ext.next_payloads() == ["m2", "m3", "m4", b"\x00" * 300]
+
+    def test_send_payloads(self) -> None:
+        ext = WebSocketExtensionFromHTTP()
+        server = _complete_handshake(ext._protocol)
+        _wire_sync_ext(ext, [])
+
+        sent: list[bytes] = []
+        ext._dsa.sendall = sent.append  # type: ignore[union-attr,method-assign]
+
+        ext.send_payloads(["a", b"b"])
+
+        assert len(sent) == 1
+
+        server.receive_data(sent[0])
+
+        assert [
+            e.data
+            for e in server.events()
+            if isinstance(e, (TextMessage, BytesMessage))
+        ] == ["a", b"b"]
+
+
+@pytest.mark.asyncio
+class TestAsyncWebSocketBatch:
+    async def test_next_payloads(self) -> None:
+        ext = AsyncWebSocketExtensionFromHTTP()
+        server = _complete_handshake(ext._protocol)
+        frames = [b"".join(server.send(TextMessage(data=f"m{i}")) for i in range(3))]
+        _wire_async_ext(ext, frames)
+
+        assert await ext.next_payloads() == ["m0", "m1", "m2"]
@@ -0,0 +1,347 @@
+"""Tests for the built-in WebSocket (RFC 6455) frame codec and its extension."""
+
+from __future__ import annotations
+
+import os
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Generator
+from unittest.mock import MagicMock
+
+import pytest
+
+from urllib3.contrib.webextensions import load_extension
+from urllib3.contrib.webextensions._async import (
+    AsyncWebSocketNativeExtensionFromHTTP,
+)
+from urllib3.contrib.webextensions._rfc6455 import (
+    CLOSE_MESSAGE_TOO_BIG,
+    OPCODE_BINARY,
+    OPCODE_CLOSE,
+    OPCODE_PING,
+    OPCODE_PONG,
+    OPCODE_TEXT,
+    WebSocketFrameCodec,
+    mask_payload,
+)
+from urllib3.contrib.webextensions.ws_native import WebSocketNativeExtensionFromHTTP
+from urllib3.exceptions import ProtocolError
+
+
+def _server_frame(opcode: int, payload: bytes, fin: bool = True) -> bytes:
+    """Build an unmasked frame, as a server would send it."""
+    first = (0x80 if fin else 0x00) | opcode
+
+    if len(payload) < 126:
+        return bytes((first, len(payload))) + payload
+    if len(payload) < 65536:
+        return bytes((first, 126)) + len(payload).to_bytes(2, "big") + payload
+    return bytes((first, 127)) + len(payload).to_bytes(8, "big") + payload
+
+
+def _unmask_frames(data: bytes) -> list[tuple[int, bytes]]:
+    """Decode frames written by the client."""
+    frames = []
+
+    while data:
+        opcode = data[0] & 0x0F
+        assert data[0] & 0x80 and data[1] & 0x80
+        length = data[1] & 0x7F
+        offset = 2
+
+        if length == 126:
+            length, offset = int.from_bytes(data[2:4], "big"), 4
+        elif length == 127:
+            length, offset = int.from_bytes(data[2:10], "big"), 10
+
+        key = data[offset : offset + 4]
+        payload = data[offset + 4 : offset + 4 + length]
+
+        frames.append((opcode, bytes(mask_payload(key, payload))))
+        data = data[offset + 4 + length :]
+
+    return frames
+
+
+@pytest.mark.parametrize("size", [0, 1, 3, 4, 5, 125, 126, 65535, 65536, 100003])
+def test_mask_payload(size: int) -> None:
+    key = os.urandom(4)
+    payload = os.urandom(size)
+
+    masked = mask_payload(key, payload)
+
+    assert bytes(masked) == bytes(b ^ key[i % 4] for i, b in enumerate(payload))
+    assert bytes(mask_payload(key, bytes(masked))) == payload
+
+
+def test_handshake_accept_token() -> None:
+    codec = WebSocketFrameCodec()
+
+    # RFC 6455 section 1.3 example
+    codec._key = "dGhlIHNhbXBsZSBub25jZQ=="
+
+    assert codec.accept_token() == "s3pPLMBiTxaQ9kYGzzhZRbK+xOo="
+    assert codec.handshake_headers()["sec-websocket-key"] == codec._key
+
+
+def test_encode_messages() -> None:
+    codec = WebSocketFrameCodec()
+
+    data = codec.encode_messages(["hello", b"\x00\x01", "x" * 300, b"y" * 70000])
+
+    assert _unmask_frames(data) == [
+        (OPCODE_TEXT, b"hello"),
+        (OPCODE_BINARY, b"\x00\x01"),
+        (OPCODE_TEXT, b"x" * 300),
+        (OPCODE_BINARY, b"y" * 70000),
+    ]
+
+    assert codec.encode_messages([]) == b""
+
+
+def test_decode_byte_per_byte() -> None:
+    codec = WebSocketFrameCodec()
+
+    stream = (
+        _server_frame(OPCODE_TEXT, "héllo".encode())
+        + _server_frame(OPCODE_PING, b"p")
+        + _server_frame(OPCODE_BINARY, b"a" * 300, fin=False)
+        + _server_frame(OPCODE_PONG, b"")
+        + _server_frame(0x0, b"b" * 70000)
+        + _server_frame(OPCODE_CLOSE, b"\x03\xe8")
+    )
+
+    events: list[tuple[int, str | bytes]] = []
+
+    for i in range(len(stream)):
+        codec.receive_data(stream[i : i + 1])
+        events.extend(codec.events())
+
+    assert events == [
+        (OPCODE_TEXT, "héllo"),
+        (OPCODE_PING, b"p"),
+        (OPCODE_PONG, b""),
+        (OPCODE_BINARY, b"a" * 300 + b"b" * 70000),
+        (OPCODE_CLOSE, b"\x03\xe8"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        bytes((0x81 | 0x40, 0)),  # RSV1 without extension
+        bytes((0x81, 0x80)) + b"\x00" * 4,  # masked by server
+        _server_frame(0x0, b"orphan"),
+        _server_frame(OPCODE_PING, b"", fin=False),
+        _server_frame(OPCODE_PING, b"p" * 126),
+        _server_frame(0x3, b""),
+        _server_frame(0xB, b""),
+        _server_frame(OPCODE_TEXT, b"\xff\xfe"),
+        _server_frame(OPCODE_TEXT, b"a", fin=False) + _server_frame(OPCODE_TEXT, b"b"),
+    ],
+)
+def test_decode_protocol_violation(frame: bytes) -> None:
+    codec = WebSocketFrameCodec()
+    codec.receive_data(frame)
+
+    with pytest.raises(ProtocolError):
+        list(codec.events())
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        # only the header of a 1 TiB frame, the payload is refused before it arrives.
+        bytes((0x82, 127)) + (2**40).to_bytes(8, "big"),
+        bytes((0x82, 126)) + (1025).to_bytes(2, "big"),
+    ],
+)
+def test_decode_frame_too_big(header: bytes) -> None:
+    codec = WebSocketFrameCodec(max_frame_size=1024)
+    codec.receive_data(header)
+
+    with pytest.raises(ProtocolError, match="exceeds the limit"):
+        list(codec.events())
+
+    assert codec.close_code == CLOSE_MESSAGE_TOO_BIG
+
+
+def test_decode_message_too_big() -> None:
+    codec = WebSocketFrameCodec(max_message_size=1024)
+    codec.receive_data(
+        _server_frame(OPCODE_BINARY, b"a" * 1000, fin=False)
+        + _server_frame(0x0, b"b" * 24, fin=False)
+    )
+
+    assert list(codec.events()) == []
+
+    codec.receive_data(bytes((0x80, 1)))
+
+    with pytest.raises(ProtocolError, match="message of 1025 bytes"):
+        list(codec.events())
+
+    assert codec.close_code == CLOSE_MESSAGE_TOO_BIG
+
+
+def test_decode_control_frame_checked_on_header() -> None:
+    codec = WebSocketFrameCodec()
+    # a ping announcing 1000 bytes, nothing more was received.
+    codec.receive_data(bytes((0x89, 126)) + (1000).to_bytes(2, "big"))
+
+    with pytest.raises(ProtocolError, match="control frame"):
+        list(codec.events())
+
+
+def test_load_native_extension() -> None:
+    assert load_extension("wss", "native") is WebSocketNativeExtensionFromHTTP
+    assert WebSocketNativeExtensionFromHTTP.scheme_to_http_scheme("wss") == "https"
+
+
+class _FakePoliceOfficer:
+    @contextmanager
+    def borrow(self, response: Any) -> Generator[None, None, None]:
+        yield
+
+    def forget(self, response: Any) -> None:
+        pass
+
+
+class _AsyncFakePoliceOfficer:
+    @asynccontextmanager
+    async def borrow(self, response: Any) -> AsyncGenerator[None, None]:
+        yield
+
+    def forget(self, response: Any) -> None:
+        pass
+
+
+class _RecordingDSA:
+    """Feeds pre-built raw frames one-by-one and records what is sent."""
+
+    def __init__(self, frames: list[bytes]) -> None:
+        self._frames = list(frames)
+        self.sent: list[bytes] = []
+
+    def recv_extended(self, max_bytes: int | None) -> tuple[bytes, bool, bool]:
+        if not self._frames:
+            raise OSError("No more data")
+        return self._frames.pop(0), False, False
+
+    def sendall(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    def close(self) -> None:
+        pass
+
+
+class _AsyncRecordingDSA(_RecordingDSA):
+    async def recv_extended(self, max_bytes: int | None) -> tuple[bytes, bool, bool]:  # type: ignore[override]
+        return super().recv_extended(max_bytes)
+
+    async def sendall(self, data: bytes) -> None:  # type: ignore[override]
+        super().sendall(data)
+
+    async def close(self) -> None:  # type: ignore[override]
+        pass
+
+
+def _wire_sync_ext(frames: list[bytes]) -> WebSocketNativeExtensionFromHTTP:
+    ext = WebSocketNativeExtensionFromHTTP()
+    ext._dsa = _RecordingDSA(frames)  # type: ignore[assignment]
+    ext._police_officer = _FakePoliceOfficer()  # type: ignore[assignment]
+    ext._response = MagicMock()
+    return ext
+
+
+def test_start_verify_accept_token() -> None:
+    ext = WebSocketNativeExtensionFromHTTP()
+    response = MagicMock()
+    response._fp._dsa = _RecordingDSA([])
+
+    response.headers = {"Sec-Websocket-Accept": "invalid"}
+
+    with pytest.raises(ProtocolError):
+        ext.start(response)
+
+    response.headers = {"Sec-Websocket-Accept": ext._codec.accept_token()}
+
+    ext.start(response)
+
+
+def test_next_payloads_batch() -> None:
+    ext = _wire_sync_ext(
+        [
+            b"".join(_server_frame(OPCODE_TEXT, f"m{i}".encode()) for i in range(10))
+            + _server_frame(OPCODE_PING, b"p"),
+            _server_frame(OPCODE_BINARY, b"last"),
+        ]
+    )
+
+    assert ext.next_payload() == "m0"
+    assert ext.next_payloads(max_n=4) == ["m1", "m2", "m3", "m4"]
+    assert ext.next_payloads() == ["m5", "m6", "m7", "m8", "m9"]
+
+    # the ping was answered while draining.
+    assert _unmask_frames(ext._dsa.sent[0]) == [(OPCODE_PONG, b"p")]  # type: ignore[union-attr]
+
+    assert ext.next_payloads() == [b"last"]
+
+
+def test_send_payloads_single_write() -> None:
+    ext = _wire_sync_ext([])
+    dsa = ext._dsa
+
+    ext.send_payloads(["a", b"b", "c"])
+    ext.send_payloads([])
+
+    assert len(dsa.sent) == 1  # type: ignore[union-attr]
+    assert _unmask_frames(dsa.sent[0]) == [  # type: ignore[union-attr]
+        (OPCODE_TEXT, b"a"),
+        (OPCODE_BINARY, b"b"),
+        (OPCODE_TEXT, b"c"),
+    ]
+
+
+def test_remote_close() -> None:
+    ext = _wire_sync_ext(
+        [_server_frame(OPCODE_TEXT, b"bye") + _server_frame(OPCODE_CLOSE, b"\x03\xe8")]
+    )
+    dsa = ext._dsa
+
+    assert ext.next_payloads() == ["bye"]
+    assert ext.closed is True
+
+    # the closing handshake is answered with the same status code.
+    assert _unmask_frames(dsa.sent[-1]) == [(OPCODE_CLOSE, b"\x03\xe8")]  # type: ignore[union-attr]
+
+
+def test_message_too_big_closes_with_1009() -> None:
+    ext = WebSocketNativeExtensionFromHTTP(max_message_size=16)
+    ext._dsa = _RecordingDSA([_server_frame(OPCODE_TEXT, b"a" * 17)])  # type: ignore[assignment]
+    ext._police_officer = _FakePoliceOfficer()  # type: ignore[assignment]
+    ext._response = MagicMock()
+    dsa = ext._dsa
+
+    with pytest.raises(ProtocolError):
+        ext.next_payloads()
+
+    assert ext.closed is True
+    assert _unmask_frames(dsa.sent[-1]) == [  # type: ignore[union-attr]
+        (OPCODE_CLOSE, CLOSE_MESSAGE_TOO_BIG.to_bytes(2, "big"))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_next_payloads_batch() -> None:
+    ext = AsyncWebSocketNativeExtensionFromHTTP()
+    ext._dsa = _AsyncRecordingDSA(  # type: ignore[assignment]
+        [
+            _server_frame(OPCODE_TEXT, b"a") + _server_frame(OPCODE_TEXT, b"b"),
+            _server_frame(OPCODE_CLOSE, b""),
+        ]
+    )
+    ext._police_officer = _AsyncFakePoliceOfficer()  # type: ignore[assignment]
+    ext._response = MagicMock()
+
+    assert await ext.next_payloads() == ["a", "b"]
+    assert await ext.next_payload() is None
+    assert ext.closed is True
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import typing
+from unittest.mock import Mock, patch
 
 import pytest
 
 from urllib3._async.connectionpool import AsyncHTTPConnectionPool
+from urllib3._async.response import AsyncHTTPResponse
+from urllib3.backend import ResponsePromise
 
 
 @pytest.mark.asyncio
@@ -93,3 +98,118 @@ async def test_get_response_none_path_yields_control() -> None:
         assert beats > 1
     finally:
         await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_hedge_waits_on_both_streams() -> None:
+    primary = Mock(spec=ResponsePromise, uid="primary")
+    secondary = Mock(spec=ResponsePromise, uid="secondary")
+    response = Mock(spec=AsyncHTTPResponse)
+
+    sent = [primary, secondary]
+    waits = []
+    aborted = []
+
+    class Conn:
+        """Both streams ride the same connection."""
+
+        def __contains__(self, promise: ResponsePromise) -> bool:
+            return True
+
+        async def wait_for_any_response(
+            self, promises: list[ResponsePromise], timeout: float | None = None
+        ) -> ResponsePromise:
+            waits.append(promises)
+            return secondary
+
+    @contextlib.asynccontextmanager
+    async def borrow(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        yield Conn()
+
+    async def urlopen(*args: typing.Any, **kwargs: typing.Any) -> ResponsePromise:
+        return sent.pop(0)
+
+    async def wait_for_promise(promise: ResponsePromise, timeout: float) -> bool:
+        return False
+
+    async def abort_promise(promise: ResponsePromise) -> None:
+        aborted.append(promise)
+
+    async def get_response(promise: ResponsePromise) -> AsyncHTTPResponse:
+        assert promise is secondary
+        return response
+
+    async with AsyncHTTPConnectionPool(host="localhost", maxsize=1) as pool:
+        assert pool.pool is not None
+
+        with patch.object(pool, "urlopen", urlopen), patch.object(
+            pool, "_wait_for_promise", wait_for_promise
+        ), patch.object(pool.pool, "borrow", borrow), patch.object(
+            pool, "_abort_promise", abort_promise
+        ), patch.object(pool, "get_response", get_response):
+            assert await pool._urlopen_hedged("GET", "/", 0.05, timeout=5.0) is response
+
+        # a single wait on both streams at once, no polling.
+        assert waits == [[primary, secondary]]
+        assert aborted == [primary]
+
+        # measured from the hedge being sent, not from the primary request.
+        assert len(pool._response_latencies) == 1
+        assert pool._response_latencies[0] < 0.05
+
+
+@pytest.mark.asyncio
+async def test_coalescing_only_over_the_eligible_connection() -> None:
+    from urllib3._async.connection import AsyncHTTPSConnection
+    from urllib3._async.connectionpool import AsyncHTTPSConnectionPool
+    from urllib3.backend import ConnectionInfo
+    from urllib3.exceptions import EmptyPoolError
+
+    pool = AsyncHTTPSConnectionPool("a.example.test", maxsize=2)
+    assert pool.pool is not None
+
+    try:
+        h1_conn = pool.ConnectionCls("a.example.test", 443)
+        eligible = pool.ConnectionCls("a.example.test", 443)
+
+        for conn in (h1_conn, eligible):
+            conn.conn_info = ConnectionInfo()
+            conn.conn_info.destination_address = ("192.0.2.1", 443)
+            conn.conn_info.certificate_dict = {
+                "subjectAltName": (("DNS", "*.example.test"),)
+            }
+            await pool.pool.put(conn, immediately_unavailable=True)
+            pool.pool.release()
+
+        coalescing = ("b.example.test", frozenset({"192.0.2.1"}))
+
+        with patch.object(
+            AsyncHTTPSConnection, "is_multiplexed", property(lambda c: c is eligible)
+        ), patch.object(AsyncHTTPSConnection, "is_closed", property(lambda c: False)):
+            assert await pool._get_coalescing_conn(*coalescing) is eligible
+
+            # while busy, none other is handed out.
+            async def other_task() -> None:
+                with pytest.raises(EmptyPoolError):
+                    await pool._get_coalescing_conn(*coalescing)
+
+            await asyncio.create_task(other_task())
+
+            pool.pool.release()
+
+            async def make_request(*args: typing.Any, **kw: typing.Any) -> None:
+                raise OSError()
+
+            with patch.object(
+                pool, "_make_request", side_effect=make_request
+            ) as _make_request, patch.object(
+                pool, "_new_conn", side_effect=AssertionError("Unexpected _new_conn")
+            ):
+                # the retry cannot go elsewhere once the connection is lost.
+                with pytest.raises(EmptyPoolError):
+                    await pool.urlopen("GET", "/", retries=1, coalescing=coalescing)
+
+                assert _make_request.call_count == 1
+                assert _make_request.call_args[0][0] is eligible
+    finally:
+        await pool.close()
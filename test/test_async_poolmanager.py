@@ -1,10 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import io
+import typing
+from unittest import mock
+from unittest.mock import patch
 
 import pytest
 
-from urllib3 import AsyncPoolManager
+from urllib3 import AsyncHTTPResponse, AsyncPoolManager, ResponsePromise
+from urllib3._async.connectionpool import AsyncHTTPConnectionPool
+from urllib3._async.poolmanager import AsyncBatchResult
+from urllib3.exceptions import (
+    CircuitOpenError,
+    LocationParseError,
+    ProtocolError,
+    TimeoutError,
+)
+from urllib3.util.retry import CircuitBreaker
+from urllib3.util.url import parse_url
 
 
 @pytest.mark.asyncio
@@ -32,3 +46,234 @@ async def test_get_response_none_path_yields_control() -> None:
 
         # without the checkpoint the heartbeat task never runs (beats <= 1)
         assert beats > 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast() -> None:
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(("http", "example.com", 80))
+
+    async with AsyncPoolManager(circuit_breaker=breaker) as pm:
+        with pytest.raises(CircuitOpenError):
+            await pm.urlopen("GET", "http://example.com/")
+
+
+@pytest.mark.asyncio
+async def test_iter_responses_order() -> None:
+    first, second, third = (mock.Mock(spec=ResponsePromise) for _ in range(3))
+    responses = {
+        id(promise): mock.Mock(spec=AsyncHTTPResponse)
+        for promise in (first, second, third)
+    }
+    waited_on = []
+
+    async def wait_for_any_promise(pending: list[ResponsePromise]) -> ResponsePromise:
+        waited_on.append(list(pending))
+        # the last one arrives first, then the remaining in order.
+        return pending[-1] if len(pending) == 3 else pending[0]
+
+    async def get_response(promise: ResponsePromise) -> AsyncHTTPResponse:
+        return responses[id(promise)]
+
+    pool = mock.Mock(_wait_for_any_promise=wait_for_any_promise)
+
+    async with AsyncPoolManager() as pm:
+        with patch.object(pm, "pools") as pools, patch.object(
+            pm, "get_response", side_effect=get_response
+        ):
+            pools.borrow.return_value.__aenter__.return_value = pool
+
+            assert [r async for r in pm.iter_responses([first, second, third])] == [
+                responses[id(third)],
+                responses[id(first)],
+                responses[id(second)],
+            ]
+
+            # the connection of the oldest pending promise is always the one waited on.
+            assert [call.args[0] for call in pools.borrow.call_args_list] == [
+                first,
+                first,
+                second,
+            ]
+            assert waited_on == [[first, second, third], [first, second], [second]]
+
+
+@pytest.mark.asyncio
+async def test_request_coalescing() -> None:
+    upstream_calls = []
+    release_upstream = asyncio.Event()
+
+    async def upstream(method: str, url: str, **kw: typing.Any) -> AsyncHTTPResponse:
+        upstream_calls.append((method, url))
+        await release_upstream.wait()
+
+        return AsyncHTTPResponse(
+            body=io.BytesIO(b"foo"),
+            headers={"Content-Length": "3"},
+            status=200,
+            preload_content=False,
+            request_method=method,
+        )
+
+    async with AsyncPoolManager(request_coalescing=True) as pm:
+        with patch.object(AsyncHTTPConnectionPool, "urlopen", side_effect=upstream):
+            tasks = [
+                asyncio.create_task(pm.request("GET", "http://example.com/config"))
+                for _ in range(8)
+            ]
+
+            # let every caller reach the coalescer before the upstream answers.
+            await asyncio.sleep(0.1)
+            release_upstream.set()
+
+            responses = await asyncio.gather(*tasks)
+
+            assert upstream_calls == [("GET", "/config")]
+            assert len({id(r) for r in responses}) == 8
+            assert all([await r.data == b"foo" for r in responses])
+
+            # a cancelled caller does not cancel the request the others wait on.
+            release_upstream.clear()
+            upstream_calls.clear()
+
+            first = asyncio.create_task(pm.request("GET", "http://example.com/config"))
+            second = asyncio.create_task(pm.request("GET", "http://example.com/config"))
+            await asyncio.sleep(0.1)
+
+            first.cancel()
+            release_upstream.set()
+
+            assert (await second).status == 200
+            assert upstream_calls == [("GET", "/config")]
+
+
+@pytest.mark.asyncio
+async def test_request_coalescing_followers() -> None:
+    release_upstream = asyncio.Event()
+    upstream_calls = []
+
+    async def upstream(method: str, url: str, **kw: typing.Any) -> AsyncHTTPResponse:
+        upstream_calls.append(url)
+        await release_upstream.wait()
+
+        raise ProtocolError("boom")
+
+    async with AsyncPoolManager(request_coalescing=True) as pm:
+        with patch.object(AsyncHTTPConnectionPool, "urlopen", side_effect=upstream):
+            leader = asyncio.create_task(pm.request("GET", "http://example.com/token"))
+            await asyncio.sleep(0.1)
+
+            # a follower never waits longer than its own timeout allows.
+            with pytest.raises(TimeoutError, match="identical request in flight"):
+                await pm.request("GET", "http://example.com/token", timeout=0.05)
+
+            followers = [
+                asyncio.create_task(pm.request("GET", "http://example.com/token"))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.1)
+            release_upstream.set()
+
+            errors = await asyncio.gather(leader, *followers, return_exceptions=True)
+
+            assert upstream_calls == ["/token"]
+
+            # each caller gets an exception of its own.
+            assert all(isinstance(e, ProtocolError) for e in errors)
+            assert len({id(e) for e in errors}) == 3
+            assert all(e.args == ("boom",) for e in errors)  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_request_many_bounded() -> None:
+    pulled = 0
+    inflight: dict[str | None, int] = {}
+    peak_inflight = 0
+    peak_inflight_per_host = 0
+
+    def batch() -> typing.Iterator[str]:
+        nonlocal pulled
+
+        for i in range(200):
+            pulled += 1
+            yield f"https://{'a' if i % 4 else 'b'}.example.test/{i}"
+
+    async def fake_request(
+        method: str, url: str, request_kw: typing.Mapping[str, typing.Any]
+    ) -> AsyncHTTPResponse:
+        nonlocal peak_inflight, peak_inflight_per_host
+
+        host = parse_url(url).host
+        inflight[host] = inflight.get(host, 0) + 1
+
+        peak_inflight = max(peak_inflight, sum(inflight.values()))
+        peak_inflight_per_host = max(peak_inflight_per_host, inflight[host])
+
+        # a pending request never hold more than concurrency requests in memory.
+        assert pulled - int(url.rsplit("/", 1)[-1]) <= 2 * 8
+
+        await asyncio.sleep(0.001)
+        inflight[host] -= 1
+
+        if url.endswith("/13"):
+            raise ProtocolError("boom")
+
+        return mock.Mock(spec=AsyncHTTPResponse, url=url)
+
+    async with AsyncPoolManager() as pm:
+        with patch.object(pm, "_request_in_batch", side_effect=fake_request):
+            results = [
+                r async for r in pm.request_many(batch(), concurrency=8, per_host=3)
+            ]
+
+    assert len(results) == 200
+    assert peak_inflight <= 6  # two hosts, three each.
+    assert peak_inflight_per_host == 3
+
+    failed = [r for r in results if r.error is not None]
+
+    assert len(failed) == 1
+    assert failed[0].request == "https://a.example.test/13"
+    assert isinstance(failed[0].error, ProtocolError)
+    assert all(
+        r.response is not None and r.response.url == r.request
+        for r in results
+        if r.error is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_many_invalid_url() -> None:
+    async def fake_request(
+        method: str, url: str, request_kw: typing.Mapping[str, typing.Any]
+    ) -> AsyncHTTPResponse:
+        return mock.Mock(spec=AsyncHTTPResponse, url=url)
+
+    batch = ["https://a.example.test/", "https://a.example.test:nope/"]
+
+    async with AsyncPoolManager() as pm:
+        with patch.object(pm, "_request_in_batch", side_effect=fake_request):
+            results = [r async for r in pm.request_many(batch, per_host=1)]
+
+    # the invalid URL fails on its own, the batch goes on.
+    assert sorted(r.request for r in results) == batch
+    assert all(isinstance(r, AsyncBatchResult) for r in results)
+
+    failed = [r for r in results if r.error is not None]
+
+    assert len(failed) == 1
+    assert failed[0].request == "https://a.example.test:nope/"
+    assert failed[0].response is None
+    assert isinstance(failed[0].error, LocationParseError)
+
+
+@pytest.mark.asyncio
+async def test_request_many_invalid_arguments() -> None:
+    async with AsyncPoolManager() as pm:
+        with pytest.raises(ValueError):
+            async for _ in pm.request_many([], concurrency=0):
+                pass
+
+        with pytest.raises(ValueError):
+            async for _ in pm.request_many([], per_host=0):
+                pass
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import contextlib
 import gzip
+import hashlib
 import ssl
 import typing
 import zlib
 from base64 import b64decode
 from io import BytesIO
+from pathlib import Path
 from test import onlyBrotli, onlyZstd
 from unittest import mock
 
@@ -1228,6 +1230,46 @@ class TestAsyncResponse:
 
         assert b"foo\nbar" == data
 
+    async def test_download_to(self, tmp_path: Path) -> None:
+        body = b"foo" * 10_000
+        target = tmp_path / "download.bin"
+        sha256 = hashlib.sha256()
+
+        resp = AsyncHTTPResponse(
+            _make_async_fp(body),
+            headers={"content-length": str(len(body))},
+            preload_content=False,
+        )
+
+        assert await resp.download_to(target, hashes=[sha256]) == len(body)
+        assert target.read_bytes() == body
+        assert sha256.hexdigest() == hashlib.sha256(body).hexdigest()
+
+    async def test_json_custom_loads(self) -> None:
+        resp = AsyncHTTPResponse(_make_async_fp(b'{"a": 1}'), preload_content=False)
+
+        assert await resp.json(loads=lambda data: data) == b'{"a": 1}'
+
+    @pytest.mark.parametrize(
+        ["payload", "content_type"],
+        [
+            (b'{"a": 1}\n\n{"b": [2]}\n3', "application/x-ndjson"),
+            (b'\x1e{"a": 1}\n\x1e{\n"b": [2]\n}\n\x1e3\n', "application/json-seq"),
+        ],
+    )
+    async def test_iter_json_lines(self, payload: bytes, content_type: str) -> None:
+        resp = AsyncHTTPResponse(
+            _make_async_fp(payload),
+            headers={"content-type": content_type},
+            preload_content=False,
+        )
+
+        assert [record async for record in resp.iter_json_lines()] == [
+            {"a": 1},
+            {"b": [2]},
+            3,
+        ]
+
     async def test_non_timeout_ssl_error_on_read(self) -> None:
         mac_error = ssl.SSLError(
             "SSL routines",
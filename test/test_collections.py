@@ -4,7 +4,7 @@ import typing
 
 import pytest
 
-from urllib3._collections import HTTPHeaderDict
+from urllib3._collections import HTTPHeaderDict, LazyHTTPHeaderDict
 from urllib3._collections import RecentlyUsedContainer as Container
 
 
@@ -144,8 +144,10 @@ class NonMappingHeaderContainer:
         return self._data[key]
 
 
-@pytest.fixture()
-def d() -> HTTPHeaderDict:
+@pytest.fixture(params=["eager", "lazy"])
+def d(request: pytest.FixtureRequest) -> HTTPHeaderDict:
+    if request.param == "lazy":
+        return LazyHTTPHeaderDict.from_raw([(b"Cookie", b"foo"), (b"cookie", b"bar")])
     header_dict = HTTPHeaderDict(Cookie="foo")
     header_dict.add("cookie", "bar")
     return header_dict
@@ -435,3 +437,65 @@ class TestHTTPHeaderDict:
         d._container[marker] = ["some", "strings"]  # type: ignore[index]
         assert marker not in d
         assert marker in d._container
+
+
+class TestLazyHTTPHeaderDict:
+    def test_lookup_does_not_materialize(self) -> None:
+        h = LazyHTTPHeaderDict.from_raw(
+            [
+                (b"Content-Type", b"text/plain"),
+                (b"content-length", b"7"),
+                (b"Set-Cookie", b"a=b"),
+                (b"set-cookie", b"c=d"),
+            ]
+        )
+
+        assert h["content-type"] == "text/plain"
+        assert h.get("Content-Length") == "7"
+        assert h.getlist("SET-COOKIE") == ["a=b", "c=d"]
+        assert "set-cookie" in h
+        assert "x-missing" not in h
+        assert "x-né" not in h
+        assert h.get("x-missing") is None
+        assert len(h) == 3
+        assert list(h) == ["Content-Type", "content-length", "Set-Cookie"]
+
+        assert h._materialized is None
+
+    def test_mutation_materialize(self) -> None:
+        h = LazyHTTPHeaderDict.from_raw([(b"Content-Type", b"text/plain")])
+
+        h.add("x-custom", "1")
+
+        assert h._materialized is not None
+        assert h._raw is None
+        assert h["x-custom"] == "1"
+        assert h["content-type"] == "text/plain"
+        assert list(h.items()) == [("Content-Type", "text/plain"), ("x-custom", "1")]
+
+    def test_latin1_value(self) -> None:
+        h = LazyHTTPHeaderDict.from_raw([(b"x-value", "café".encode("latin-1"))])
+
+        assert h["x-value"] == "café"
+        assert list(h.itermerged()) == [("x-value", "café")]
+
+    def test_copy_stays_lazy(self) -> None:
+        raw = [(b"a", b"1"), (b"b", b"2")]
+        h = LazyHTTPHeaderDict.from_raw(raw)
+        c = h.copy()
+
+        assert isinstance(c, LazyHTTPHeaderDict)
+        assert c is not h
+        assert c == h
+
+        c["a"] = "3"
+
+        assert h["a"] == "1"
+        assert raw == [(b"a", b"1"), (b"b", b"2")]
+
+    def test_is_http_header_dict(self) -> None:
+        h = LazyHTTPHeaderDict.from_raw([(b"a", b"1")])
+
+        assert isinstance(h, HTTPHeaderDict)
+        assert HTTPHeaderDict(h) == h
+        assert repr(h) == "HTTPHeaderDict({'a': '1'})"
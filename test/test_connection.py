@@ -6,6 +6,14 @@ from unittest import mock
 
 import pytest
 
+from urllib3.backend import HttpVersion, QuicSessionTicketStore
+from urllib3.backend._base import (
+    AdaptiveReceiveBuffer,
+    ConnectionInfo,
+    RequestHeadersTemplate,
+    _quic_tls_context,
+    _resumed_peer_is_trusted,
+)
 from urllib3.connection import (  # type: ignore[attr-defined]
     CertificateError,
     HTTPConnection,
@@ -257,3 +265,175 @@ class TestConnection:
                 conn.connect()
 
         context.wrap_socket.return_value.close.assert_called_once_with()
+
+    def test_request_headers_template(self) -> None:
+        template = RequestHeadersTemplate(
+            {
+                "Accept": "*/*",
+                "Host": "example.com",
+                "Content-Length": "0",
+                "X-Bad": "a\r\nb",
+                "X-Unicode": "\u2603",
+            },
+            defaults=(("User-Agent", "urllib3.future"),),
+        )
+
+        assert len(template) == 2
+        assert template.get("Accept", "*/*") == (b"accept", b"*/*")
+        assert template.get("User-Agent", "urllib3.future") == (
+            b"user-agent",
+            b"urllib3.future",
+        )
+        assert template.get("Accept", "text/html") is None
+        assert template.get("Host", "example.com") is None
+        assert template.get("Accept", ["*/*"]) is None
+
+    def test_putheader_splices_precompiled_headers(self) -> None:
+        conn = HTTPConnection("example.com")
+        conn._headers_template = RequestHeadersTemplate(
+            {"Accept": "*/*", "Connection": "keep-alive"}
+        )
+
+        conn.putrequest("GET", "/")
+        conn.putheader("Accept", "*/*")
+        conn.putheader("X-Custom", "foo")
+
+        headers = conn._HfaceBackend__headers  # type: ignore[attr-defined]
+
+        assert (b"accept", b"*/*") in headers
+        assert (b"x-custom", b"foo") in headers
+
+        # HTTP/1 only headers are still filtered out for multiplexed protocols.
+        conn._svn = HttpVersion.h2
+        conn.putheader("Connection", "keep-alive")
+
+        assert (b"connection", b"keep-alive") not in headers
+
+    def test_aborted_streams_are_bounded(self) -> None:
+        from urllib3._constant import MAX_ABORTED_STREAMS
+
+        conn = HTTPConnection("example.com")
+        conn._protocol = mock.Mock(
+            bytes_to_send=mock.Mock(return_value=b""),
+            has_expired=mock.Mock(return_value=False),
+        )
+        conn.sock = mock.Mock()
+
+        for stream_id in range(1, (MAX_ABORTED_STREAMS + 10) * 2, 2):
+            conn._HfaceBackend__abort_st(stream_id)  # type: ignore[attr-defined]
+
+        assert len(conn._aborted_streams) == MAX_ABORTED_STREAMS
+        # the oldest streams were forgotten first.
+        assert 1 not in conn._aborted_streams
+        assert (MAX_ABORTED_STREAMS + 10) * 2 - 1 in conn._aborted_streams
+
+    def test_quic_session_ticket_store(self) -> None:
+        store = QuicSessionTicketStore(maxsize=2)
+
+        store.put(("a.example", 443), "ticket-a")
+        store.put(("b.example", 443), "ticket-b")
+        store.put(("c.example", 443), "ticket-c")
+
+        # least recently stored is gone.
+        assert len(store) == 2
+        assert ("a.example", 443) not in store
+
+        # a ticket is handed out once.
+        assert store.pop(("b.example", 443)) == ("ticket-b", None)
+        assert store.pop(("b.example", 443)) is None
+
+        store.put(("c.example", 443), mock.Mock(is_valid=False))
+        assert store.pop(("c.example", 443)) is None
+
+    def test_quic_session_ticket_not_shared_with_verifying_pool(self) -> None:
+        store = QuicSessionTicketStore()
+        tls_contexts = []
+
+        for cert_reqs in ("CERT_NONE", "CERT_REQUIRED"):
+            conn = HTTPSConnection("example.com", 443, cert_reqs=cert_reqs)
+            conn._svn = HttpVersion.h3
+            conn.sock = mock.Mock()
+
+            assert conn._custom_tls(cert_reqs=cert_reqs) is True
+
+            tls_contexts.append(
+                _quic_tls_context(conn._HfaceBackend__custom_tls_settings)  # type: ignore[attr-defined]
+            )
+
+        insecure_context, verifying_context = tls_contexts
+
+        store.put(("example.com", 443), "ticket", tls_context=insecure_context)
+
+        assert ("example.com", 443) in store
+        assert store.pop(("example.com", 443), tls_context=verifying_context) is None
+        assert store.pop(("example.com", 443), tls_context=insecure_context) == (
+            "ticket",
+            None,
+        )
+
+    def test_resumed_peer_is_trusted(self) -> None:
+        conn_info = ConnectionInfo()
+        conn_info.certificate_der = b"not a real certificate"
+        conn_info.certificate_dict = {"subjectAltName": (("DNS", "example.com"),)}
+
+        tls_config = mock.Mock(
+            insecure=False,
+            cert_fingerprint=None,
+            verify_hostname=True,
+            assert_hostname=None,
+            cert_use_common_name=False,
+        )
+
+        assert _resumed_peer_is_trusted(conn_info, tls_config, "example.com") is True
+        assert _resumed_peer_is_trusted(conn_info, tls_config, "evil.example") is False
+        # nothing to check the certificate against.
+        assert _resumed_peer_is_trusted(None, tls_config, "example.com") is False
+
+        tls_config.cert_fingerprint = "AA:" * 31 + "AA"
+        assert _resumed_peer_is_trusted(conn_info, tls_config, "example.com") is False
+
+        tls_config.cert_fingerprint = None
+        tls_config.insecure = True
+        assert _resumed_peer_is_trusted(None, tls_config, "evil.example") is True
+
+    def test_quic_session_ticket_store_early_data(self) -> None:
+        assert QuicSessionTicketStore().allow_early_data(("a.example", 443)) is False
+
+        store = QuicSessionTicketStore(early_data=True)
+
+        assert store.allow_early_data(("a.example", 443)) is True
+
+        store.reject_early_data(("a.example", 443))
+
+        assert store.allow_early_data(("a.example", 443)) is False
+        assert store.allow_early_data(("b.example", 443)) is True
+
+    def test_adaptive_receive_buffer(self) -> None:
+        pending = bytearray()
+
+        def recv_into(buffer: memoryview, nbytes: int) -> int:
+            chunk = pending[:nbytes]
+            del pending[:nbytes]
+            buffer[: len(chunk)] = chunk
+            return len(chunk)
+
+        sock = mock.Mock(recv_into=recv_into)
+        buffer = AdaptiveReceiveBuffer(65536, minimum=16384)
+
+        # reads that fill the buffer make it grow, up to the maximum.
+        pending += b"x" * (16384 + 32768 + 65536)
+
+        for size in (16384, 32768, 65536):
+            assert buffer.size == size
+            assert buffer.recv(sock) == b"x" * size
+
+        assert buffer.size == 65536
+
+        # a run of short reads make it shrink, down to the minimum.
+        for _ in range(8 * 3):
+            pending += b"y" * 128
+            assert buffer.recv(sock) == b"y" * 128
+
+        assert buffer.size == 16384
+
+        assert AdaptiveReceiveBuffer(1024).size == 1024
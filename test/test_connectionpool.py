@@ -4,16 +4,18 @@ import http.client as httplib
 import ssl
 import threading
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from socket import error as SocketError
 from ssl import SSLError as BaseSSLError
 from test import SHORT_TIMEOUT
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
 
 from dummyserver.server import DEFAULT_CA
 from urllib3 import Retry
-from urllib3.connection import HTTPConnection
+from urllib3.backend import ConnectionInfo, ResponsePromise
+from urllib3.connection import HTTPConnection, HTTPSConnection
 from urllib3.connectionpool import (
     HTTPConnectionPool,
     HTTPSConnectionPool,
@@ -34,6 +36,7 @@ from urllib3.exceptions import (
 from urllib3.response import HTTPResponse
 from urllib3.util.ssl_match_hostname import CertificateError
 from urllib3.util.timeout import _DEFAULT_TIMEOUT, Timeout
+from urllib3.util.traffic_police import TrafficPolice
 
 from .test_response import MockChunkedEncodingResponse, MockSock
 
@@ -364,6 +367,83 @@ class TestConnectionPool:
             with pytest.raises(HostChangedError):
                 c.request("GET", "http://yahoo.com:80", assert_same_host=True)
 
+    def test_can_coalesce(self) -> None:
+        with HTTPSConnectionPool("a.example.test") as pool:
+            conn = pool._get_conn()
+
+            conn.conn_info = ConnectionInfo()
+            conn.conn_info.destination_address = ("192.0.2.1", 443)
+            conn.conn_info.certificate_dict = {
+                "subjectAltName": (("DNS", "*.example.test"),)
+            }
+
+            pool._put_conn(conn)
+
+            # HTTP/1.1 connections cannot be shared.
+            assert not pool._can_coalesce("b.example.test", {"192.0.2.1"})
+
+            with patch.object(
+                type(conn), "is_multiplexed", new_callable=PropertyMock
+            ) as is_multiplexed, patch.object(
+                type(conn), "is_closed", new_callable=PropertyMock
+            ) as is_closed:
+                is_multiplexed.return_value = True
+
+                # a connection not (or no longer) established neither.
+                is_closed.return_value = True
+                assert not pool._can_coalesce("b.example.test", {"192.0.2.1"})
+                is_closed.return_value = False
+
+                assert pool._can_coalesce("b.example.test", {"192.0.2.1", "::1"})
+                assert not pool._can_coalesce("b.example.test", {"192.0.2.2"})
+                assert not pool._can_coalesce("b.example.org", {"192.0.2.1"})
+
+        with HTTPConnectionPool("a.example.test") as pool:
+            assert not pool._can_coalesce("b.example.test", {"192.0.2.1"})
+
+    def test_coalescing_only_over_the_eligible_connection(self) -> None:
+        with HTTPSConnectionPool("a.example.test", maxsize=2) as pool:
+            assert pool.pool is not None
+
+            h1_conn = pool.ConnectionCls("a.example.test", 443)
+            eligible = pool.ConnectionCls("a.example.test", 443)
+
+            for conn in (h1_conn, eligible):
+                conn.conn_info = ConnectionInfo()
+                conn.conn_info.destination_address = ("192.0.2.1", 443)
+                conn.conn_info.certificate_dict = {
+                    "subjectAltName": (("DNS", "*.example.test"),)
+                }
+                pool.pool.put(conn)
+
+            coalescing = ("b.example.test", frozenset({"192.0.2.1"}))
+
+            with patch.object(
+                HTTPSConnection, "is_multiplexed", property(lambda c: c is eligible)
+            ), patch.object(HTTPSConnection, "is_closed", property(lambda c: False)):
+                assert pool._get_coalescing_conn(*coalescing) is eligible
+
+                # while busy, none other is handed out.
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    with pytest.raises(EmptyPoolError):
+                        executor.submit(pool._get_coalescing_conn, *coalescing).result()
+
+                pool._put_conn(eligible)
+
+                with patch.object(
+                    pool, "_make_request", side_effect=OSError()
+                ) as make_request, patch.object(
+                    pool,
+                    "_new_conn",
+                    side_effect=AssertionError("Unexpected _new_conn"),
+                ):
+                    # the retry cannot go elsewhere once the connection is lost.
+                    with pytest.raises(EmptyPoolError):
+                        pool.urlopen("GET", "/", retries=1, coalescing=coalescing)
+
+                    assert make_request.call_count == 1
+                    assert make_request.call_args[0][0] is eligible
+
     def test_pool_close(self) -> None:
         pool = connection_from_url("http://google.com:80")
 
@@ -659,3 +739,146 @@ class TestConnectionPool:
                 assert captured["args"][1] <= 1.5
             finally:
                 pool.close()
+
+    def test_thread_affinity(self) -> None:
+        def borrow_and_release(
+            police: TrafficPolice[typing.Any], conn: Mock | None = None
+        ) -> Mock:
+            if conn is None:
+                conn = police.get(block=False)
+            else:
+                police.put(conn, immediately_unavailable=True)
+
+            police.release()
+
+            assert conn is not None
+            return conn
+
+        for thread_affinity in (False, True):
+            with HTTPConnectionPool(
+                host="localhost", maxsize=2, thread_affinity=thread_affinity
+            ) as pool:
+                assert pool.pool is not None
+
+                conn_a = Mock(is_saturated=False, is_idle=True)
+                conn_b = Mock(is_saturated=False, is_idle=True)
+
+                with ThreadPoolExecutor(1) as thread_a, ThreadPoolExecutor(
+                    1
+                ) as thread_b:
+                    thread_a.submit(borrow_and_release, pool.pool, conn_a).result()
+                    thread_b.submit(borrow_and_release, pool.pool, conn_b).result()
+
+                    # conn_b was released last, it comes first out of the shared container.
+                    reused = thread_a.submit(borrow_and_release, pool.pool).result()
+
+                    assert reused is (conn_a if thread_affinity else conn_b)
+
+                    # the preferred connection is busy, the other one is taken.
+                    assert pool.pool.get(block=False) is reused
+
+                    assert thread_a.submit(borrow_and_release, pool.pool).result() is (
+                        conn_b if thread_affinity else conn_a
+                    )
+
+    def test_hedge_delay(self) -> None:
+        from urllib3._constant import DEFAULT_HEDGE_DELAY, HEDGE_LATENCY_MIN_SAMPLES
+
+        with HTTPConnectionPool(host="localhost", maxsize=1) as pool:
+            assert pool._get_hedge_delay(0.25) == 0.25
+            # not enough samples to learn from yet.
+            assert pool._get_hedge_delay(True) == DEFAULT_HEDGE_DELAY
+
+            for i in range(1, HEDGE_LATENCY_MIN_SAMPLES * 5 + 1):
+                pool._response_latencies.append(i / 100.0)
+
+            assert pool._get_hedge_delay(True) == pytest.approx(0.77)
+
+    def test_hedge_waits_on_both_streams(self) -> None:
+        with HTTPConnectionPool(host="localhost", maxsize=1) as pool:
+            assert pool.pool is not None
+
+            primary = Mock(spec=ResponsePromise, uid="primary")
+            secondary = Mock(spec=ResponsePromise, uid="secondary")
+            response = Mock(spec=HTTPResponse)
+
+            # both streams ride the same connection.
+            conn = MagicMock()
+            conn.__contains__.return_value = True
+            conn.wait_for_any_response.return_value = secondary
+
+            with patch.object(
+                pool, "urlopen", side_effect=[primary, secondary]
+            ), patch.object(
+                pool, "_wait_for_promise", return_value=False
+            ), patch.object(pool.pool, "borrow") as borrow, patch.object(
+                pool, "_abort_promise"
+            ) as abort_promise, patch.object(
+                pool, "get_response", return_value=response
+            ) as get_response:
+                borrow.return_value.__enter__.return_value = conn
+
+                assert pool._urlopen_hedged("GET", "/", 0.05, timeout=5.0) is response
+
+            # a single wait on both streams at once, no polling.
+            conn.wait_for_any_response.assert_called_once()
+            assert conn.wait_for_any_response.call_args.args[0] == [primary, secondary]
+
+            abort_promise.assert_called_once_with(primary)
+            get_response.assert_called_once_with(promise=secondary)
+
+            # measured from the hedge being sent, not from the primary request.
+            assert len(pool._response_latencies) == 1
+            assert pool._response_latencies[0] < 0.05
+
+    def test_record_latency_hedgeable_only(self) -> None:
+        with HTTPConnectionPool(host="localhost", maxsize=1) as pool:
+            pool._record_latency("GET", 0.1)
+            pool._record_latency("POST", 0.2)
+
+            assert list(pool._response_latencies) == [0.1]
+
+    @pytest.mark.parametrize(
+        "method, body",
+        [
+            ("POST", None),
+            ("PATCH", b"foo"),
+            ("GET", iter([b"foo"])),
+            ("PUT", b"foo"),
+            ("DELETE", None),
+        ],
+    )
+    def test_hedge_after_ignored_when_unsafe(
+        self, method: str, body: typing.Any
+    ) -> None:
+        with HTTPConnectionPool(host="localhost", maxsize=1) as pool:
+            with patch.object(
+                pool, "_urlopen_hedged", side_effect=AssertionError
+            ), patch.object(pool, "_get_conn", side_effect=EmptyPoolError(pool, "")):
+                with pytest.raises(EmptyPoolError):
+                    pool.urlopen(method, "/", body=body, hedge_after=0.1, retries=False)
+
+    def test_hedge_after_opt_in_methods(self) -> None:
+        with HTTPConnectionPool(host="localhost", maxsize=1) as pool:
+            pool.hedgeable_methods = pool.hedgeable_methods | {"PUT", "DELETE"}
+            response = Mock(spec=HTTPResponse)
+
+            with patch.object(
+                pool, "_urlopen_hedged", return_value=response
+            ) as urlopen_hedged:
+                assert (
+                    pool.urlopen("PUT", "/", body=b"foo", hedge_after=0.1) is response
+                )
+
+            assert urlopen_hedged.call_count == 1
+
+    def test_hedge_after_without_multiplexing(self) -> None:
+        with HTTPConnectionPool(host="localhost", maxsize=1) as pool:
+            response = Mock(spec=HTTPResponse)
+
+            with patch.object(pool, "urlopen", return_value=response) as urlopen:
+                assert pool._urlopen_hedged("GET", "/", 0.1) is response
+
+            # HTTP/1.1 connection: the request was sent once, without hedging.
+            urlopen.assert_called_once_with("GET", "/", multiplexed=True)
+            assert len(pool._response_latencies) == 0
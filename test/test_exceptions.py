@@ -10,6 +10,7 @@ import pytest
 from urllib3.connection import HTTPConnection
 from urllib3.connectionpool import HTTPConnectionPool
 from urllib3.exceptions import (
+    CircuitOpenError,
     ClosedPoolError,
     ConnectTimeoutError,
     EmptyPoolError,
@@ -38,6 +39,7 @@ class TestPickle:
             LocationParseError("fake location"),
             ClosedPoolError(HTTPConnectionPool("localhost"), ""),
             EmptyPoolError(HTTPConnectionPool("localhost"), ""),
+            CircuitOpenError(HTTPConnectionPool("localhost"), 1.0),
             HostChangedError(HTTPConnectionPool("localhost"), "/", 0),
             ReadTimeoutError(HTTPConnectionPool("localhost"), "/", ""),
             NewConnectionError(HTTPConnection("localhost"), ""),
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import io
+import os
+import typing
+
 import pytest
 
 from urllib3._typing import _TYPE_FIELDS
 from urllib3.fields import RequestField
-from urllib3.filepost import encode_multipart_formdata
+from urllib3.filepost import MultipartEncoder, encode_multipart_formdata
+from urllib3.util.request import body_to_chunks
 
 BOUNDARY = "!! test boundary !!"
 BOUNDARY_BYTES = BOUNDARY.encode()
@@ -115,3 +120,131 @@ class TestMultipartEncoding:
         )
 
         assert encoded == expected
+
+
+class TestMultipartEncoder:
+    def test_same_output_as_in_memory(self) -> None:
+        payload = os.urandom(100003)
+        fields: _TYPE_FIELDS = [
+            ("k", "v"),
+            ("file", ("a.bin", io.BytesIO(payload))),
+            ("typed", ("b.txt", io.BytesIO(b"foo"), "text/plain")),
+            ("empty", ("c.bin", io.BytesIO(b""))),
+        ]
+
+        encoder = MultipartEncoder(fields, boundary=BOUNDARY)
+        expected, content_type = encode_multipart_formdata(
+            [
+                ("k", "v"),
+                ("file", ("a.bin", payload)),
+                ("typed", ("b.txt", b"foo", "text/plain")),
+                ("empty", ("c.bin", b"")),
+            ],
+            boundary=BOUNDARY,
+        )
+
+        assert encoder.streaming is True
+        assert encoder.content_type == content_type
+        assert len(encoder) == len(expected)
+        assert b"".join(encoder) == expected
+
+    @pytest.mark.parametrize("amt", [1, 7, 4096, 65536])
+    def test_read_by_chunks(self, amt: int) -> None:
+        payload = os.urandom(20000)
+        encoder = MultipartEncoder(
+            {"a": ("a", io.BytesIO(payload)), "b": "c"}, boundary=BOUNDARY
+        )
+        expected = encode_multipart_formdata(
+            {"a": ("a", payload), "b": "c"}, boundary=BOUNDARY
+        )[0]
+
+        chunks = []
+
+        while True:
+            chunk = encoder.read(amt)
+            if not chunk:
+                break
+            assert len(chunk) <= amt
+            chunks.append(chunk)
+
+        assert b"".join(chunks) == expected
+        assert encoder.tell() == len(expected)
+
+    def test_file_read_lazily_from_its_position(self) -> None:
+        fp = io.BytesIO(b"skipme" + b"x" * 1000)
+        fp.seek(6)
+
+        encoder = MultipartEncoder({"f": ("f", fp)}, boundary=BOUNDARY)
+
+        # nothing is read from the file until needed.
+        assert fp.tell() == 6
+        assert b"skipme" not in encoder.read()
+        assert len(encoder) == encoder.tell()
+
+    def test_seek_rewind(self) -> None:
+        fp = io.BytesIO(b"0123456789" * 1000)
+        encoder = MultipartEncoder(
+            [("a", ("a", fp)), ("b", ("b", fp))], boundary=BOUNDARY
+        )
+
+        full = encoder.read()
+
+        assert full.count(b"0123456789" * 1000) == 2
+
+        assert encoder.seek(0) == 0
+        assert encoder.read() == full
+
+        # land in the middle of the second file.
+        middle = len(full) - 500
+        encoder.seek(middle)
+        assert encoder.read() == full[middle:]
+
+        encoder.seek(-10, os.SEEK_END)
+        assert encoder.read() == full[-10:]
+
+        with pytest.raises(OSError):
+            encoder.seek(-1)
+
+    def test_unmeasurable_file_is_buffered(self) -> None:
+        class Unseekable(io.RawIOBase):
+            def __init__(self) -> None:
+                self._data = io.BytesIO(b"abc")
+
+            def readable(self) -> bool:
+                return True
+
+            def readinto(self, b: typing.Any) -> int:
+                return self._data.readinto(b)
+
+        encoder = MultipartEncoder(
+            {"a": ("a", Unseekable()), "b": ("b", io.StringIO("é"))},  # type: ignore[dict-item]
+            boundary=BOUNDARY,
+        )
+
+        assert encoder.streaming is False
+        assert (
+            encoder.read()
+            == encode_multipart_formdata(
+                {"a": ("a", b"abc"), "b": ("b", "é")}, boundary=BOUNDARY
+            )[0]
+        )
+
+    def test_truncated_file(self) -> None:
+        fp = io.BytesIO(b"x" * 100)
+        encoder = MultipartEncoder({"a": ("a", fp)}, boundary=BOUNDARY)
+
+        fp.truncate(50)
+
+        with pytest.raises(OSError):
+            encoder.read()
+
+    def test_body_to_chunks_content_length(self) -> None:
+        encoder = MultipartEncoder(
+            {"a": ("a", io.BytesIO(b"x" * 100))}, boundary=BOUNDARY
+        )
+
+        chunks_and_cl = body_to_chunks(encoder, "POST", 16)
+
+        assert chunks_and_cl.content_length == len(encoder)
+        assert isinstance(chunks_and_cl.chunks, typing.Iterable)
+        assert sum(len(c) for c in chunks_and_cl.chunks) == len(encoder)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from test import USING_SECONDARY_ENTRYPOINT
+
+import pytest
+
+package_name = "urllib3" if not USING_SECONDARY_ENTRYPOINT else "urllib3_future"
+
+#: About twice what a slow CI runner takes, the best of a few attempts is compared to it.
+IMPORT_TIME_BUDGET_US = 750_000
+IMPORT_TIME_ATTEMPTS = 3
+
+#: None of those are needed to issue a synchronous HTTP/1.1 request.
+DEFERRED_MODULES = (
+    f"{package_name}._async.",
+    f"{package_name}.backend._async.",
+    f"{package_name}.contrib.resolver._async.",
+    f"{package_name}.contrib.webextensions.",
+    f"{package_name}.contrib.hface.protocols.http",
+    "h11.",
+    "jh2.",
+    "qh3.",
+    "wsproto.",
+)
+
+
+def _import(name: str) -> tuple[list[str], dict[str, int]]:
+    """Import given module in a fresh interpreter. Return every loaded module
+    and the cumulative import time (us) reported by ``-X importtime``."""
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys, {name}; print(*sys.modules, sep=chr(10))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, module_name = line.split("|")
+
+        if not cumulative.strip().isdigit():
+            continue  # the header.
+
+        timings[module_name.strip()] = int(cumulative)
+
+    return process.stdout.split(), timings
+
+
+class TestImportTime:
+    def test_import_defer_async_and_protocols(self) -> None:
+        modules, timings = _import(package_name)
+
+        assert package_name in modules
+
+        loaded = [
+            name
+            for name in modules
+            if any(f"{name}.".startswith(prefix) for prefix in DEFERRED_MODULES)
+        ]
+
+        assert loaded == []
+
+        for name in (
+            f"{package_name}._async",
+            f"{package_name}._async.poolmanager",
+            f"{package_name}._async.connectionpool",
+            f"{package_name}.backend._async",
+        ):
+            assert name not in modules
+
+    def test_import_time_budget(self) -> None:
+        # the first import may have to compile the bytecode.
+        _import(package_name)
+
+        best = min(
+            _import(package_name)[1][package_name] for _ in range(IMPORT_TIME_ATTEMPTS)
+        )
+
+        assert best < IMPORT_TIME_BUDGET_US
+
+    def test_lazy_attributes(self) -> None:
+        import urllib3
+        from urllib3._async.poolmanager import AsyncPoolManager
+        from urllib3.contrib.resolver._async import AsyncResolverDescription
+
+        assert urllib3.AsyncPoolManager is AsyncPoolManager
+        assert urllib3.AsyncResolverDescription is AsyncResolverDescription
+
+    def test_unknown_attribute(self) -> None:
+        import urllib3
+
+        with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+            urllib3.Nope
+
+        assert "AsyncPoolManager" in dir(urllib3)
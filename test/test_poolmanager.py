@@ -1,19 +1,47 @@
 from __future__ import annotations
 
 import gc
+import gzip
+import io
 import socket
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from test import resolvesLocalhostFQDN
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from urllib3 import connection_from_url
+from urllib3 import HTTPHeaderDict, connection_from_url
 from urllib3._constant import DEFAULT_BLOCKSIZE
-from urllib3.connectionpool import HTTPSConnectionPool
-from urllib3.exceptions import LocationValueError
-from urllib3.poolmanager import PoolKey, PoolManager, key_fn_by_scheme
+from urllib3.backend import MemoryBudget
+from urllib3.backend import ResponsePromise
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import (
+    CircuitOpenError,
+    EmptyPoolError,
+    LocationValueError,
+    NewConnectionError,
+    ProtocolError,
+    TimeoutError,
+)
+from urllib3.response import HTTPResponse
+from urllib3.poolmanager import (
+    PoolKey,
+    PoolManager,
+    ProxyManager,
+    _PoolKeyMemo,
+    key_fn_by_scheme,
+)
+from urllib3.contrib.resolver import ProtocolResolver, ResolverDescription
 from urllib3.util import retry, timeout
+from urllib3.util.download import plan_segments
+from urllib3.util.fork import _before_fork
+from urllib3.util.singleflight import wait_bound
+from urllib3.util.retry import CircuitBreaker, RetryBudget
 from urllib3.util.url import Url
 
 
@@ -213,6 +241,784 @@ class TestPoolManager:
             if i != j
         )
 
+    def test_pool_key_memoized(self) -> None:
+        p = PoolManager(5)
+
+        pool = p.connection_from_host("example.com", 443, scheme="https")
+
+        assert len(p._pool_key_memo) == 1
+
+        key_fn = MagicMock(wraps=key_fn_by_scheme["https"])
+
+        with patch.object(p, "key_fn_by_scheme", {"https": key_fn}):
+            # a different key function means a fresh computation.
+            assert p.connection_from_host("example.com", 443, scheme="https") is pool
+            assert key_fn.call_count == 1
+            assert p.connection_from_host("example.com", 443, scheme="https") is pool
+            assert key_fn.call_count == 1
+
+    def test_pool_key_memo_invalidated_on_kwargs_change(self) -> None:
+        p = PoolManager(5)
+
+        pool = p.connection_from_host("example.com", 443, scheme="https")
+        assert p.connection_from_host("example.com", 443, scheme="https") is pool
+
+        p.connection_pool_kw["cert_reqs"] = "CERT_NONE"
+        other_pool = p.connection_from_host("example.com", 443, scheme="https")
+
+        assert other_pool is not pool
+        assert other_pool.cert_reqs == "CERT_NONE"  # type: ignore[attr-defined]
+
+        p.connection_pool_kw = {"cert_reqs": "CERT_REQUIRED"}
+
+        assert len(p._pool_key_memo) == 0
+        assert (
+            p.connection_from_host("example.com", 443, scheme="https").cert_reqs  # type: ignore[attr-defined]
+            == "CERT_REQUIRED"
+        )
+
+    def test_pool_key_memo_with_pool_kwargs(self) -> None:
+        p = PoolManager(5)
+
+        pool = p.connection_from_host(
+            "example.com", 443, scheme="https", pool_kwargs={"cert_reqs": "CERT_NONE"}
+        )
+        other_pool = p.connection_from_host(
+            "example.com", 443, scheme="https", pool_kwargs={"cert_reqs": "CERT_NONE"}
+        )
+
+        assert pool is other_pool
+        assert len(p._pool_key_memo) == 1
+
+        # unhashable values are not memoized but still reach the key function.
+        def join_headers(request_context: dict[str, typing.Any]) -> PoolKey:
+            context = request_context.copy()
+            context["headers"] = {
+                k: ", ".join(v) for k, v in context.get("headers", {}).items()
+            }
+            return key_fn_by_scheme["https"](context)
+
+        key_fn = MagicMock(wraps=join_headers)
+
+        with patch.object(p, "key_fn_by_scheme", {"https": key_fn}):
+            headers_pool = p.connection_from_host(
+                "example.com",
+                443,
+                scheme="https",
+                pool_kwargs={"headers": {"X-Custom": ["a", "b"]}},
+            )
+
+            assert headers_pool is not pool
+
+            assert (
+                p.connection_from_host(
+                    "example.com",
+                    443,
+                    scheme="https",
+                    pool_kwargs={"headers": {"X-Custom": ["a", "b"]}},
+                )
+                is headers_pool
+            )
+            assert key_fn.call_count == 2
+
+        assert len(p._pool_key_memo) == 1
+
+    def test_pool_key_memo_invalidated_on_nested_kwargs_change(self) -> None:
+        p = PoolManager(5)
+        p.connection_pool_kw["headers"] = {"X-Custom": "a"}
+
+        pool = p.connection_from_host("example.com", 443, scheme="https")
+        assert p.connection_from_host("example.com", 443, scheme="https") is pool
+
+        p.connection_pool_kw["headers"]["X-Custom"] = "b"
+        other_pool = p.connection_from_host("example.com", 443, scheme="https")
+
+        assert other_pool is not pool
+        assert other_pool.headers == {"X-Custom": "b"}
+
+    def test_pool_key_memo_evicts_least_recently_used(self) -> None:
+        memo = _PoolKeyMemo(maxsize=2)
+        keys = [mock.Mock(spec=PoolKey) for _ in range(3)]
+
+        memo.put("a", keys[0])
+        memo.put("b", keys[1])
+
+        # a hit makes "a" the most recently used, "b" is evicted in its stead.
+        assert memo.get("a") is keys[0]
+        memo.put("c", keys[2])
+
+        assert memo.get("b") is None
+        assert memo.get("a") is keys[0]
+        assert memo.get("c") is keys[2]
+        assert len(memo) == 2
+
+    def test_pool_key_memo_honor_connection_from_context_override(self) -> None:
+        class CustomPoolManager(PoolManager):
+            def connection_from_context(
+                self, request_context: dict[str, typing.Any]
+            ) -> HTTPConnectionPool:
+                request_context["block"] = True
+                return super().connection_from_context(request_context)
+
+        p = CustomPoolManager(5)
+
+        pool = p.connection_from_host("example.com", 443, scheme="https")
+
+        assert pool.block is True
+        assert p.connection_from_host("example.com", 443, scheme="https") is pool
+
+    def test_retry_policies_kwargs(self) -> None:
+        budget = RetryBudget()
+        breaker = CircuitBreaker()
+
+        p = PoolManager(5, retries=2, retry_budget=budget, circuit_breaker=breaker)
+        pool = p.connection_from_url("http://example.com/")
+
+        assert pool.retries.total == 2  # type: ignore[union-attr]
+        assert pool.retries.retry_budget is budget  # type: ignore[union-attr]
+        assert pool.retries.circuit_breaker is breaker  # type: ignore[union-attr]
+
+        with patch.object(HTTPConnectionPool, "urlopen") as urlopen:
+            urlopen.return_value = mock.MagicMock(get_redirect_location=lambda: False)
+            p.urlopen("GET", "http://example.com/", retries=5)
+
+        retries = urlopen.call_args.kwargs["retries"]
+
+        assert retries.total == 5
+        assert retries.retry_budget is budget
+        assert retries.circuit_breaker is breaker
+
+    def test_memory_budget_shared(self) -> None:
+        p = PoolManager(5, memory_budget=8388608)
+
+        assert isinstance(p.memory_budget, MemoryBudget)
+        assert p.memory_budget.limit == 8388608
+        assert p.memory_budget.usage == 0
+
+        pool_a = p.connection_from_url("https://example.com/")
+        pool_b = p.connection_from_url("https://example.org/")
+
+        assert pool_a.conn_kw["memory_budget"] is p.memory_budget
+        assert pool_b.conn_kw["memory_budget"] is p.memory_budget
+
+        budget = MemoryBudget(1048576)
+
+        assert PoolManager(memory_budget=budget).memory_budget is budget
+        assert PoolManager().memory_budget is None
+        assert "memory_budget" not in (
+            PoolManager().connection_from_url("https://example.com/").conn_kw
+        )
+
+    def test_after_fork_in_child(self) -> None:
+        with PoolManager(5, memory_budget=8388608) as p:
+            pool = p.connection_from_url("http://example.com/")
+            # remain borrowed, as if a thread of the parent was using it at the time of the fork.
+            conn = pool._new_conn()
+            sock = mock.MagicMock()
+            conn.sock = sock
+
+            assert pool.pool is not None
+
+            pool.pool.put(conn)
+            p.memory_budget.acquire(1024)  # type: ignore[union-attr]
+
+            p._after_fork_in_child()
+            pool._after_fork_in_child()
+
+            # the pools are kept and available, their connections are not.
+            assert not p.pools.busy
+            assert p.connection_from_url("http://example.com/") is pool
+            assert pool.pool.qsize() == 0
+            assert p.memory_budget.usage == 0  # type: ignore[union-attr]
+
+            # only our file descriptor is released, the parent keep using the connection.
+            sock.close.assert_called_once_with()
+            sock.shutdown.assert_not_called()
+            sock.sendall.assert_not_called()
+            assert conn.sock is None
+
+    def test_iter_responses_order(self) -> None:
+        first, second, third = (mock.Mock(spec=ResponsePromise) for _ in range(3))
+        responses = {
+            id(promise): mock.Mock(spec=HTTPResponse)
+            for promise in (first, second, third)
+        }
+        waited_on = []
+
+        def wait_for_any_promise(pending: list[ResponsePromise]) -> ResponsePromise:
+            waited_on.append(list(pending))
+            # the last one arrives first, then the remaining in order.
+            return pending[-1] if len(pending) == 3 else pending[0]
+
+        pool = mock.Mock(_wait_for_any_promise=wait_for_any_promise)
+
+        with PoolManager() as p:
+            with patch.object(p, "pools") as pools, patch.object(
+                p, "get_response", side_effect=lambda promise: responses[id(promise)]
+            ):
+                pools.borrow.return_value.__enter__.return_value = pool
+
+                assert list(p.iter_responses([first, second, third])) == [
+                    responses[id(third)],
+                    responses[id(first)],
+                    responses[id(second)],
+                ]
+
+                # the connection of the oldest pending promise is always the one waited on.
+                assert [call.args[0] for call in pools.borrow.call_args_list] == [
+                    first,
+                    first,
+                    second,
+                ]
+                assert waited_on == [[first, second, third], [first, second], [second]]
+
+            with pytest.raises(TypeError):
+                list(p.iter_responses([first, "nope"]))  # type: ignore[list-item]
+
+    def test_prewarm(self) -> None:
+        with PoolManager() as p:
+            with patch.object(p, "request") as request:
+                request.side_effect = [
+                    mock.MagicMock(),
+                    NewConnectionError(
+                        p.connection_from_url("https://b.example.test/"), "nope"
+                    ),
+                ]
+
+                p.prewarm(["https://a.example.test/", "https://b.example.test/"])
+
+                assert request.call_args_list == [
+                    mock.call(
+                        "HEAD", "https://a.example.test/", redirect=False, retries=False
+                    ),
+                    mock.call(
+                        "HEAD", "https://b.example.test/", redirect=False, retries=False
+                    ),
+                ]
+
+            with patch.object(p, "request") as request, patch(
+                "os.register_at_fork"
+            ) as register_at_fork:
+                p.prewarm(["https://a.example.test/"], before_fork=True)
+                p.prewarm(["https://b.example.test/"], before_fork=True)
+
+                # a single hook, registered once at import, serves every manager.
+                register_at_fork.assert_not_called()
+                request.assert_not_called()
+
+                _before_fork()
+                _before_fork()
+
+                assert request.call_args_list == [
+                    mock.call(
+                        "HEAD", "https://a.example.test/", redirect=False, retries=False
+                    ),
+                    mock.call(
+                        "HEAD", "https://b.example.test/", redirect=False, retries=False
+                    ),
+                ]
+
+    def test_request_coalescing(self) -> None:
+        body = gzip.compress(b'{"token": "foo"}')
+        upstream_calls = []
+        release_upstream = threading.Event()
+
+        def upstream(method: str, url: str, **kw: typing.Any) -> HTTPResponse:
+            upstream_calls.append((method, url, kw.get("preload_content", True)))
+            release_upstream.wait(timeout=5)
+
+            return HTTPResponse(
+                body=io.BytesIO(body),
+                headers={"Content-Encoding": "gzip", "Content-Length": str(len(body))},
+                status=200,
+                preload_content=False,
+                request_method=method,
+            )
+
+        with PoolManager(request_coalescing=True) as p:
+            with patch.object(HTTPConnectionPool, "urlopen", side_effect=upstream):
+                with ThreadPoolExecutor(max_workers=8) as tpe:
+                    tasks = [
+                        tpe.submit(p.request, "GET", "http://example.com/token")
+                        for _ in range(8)
+                    ]
+
+                    # let every caller reach the coalescer before the upstream answers.
+                    time.sleep(0.2)
+                    release_upstream.set()
+
+                    responses = [task.result() for task in tasks]
+
+                assert upstream_calls == [("GET", "/token", False)]
+                assert len(p._request_coalescer) == 0  # type: ignore[arg-type]
+
+                # independent views, each decoding the shared body on its own.
+                assert len({id(r) for r in responses}) == 8
+                assert all(r.json() == {"token": "foo"} for r in responses)
+                assert responses[0].headers is not responses[1].headers
+
+                raw = p.request("GET", "http://example.com/token", decode_content=False)
+                assert raw.data == body
+
+                upstream_calls.clear()
+
+                # neither other headers, methods with a body nor streamed responses are shared.
+                p.request("GET", "http://example.com/token", headers={"X-Foo": "bar"})
+                p.request("POST", "http://example.com/token", body=b"foo")
+                p.request(
+                    "GET", "http://example.com/token", preload_content=False
+                ).release_conn()
+
+                assert [c[0] for c in upstream_calls] == ["GET", "POST", "GET"]
+                assert upstream_calls[1][2] is True
+
+    def test_request_coalescing_followers(self) -> None:
+        release_upstream = threading.Event()
+        upstream_calls = []
+
+        def upstream(method: str, url: str, **kw: typing.Any) -> HTTPResponse:
+            upstream_calls.append(url)
+            release_upstream.wait(timeout=5)
+
+            raise ProtocolError("boom")
+
+        with PoolManager(request_coalescing=True) as p:
+            with patch.object(HTTPConnectionPool, "urlopen", side_effect=upstream):
+                with ThreadPoolExecutor(max_workers=4) as tpe:
+                    leader = tpe.submit(p.request, "GET", "http://example.com/token")
+                    time.sleep(0.1)
+
+                    # a follower never waits longer than its own timeout allows.
+                    with pytest.raises(
+                        TimeoutError, match="identical request in flight"
+                    ):
+                        p.request(
+                            "GET",
+                            "http://example.com/token",
+                            timeout=timeout.Timeout(total=0.1),
+                        )
+
+                    followers = [
+                        tpe.submit(p.request, "GET", "http://example.com/token")
+                        for _ in range(2)
+                    ]
+                    time.sleep(0.1)
+                    release_upstream.set()
+
+                    errors = [task.exception() for task in [leader, *followers]]
+
+                assert upstream_calls == ["/token"]
+
+                # each caller gets an exception of its own.
+                assert all(isinstance(e, ProtocolError) for e in errors)
+                assert len({id(e) for e in errors}) == 3
+                assert all(e.args == ("boom",) for e in errors)  # type: ignore[union-attr]
+                assert errors[1].__cause__ is errors[0]  # type: ignore[union-attr]
+
+    @pytest.mark.parametrize(
+        ["request_timeout", "expected"],
+        [
+            (None, None),
+            (timeout.Timeout.DEFAULT_TIMEOUT, None),
+            (2.0, 4.0),
+            (timeout.Timeout(total=3.0, read=10.0), 3.0),
+            (timeout.Timeout(connect=1.0, read=2.0), 3.0),
+            (timeout.Timeout(connect=1.0, read=None), None),
+        ],
+    )
+    def test_request_coalescing_wait_bound(
+        self, request_timeout: typing.Any, expected: float | None
+    ) -> None:
+        assert wait_bound(request_timeout) == expected
+
+    def test_urlopen_many(self) -> None:
+        from urllib3._async.poolmanager import _BatchPoolManager
+        from urllib3._async.response import AsyncHTTPResponse
+
+        async def _request_in_batch(
+            manager: typing.Any,
+            method: str,
+            url: str,
+            request_kw: dict[str, typing.Any],
+        ) -> AsyncHTTPResponse:
+            # the body is always buffered by urlopen_many itself.
+            assert request_kw["preload_content"] is False
+
+            if url.endswith("/fail"):
+                raise NewConnectionError(None, "nope")  # type: ignore[arg-type]
+
+            return AsyncHTTPResponse(
+                body=io.BytesIO(gzip.compress(url.encode())),
+                headers={"content-encoding": "gzip"},
+                status=200,
+                preload_content=False,
+            )
+
+        with PoolManager(num_pools=3, headers={"X-Foo": "bar"}, maxsize=4) as p:
+            with patch(
+                "urllib3._async.poolmanager.AsyncPoolManager._request_in_batch",
+                _request_in_batch,
+            ):
+                results = list(
+                    p.urlopen_many(
+                        [
+                            "http://a.example.test/",
+                            ("GET", "http://b.example.test/fail"),
+                            (
+                                "GET",
+                                "http://c.example.test/",
+                                {"decode_content": False},
+                            ),
+                        ],
+                        concurrency=2,
+                    )
+                )
+
+            assert len(results) == 3
+
+            by_url = {
+                r.request if isinstance(r.request, str) else r.request[1]: r
+                for r in results
+            }
+
+            a = by_url["http://a.example.test/"].response
+            assert isinstance(a, HTTPResponse)
+            assert a.data == b"http://a.example.test/"
+
+            c = by_url["http://c.example.test/"].response
+            assert isinstance(c, HTTPResponse)
+            assert c.data == gzip.compress(b"http://c.example.test/")
+
+            assert isinstance(
+                by_url["http://b.example.test/fail"].error, NewConnectionError
+            )
+
+            assert p._batch is not None
+            loop, manager = p._batch
+
+            # the same loop and manager serve the next batches.
+            assert list(p.urlopen_many([])) == []
+            assert p._batch == (loop, manager)
+
+            assert isinstance(manager, _BatchPoolManager)
+            assert manager._num_pools == 3
+            assert manager.headers == {"X-Foo": "bar"}
+            assert manager.connection_pool_kw["maxsize"] == 4
+
+        assert p._batch is None
+        assert loop.is_closed()
+
+    def test_urlopen_many_abandoned(self) -> None:
+        from urllib3._async.response import AsyncHTTPResponse
+
+        async def _request_in_batch(
+            manager: typing.Any,
+            method: str,
+            url: str,
+            request_kw: dict[str, typing.Any],
+        ) -> AsyncHTTPResponse:
+            return AsyncHTTPResponse(
+                body=io.BytesIO(url.encode()), status=200, preload_content=False
+            )
+
+        p = PoolManager()
+
+        with patch(
+            "urllib3._async.poolmanager.AsyncPoolManager._request_in_batch",
+            _request_in_batch,
+        ):
+            batch = p.urlopen_many(
+                [f"http://a.example.test/{i}" for i in range(8)], concurrency=2
+            )
+            assert next(batch).error is None
+
+            # another thread can use the manager while the iterator is left suspended.
+            with ThreadPoolExecutor(max_workers=1) as tpe:
+                assert (
+                    tpe.submit(lambda: list(p.urlopen_many([]))).result(timeout=5) == []
+                )
+
+                assert p._batch is not None
+                loop = p._batch[0]
+
+                tpe.submit(p.clear).result(timeout=5)
+
+            assert p._batch is None
+            assert loop.is_closed()
+
+            with pytest.raises(RuntimeError, match="got cleared"):
+                next(batch)
+
+            # the manager is still usable, with a loop of its own.
+            assert list(p.urlopen_many([])) == []
+            assert p._batch is not None and p._batch[0] is not loop
+
+            # collected by another thread than the one that iterated it.
+            abandoned = p.urlopen_many(["http://a.example.test/"])
+            next(abandoned)
+
+            with ThreadPoolExecutor(max_workers=1) as tpe:
+                tpe.submit(abandoned.close).result(timeout=5)
+
+        p.clear()
+
+    def test_urlopen_many_through_proxy(self) -> None:
+        from urllib3._async.poolmanager import _BatchProxyManager
+
+        with ProxyManager("http://proxy.example.test:3128") as p:
+            assert list(p.urlopen_many([])) == []
+
+            assert p._batch is not None
+            manager = p._batch[1]
+
+            assert isinstance(manager, _BatchProxyManager)
+            assert manager.proxy == p.proxy
+
+    def test_urlopen_many_resolver_instance(self) -> None:
+        resolver = ResolverDescription.from_url(
+            "in-memory://default?hosts=example.test:192.0.2.1"
+        ).new()
+
+        with PoolManager(resolver=resolver) as p:
+            # the batch would otherwise be resolved elsewhere, behind the caller's back.
+            with pytest.raises(ValueError, match="resolver instance"):
+                list(p.urlopen_many(["http://example.test/"]))
+
+            assert p._batch is None
+
+        with PoolManager(
+            resolver="in-memory://default?hosts=example.test:192.0.2.1"
+        ) as p:
+            assert list(p.urlopen_many([])) == []
+
+            assert p._batch is not None
+            assert p._batch[1]._resolvers[0].protocol == ProtocolResolver.MANUAL
+
+    @pytest.mark.parametrize(
+        ["length", "segments", "min_segment_size", "expected"],
+        [
+            (10, 4, 1, [(0, 2), (3, 5), (6, 7), (8, 9)]),
+            (10, 4, 4, [(0, 4), (5, 9)]),
+            (10, 4, 100, [(0, 9)]),
+        ],
+    )
+    def test_plan_segments(
+        self,
+        length: int,
+        segments: int,
+        min_segment_size: int,
+        expected: list[tuple[int, int]],
+    ) -> None:
+        assert [
+            (s.start, s.end) for s in plan_segments(length, segments, min_segment_size)
+        ] == expected
+
+    def test_download_resume_segment(self, tmp_path: Path) -> None:
+        data = bytes(range(256)) * 40
+        failures: list[int] = []
+
+        def request(
+            method: str, url: str, headers: HTTPHeaderDict, **kw: typing.Any
+        ) -> HTTPResponse:
+            resource_headers = {
+                "accept-ranges": "bytes",
+                "etag": '"v1"',
+                "content-length": str(len(data)),
+            }
+
+            if method == "HEAD":
+                return HTTPResponse(
+                    io.BytesIO(),
+                    headers=resource_headers,
+                    status=200,
+                    preload_content=False,
+                )
+
+            assert headers["If-Range"] == '"v1"'
+            assert kw["multiplexed"] is True
+
+            start, end = map(int, headers["Range"][len("bytes=") :].split("-"))
+
+            response = mock.MagicMock(spec=HTTPResponse)
+            response.status = 206
+            response.headers = HTTPHeaderDict(resource_headers)
+            response.headers["content-range"] = f"bytes {start}-{end}/{len(data)}"
+
+            def stream() -> typing.Iterator[bytes]:
+                yield data[start : start + 100]
+
+                # the last segment breaks once, after its first 100 bytes.
+                if start == 7680 and not failures:
+                    failures.append(start)
+                    raise ProtocolError("Connection broken")
+
+                yield data[start + 100 : end + 1]
+
+            response.stream.side_effect = stream
+
+            return response
+
+        progress = []
+
+        with PoolManager() as p:
+            with patch.object(p, "request", side_effect=request) as mocked:
+                assert p.download(
+                    "http://example.test/file",
+                    tmp_path / "file",
+                    segments=4,
+                    min_segment_size=1024,
+                    progress=lambda received, total: progress.append((received, total)),
+                ) == len(data)
+
+        assert (tmp_path / "file").read_bytes() == data
+        assert failures == [7680]
+        assert progress[-1] == (len(data), len(data))
+
+        ranges = [c.kwargs["headers"].get("Range") for c in mocked.call_args_list]
+
+        # the probe, the four segments then the last one resumed.
+        assert sorted(ranges, key=str) == sorted(
+            [
+                None,
+                "bytes=0-2559",
+                "bytes=2560-5119",
+                "bytes=5120-7679",
+                "bytes=7680-10239",
+                "bytes=7780-10239",
+            ],
+            key=str,
+        )
+
+    def test_connection_coalescing(self) -> None:
+        with PoolManager(
+            connection_coalescing=True,
+            resolver="in-memory://default?hosts=a.example.test:192.0.2.1"
+            "&hosts=b.example.test:192.0.2.1&hosts=d.example.test:192.0.2.1",
+        ) as p:
+            pool_a = p.connection_from_url("https://a.example.test/")
+            p.pools.release()
+
+            with patch.object(
+                HTTPSConnectionPool, "_can_coalesce", return_value=True
+            ) as can_coalesce:
+                coalesced = p._connection_from_coalescing("b.example.test", None, None)
+
+                assert coalesced is not None
+                assert coalesced[0].key_host == "b.example.test"
+                assert coalesced[1] is pool_a
+                assert coalesced[2] == frozenset({"192.0.2.1"})
+                can_coalesce.assert_called_once_with(
+                    "b.example.test", frozenset({"192.0.2.1"})
+                )
+                p.pools.release()
+
+                # pools with other TLS settings are never shared.
+                assert (
+                    p._connection_from_coalescing(
+                        "b.example.test", None, {"cert_reqs": "CERT_NONE"}
+                    )
+                    is None
+                )
+
+                # a host with a pool of its own no longer look elsewhere.
+                p.connection_from_url("https://b.example.test/")
+                p.pools.release()
+
+                assert (
+                    p._connection_from_coalescing("b.example.test", None, None) is None
+                )
+
+                # nor a host that answered 421 Misdirected Request.
+                p._coalescing_denied.add(
+                    coalesced[0]._replace(key_host="c.example.test")
+                )
+
+                assert (
+                    p._connection_from_coalescing("c.example.test", None, None) is None
+                )
+
+            with patch.object(
+                HTTPSConnectionPool, "_can_coalesce", return_value=False
+            ) as can_coalesce:
+                assert (
+                    p._connection_from_coalescing("d.example.test", None, None) is None
+                )
+                assert can_coalesce.called
+
+    def test_connection_coalescing_addresses_expire(self) -> None:
+        with PoolManager(
+            connection_coalescing=True,
+            resolver="in-memory://default?hosts=a.example.test:192.0.2.1"
+            "&hosts=b.example.test:192.0.2.1",
+        ) as p:
+            p.connection_from_url("https://a.example.test/")
+            p.pools.release()
+
+            with patch.object(
+                HTTPSConnectionPool, "_can_coalesce", return_value=True
+            ), patch.object(
+                p._resolver, "getaddrinfo", wraps=p._resolver.getaddrinfo
+            ) as getaddrinfo:
+                for _ in range(2):
+                    coalesced = p._connection_from_coalescing(
+                        "b.example.test", None, None
+                    )
+                    assert coalesced is not None
+                    p.pools.release()
+
+                assert getaddrinfo.call_count == 1
+                assert coalesced is not None
+
+                addresses, trusted_until = p._coalesced_addresses[coalesced[0]]
+                assert trusted_until <= time.monotonic() + 5.0
+
+                # past their age, the addresses are resolved anew.
+                p._coalesced_addresses[coalesced[0]] = addresses, time.monotonic()
+
+                assert p._connection_from_coalescing("b.example.test", None, None)
+                p.pools.release()
+
+                assert getaddrinfo.call_count == 2
+
+    def test_connection_coalescing_fallback(self) -> None:
+        def urlopen(
+            pool: HTTPSConnectionPool, method: str, url: str, **kw: typing.Any
+        ) -> HTTPResponse:
+            if kw.get("coalescing") is not None:
+                assert kw["headers"]["Host"] == "b.example.test"
+                raise EmptyPoolError(pool, "No established connection")
+            assert "Host" not in kw["headers"]
+            return HTTPResponse(status=200)
+
+        with PoolManager(
+            connection_coalescing=True,
+            resolver="in-memory://default?hosts=a.example.test:192.0.2.1"
+            "&hosts=b.example.test:192.0.2.1",
+        ) as p:
+            pool_a = p.connection_from_url("https://a.example.test/")
+            p.pools.release()
+
+            with patch.object(
+                HTTPSConnectionPool, "_can_coalesce", return_value=True
+            ), patch.object(
+                HTTPSConnectionPool, "urlopen", autospec=True, side_effect=urlopen
+            ) as pool_urlopen:
+                assert p.request("GET", "https://b.example.test/").status == 200
+
+            # the eligible connection was busy, a dedicated one took over.
+            assert pool_urlopen.call_count == 2
+            assert pool_urlopen.call_args_list[0][0][0] is pool_a
+            assert pool_urlopen.call_args_list[1][0][0].host == "b.example.test"
+            assert "coalescing" not in pool_urlopen.call_args_list[1][1]
+
+    def test_circuit_breaker_fails_fast(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure(("http", "example.com", 80))
+
+        with PoolManager(circuit_breaker=breaker) as p:
+            with pytest.raises(CircuitOpenError):
+                p.urlopen("GET", "http://example.com/", retries=3)
+
     def test_https_connection_from_url_case_insensitive(self) -> None:
         """Assert scheme case is ignored when pooling HTTPS connections."""
         p = PoolManager()
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import contextlib
 import gzip
+import hashlib
 import http.client as httplib
+import os
 import socket
 import ssl
 import sys
@@ -10,6 +12,7 @@ import typing
 import zlib
 from base64 import b64decode
 from io import BufferedReader, BytesIO, TextIOWrapper
+from pathlib import Path
 from test import onlyBrotli, onlyZstd
 from unittest import mock
 
@@ -30,7 +33,7 @@ from urllib3.response import (  # type: ignore[attr-defined]
     brotli,
     zstd,
 )
-from urllib3.util.response import is_fp_closed
+from urllib3.util.response import RecordSplitter, is_fp_closed
 from urllib3.util.retry import RequestHistory, Retry
 
 
@@ -85,6 +88,35 @@ class TestBytesQueueBuffer:
         assert len(buffer.get(10 * 2**20)) == 10 * 2**20
 
 
+class TestRecordSplitter:
+    @pytest.mark.parametrize(
+        ["chunks", "expected"],
+        [
+            ([], []),
+            ([b"\n\n"], []),
+            ([b'{"a": 1}\n{"b": 2}\n'], [b'{"a": 1}', b'{"b": 2}']),
+            ([b'{"a": 1}\r\n\n  \n{"b": 2}'], [b'{"a": 1}', b'{"b": 2}']),
+            ([b'{"a"', b": 1", b"}\n", b'{"b"', b": 2}"], [b'{"a": 1}', b'{"b": 2}']),
+        ],
+    )
+    def test_feed(self, chunks: list[bytes], expected: list[bytes]) -> None:
+        splitter = RecordSplitter()
+        records = []
+
+        for chunk in chunks:
+            records += splitter.feed(chunk)
+
+        assert records + splitter.close() == expected
+
+    def test_custom_separator(self) -> None:
+        splitter = RecordSplitter(b"\x1e")
+
+        assert splitter.feed(b'\x1e{\n"a": 1\n}\n\x1e[1') == [b'{\n"a": 1\n}']
+        assert splitter.feed(b"]\n") == []
+        assert splitter.close() == [b"[1]"]
+        assert splitter.close() == []
+
+
 # A known random (i.e, not-too-compressible) payload generated with:
 #    "".join(random.choice(string.printable) for i in range(512))
 #    .encode("zlib").encode("base64")
@@ -1294,6 +1326,116 @@ class TestResponse:
 
         assert b"foo\nbar" == data
 
+    def test_json_custom_loads(self) -> None:
+        resp = HTTPResponse(BytesIO(b'{"a": 1}'))
+
+        assert resp.json() == {"a": 1}
+        assert resp.json(loads=lambda data: data) == b'{"a": 1}'
+
+    @pytest.mark.parametrize(
+        ["payload", "content_type"],
+        [
+            (b'{"a": 1}\n\n{"b": [2]}\n3', "application/x-ndjson"),
+            (b'\x1e{"a": 1}\n\x1e{\n"b": [2]\n}\n\x1e3\n', "application/json-seq"),
+        ],
+    )
+    def test_iter_json_lines(self, payload: bytes, content_type: str) -> None:
+        resp = HTTPResponse(
+            BytesIO(gzip.compress(payload)),
+            headers={"content-type": content_type, "content-encoding": "gzip"},
+            preload_content=False,
+        )
+
+        assert list(resp.iter_json_lines()) == [{"a": 1}, {"b": [2]}, 3]
+
+    def test_iter_json_lines_custom_loads(self) -> None:
+        resp = HTTPResponse(BytesIO(b"1\n2\n"), preload_content=False)
+
+        assert list(resp.iter_json_lines(loads=int)) == [1, 2]
+
+    def test_download_to(self, tmp_path: Path) -> None:
+        body = b"foo" * 10_000
+        target = tmp_path / "download.bin"
+        sha256 = hashlib.sha256()
+
+        resp = HTTPResponse(
+            BytesIO(gzip.compress(body)),
+            headers={"content-encoding": "gzip"},
+            preload_content=False,
+        )
+
+        with mock.patch("os.fsync") as fsync:
+            written = resp.download_to(
+                target, hashes=[sha256], fsync=True, chunk_size=1024
+            )
+
+        assert written == len(body)
+        assert target.read_bytes() == body
+        assert sha256.hexdigest() == hashlib.sha256(body).hexdigest()
+        fsync.assert_called_once()
+
+    def test_download_to_fd(self, tmp_path: Path) -> None:
+        target = tmp_path / "download.bin"
+        target.write_bytes(b"head:")
+
+        resp = HTTPResponse(
+            BytesIO(b"x" * 5000),
+            headers={"content-length": "5000"},
+            preload_content=False,
+        )
+
+        fd = os.open(target, os.O_WRONLY)
+
+        try:
+            os.lseek(fd, 0, os.SEEK_END)
+
+            with mock.patch("os.fsync") as fsync:
+                assert resp.download_to(fd, fsync=2048, chunk_size=1024) == 5000
+
+            # every 2048 bytes written, then once complete.
+            assert fsync.call_count == 3
+        finally:
+            os.close(fd)
+
+        assert target.read_bytes() == b"head:" + b"x" * 5000
+
+    def test_download_to_incomplete(self, tmp_path: Path) -> None:
+        target = tmp_path / "download.bin"
+
+        resp = HTTPResponse(
+            BytesIO(b"abc"),
+            headers={"content-length": "10"},
+            preload_content=False,
+        )
+
+        with pytest.raises(ProtocolError):
+            resp.download_to(target)
+
+        # the space reserved for the missing bytes is not left behind.
+        assert os.path.getsize(target) < 10
+
+    def test_download_to_fd_incomplete(self, tmp_path: Path) -> None:
+        target = tmp_path / "download.bin"
+        target.write_bytes(b"p" * 100)
+
+        resp = HTTPResponse(
+            BytesIO(b"abc"),
+            headers={"content-length": "10"},
+            preload_content=False,
+        )
+
+        fd = os.open(target, os.O_WRONLY)
+
+        try:
+            with pytest.raises(ProtocolError):
+                resp.download_to(fd)
+        finally:
+            os.close(fd)
+
+        # the caller's file is not cut short, past what was written.
+        assert len(target.read_bytes()) == 100
+        assert target.read_bytes().endswith(b"p" * 90)
+
     @pytest.mark.parametrize(
         "http_version, headers",
         [
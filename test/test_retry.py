@@ -6,7 +6,9 @@ from unittest import mock
 
 import pytest
 
+from urllib3.connectionpool import HTTPConnectionPool
 from urllib3.exceptions import (
+    CircuitOpenError,
     ConnectTimeoutError,
     InvalidHeader,
     MaxRetryError,
@@ -15,7 +17,7 @@ from urllib3.exceptions import (
     SSLError,
 )
 from urllib3.response import HTTPResponse
-from urllib3.util.retry import RequestHistory, Retry
+from urllib3.util.retry import CircuitBreaker, RequestHistory, Retry, RetryBudget
 
 
 class TestRetry:
@@ -435,3 +437,113 @@ class TestRetry:
                 sleep_mock.assert_called_with(sleep_duration)
             else:
                 sleep_mock.assert_not_called()
+
+
+class TestRetryBudget:
+    def test_budget_limits_retries(self) -> None:
+        pool = HTTPConnectionPool("example.com", 80)
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        retry = Retry(total=10, retry_budget=budget)
+
+        retry = retry.increment(error=ConnectTimeoutError(), _pool=pool)
+        retry = retry.increment(error=ConnectTimeoutError(), _pool=pool)
+
+        with pytest.raises(MaxRetryError):
+            retry.increment(error=ConnectTimeoutError(), _pool=pool)
+
+        # two successful responses earn back a retry.
+        retry.record_success(pool)
+        retry.record_success(pool)
+
+        assert budget.tokens(("http", "example.com", 80)) == 1.0
+        retry.increment(error=ConnectTimeoutError(), _pool=pool)
+
+    def test_budget_is_per_upstream(self) -> None:
+        budget = RetryBudget(max_tokens=1)
+        retry = Retry(total=10, retry_budget=budget)
+
+        retry.increment(error=ConnectTimeoutError(), _pool=HTTPConnectionPool("a.com"))
+        retry.increment(error=ConnectTimeoutError(), _pool=HTTPConnectionPool("b.com"))
+
+    def test_redirect_does_not_consume_budget(self) -> None:
+        pool = HTTPConnectionPool("example.com", 80)
+        budget = RetryBudget(max_tokens=0)
+        retry = Retry(total=10, retry_budget=budget)
+
+        response = HTTPResponse(status=302, headers={"Location": "/"})
+        retry.increment(response=response, _pool=pool)
+
+        with pytest.raises(MaxRetryError):
+            retry.increment(response=HTTPResponse(status=503), _pool=pool)
+
+    def test_new_keeps_shared_policies(self) -> None:
+        budget = RetryBudget()
+        breaker = CircuitBreaker()
+        retry = Retry(retry_budget=budget, circuit_breaker=breaker).new(total=3)
+
+        assert retry.retry_budget is budget
+        assert retry.circuit_breaker is breaker
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self) -> None:
+        pool = HTTPConnectionPool("example.com", 80)
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+        retry = Retry(total=10, circuit_breaker=breaker)
+
+        retry.admit(pool)
+        retry = retry.increment(error=ConnectTimeoutError(), _pool=pool)
+        retry.admit(pool)
+        retry = retry.increment(
+            method="GET", error=ReadTimeoutError(DUMMY_POOL, "/", "_"), _pool=pool
+        )
+
+        with pytest.raises(CircuitOpenError) as e:
+            retry.admit(pool)
+
+        assert 0 < e.value.retry_after <= 10
+
+    def test_success_resets_failures(self) -> None:
+        pool = HTTPConnectionPool("example.com", 80)
+        breaker = CircuitBreaker(failure_threshold=2)
+        retry = Retry(total=10, circuit_breaker=breaker)
+
+        retry.increment(error=ConnectTimeoutError(), _pool=pool)
+        retry.record_success(pool)
+        retry.increment(error=ConnectTimeoutError(), _pool=pool)
+
+        retry.admit(pool)
+
+    def test_failures_recorded_when_retries_disabled(self) -> None:
+        pool = HTTPConnectionPool("example.com", 80)
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        with pytest.raises(ConnectTimeoutError):
+            Retry(False, circuit_breaker=breaker).increment(
+                error=ConnectTimeoutError(), _pool=pool
+            )
+
+        assert breaker.is_open(("http", "example.com", 80))
+
+    def test_half_open_probe(self) -> None:
+        upstream = ("http", "example.com", 80)
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+
+        with mock.patch("time.monotonic", return_value=100.0):
+            breaker.record_failure(upstream)
+            assert breaker.admit(upstream) == 5.0
+
+        with mock.patch("time.monotonic", return_value=106.0):
+            # a single probe is let through
+            assert breaker.admit(upstream) is None
+            assert breaker.admit(upstream) == 5.0
+
+            # the probe failed, back to open.
+            breaker.record_failure(upstream)
+            assert breaker.admit(upstream) == 5.0
+
+        with mock.patch("time.monotonic", return_value=112.0):
+            assert breaker.admit(upstream) is None
+            breaker.record_success(upstream)
+            assert breaker.admit(upstream) is None
+            assert not breaker.is_open(upstream)
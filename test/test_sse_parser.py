@@ -6,12 +6,17 @@ underlying byte stream.
 
 from __future__ import annotations
 
+import typing
 from unittest.mock import MagicMock
 
 import pytest
 
+from urllib3.contrib.webextensions._async.sse import (
+    AsyncServerSideEventExtensionFromHTTP,
+)
 from urllib3.contrib.webextensions.sse import (
     ServerSentEvent,
+    ServerSentEventParser,
     ServerSideEventExtensionFromHTTP,
 )
 
@@ -57,6 +62,36 @@ def _make_ext(chunks: list[bytes]) -> ServerSideEventExtensionFromHTTP:
             ["one", "two"],
             id="crlf-separator",
         ),
+        pytest.param(
+            [b"data: one\r\rdata: two\r\r"],
+            ["one", "two"],
+            id="cr-separator",
+        ),
+        pytest.param(
+            [b"data: one\r", b"\n\r", b"\ndata: two\n\n"],
+            ["one", "two"],
+            id="crlf-split-across-chunks",
+        ),
+        pytest.param(
+            [b"data: a\ndata: b\ndata\n\n"],
+            ["a\nb\n"],
+            id="multi-line-data",
+        ),
+        pytest.param(
+            [b"\xef\xbb\xbfdata: bom\n\n"],
+            ["bom"],
+            id="leading-bom",
+        ),
+        pytest.param(
+            [bytes([b]) for b in "data: h\u00e9llo\n\ndata: w\n\n".encode()],
+            ["h\u00e9llo", "w"],
+            id="byte-per-chunk",
+        ),
+        pytest.param(
+            [b"data: complete\n\ndata: incomplete\n"],
+            ["complete"],
+            id="incomplete-event-discarded",
+        ),
     ],
 )
 def test_sse_parser(chunks: list[bytes], expected_data: list[str]) -> None:
@@ -103,3 +138,79 @@ def test_comment_only_events_skipped_without_recursion() -> None:
     ev = ext.next_payload()
     assert isinstance(ev, ServerSentEvent)
     assert ev.data == "real"
+
+
+def test_retry_and_id_fields() -> None:
+    ext = _make_ext(
+        [b"retry: 1000\nid: 1\ndata: a\n\nretry: 1x\ndata: b\n\nid\ndata: c\n\n"]
+    )
+
+    ev = ext.next_payload()
+    assert isinstance(ev, ServerSentEvent)
+    assert ev.retry == 1000 and ev.id == "1"
+
+    ev = ext.next_payload()
+    assert isinstance(ev, ServerSentEvent)
+    assert ev.retry is None and ev.id == "1"
+
+    # an empty id resets the last event id.
+    ev = ext.next_payload()
+    assert isinstance(ev, ServerSentEvent)
+    assert ev.id == ""
+
+
+def test_event_without_data_not_dispatched() -> None:
+    ext = _make_ext([b"event: ping\n\nid: 7\nretry: 500\n\ndata\n\n"])
+
+    # the id and retry of the discarded events carry over.
+    ev = ext.next_payload()
+    assert isinstance(ev, ServerSentEvent)
+    assert ev.event == "message" and ev.data == ""
+    assert ev.id == "7" and ev.retry == 500
+    assert ext.next_payload() is None
+
+
+def test_next_payloads_return_every_buffered_event() -> None:
+    ext = _make_ext([b"data: 1\n\ndata: 2\n\ndata: 3", b"\n\n"])
+
+    assert [e.data for e in ext.next_payloads()] == ["1", "2"]
+    assert ext.next_payloads(raw=True) == ["data: 3\n\n"]
+    assert ext.next_payloads() == []
+    assert ext.closed is True
+
+
+def test_parser_raw_keep_split_crlf() -> None:
+    parser = ServerSentEventParser()
+
+    parser.feed(b": comment\r\n\r\ndata: x\r\n\r")
+    assert len(parser) == 1
+
+    parser.feed(b"\n")
+    assert parser.next_event(raw=True) == "data: x\r\n\r\n"
+    assert parser.next_event() is None
+
+
+def test_parser_scale_with_event_count() -> None:
+    parser = ServerSentEventParser()
+
+    for _ in range(1000):
+        parser.feed(b"data: tok\n\n" * 100)
+        assert len(parser.events()) == 100
+
+
+@pytest.mark.asyncio
+async def test_async_next_payloads() -> None:
+    async def stream() -> typing.AsyncGenerator[bytes, None]:
+        yield b"data: 1\n\ndata: 2"
+        yield b"\n\ndata: 3\n\n"
+
+    ext = AsyncServerSideEventExtensionFromHTTP()
+    ext._stream = stream()
+    ext._response = MagicMock()
+
+    ev = await ext.next_payload()
+    assert isinstance(ev, ServerSentEvent) and ev.data == "1"
+
+    assert [e.data for e in await ext.next_payloads()] == ["2", "3"]
+    assert await ext.next_payloads() == []
+    assert ext.closed is True
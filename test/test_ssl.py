@@ -253,6 +253,57 @@ class TestSSL:
                 keys.append(_SSLContextCache._cursor)
         assert len(set(keys)) == len(keys)
 
+    def test_ssl_context_cache_info(self) -> None:
+        from urllib3.util.ssl_ import _SSLContextCache
+
+        args = [None] * 16 + ["ssl"]
+
+        with _SSLContextCache.lock(*args):
+            assert _SSLContextCache.get() is None
+            _SSLContextCache.save(ssl_.create_urllib3_context())
+
+        for _ in range(3):
+            with _SSLContextCache.lock(*args):
+                assert _SSLContextCache.get() is not None
+
+        info = _SSLContextCache.cache_info()
+
+        assert (info.hits, info.misses, info.currsize) == (3, 1, 1)
+        assert info.build_time > 0.0
+        assert info.hit_ratio == 0.75
+
+        aggregated = ssl_.ssl_context_cache_info()
+
+        assert aggregated.hits >= 3 and aggregated.misses >= 1
+
+        _SSLContextCache._after_fork_in_child()
+
+        with _SSLContextCache.lock(*args):
+            assert _SSLContextCache.get() is not None
+
+    def test_trust_store_ca_bundle(self) -> None:
+        import trustme
+
+        registry = ssl_._TrustStoreRegistry()
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+        assert registry.ca_bundle(ctx) is None
+
+        first_ca, second_ca = trustme.CA(), trustme.CA()
+        first_ca.configure_trust(ctx)
+
+        bundle = registry.ca_bundle(ctx)
+
+        assert bundle is not None and bundle.count("BEGIN CERTIFICATE") == 1
+
+        with mock.patch.object(ssl, "DER_cert_to_PEM_cert") as der_to_pem:
+            assert registry.ca_bundle(ctx) == bundle
+            assert not der_to_pem.called
+
+        # the trust store grew, the bundle must follow.
+        second_ca.configure_trust(ctx)
+        assert registry.ca_bundle(ctx).count("BEGIN CERTIFICATE") == 2  # type: ignore[union-attr]
+
     def test_anytls_getattr_unknown_attribute(self) -> None:
         from urllib3.contrib import anytls
 
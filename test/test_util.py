@@ -580,6 +580,8 @@ class TestUtil:
                 {"proxy-authorization": "Basic Zm9vOmJhcg=="},
             ),
             ({"disable_cache": True}, {"cache-control": "no-cache"}),
+            ({"priority": 0}, {"priority": "u=0"}),
+            ({"priority": (5, True)}, {"priority": "u=5, i"}),
         ],
     )
     def test_make_headers(
@@ -587,6 +589,11 @@ class TestUtil:
     ) -> None:
         assert make_headers(**kwargs) == expected  # type: ignore[arg-type]
 
+    @pytest.mark.parametrize("priority", [-1, 8, (9, True), "1"])
+    def test_make_headers_invalid_priority(self, priority: typing.Any) -> None:
+        with pytest.raises(ValueError):
+            make_headers(priority=priority)
+
     def test_rewind_body(self) -> None:
         body = io.BytesIO(b"test data")
         assert body.read() == b"test data"
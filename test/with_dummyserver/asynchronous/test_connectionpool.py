@@ -234,6 +234,14 @@ class TestConnectionPool(HTTPDummyServerTestCase):
             r = await pool.request("GET", "/specific_method", fields={"method": "GET"})
             assert r.status == 200, await r.data
 
+    async def test_response_latency_recorded(self) -> None:
+        async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+            await pool.request("GET", "/")
+            await pool.request("POST", "/echo", body=b"foo")
+
+            # every response feeds the learned hedging delay, not only hedged ones.
+            assert len(pool._response_latencies) == 1
+
     async def test_post_url(self) -> None:
         async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
             r = await pool.request(
@@ -269,6 +277,21 @@ class TestConnectionPool(HTTPDummyServerTestCase):
             r = await pool.request("POST", "/upload", fields=fields)
             assert r.status == 200, await r.data
 
+    async def test_upload_file_object(self) -> None:
+        data = b"\x00cheezburgr\xff" * 65536
+
+        with io.BytesIO(data) as fp:
+            fields: dict[str, _TYPE_FIELD_VALUE_TUPLE] = {
+                "upload_param": "filefield",
+                "upload_filename": "lolcat.bin",
+                "upload_size": str(len(data)),
+                "filefield": ("lolcat.bin", fp),
+            }
+
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("POST", "/upload", fields=fields)
+                assert r.status == 200, await r.data
+
     async def test_one_name_multiple_values(self) -> None:
         fields = [("foo", "a"), ("foo", "b")]
 
@@ -48,6 +48,38 @@ class TestAsyncPoolManager(HTTPDummyServerTestCase):
             assert r.status == 200
             assert await r.data == b"Dummy server!"
 
+    async def test_request_many(self) -> None:
+        def batch() -> typing.Iterator[typing.Any]:
+            for i in range(40):
+                if i % 2:
+                    yield f"{self.base_url}/echo_uri?i={i}"
+                else:
+                    yield ("POST", f"{self.base_url_alt}/echo", {"body": str(i)})
+
+            yield f"{self.base_url}/status?status=503 Service Unavailable"
+
+        async with AsyncPoolManager(maxsize=2) as http:
+            results = [
+                r async for r in http.request_many(batch(), concurrency=4, per_host=2)
+            ]
+
+        assert len(results) == 41
+        assert all(r.error is None and r.response is not None for r in results)
+
+        for result in results:
+            assert result.response is not None
+
+            if isinstance(result.request, tuple):
+                assert len(result.request) == 3
+                assert await result.response.data == result.request[2]["body"].encode()
+            elif "status" in result.request:
+                assert result.response.status == 503
+            else:
+                assert (
+                    await result.response.data
+                    == result.request[len(self.base_url) :].encode()
+                )
+
     async def test_redirect_with_alt_top_level(self) -> None:
         from urllib3_future import AsyncPoolManager as APM  # type: ignore
 
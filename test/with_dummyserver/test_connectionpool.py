@@ -206,6 +206,14 @@ class TestConnectionPool(HTTPDummyServerTestCase):
             r = pool.request("GET", "/specific_method", fields={"method": "GET"})
             assert r.status == 200, r.data
 
+    def test_response_latency_recorded(self) -> None:
+        with HTTPConnectionPool(self.host, self.port) as pool:
+            pool.request("GET", "/")
+            pool.request("POST", "/echo", body=b"foo")
+
+            # every response feeds the learned hedging delay, not only hedged ones.
+            assert len(pool._response_latencies) == 1
+
     def test_post_url(self) -> None:
         with HTTPConnectionPool(self.host, self.port) as pool:
             r = pool.request("POST", "/specific_method", fields={"method": "POST"})
@@ -239,6 +247,49 @@ class TestConnectionPool(HTTPDummyServerTestCase):
             r = pool.request("POST", "/upload", fields=fields)
             assert r.status == 200, r.data
 
+    def test_upload_file_object(self) -> None:
+        data = b"\x00cheezburgr\xff" * 65536
+
+        with io.BytesIO(b"headerjunk" + data) as fp:
+            fp.seek(len(b"headerjunk"))
+
+            fields: dict[str, _TYPE_FIELD_VALUE_TUPLE] = {
+                "upload_param": "filefield",
+                "upload_filename": "lolcat.bin",
+                "upload_size": str(len(data)),
+                "filefield": ("lolcat.bin", fp),
+            }
+
+            with HTTPConnectionPool(self.host, self.port) as pool:
+                r = pool.request("POST", "/upload", fields=fields)
+                assert r.status == 200, r.data
+
+                # the file is streamed with a known length.
+                fp.seek(len(b"headerjunk"))
+                r = pool.request("POST", "/headers", fields=fields)
+                assert "Transfer-Encoding" not in r.json()
+                assert int(r.json()["Content-Length"]) > len(data)
+
+    def test_upload_file_object_rewind_on_redirect(self) -> None:
+        data = b"a" * 200000
+
+        with io.BytesIO(data) as fp:
+            with HTTPConnectionPool(self.host, self.port) as pool:
+                r = pool.request(
+                    "POST",
+                    "/redirect?target=/echo&status=307",
+                    fields={"f": ("a.bin", fp)},
+                    multipart_boundary="foo",
+                )
+
+                assert r.status == 200
+                assert (
+                    r.data
+                    == encode_multipart_formdata(
+                        {"f": ("a.bin", data)}, boundary="foo"
+                    )[0]
+                )
+
     def test_one_name_multiple_values(self) -> None:
         fields = [("foo", "a"), ("foo", "b")]
 
@@ -961,6 +1012,15 @@ class TestConnectionPool(HTTPDummyServerTestCase):
             request_headers = r.json()
             assert request_headers.get("User-Agent") == custom_ua2
 
+    def test_priority_header(self) -> None:
+        with HTTPConnectionPool(self.host, self.port) as pool:
+            r = pool.request("GET", "/headers", priority=(1, True))
+            assert r.json().get("Priority") == "u=1, i"
+
+            # an explicit header is left untouched.
+            r = pool.request("GET", "/headers", headers={"priority": "u=6"}, priority=0)
+            assert r.json().get("Priority") == "u=6"
+
     @pytest.mark.parametrize(
         "headers",
         [
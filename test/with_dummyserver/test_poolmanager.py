@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import gzip
+import os
 import typing
+from pathlib import Path
 
 from test import LONG_TIMEOUT
 from unittest import mock
@@ -12,7 +14,7 @@ from dummyserver.server import HAS_IPV6
 from dummyserver.testcase import HTTPDummyServerTestCase, IPv6HTTPDummyServerTestCase
 from urllib3 import HTTPHeaderDict, HTTPResponse, request
 from urllib3.connectionpool import port_by_scheme
-from urllib3.exceptions import MaxRetryError, URLSchemeUnknown
+from urllib3.exceptions import DownloadError, MaxRetryError, URLSchemeUnknown
 from urllib3.poolmanager import PoolManager
 from urllib3.util.retry import Retry
 
@@ -48,6 +50,75 @@ class TestPoolManager(HTTPDummyServerTestCase):
             assert r.status == 200
             assert r.data == b"Dummy server!"
 
+    def test_urlopen_many(self) -> None:
+        def batch() -> typing.Iterator[typing.Any]:
+            for i in range(40):
+                if i % 2:
+                    yield f"{self.base_url}/echo_uri?i={i}"
+                else:
+                    yield ("POST", f"{self.base_url_alt}/echo", {"body": str(i)})
+
+            yield f"{self.base_url}/status?status=503 Service Unavailable"
+
+        with PoolManager(maxsize=2) as http:
+            results = list(http.urlopen_many(batch(), concurrency=4, per_host=2))
+
+        assert len(results) == 41
+        assert all(r.error is None and r.response is not None for r in results)
+
+        for result in results:
+            assert isinstance(result.response, HTTPResponse)
+
+            if isinstance(result.request, tuple):
+                assert len(result.request) == 3
+                assert result.response.data == result.request[2]["body"].encode()
+            elif "status" in result.request:
+                assert result.response.status == 503
+            else:
+                assert (
+                    result.response.data
+                    == result.request[len(self.base_url) :].encode()
+                )
+
+    def test_download(self, tmp_path: Path) -> None:
+        progress = []
+
+        with PoolManager(maxsize=2) as http:
+            written = http.download(
+                f"{self.base_url}/ranged?length=100000",
+                tmp_path / "ranged.bin",
+                segments=5,
+                min_segment_size=1000,
+                progress=lambda received, total: progress.append((received, total)),
+            )
+
+        assert written == 100000
+        assert (tmp_path / "ranged.bin").read_bytes() == bytes(
+            i % 251 for i in range(100000)
+        )
+        assert progress[-1] == (100000, 100000)
+
+    def test_download_resource_changed(self, tmp_path: Path) -> None:
+        with PoolManager() as http:
+            with pytest.raises(DownloadError, match="got 200"):
+                http.download(
+                    f"{self.base_url}/ranged?length=100000&changed_etag=v2",
+                    tmp_path / "ranged.bin",
+                    segments=5,
+                    min_segment_size=1000,
+                )
+
+    def test_download_without_range(self, tmp_path: Path) -> None:
+        with PoolManager() as http:
+            written = http.download(
+                f"{self.base_url}/nbytes?length=5000",
+                tmp_path / "nbytes.bin",
+                min_segment_size=1000,
+            )
+
+        assert written == 5000
+        assert (tmp_path / "nbytes.bin").read_bytes() == b"1" * 5000
+
     def test_redirect_with_alt_top_level(self) -> None:
         from urllib3_future import PoolManager as APM  # type: ignore[import-not-found]
 
@@ -434,6 +505,51 @@ class TestPoolManager(HTTPDummyServerTestCase):
                 )
             assert e.value.scheme == unknown_scheme
 
+    @pytest.mark.skipif(
+        not hasattr(os, "fork"), reason="os.fork() is not available on this platform"
+    )
+    def test_fork_drop_inherited_connections(self) -> None:
+        with PoolManager(background_watch_delay=1.0) as http:
+            r = http.request("GET", f"{self.base_url}/")
+            assert r.status == 200
+
+            pool = http.connection_from_url(self.base_url)
+            http.pools.release()
+
+            assert pool.pool is not None
+            assert pool.pool.qsize() == 1
+
+            conn = pool.pool.get()
+            pool.pool.release()
+            assert conn is not None
+            parent_sock = conn.sock
+
+            pid = os.fork()
+
+            if pid == 0:  # pragma: no cover
+                # anything going wrong must surface as a non-zero exit code, never as
+                # a second test session running in the child.
+                exit_code = 1
+
+                try:
+                    if pool.pool.qsize() == 0:
+                        r = http.request("GET", f"{self.base_url}/")
+
+                        if r.status == 200 and pool.pool.get() is not conn:
+                            exit_code = 0
+                finally:
+                    os._exit(exit_code)
+
+            _, status = os.waitpid(pid, 0)
+
+            assert os.waitstatus_to_exitcode(status) == 0
+
+            # the child left the connection of the parent intact.
+            assert conn.sock is parent_sock
+            r = http.request("GET", f"{self.base_url}/")
+            assert r.status == 200
+            assert pool.num_connections == 1
+
     def test_raise_on_redirect(self) -> None:
         with PoolManager() as http:
             r = http.request(
@@ -58,6 +58,43 @@ class TestPoolManagerMultiplexed(TraefikTestCase):
             assert 3.5 >= round(time() - before, 2)
             assert await pool.get_response() is None
 
+    @notMacOS()
+    async def test_multiplexing_iter_responses(self) -> None:
+        async with AsyncPoolManager(
+            ca_certs=self.ca_authority,
+            resolver=self.test_resolver_raw,
+        ) as pool:
+            promise_slow = await pool.urlopen(
+                "GET", f"{self.https_url}/delay/3", multiplexed=True
+            )
+            promise_fast = await pool.urlopen(
+                "GET", f"{self.https_url}/delay/1", multiplexed=True
+            )
+            promise_aside = await pool.urlopen(
+                "GET", f"{self.https_url}/get", multiplexed=True
+            )
+
+            assert isinstance(promise_slow, ResponsePromise)
+            assert isinstance(promise_fast, ResponsePromise)
+            assert isinstance(promise_aside, ResponsePromise)
+
+            before = time()
+            urls = []
+
+            async for response in pool.iter_responses([promise_slow, promise_fast]):
+                assert response.status == 200
+                urls.append((await response.json())["url"])
+
+            assert 3.5 >= round(time() - before, 2)
+            assert "/delay/1" in urls[0]
+            assert "/delay/3" in urls[1]
+
+            # a response outside the given promises is never consumed.
+            aside = await pool.get_response()
+            assert aside is not None
+            assert "/get" in (await aside.json())["url"]
+            assert await pool.get_response() is None
+
     async def test_multiplexing_without_preload(self) -> None:
         async with AsyncPoolManager(
             ca_certs=self.ca_authority,
@@ -5,6 +5,7 @@ import sys
 import pytest
 
 from urllib3 import ConnectionInfo, HttpVersion, PoolManager
+from urllib3.backend import QuicSessionTicketStore
 from urllib3.exceptions import InsecureRequestWarning
 
 from . import TraefikTestCase
@@ -108,3 +109,57 @@ class TestConnectionInfo(TraefikTestCase):
         assert conn_info.http_version == HttpVersion.h3
 
         p.clear()
+
+    @pytest.mark.usefixtures("requires_http3")
+    def test_tls_on_udp_session_resumption(self) -> None:
+        store = QuicSessionTicketStore()
+
+        conn_infos: list[ConnectionInfo] = []
+
+        for _ in range(2):
+            with PoolManager(
+                preemptive_quic_cache={
+                    (self.host, self.https_port): (self.host, self.https_port)
+                },
+                quic_session_tickets=store,
+                ca_certs=self.ca_authority,
+                resolver=self.test_resolver,
+            ) as p:
+                p.urlopen(
+                    method="GET",
+                    url=self.https_url,
+                    on_post_connection=conn_infos.append,
+                )
+
+        assert len(conn_infos) == 2
+        assert conn_infos[0].tls_session_resumed is False
+        assert conn_infos[1].tls_session_resumed is True
+        assert conn_infos[1].http_version == HttpVersion.h3
+        assert conn_infos[1].certificate_der == conn_infos[0].certificate_der
+
+    @pytest.mark.usefixtures("requires_http3")
+    def test_tls_on_udp_session_resumption_needs_same_verification(self) -> None:
+        store = QuicSessionTicketStore()
+
+        conn_infos: list[ConnectionInfo] = []
+
+        for pool_kw in ({"cert_reqs": "CERT_NONE"}, {"ca_certs": self.ca_authority}):
+            with PoolManager(
+                preemptive_quic_cache={
+                    (self.host, self.https_port): (self.host, self.https_port)
+                },
+                quic_session_tickets=store,
+                resolver=self.test_resolver,
+                **pool_kw,
+            ) as p:
+                p.urlopen(
+                    method="GET",
+                    url=self.https_url,
+                    on_post_connection=conn_infos.append,
+                )
+
+        # the ticket issued to the insecure pool is not used by the verifying one.
+        assert len(conn_infos) == 2
+        assert conn_infos[0].tls_session_resumed is False
+        assert conn_infos[1].tls_session_resumed is False
+        assert conn_infos[1].http_version == HttpVersion.h3
@@ -56,6 +56,43 @@ class TestPoolManagerMultiplexed(TraefikTestCase):
             assert 3.5 >= round(time() - before, 2)
             assert pool.get_response() is None
 
+    @notMacOS()
+    def test_multiplexing_iter_responses(self) -> None:
+        with PoolManager(
+            ca_certs=self.ca_authority,
+            resolver=self.test_resolver.new(),
+        ) as pool:
+            promise_slow = pool.urlopen(
+                "GET", f"{self.https_url}/delay/3", multiplexed=True
+            )
+            promise_fast = pool.urlopen(
+                "GET", f"{self.https_url}/delay/1", multiplexed=True
+            )
+            promise_aside = pool.urlopen(
+                "GET", f"{self.https_url}/get", multiplexed=True
+            )
+
+            assert isinstance(promise_slow, ResponsePromise)
+            assert isinstance(promise_fast, ResponsePromise)
+            assert isinstance(promise_aside, ResponsePromise)
+
+            before = time()
+            urls = []
+
+            for response in pool.iter_responses([promise_slow, promise_fast]):
+                assert response.status == 200
+                urls.append(response.json()["url"])
+
+            assert 3.5 >= round(time() - before, 2)
+            assert "/delay/1" in urls[0]
+            assert "/delay/3" in urls[1]
+
+            # a response outside the given promises is never consumed.
+            aside = pool.get_response()
+            assert aside is not None
+            assert "/get" in aside.json()["url"]
+            assert pool.get_response() is None
+
     def test_multiplexing_without_preload(self) -> None:
         with PoolManager(
             ca_certs=self.ca_authority,
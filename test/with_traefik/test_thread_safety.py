@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import time
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from urllib3 import PoolManager, HttpVersion, HTTPResponse
+from urllib3 import (
+    HTTPConnectionPool,
+    HTTPSConnectionPool,
+    HttpVersion,
+    HTTPResponse,
+    PoolManager,
+)
 from urllib3.backend.hface import _HAS_HTTP3_SUPPORT
 
 from . import TraefikTestCase
@@ -105,3 +112,57 @@ class TestThreadSafety(TraefikTestCase):
 
                     assert len(responses) == 16
                     assert all(r.status for r in responses)
+
+    @onlyCPython()
+    @pytest.mark.parametrize(
+        "thread_affinity",
+        [
+            False,
+            True,
+        ],
+    )
+    def test_contention_thread_affinity(self, thread_affinity: bool) -> None:
+        """
+        Many threads hammering a single HTTP/1.1 pool, one connection per thread. Meant to be run
+        (with -s) under the free threaded build to compare the time spent with and without
+        thread affinity. With it, a thread should mostly keep riding the same connection.
+        """
+        worker_maxsize = 8
+        request_count = 64
+
+        def fetch(pool: HTTPConnectionPool) -> set[int]:
+            seen_connections = set()
+
+            for _ in range(request_count):
+                r = pool.urlopen("GET", "/get", timeout=10.0)
+
+                assert r.status == 200
+                seen_connections.add(id(r.connection))
+
+                r.release_conn()
+
+            return seen_connections
+
+        with HTTPSConnectionPool(
+            self.host,
+            self.https_port,
+            maxsize=worker_maxsize,
+            disabled_svn={HttpVersion.h2, HttpVersion.h3},
+            ca_certs=self.ca_authority,
+            resolver=self.test_resolver.new(),
+            thread_affinity=thread_affinity,
+        ) as pool:
+            with ThreadPoolExecutor(max_workers=worker_maxsize) as tpe:
+                # warm up, each worker open its connection.
+                for task in [tpe.submit(fetch, pool) for _ in range(worker_maxsize)]:
+                    task.result()
+
+                before = time.perf_counter()
+                tasks = [tpe.submit(fetch, pool) for _ in range(worker_maxsize)]
+                seen_connections = [task.result() for task in tasks]
+                elapsed = time.perf_counter() - before
+
+        print(
+            f"thread_affinity={thread_affinity}: {worker_maxsize * request_count} requests in {elapsed:.3f}s, "
+            f"{sum(len(s) for s in seen_connections) / worker_maxsize:.2f} connection(s) used per thread"
+        )